@@ -0,0 +1,139 @@
+"""Stockage des gros tableaux d'un projet à côté du fichier JSON.
+
+Les tableaux volumineux sont écrits une seule fois en ``.npy`` dans le dossier
+``<projet>.data/``, nommés d'après l'empreinte de leur contenu ; le JSON ne
+garde qu'une référence ``{"$array": "<nom>.npy"}``. Au chargement, ils sont
+ouverts en ``mmap_mode="r"`` : seules les pages réellement lues (zoom sur une
+portion de courbe) sont chargées depuis le disque.
+
+Les niveaux de décimation (pyramides min/max) sont rangés dans le même
+dossier en ``.npz``, associés à la version des tableaux dont ils dérivent.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Iterable, Optional, Set
+
+import numpy as np
+
+from core.lod import MinMaxPyramid
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Arrays shorter than this stay inline in the JSON document
+INLINE_THRESHOLD = 10_000
+ARRAY_KEY = "$array"
+
+
+def is_array_ref(value) -> bool:
+    return isinstance(value, dict) and ARRAY_KEY in value
+
+
+def array_digest(arr: np.ndarray) -> str:
+    arr = np.ascontiguousarray(arr)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(arr.dtype).encode())
+    digest.update(memoryview(arr).cast("B"))
+    return digest.hexdigest()
+
+
+def data_signature(x_value, y_value) -> str:
+    """Version identifying the (x, y) data of a serialized curve.
+
+    Sidecar arrays are content-addressed, so their file names already are a
+    digest; inline lists are small and hashed directly.
+    """
+    parts = []
+    for value in (x_value, y_value):
+        if is_array_ref(value):
+            parts.append(Path(value[ARRAY_KEY]).stem)
+        else:
+            parts.append(array_digest(np.asarray(value, dtype=np.float64)))
+    return ":".join(parts)
+
+
+class ProjectArrayStore:
+    """Dossier ``<projet>.data/`` contenant les tableaux d'un projet."""
+
+    def __init__(self, directory: Path | str, inline_threshold: int = INLINE_THRESHOLD):
+        self.directory = Path(directory)
+        self.inline_threshold = inline_threshold
+        self.used: Set[str] = set()
+
+    @classmethod
+    def for_project(cls, project_path: str, **kwargs) -> "ProjectArrayStore":
+        path = Path(project_path)
+        return cls(path.with_name(path.stem + ".data"), **kwargs)
+
+    # ------------------------------------------------------------------
+    # Écriture
+    # ------------------------------------------------------------------
+    def _write(self, name: str, save) -> str:
+        self.used.add(name)
+        target = self.directory / name
+        if not target.exists():
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp = target.with_name(target.name + ".tmp")
+            with open(tmp, "wb") as f:
+                save(f)
+            os.replace(tmp, target)
+        return name
+
+    def array_to_json(self, arr: np.ndarray, digest: Optional[str] = None):
+        """Inline list for small arrays, sidecar reference otherwise.
+
+        *digest* may be given when the caller already knows it, to avoid
+        hashing unchanged data on every save.
+        """
+        if len(arr) < self.inline_threshold:
+            return np.asarray(arr).tolist()
+        arr = np.ascontiguousarray(arr)
+        name = self._write(f"{digest or array_digest(arr)}.npy", lambda f: np.save(f, arr))
+        return {ARRAY_KEY: name}
+
+    def put_lod(self, pyr: MinMaxPyramid, version: str) -> str:
+        arrays = {"bucket_sizes": np.asarray(pyr.bucket_sizes, dtype=np.int64)}
+        for level in range(pyr.levels):
+            arrays[f"x{level}"] = pyr.x[level]
+            arrays[f"min{level}"] = pyr.y_min[level]
+            arrays[f"max{level}"] = pyr.y_max[level]
+        name = f"lod-{version.replace(':', '-')}.npz"
+        return self._write(name, lambda f: np.savez(f, length=pyr.length, **arrays))
+
+    def prune(self, keep: Optional[Iterable[str]] = None):
+        """Delete sidecar files no longer referenced by the saved project."""
+        keep = set(self.used if keep is None else keep)
+        if not self.directory.is_dir():
+            return
+        for path in self.directory.iterdir():
+            if path.name in keep:
+                continue
+            try:
+                path.unlink()
+            except OSError as e:  # e.g. still memory-mapped on Windows
+                logger.debug(f"⚠️ [ProjectArrayStore.prune] {path.name} conservé : {e}")
+
+    # ------------------------------------------------------------------
+    # Lecture
+    # ------------------------------------------------------------------
+    def json_to_array(self, value):
+        if is_array_ref(value):
+            self.used.add(value[ARRAY_KEY])
+            return np.load(self.directory / value[ARRAY_KEY], mmap_mode="r")
+        return value
+
+    def get_lod(self, name: str) -> Optional[MinMaxPyramid]:
+        path = self.directory / name
+        if not path.exists():
+            return None
+        with np.load(path) as data:
+            sizes = [int(s) for s in data["bucket_sizes"]]
+            pyr = MinMaxPyramid(length=int(data["length"]), bucket_sizes=sizes)
+            for level in range(len(sizes)):
+                pyr.x.append(data[f"x{level}"])
+                pyr.y_min.append(data[f"min{level}"])
+                pyr.y_max.append(data[f"max{level}"])
+        self.used.add(name)
+        return pyr
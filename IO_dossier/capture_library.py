@@ -0,0 +1,374 @@
+"""Bibliothèque locale de captures indexée dans SQLite.
+
+Chaque fichier importé et chacune de ses courbes sont enregistrés dans une
+base ``sqlite3`` avec leurs métadonnées (instrument, voie, fréquence
+d'échantillonnage, longueur, min/max, date d'acquisition). Les tableaux sont
+ensuite copiés, par une tâche de fond distincte de l'import, dans un cache
+``.npy`` afin de pouvoir recharger une capture sans relancer le parseur
+d'origine ; les fichiers du cache que plus aucune courbe ne référence sont
+supprimés.
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+
+from core.models import CurveData
+from core.utils import generate_random_color
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Sub-folder of the per-user data directory holding the library
+LIBRARY_SUBDIR = Path("GestionnaireCourbes") / "capture_library"
+DB_NAME = "captures.sqlite"
+
+# Instrument name associated with each import format
+FORMAT_INSTRUMENTS = {
+    "keysight_bin": "Keysight",
+    "keysight_json_v5": "Keysight",
+    "rohde_schwarz_bin": "Rohde & Schwarz",
+    "tektro_json_v1_2": "Tektronix",
+    "csv_standard": "CSV",
+    "csv_or_excel": "CSV",
+    "excel": "Excel",
+    "internal_json": "Gestionnaire de courbes",
+}
+
+_CHANNEL_RE = re.compile(r"(?:\bCH|\bC|Channel\s*|Voie\s*)(\d+)\b", re.IGNORECASE)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    format TEXT,
+    instrument TEXT,
+    size INTEGER,
+    acquired_at REAL,
+    indexed_at REAL
+);
+CREATE TABLE IF NOT EXISTS curves (
+    id INTEGER PRIMARY KEY,
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    channel TEXT,
+    sample_rate REAL,
+    length INTEGER,
+    y_min REAL,
+    y_max REAL,
+    acquired_at REAL,
+    x_cache TEXT,
+    y_cache TEXT,
+    UNIQUE(file_id, name)
+);
+CREATE INDEX IF NOT EXISTS idx_files_instrument ON files(instrument);
+CREATE INDEX IF NOT EXISTS idx_curves_channel ON curves(channel, acquired_at);
+CREATE INDEX IF NOT EXISTS idx_curves_acquired ON curves(acquired_at);
+CREATE INDEX IF NOT EXISTS idx_curves_max ON curves(y_max);
+CREATE INDEX IF NOT EXISTS idx_curves_min ON curves(y_min);
+"""
+
+
+@dataclass
+class CaptureRecord:
+    """One indexed curve as returned by :meth:`CaptureLibrary.search`."""
+
+    id: int
+    name: str
+    path: str
+    instrument: Optional[str]
+    channel: Optional[str]
+    sample_rate: Optional[float]
+    length: int
+    y_min: Optional[float]
+    y_max: Optional[float]
+    acquired_at: Optional[float]
+    x_cache: str
+    y_cache: str
+
+
+def default_library_dir() -> Path:
+    """Per-user location of the library, independent of the working directory."""
+    from PyQt5.QtCore import QStandardPaths
+
+    base = QStandardPaths.writableLocation(QStandardPaths.GenericDataLocation)
+    return Path(base or Path.home()) / LIBRARY_SUBDIR
+
+
+def guess_channel(name: str) -> Optional[str]:
+    """Return a normalised channel label (``"CH2"``) parsed from a curve name."""
+    match = _CHANNEL_RE.search(name or "")
+    return f"CH{int(match.group(1))}" if match else None
+
+
+def estimate_sample_rate(x: np.ndarray) -> Optional[float]:
+    """Estimate the sample rate from the median step of the first samples."""
+    head = np.asarray(x[:10_000], dtype=np.float64)
+    steps = np.diff(head[np.isfinite(head)])
+    if not steps.size:
+        return None
+    step = float(np.median(steps))
+    return 1.0 / step if step > 0 else None
+
+
+def _finite_range(y: np.ndarray, chunk_size: int = 1_000_000):
+    lo, hi = np.inf, -np.inf
+    for start in range(0, len(y), chunk_size):
+        part = np.asarray(y[start : start + chunk_size], dtype=np.float64)
+        part = part[np.isfinite(part)]
+        if part.size:
+            lo = min(lo, float(part.min()))
+            hi = max(hi, float(part.max()))
+    if lo > hi:
+        return None, None
+    return lo, hi
+
+
+class CaptureLibrary:
+    """Index SQLite des captures importées et cache de leurs tableaux.
+
+    Imports are parsed (and indexed) on job threads while the GUI thread
+    searches: each thread gets its own connection to the database.
+    """
+
+    def __init__(self, directory: Path | str | None = None):
+        self.directory = Path(directory) if directory is not None else default_library_dir()
+        self.cache_dir = self.directory / "arrays"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        # Held while cache files are written or pruned (a new file is not referenced yet)
+        self._cache_lock = threading.Lock()
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.executescript(_SCHEMA)
+        logger.debug(f"📚 [CaptureLibrary.__init__] Base ouverte : {self.directory}")
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Connection of the calling thread, opened on its first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Only ever used by this thread; the flag lets close() run anywhere
+            conn = sqlite3.connect(str(self.directory / DB_NAME), timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA foreign_keys = ON")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def close(self):
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+    # ------------------------------------------------------------------
+    # Indexation
+    # ------------------------------------------------------------------
+    def _cache_array(self, arr: np.ndarray) -> str:
+        """Store *arr* once in the cache, named after its content digest."""
+        arr = np.ascontiguousarray(arr)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(str(arr.dtype).encode())
+        digest.update(memoryview(arr).cast("B"))
+        name = f"{digest.hexdigest()}.npy"
+        target = self.cache_dir / name
+        if not target.exists():
+            tmp = target.with_suffix(".tmp")
+            with open(tmp, "wb") as f:
+                np.save(f, arr)
+            os.replace(tmp, target)
+        return name
+
+    def index_file(self, path: str, fmt: str, curves: List[CurveData]) -> int:
+        """Index every curve loaded from *path* (re-indexing replaces old rows).
+
+        Only the metadata is recorded: the arrays are copied afterwards by
+        :meth:`cache_arrays`, so that indexing does not slow the import down.
+        """
+        path = os.path.abspath(path) if path else ""
+        stat = os.stat(path) if path and os.path.exists(path) else None
+        acquired_at = stat.st_mtime if stat else time.time()
+        logger.debug(f"📥 [CaptureLibrary.index_file] {path} ({len(curves)} courbe(s))")
+
+        with self.conn:
+            self.conn.execute("DELETE FROM files WHERE path = ?", (path,))
+            cur = self.conn.execute(
+                "INSERT INTO files (path, format, instrument, size, acquired_at, indexed_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    path,
+                    fmt,
+                    FORMAT_INSTRUMENTS.get(fmt, fmt),
+                    stat.st_size if stat else None,
+                    acquired_at,
+                    time.time(),
+                ),
+            )
+            file_id = cur.lastrowid
+            for curve in curves:
+                y_min, y_max = _finite_range(curve.y)
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO curves (file_id, name, channel, sample_rate, length,"
+                    " y_min, y_max, acquired_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        file_id,
+                        curve.name,
+                        guess_channel(curve.name),
+                        estimate_sample_rate(curve.x),
+                        len(curve.y),
+                        y_min,
+                        y_max,
+                        acquired_at,
+                    ),
+                )
+        return file_id
+
+    def cache_arrays(self, path: str, curves: List[CurveData]) -> int:
+        """Copy the arrays of *path*'s indexed curves into the cache (background job).
+
+        Curves of *curves* that are not indexed for *path* are skipped; files
+        left unreferenced (by a re-index) are pruned. Returns the number of
+        curves cached.
+        """
+        path = os.path.abspath(path) if path else ""
+        rows = self.conn.execute(
+            "SELECT c.id, c.name FROM curves c JOIN files f ON f.id = c.file_id WHERE f.path = ?", (path,)
+        ).fetchall()
+        ids = {name: curve_id for curve_id, name in rows}
+        cached = 0
+        with self._cache_lock:
+            x_names = {}
+            for curve in curves:
+                curve_id = ids.get(curve.name)
+                if curve_id is None:
+                    continue
+                key = id(curve.x)
+                if key not in x_names:
+                    x_names[key] = self._cache_array(curve.x)
+                with self.conn:
+                    self.conn.execute(
+                        "UPDATE curves SET x_cache = ?, y_cache = ? WHERE id = ?",
+                        (x_names[key], self._cache_array(curve.y), curve_id),
+                    )
+                cached += 1
+            self._prune_unlocked()
+        logger.debug(f"💾 [CaptureLibrary.cache_arrays] {cached} courbe(s) en cache pour {path}")
+        return cached
+
+    def prune_cache(self) -> int:
+        """Delete the cache files no indexed curve refers to; returns how many."""
+        with self._cache_lock:
+            return self._prune_unlocked()
+
+    def _prune_unlocked(self) -> int:
+        rows = self.conn.execute(
+            "SELECT x_cache FROM curves WHERE x_cache IS NOT NULL"
+            " UNION SELECT y_cache FROM curves WHERE y_cache IS NOT NULL"
+        )
+        referenced = {r[0] for r in rows}
+        removed = 0
+        for entry in self.cache_dir.iterdir():
+            if entry.name not in referenced:
+                try:
+                    entry.unlink()
+                    removed += 1
+                except OSError as e:
+                    logger.warning(f"⚠️ [CaptureLibrary.prune_cache] {entry} : {e}")
+        return removed
+
+    # ------------------------------------------------------------------
+    # Recherche
+    # ------------------------------------------------------------------
+    def search(
+        self,
+        *,
+        name: Optional[str] = None,
+        channel: Optional[str] = None,
+        instrument: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        max_above: Optional[float] = None,
+        min_below: Optional[float] = None,
+        min_length: Optional[int] = None,
+        limit: int = 1000,
+    ) -> List[CaptureRecord]:
+        """Return captures matching every given criterion, newest first.
+
+        *name* accepts ``*`` wildcards; *since*/*until* are epoch seconds.
+        Only captures whose arrays are cached (reloadable) are listed.
+        """
+        clauses, params = ["c.y_cache IS NOT NULL"], []
+        if name:
+            clauses.append("c.name LIKE ?")
+            params.append(name.replace("*", "%"))
+        if channel:
+            clauses.append("c.channel = ?")
+            params.append(guess_channel(channel) or channel)
+        if instrument:
+            clauses.append("f.instrument = ?")
+            params.append(instrument)
+        if since is not None:
+            clauses.append("c.acquired_at >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("c.acquired_at <= ?")
+            params.append(until)
+        if max_above is not None:
+            clauses.append("c.y_max > ?")
+            params.append(max_above)
+        if min_below is not None:
+            clauses.append("c.y_min < ?")
+            params.append(min_below)
+        if min_length is not None:
+            clauses.append("c.length >= ?")
+            params.append(min_length)
+
+        where = f"WHERE {' AND '.join(clauses)}"
+        rows = self.conn.execute(
+            "SELECT c.id, c.name, f.path, f.instrument, c.channel, c.sample_rate, c.length,"
+            " c.y_min, c.y_max, c.acquired_at, c.x_cache, c.y_cache"
+            f" FROM curves c JOIN files f ON f.id = c.file_id {where}"
+            " ORDER BY c.acquired_at DESC, c.id LIMIT ?",
+            (*params, limit),
+        ).fetchall()
+        return [CaptureRecord(*row) for row in rows]
+
+    def instruments(self) -> List[str]:
+        rows = self.conn.execute(
+            "SELECT DISTINCT instrument FROM files WHERE instrument IS NOT NULL ORDER BY instrument"
+        )
+        return [r[0] for r in rows]
+
+    # ------------------------------------------------------------------
+    # Chargement
+    # ------------------------------------------------------------------
+    def load_curve(self, record: CaptureRecord) -> CurveData:
+        """Rebuild a curve from the cached arrays without re-parsing the source file."""
+        x = np.load(self.cache_dir / record.x_cache, mmap_mode="r")
+        y = np.load(self.cache_dir / record.y_cache, mmap_mode="r")
+        return CurveData(name=record.name, x=x, y=y, color=generate_random_color())
+
+
+_library: Optional[CaptureLibrary] = None
+_library_lock = threading.Lock()
+
+
+def get_capture_library() -> CaptureLibrary:
+    """Return the application-wide library, opening it on first use (any thread)."""
+    global _library
+    with _library_lock:
+        if _library is None:
+            _library = CaptureLibrary()
+        return _library
@@ -0,0 +1,274 @@
+"""Export CSV en flux (par blocs) des graphiques et projets.
+
+Les courbes sont écrites par blocs de lignes afin de garder une mémoire bornée
+quelle que soit la taille des données. Lorsque toutes les courbes partagent le
+même axe X, une seule colonne X est écrite ; sinon les axes sont fusionnés
+(union triée des abscisses) bloc par bloc, les valeurs absentes restant vides.
+Gain, offset, décalage temporel et courbes de bits dérivées sont appliqués à
+la volée sur chaque bloc. Le fichier est écrit à côté puis mis en place à la
+fin : un export annulé ou en échec laisse la cible telle qu'elle était.
+"""
+
+import csv
+import os
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from core.models import CurveData, GraphData
+from core.bit_curves import bit_values
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 250_000
+
+ProgressCallback = Callable[[float], None]
+CancelCallback = Callable[[], bool]
+
+
+@dataclass
+class _Column:
+    """One exported column: raw X axis plus a per-chunk value provider."""
+
+    header: str
+    curve: CurveData
+    x: np.ndarray
+    time_offset: float
+    source: Optional[CurveData] = None  # parent curve for derived bit curves
+
+    def values(self, start: int, stop: int, order: Optional[np.ndarray] = None) -> np.ndarray:
+        """Return transformed Y values for rows ``start:stop``."""
+        curve = self.curve
+        if self.source is not None:
+            raw = self.source.y[start:stop] if order is None else self.source.y[order[start:stop]]
+            y = bit_values(raw, curve.derived_bits)
+        else:
+            raw = curve.y[start:stop] if order is None else curve.y[order[start:stop]]
+            y = np.asarray(raw, dtype=np.float64)
+        return curve.gain * y + curve.offset
+
+
+def _build_columns(graph: GraphData, prefix: str = "") -> List[_Column]:
+    by_name = {c.name: c for c in graph.curves}
+    columns = []
+    for curve in graph.curves:
+        source = None
+        if curve.derived_bits and curve.parent_curve in by_name:
+            parent = by_name[curve.parent_curve]
+            if len(parent.y) == len(curve.x):
+                source = parent
+        columns.append(
+            _Column(
+                header=f"{prefix}{curve.name}",
+                curve=curve,
+                x=curve.x,
+                time_offset=curve.time_offset,
+                source=source,
+            )
+        )
+    return columns
+
+
+def _same_axis(a: np.ndarray, b: np.ndarray, chunk_size: int) -> bool:
+    """Compare two X arrays chunk by chunk (NaN-aware)."""
+    if a is b:
+        return True
+    if len(a) != len(b):
+        return False
+    for start in range(0, len(a), chunk_size):
+        stop = start + chunk_size
+        if not np.array_equal(a[start:stop], b[start:stop], equal_nan=True):
+            return False
+    return True
+
+
+def _is_sorted(x: np.ndarray, chunk_size: int) -> bool:
+    """Return ``True`` when *x* is non-decreasing (any NaN makes it unsorted)."""
+    for start in range(0, len(x), chunk_size):
+        # overlap by one sample so chunk boundaries are checked too
+        part = x[max(start - 1, 0) : start + chunk_size]
+        if part.size > 1 and not np.all(part[1:] >= part[:-1]):
+            return False
+    return True
+
+
+def _write_header(handle, headers: List[str], sep: str):
+    csv.writer(handle, delimiter=sep, lineterminator="\n").writerow(headers)
+
+
+def _write_block(handle, arrays: List[np.ndarray], sep: str, decimal: str):
+    """Format a block of columns in one C-level ``%`` operation.
+
+    ``repr`` keeps the shortest round-trip representation of each float;
+    NaN values are written as empty cells.
+    """
+    rows = len(arrays[0])
+    if not rows:
+        return
+    line = sep.join(["%r"] * len(arrays)) + "\n"
+    values = np.column_stack(arrays).ravel().tolist()
+    text = (line * rows) % tuple(values)
+    text = text.replace("nan", "")
+    if decimal != ".":
+        text = text.replace(".", decimal)
+    handle.write(text)
+
+
+def _write_shared(columns, handle, sep, decimal, chunk_size, progress, is_cancelled) -> bool:
+    x = columns[0].x
+    offset = columns[0].time_offset
+    total = len(x)
+    headers = ["x"] + [c.header for c in columns]
+    for start in range(0, max(total, 1), chunk_size):
+        if is_cancelled and is_cancelled():
+            return False
+        stop = min(start + chunk_size, total)
+        if start == 0:
+            _write_header(handle, headers, sep)
+        arrays = [np.asarray(x[start:stop], dtype=np.float64) + offset]
+        arrays.extend(col.values(start, stop) for col in columns)
+        _write_block(handle, arrays, sep, decimal)
+        if progress:
+            progress(stop / total if total else 1.0)
+    return True
+
+
+def _write_merged(columns, handle, sep, decimal, chunk_size, progress, is_cancelled) -> bool:
+    """k-way merge of the X axes, one bounded window at a time."""
+    axes = []
+    orders = []
+    for col in columns:
+        x = col.x
+        order = None
+        if not _is_sorted(x, chunk_size):
+            logger.debug(f"🔀 [_write_merged] Axe X non trié pour '{col.header}', tri préalable")
+            order = np.argsort(x, kind="stable")
+            x = x[order]
+        # NaN abscissae cannot be placed on a merged axis: they sort last, drop them
+        n_valid = int(np.searchsorted(x, np.nan)) if len(x) else 0
+        axes.append((x, n_valid))
+        orders.append(order)
+
+    cursors = [0] * len(columns)
+    total = sum(n for _, n in axes) or 1
+    _write_header(handle, ["x"] + [c.header for c in columns], sep)
+
+    while True:
+        if is_cancelled and is_cancelled():
+            return False
+        active = [i for i, (_, n) in enumerate(axes) if cursors[i] < n]
+        if not active:
+            break
+        bound = min(
+            axes[i][0][min(cursors[i] + chunk_size, axes[i][1]) - 1] + columns[i].time_offset
+            for i in active
+        )
+        slices = {}
+        for i in active:
+            x, n = axes[i]
+            cur = cursors[i]
+            window = x[cur : min(cur + chunk_size, n)]
+            end = cur + int(np.searchsorted(window, bound - columns[i].time_offset, side="right"))
+            slices[i] = (cur, end)
+        parts = {
+            i: np.asarray(axes[i][0][a:b], dtype=np.float64) + columns[i].time_offset
+            for i, (a, b) in slices.items()
+        }
+        values = np.unique(np.concatenate(list(parts.values())))
+        # A value repeated in a column gets one row per repetition, as on a shared axis
+        repeats = np.ones(len(values), dtype=np.int64)
+        for xs in parts.values():
+            uniq, counts = np.unique(xs, return_counts=True)
+            pos = np.searchsorted(values, uniq)
+            repeats[pos] = np.maximum(repeats[pos], counts)
+        first_row = np.cumsum(repeats) - repeats
+        merged = np.repeat(values, repeats)
+        arrays = [merged]
+        for i, col in enumerate(columns):
+            out = np.full(len(merged), np.nan)
+            if i in slices:
+                a, b = slices[i]
+                xs = parts[i]
+                rank = np.arange(len(xs)) - np.searchsorted(xs, xs, side="left")
+                out[first_row[np.searchsorted(values, xs)] + rank] = col.values(a, b, orders[i])
+                cursors[i] = b
+            arrays.append(out)
+        _write_block(handle, arrays, sep, decimal)
+        if progress:
+            progress(min(sum(cursors) / total, 1.0))
+    return True
+
+
+def _export_columns(
+    columns: List[_Column],
+    path: str,
+    sep: str,
+    decimal: str,
+    chunk_size: int,
+    progress: Optional[ProgressCallback],
+    is_cancelled: Optional[CancelCallback],
+) -> bool:
+    if sep == decimal:
+        raise ValueError("Le séparateur et le symbole décimal doivent être différents.")
+    if not columns:
+        raise ValueError("Aucune courbe à exporter.")
+
+    shared = all(
+        c.time_offset == columns[0].time_offset and _same_axis(c.x, columns[0].x, chunk_size)
+        for c in columns[1:]
+    )
+    logger.debug(
+        f"📤 [_export_columns] {len(columns)} colonne(s) → {path} (axe X {'partagé' if shared else 'fusionné'})"
+    )
+    writer = _write_shared if shared else _write_merged
+    tmp = f"{path}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8", newline="") as handle:
+            done = writer(columns, handle, sep, decimal, chunk_size, progress, is_cancelled)
+        if done:
+            os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)  # cancelled or failed: no partial file
+    if not done:
+        logger.debug(f"⛔️ [_export_columns] Export annulé : {path}")
+    return done
+
+
+def export_graph_to_csv(
+    graph: GraphData,
+    path: str,
+    sep: str = ";",
+    decimal: str = ",",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    progress: Optional[ProgressCallback] = None,
+    is_cancelled: Optional[CancelCallback] = None,
+) -> bool:
+    """Exporte les courbes d'un graphique vers un fichier CSV.
+
+    Retourne ``False`` si l'export a été annulé via *is_cancelled*.
+    """
+    return _export_columns(
+        _build_columns(graph), path, sep, decimal, chunk_size, progress, is_cancelled
+    )
+
+
+def export_project_to_csv(
+    graphs: Dict[str, GraphData],
+    path: str,
+    sep: str = ";",
+    decimal: str = ",",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    progress: Optional[ProgressCallback] = None,
+    is_cancelled: Optional[CancelCallback] = None,
+) -> bool:
+    """Exporte toutes les courbes d'un projet dans un seul fichier CSV.
+
+    Les en-têtes de colonnes sont préfixés par le nom du graphique.
+    """
+    columns = []
+    for graph in graphs.values():
+        columns.extend(_build_columns(graph, prefix=f"{graph.name} - "))
+    return _export_columns(columns, path, sep, decimal, chunk_size, progress, is_cancelled)
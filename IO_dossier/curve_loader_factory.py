@@ -13,9 +13,13 @@ from collections import namedtuple
 import numpy as np
 from ui.dialogs.curve_selection_dialog import CurveSelectionDialog
 from .RTxReadBin import RTxReadBin
+from .capture_library import get_capture_library
+import logging
 
+logger = logging.getLogger(__name__)
 
-def _select_curves(curves: List[CurveData]) -> List[CurveData]:
+
+def select_curves(curves: List[CurveData]) -> List[CurveData]:
     """Display dialog to let the user pick which curves to import."""
     if not curves:
         return []
@@ -29,6 +33,17 @@ def load_curve_by_format(
     path: str, fmt: str, *, sep: str = ",", mode: TimeMode = TimeMode.NUMERIC
 ) -> List[CurveData]:
     """Load curves according to the given format and ask the user which ones to keep."""
+    return select_curves(parse_curves_by_format(path, fmt, sep, mode))
+
+
+def parse_curves_by_format(
+    path: str, fmt: str, sep: str = ",", mode: TimeMode = TimeMode.NUMERIC
+) -> List[CurveData]:
+    """Parse *path* and index it in the capture library, without any dialog.
+
+    Safe to run off the GUI thread (import jobs); the selection dialog is
+    shown afterwards by :func:`select_curves`.
+    """
     if isinstance(mode, str):
         mode = TimeMode(mode)
     if fmt == "internal_json":
@@ -50,7 +65,33 @@ def load_curve_by_format(
     else:
         raise ValueError(f"Format inconnu : {fmt}")
 
-    return _select_curves(curves)
+    _index_in_library(path, fmt, curves)
+    return curves
+
+
+def _index_in_library(path: str, fmt: str, curves: List[CurveData]):
+    """Record the parsed file's metadata in the capture library; never fails the import.
+
+    The arrays are copied later by :func:`cache_in_library`, in its own job.
+    """
+    if not curves:
+        return
+    try:
+        get_capture_library().index_file(path, fmt, curves)
+    except Exception as e:
+        logger.warning(f"⚠️ [_index_in_library] Indexation impossible pour {path} : {e}")
+
+
+def cache_in_library(path: str, curves: List[CurveData]) -> int:
+    """Copy the arrays of an imported file into the capture library (background job).
+
+    Only reads *curves*. Returns the number of curves cached.
+    """
+    try:
+        return get_capture_library().cache_arrays(path, curves)
+    except Exception as e:
+        logger.warning(f"⚠️ [cache_in_library] Mise en cache impossible pour {path} : {e}")
+        return 0
 
 
 def load_internal_json(path: str) -> CurveData:
@@ -14,6 +14,7 @@ class TimeMode(Enum):
     TIMESTAMP_ABSOLUTE = "timestamp_absolute"  # Parse timestamps as seconds since epoch.
 
 from core.models import CurveData, DataType
+from core.curve_stats import compute_curve_stats
 from core.utils import generate_random_color
 import logging
 
@@ -24,16 +25,7 @@ def suggest_dtype(array: pd.Series | pd.Index | pd.DataFrame | list) -> DataType
     """Return a suggested DataType for the given numeric values."""
     import numpy as np
 
-    arr = np.asarray(array)
-    if np.all(np.isfinite(arr)) and np.allclose(arr, np.round(arr)) and np.all(arr >= 0):
-        max_val = int(arr.max()) if arr.size else 0
-        if max_val <= 0xFF:
-            return DataType.UINT8
-        if max_val <= 0xFFFF:
-            return DataType.UINT16
-        if max_val <= 0xFFFFFFFF:
-            return DataType.UINT32
-    return DataType.FLOAT64
+    return compute_curve_stats(None, np.asarray(array)).suggested_dtype()
 
 
 def _curves_from_dataframe(df: pd.DataFrame, mode: TimeMode) -> List[CurveData]:
@@ -74,15 +66,17 @@ def _curves_from_dataframe(df: pd.DataFrame, mode: TimeMode) -> List[CurveData]:
         logger.debug(
             f"📈 [_curves_from_dataframe] Courbe '{col}' avec {len(x)} points"
         )
-        curves.append(
-            CurveData(
-                name=col,
-                x=x,
-                y=y_data,
-                dtype=suggest_dtype(y_data),
-                color=generate_random_color(),
-            )
+        # One pass gives both the suggested type and the cached statistics
+        stats = compute_curve_stats(x, y_data)
+        curve = CurveData(
+            name=col,
+            x=x,
+            y=y_data,
+            dtype=stats.suggested_dtype(),
+            color=generate_random_color(),
         )
+        curve.seed_cache("stats", stats)
+        curves.append(curve)
 
     return curves
 
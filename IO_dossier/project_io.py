@@ -1,16 +1,44 @@
-
+import copy
 import json
+import os
 from typing import Dict
 from core.models import GraphData
+from .array_store import ProjectArrayStore
 from .serializers import project_to_dict, dict_to_project
 
+def snapshot_project(graphs: Dict[str, GraphData]) -> Dict[str, GraphData]:
+    """Copy of *graphs* that a job can serialise while the GUI keeps editing.
+
+    Graphs, curves and annotations are deep-copied; the data arrays (always
+    replaced, never modified in place) and the derived-data caches are
+    shared, so that taking the snapshot copies no samples.
+    """
+    memo = {}
+    for graph in graphs.values():
+        for curve in graph.curves:
+            for name in ("x", "y", "_derived_cache", "_lazy_lock"):
+                value = curve.__dict__.get(name)
+                if value is not None:
+                    memo[id(value)] = value
+    return copy.deepcopy(graphs, memo)
+
+
 def export_project_to_json(graphs: Dict[str, GraphData], path: str):
-    """Exporte un projet (ensemble de graphiques) vers un fichier JSON."""
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(project_to_dict(graphs), f, indent=2)
+    """Exporte un projet (ensemble de graphiques) vers un fichier JSON.
+
+    Les gros tableaux, les statistiques et les niveaux de décimation sont
+    rangés dans le dossier ``<projet>.data/`` voisin.
+    """
+    store = ProjectArrayStore.for_project(path)
+    data = project_to_dict(graphs, store)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp, path)
+    store.prune()
 
 def import_project_from_json(path: str) -> Dict[str, GraphData]:
     """Importe un projet (ensemble de graphiques) depuis un fichier JSON."""
     with open(path, "r", encoding="utf-8") as f:
         data = json.load(f)
-    return dict_to_project(data)
+    return dict_to_project(data, ProjectArrayStore.for_project(path))
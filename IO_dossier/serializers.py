@@ -1,15 +1,40 @@
 
 import numpy as np
-from typing import List, Dict
+from typing import List, Dict, Optional
+from core.annotations import AnnotationStore
 from core.models import CurveData, GraphData
 from core.utils import generate_random_color
+from core.bit_curves import bit_source_matches, rebind_bit_curve
+from core.curve_stats import CurveStats, get_curve_stats
+from core.lod import LOD_MIN_POINTS, get_lod
+from .array_store import ProjectArrayStore, array_digest, data_signature
+import logging
 
+logger = logging.getLogger(__name__)
 
-def curve_to_dict(curve: CurveData) -> dict:
-    return {
+
+def curve_to_dict(curve: CurveData, store: Optional[ProjectArrayStore] = None) -> dict:
+    if store is None:
+        x, y = curve.x.tolist(), curve.y.tolist()
+    else:
+        x = store.array_to_json(curve.x, curve.cached("digest_x", lambda c: array_digest(c.x)))
+        y = store.array_to_json(curve.y, curve.cached("digest_y", lambda c: array_digest(c.y)))
+    data = {
         "name": curve.name,
-        "x": curve.x.tolist(),
-        "y": curve.y.tolist(),
+        "x": x,
+        "y": y,
+        **_curve_style_to_dict(curve),
+        "parent_curve": curve.parent_curve,
+        "bit_index": curve.bit_index,
+        "bit_indices": curve.bit_indices,
+    }
+    if store is not None:
+        data["derived"] = _derived_to_dict(curve, x, y, store)
+    return data
+
+
+def _curve_style_to_dict(curve: CurveData) -> dict:
+    return {
         "color": curve.color,
         "width": curve.width,
         "style": curve.style,
@@ -19,23 +44,79 @@ def curve_to_dict(curve: CurveData) -> dict:
         "symbol": curve.symbol,
         "fill": curve.fill,
         "display_mode": curve.display_mode,
+        "bar_aggregate": curve.bar_aggregate,
         "gain": curve.gain,
         "units_per_grid": curve.units_per_grid,
         "gain_mode": curve.gain_mode,
         "offset": curve.offset,
         "time_offset": curve.time_offset,
-        "show_zero_line": curve.show_zero_line,
+        "show_zero_line": getattr(curve, "show_zero_line", False),
         "label_mode": curve.label_mode,
         "zero_indicator": curve.zero_indicator
 
     }
 
 
+def _bit_recipe_to_dict(curve: CurveData) -> dict:
+    """Derived bit curve saved as parent + bits + style, without its arrays."""
+    if curve.bit_index is not None:
+        recipe = {"parent": curve.parent_curve, "bit_index": curve.bit_index}
+    else:
+        recipe = {"parent": curve.parent_curve, "bit_indices": list(curve.bit_indices)}
+    return {"name": curve.name, "recipe": recipe, **_curve_style_to_dict(curve)}
+
+
+def _bit_recipe_to_curve(cdict: dict, parent: CurveData) -> CurveData:
+    """Rebuild a derived bit curve; its data is computed on first access."""
+    recipe = cdict["recipe"]
+    curve = dict_to_curve(dict(cdict, x=[], y=[]))
+    curve.parent_curve = parent.name
+    curve.bit_index = recipe.get("bit_index")
+    curve.bit_indices = recipe.get("bit_indices")
+    rebind_bit_curve(curve, parent)
+    return curve
+
+
+def _derived_to_dict(curve: CurveData, x, y, store: ProjectArrayStore) -> dict:
+    """Statistics and decimation levels saved with the arrays they derive from."""
+    version = data_signature(x, y)
+    derived = {"version": version, "stats": get_curve_stats(curve).to_dict()}
+    if len(curve.y) >= LOD_MIN_POINTS:
+        pyr = get_lod(curve)
+        if pyr is not None:
+            derived["lod"] = store.put_lod(pyr, version)
+    return derived
+
+
+def _seed_derived(curve: CurveData, cdict: dict, store: ProjectArrayStore):
+    """Reuse saved statistics/LOD when they match the loaded arrays."""
+    derived = cdict.get("derived")
+    if not derived or derived.get("version") != data_signature(cdict["x"], cdict["y"]):
+        return
+    stats = CurveStats.from_dict(derived.get("stats", {}))
+    if stats is None or stats.length != len(curve.y):
+        return
+    curve.seed_cache("stats", stats)
+    if derived.get("lod"):
+        pyr = store.get_lod(derived["lod"])
+        if pyr is not None and pyr.length == len(curve.y):
+            curve.seed_cache("lod", pyr)
+
+
+def _load_curve(cdict: dict, store: Optional[ProjectArrayStore] = None) -> CurveData:
+    if store is None:
+        return dict_to_curve(cdict)
+    resolved = dict(cdict, x=store.json_to_array(cdict["x"]), y=store.json_to_array(cdict["y"]))
+    curve = dict_to_curve(resolved)
+    _seed_derived(curve, cdict, store)
+    return curve
+
+
 def dict_to_curve(data: dict) -> CurveData:
     color = data.get("color")
     if not color or color.lower() in {"#000000", "black", "#ffffff", "white", "b", "w"}:
         color = generate_random_color()
-    return CurveData(
+    curve = CurveData(
         name=data["name"],
         x=data["x"],
         y=data["y"],
@@ -48,22 +129,34 @@ def dict_to_curve(data: dict) -> CurveData:
         symbol=data.get("symbol"),
         fill=data.get("fill", False),
         display_mode=data.get("display_mode", "line"),
+        bar_aggregate=data.get("bar_aggregate", "max"),
         gain=data.get("gain", 1.0),
         units_per_grid=data.get("units_per_grid", 1.0),
         gain_mode=data.get("gain_mode", "multiplier"),
         offset=data.get("offset", 0.0),
         time_offset=data.get("time_offset", 0.0),
-        show_zero_line=data.get("show_zero_line", False),
-        show_label=data.get("show_label", False),
         label_mode=data.get("label_mode", "none"),
-        zero_indicator=data.get("zero_indicator", "none")
+        zero_indicator=data.get("zero_indicator", "none"),
+        bit_index=data.get("bit_index"),
+        parent_curve=data.get("parent_curve"),
+        bit_indices=data.get("bit_indices"),
+    )
+    # Not dataclass fields: kept as plain attributes for round-tripping
+    curve.show_zero_line = data.get("show_zero_line", False)
+    curve.show_label = data.get("show_label", False)
+    return curve
 
 
-    )
+def _is_recipe(curve: CurveData, sources: Dict[str, CurveData]) -> bool:
+    parent = sources.get(curve.parent_curve)
+    return bool(curve.derived_bits) and parent is not None and bit_source_matches(curve, parent)
 
 
-def graph_to_dict(graph: GraphData) -> dict:
-    return {
+def graph_to_dict(graph: GraphData, store: Optional[ProjectArrayStore] = None) -> dict:
+    # Bit curves whose parent is saved in the same graph, with the data they
+    # were taken from, are stored as recipes
+    sources = {c.name: c for c in graph.curves if not c.derived_bits}
+    data = {
         "name": graph.name,
         "properties": {
             "grid_visible": graph.grid_visible,
@@ -78,17 +171,32 @@ def graph_to_dict(graph: GraphData) -> dict:
             "y_max": graph.y_max,
             "mouse_enabled_x": graph.mouse_enabled_x,
             "mouse_enabled_y": graph.mouse_enabled_y,
+            "batch_curves": graph.batch_curves,
+            "x_link_group": graph.x_link_group,
+            "lane_height_px": graph.lane_height_px,
+            "cursors_vertical": graph.cursors_vertical,
+            "cursors_horizontal": graph.cursors_horizontal,
+            "adaptive_rendering": graph.adaptive_rendering,
+            "render_budget_ms": graph.render_budget_ms,
+            "render_idle_ms": graph.render_idle_ms,
+            "render_overlay": graph.render_overlay,
             "x_unit": graph.x_unit,
             "y_unit": graph.y_unit,
             "x_format": graph.x_format,
             "y_format": graph.y_format,
             "mode": graph.mode
         },
-        "curves": [curve_to_dict(c) for c in graph.curves]
+        "curves": [
+            _bit_recipe_to_dict(c) if _is_recipe(c, sources) else curve_to_dict(c, store)
+            for c in graph.curves
+        ]
     }
+    if len(graph.annotations):
+        data["annotations"] = graph.annotations.to_dict(store)
+    return data
 
 
-def dict_to_graph(data: dict) -> GraphData:
+def dict_to_graph(data: dict, store: Optional[ProjectArrayStore] = None) -> GraphData:
     g = GraphData(name=data["name"])
     props = data.get("properties", {})
     g.grid_visible = props.get("grid_visible", False)
@@ -103,28 +211,49 @@ def dict_to_graph(data: dict) -> GraphData:
     g.y_max = props.get("y_max", 5.0)
     g.mouse_enabled_x = props.get("mouse_enabled_x", True)
     g.mouse_enabled_y = props.get("mouse_enabled_y", True)
+    g.batch_curves = props.get("batch_curves", False)
+    g.x_link_group = props.get("x_link_group", "")
+    g.lane_height_px = props.get("lane_height_px", 24)
+    g.cursors_vertical = props.get("cursors_vertical", False)
+    g.cursors_horizontal = props.get("cursors_horizontal", False)
+    g.adaptive_rendering = props.get("adaptive_rendering", True)
+    g.render_budget_ms = props.get("render_budget_ms", 25.0)
+    g.render_idle_ms = props.get("render_idle_ms", 150)
+    g.render_overlay = props.get("render_overlay", False)
     g.x_unit = props.get("x_unit", "")
     g.y_unit = props.get("y_unit", "")
     g.x_format = props.get("x_format", "normal")
     g.y_format = props.get("y_format", "normal")
     g.mode = props.get("mode", "standard")
+    g.annotations = AnnotationStore.from_dict(data.get("annotations"), store)
 
+    curves = [None if "recipe" in cdict else _load_curve(cdict, store) for cdict in data.get("curves", [])]
+    by_name = {c.name: c for c in curves if c is not None}
+    for i, cdict in enumerate(data.get("curves", [])):
+        if "recipe" not in cdict:
+            continue
+        parent = by_name.get(cdict["recipe"].get("parent"))
+        if parent is None:
+            logger.warning(f"⚠️ [dict_to_graph] Courbe parente introuvable pour '{cdict['name']}'")
+            continue
+        curves[i] = _bit_recipe_to_curve(cdict, parent)
 
-    for cdict in data.get("curves", []):
-        g.add_curve(dict_to_curve(cdict))
+    for curve in curves:
+        if curve is not None:
+            g.add_curve(curve)
     return g
 
 
-def project_to_dict(graphs: Dict[str, GraphData]) -> dict:
+def project_to_dict(graphs: Dict[str, GraphData], store: Optional[ProjectArrayStore] = None) -> dict:
     return {
         "version": 1,
-        "graphs": [graph_to_dict(g) for g in graphs.values()]
+        "graphs": [graph_to_dict(g, store) for g in graphs.values()]
     }
 
 
-def dict_to_project(data: dict) -> Dict[str, GraphData]:
+def dict_to_project(data: dict, store: Optional[ProjectArrayStore] = None) -> Dict[str, GraphData]:
     graphs = {}
     for gdict in data.get("graphs", []):
-        g = dict_to_graph(gdict)
+        g = dict_to_graph(gdict, store)
         graphs[g.name] = g
     return graphs
@@ -1,12 +1,14 @@
 # controllers.py
 
 from core.app_state import AppState
-from core.graph_service import GraphService
+from core.graph_service import GraphService, compute_bit_values
+from core.job_service import BACKGROUND, INTERACTIVE, Job, JobService
 from curve_generators import generate_random_curve
 from ui.graph_ui_coordinator import GraphUICoordinator
 from signal_bus import signal_bus
 from typing import Optional
 import logging
+import os
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +17,7 @@ class GraphController:
         logger.debug("🧠 [GraphController.__init__] Initialisation du contrôleur")
         self.state = AppState.get_instance()
         self.service = GraphService(self.state)
+        self.jobs = JobService(self.state)
         try:
             self.ui = GraphUICoordinator(
                 self.state, views, central_area, properties_panel
@@ -28,9 +31,7 @@ class GraphController:
     def load_project(self, graphs: dict):
         logger.debug("📂 [GraphController.load_project] Chargement du projet...")
         logger.debug(f"📊 [GraphController.load_project] Graphiques reçus : {list(graphs.keys())}")
-        self.state.graphs = graphs
-        self.state.current_graph = None
-        self.state.current_curve = None
+        self.service.load_graphs(graphs)
         self.ui.refresh_plot()
 
     def add_graph(self, name: str = None):
@@ -108,6 +109,66 @@ class GraphController:
         self.ui.refresh_plot()
         return names
 
+    def create_bit_curves_in_background(self, curve_name: str, bit_count: Optional[int] = None):
+        """Same as :meth:`create_bit_curves`, the bits being computed by a job.
+
+        The source is checked right away (``ValueError`` as usual); the
+        curves are added once the job is done. Returns the job handle.
+        """
+        curve, bit_count = self.service.bit_source(curve_name, bit_count)
+        graph_name = self.state.current_graph.name
+        logger.debug(f"🔬 [GraphController.create_bit_curves_in_background] {curve_name} → {bit_count} bits")
+
+        def apply(state, values):
+            if state.current_graph is None or state.current_graph.name != graph_name:
+                raise ValueError(f"Le graphique '{graph_name}' n'est plus sélectionné")
+            self.service.create_bit_curves(curve_name, bit_count, values)
+            signal_bus.curve_list_updated.emit()
+            signal_bus.curve_updated.emit()
+            self.ui.refresh_plot()
+
+        return self.jobs.submit(Job(
+            name=f"Bits de {curve_name}",
+            run=compute_bit_values,
+            inputs=(curve, bit_count),
+            outputs=(f"graph:{graph_name}",),
+            apply=apply,
+            priority=INTERACTIVE,
+            reports_progress=True,
+            key=("bits", graph_name, curve_name, bit_count),
+        ))
+
+    def import_curves_in_background(self, graph_name: str, path: str, fmt: str, sep: str = ",", mode="numeric"):
+        """Parse a curve file in a job, then let the user pick the curves to add."""
+        from IO_dossier.curve_loader_factory import cache_in_library, parse_curves_by_format, select_curves
+
+        logger.debug(f"📥 [GraphController.import_curves_in_background] {path} ({fmt}) → {graph_name}")
+
+        def apply(state, curves):
+            # The capture library copies the arrays afterwards, without delaying the import
+            if curves:
+                self.jobs.submit(Job(
+                    name=f"Bibliothèque : {os.path.basename(path)}",
+                    run=cache_in_library,
+                    inputs=(path, curves),
+                    priority=BACKGROUND,
+                ))
+            names = self.service.add_curves(graph_name, select_curves(curves))
+            if names:
+                signal_bus.curve_selected.emit(graph_name, names[-1])
+            signal_bus.curve_list_updated.emit()
+            signal_bus.curve_updated.emit()
+            self.ui.refresh_plot()
+
+        return self.jobs.submit(Job(
+            name=f"Import de {os.path.basename(path)}",
+            run=parse_curves_by_format,
+            inputs=(path, fmt, sep, mode),
+            outputs=(f"graph:{graph_name}",),
+            apply=apply,
+            priority=INTERACTIVE,
+        ))
+
     def create_bit_group_curve(
         self, curve_name: str, bit_indices: list[int], group_name: Optional[str] = None
     ):
@@ -140,6 +201,22 @@ class GraphController:
         logger.debug(f"🌒 [GraphController.set_dark_mode] {enabled}")
         self._apply_graph_update(self.service.set_dark_mode, enabled)
 
+    def set_batch_curves(self, enabled: bool):
+        logger.debug(f"🧺 [GraphController.set_batch_curves] {enabled}")
+        self._apply_graph_update(self.service.set_batch_curves, enabled)
+
+    def set_adaptive_rendering(self, enabled: bool):
+        logger.debug(f"🎚 [GraphController.set_adaptive_rendering] {enabled}")
+        self._apply_graph_update(self.service.set_adaptive_rendering, enabled)
+
+    def set_render_thresholds(self, budget_ms: float, idle_ms: int):
+        logger.debug(f"⏱ [GraphController.set_render_thresholds] {budget_ms} ms / {idle_ms} ms")
+        self._apply_graph_update(self.service.set_render_thresholds, budget_ms, idle_ms)
+
+    def set_render_overlay(self, visible: bool):
+        logger.debug(f"🐞 [GraphController.set_render_overlay] {visible}")
+        self._apply_graph_update(self.service.set_render_overlay, visible)
+
     def set_log_x(self, enabled: bool):
         logger.debug(f"📈 [GraphController.set_log_x] {enabled}")
         self._apply_graph_update(self.service.set_log_x, enabled)
@@ -148,6 +225,26 @@ class GraphController:
         logger.debug(f"📉 [GraphController.set_log_y] {enabled}")
         self._apply_graph_update(self.service.set_log_y, enabled)
 
+    def set_x_link_group(self, group: str):
+        logger.debug(f"🔗 [GraphController.set_x_link_group] {group!r}")
+        self._apply_graph_update(self.service.set_x_link_group, group)
+
+    def set_lane_height(self, height_px: int):
+        logger.debug(f"🎚 [GraphController.set_lane_height] {height_px} px")
+        self._apply_graph_update(self.service.set_lane_height, height_px)
+
+    def set_measurement_cursors(self, vertical: bool, horizontal: bool):
+        logger.debug(f"📍 [GraphController.set_measurement_cursors] X={vertical} Y={horizontal}")
+        self._apply_graph_update(self.service.set_measurement_cursors, vertical, horizontal)
+
+    def add_annotations(self, starts, ends=None, kind: str = "event", labels=None):
+        logger.debug(f"🔖 [GraphController.add_annotations] {len(starts)} × {kind}")
+        self._apply_graph_update(self.service.add_annotations, starts, ends, kind, labels)
+
+    def clear_annotations(self, kind=None):
+        logger.debug(f"🔖 [GraphController.clear_annotations] type={kind}")
+        self._apply_graph_update(self.service.clear_annotations, kind)
+
     def set_x_unit(self, unit: str):
         logger.debug(f"📏 [GraphController.set_x_unit] {unit}")
         self._apply_graph_update(self.service.set_x_unit, unit)
@@ -263,9 +360,10 @@ class GraphController:
 
     def set_curve_visible(self, graph_name: str, curve_name: str, visible: bool):
         logger.debug(f"👁 [GraphController.set_curve_visible] {curve_name} in {graph_name} → {visible}")
-        self._apply_graph_update(
-            self.service.set_curve_visible, graph_name, curve_name, visible
-        )
+        self.service.set_curve_visible(graph_name, curve_name, visible)
+        signal_bus.graph_updated.emit()
+        # Only the curve's view is redrawn (a batched curve is just masked)
+        self.ui.refresh_curve(graph_name, curve_name, {"visible"})
         signal_bus.curve_updated.emit()
 
     def set_opacity(self, value: float):
@@ -323,6 +421,11 @@ class GraphController:
         self.service.set_display_mode(mode)
         self.ui.refresh_curve_ui()
 
+    def set_bar_aggregate(self, how: str):
+        logger.debug(f"📊 [GraphController.set_bar_aggregate] Agrégation des barres = {how}")
+        self.service.set_bar_aggregate(how)
+        self.ui.refresh_curve_ui()
+
     def set_label_mode(self, mode: str):
         logger.debug(f"🏷 [GraphController.set_label_mode] Mode étiquette = {mode}")
         self.service.set_label_mode(mode)
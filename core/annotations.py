@@ -0,0 +1,234 @@
+# core/annotations.py
+
+"""Annotations d'un graphe : événements et intervalles typés, indexés par X.
+
+Résultats de recherche, sorties de décodeurs ou mesures produisent des
+dizaines de milliers de repères : ils sont rangés dans des tableaux triés
+par début (début, fin, type, libellé), accompagnés du maximum cumulé des
+fins. Trouver les annotations d'une fenêtre ``[x0, x1]`` revient alors à
+deux recherches dichotomiques, quel que soit leur nombre. Les types et les
+libellés sont des codes entiers vers deux tables de chaînes, ce qui permet
+d'enregistrer le tout sous forme de quelques tableaux compacts.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+KIND_DTYPE = np.int16
+LABEL_DTYPE = np.int32
+
+
+@dataclass
+class AnnotationClusters:
+    """Annotations of a window, reduced to what fits the pixel grid."""
+
+    singles: np.ndarray  # indices of the annotations drawn individually
+    x0: np.ndarray  # extent of each cluster
+    x1: np.ndarray
+    count: np.ndarray  # annotations merged in each cluster
+
+    def __len__(self):
+        return len(self.singles) + len(self.count)
+
+
+class AnnotationStore:
+    """Typed events (``end == start``) and spans of one graph, sorted by start.
+
+    Additions are buffered and merged on the next query, so adding results
+    one by one does not re-sort the arrays each time.
+    """
+
+    def __init__(self):
+        self.kinds: List[str] = []
+        self.labels: List[str] = [""]
+        self._kind_codes: Dict[str, int] = {}
+        self._label_codes: Dict[str, int] = {"": 0}
+        self._start = np.empty(0)
+        self._end = np.empty(0)
+        self._kind = np.empty(0, dtype=KIND_DTYPE)
+        self._label = np.empty(0, dtype=LABEL_DTYPE)
+        self._max_end = np.empty(0)  # running max of the ends (spans overlap)
+        self._pending: List[tuple] = []
+        self.version = 0
+
+    def __len__(self):
+        return len(self._start) + sum(len(chunk[0]) for chunk in self._pending)
+
+    # ------------------------------------------------------------------
+    # Ajout / suppression
+    # ------------------------------------------------------------------
+    def kind_code(self, kind: str) -> int:
+        code = self._kind_codes.get(kind)
+        if code is None:
+            code = self._kind_codes[kind] = len(self.kinds)
+            self.kinds.append(kind)
+        return code
+
+    def _label_code(self, label: str) -> int:
+        code = self._label_codes.get(label)
+        if code is None:
+            code = self._label_codes[label] = len(self.labels)
+            self.labels.append(label)
+        return code
+
+    def add(self, start: float, end: Optional[float] = None, kind: str = "event", label: str = ""):
+        self.add_many([start], None if end is None else [end], kind, [label])
+
+    def add_many(self, starts, ends=None, kind: str = "event", labels: Optional[Sequence[str]] = None):
+        """Add annotations of one *kind*; *ends* omitted for point events."""
+        starts = np.asarray(starts, dtype=np.float64).ravel()
+        ends = starts.copy() if ends is None else np.asarray(ends, dtype=np.float64).ravel()
+        if len(ends) != len(starts):
+            raise ValueError("starts et ends doivent avoir la même longueur")
+        if labels is None:
+            label_codes = np.zeros(len(starts), dtype=LABEL_DTYPE)
+        else:
+            if len(labels) != len(starts):
+                raise ValueError("un libellé par annotation est attendu")
+            label_codes = np.fromiter((self._label_code(str(l)) for l in labels), LABEL_DTYPE, len(starts))
+        lo, hi = np.minimum(starts, ends), np.maximum(starts, ends)
+        kinds = np.full(len(starts), self.kind_code(kind), dtype=KIND_DTYPE)
+        self._pending.append((lo, hi, kinds, label_codes))
+        self.version += 1
+
+    def remove_kind(self, kind: str):
+        """Drop every annotation of *kind* (e.g. before re-running a search)."""
+        code = self._kind_codes.get(kind)
+        if code is None:
+            return
+        self._flush()
+        keep = self._kind != code
+        self._set_arrays(self._start[keep], self._end[keep], self._kind[keep], self._label[keep])
+        self.version += 1
+
+    def clear(self):
+        version = self.version
+        self.__init__()
+        self.version = version + 1
+
+    def _flush(self):
+        if not self._pending:
+            return
+        chunks = [(self._start, self._end, self._kind, self._label)] + self._pending
+        self._pending = []
+        start, end, kind, label = (np.concatenate(parts) for parts in zip(*chunks))
+        order = np.argsort(start, kind="stable")
+        self._set_arrays(start[order], end[order], kind[order], label[order])
+
+    def _set_arrays(self, start, end, kind, label):
+        self._start, self._end, self._kind, self._label = start, end, kind, label
+        self._max_end = np.maximum.accumulate(end) if len(end) else np.empty(0)
+
+    # ------------------------------------------------------------------
+    # Lecture
+    # ------------------------------------------------------------------
+    @property
+    def start(self) -> np.ndarray:
+        self._flush()
+        return self._start
+
+    @property
+    def end(self) -> np.ndarray:
+        self._flush()
+        return self._end
+
+    @property
+    def kind_codes(self) -> np.ndarray:
+        self._flush()
+        return self._kind
+
+    def kind_of(self, index: int) -> str:
+        return self.kinds[self.kind_codes[index]]
+
+    def label_of(self, index: int) -> str:
+        self._flush()
+        return self.labels[self._label[index]]
+
+    def in_window(self, x0: float, x1: float) -> np.ndarray:
+        """Indices (sorted by start) of the annotations intersecting ``[x0, x1]``."""
+        self._flush()
+        if x1 < x0:
+            x0, x1 = x1, x0
+        # Before lo, every annotation ended before x0; from hi, all start after x1
+        lo = int(np.searchsorted(self._max_end, x0, side="left"))
+        hi = int(np.searchsorted(self._start, x1, side="right"))
+        if hi <= lo:
+            return np.empty(0, dtype=np.intp)
+        idx = np.arange(lo, hi)
+        return idx[self._end[lo:hi] >= x0]
+
+    def clustered(self, x0: float, x1: float, n_columns: int, log_x: bool = False) -> AnnotationClusters:
+        """Annotations of ``[x0, x1]`` for a grid of *n_columns* pixels.
+
+        Spans wider than a column are kept as they are; the others are
+        grouped by column, and columns holding several of them become one
+        cluster marker. With *log_x* the columns are even in ``log10(x)``,
+        like the pixels of a log X axis (a window reaching ``x <= 0`` keeps
+        linear columns).
+        """
+        idx = self.in_window(x0, x1)
+        if x1 < x0:
+            x0, x1 = x1, x0
+        log = log_x and x0 > 0
+
+        def to_columns(values):
+            # Starts before the window are clipped to it: they fall in column 0
+            return np.log10(np.maximum(values, x0)) if log else values
+
+        n_columns = max(1, int(n_columns))
+        lo = to_columns(x0)
+        width = (to_columns(x1) - lo) / n_columns
+        empty = np.empty(0)
+        if not len(idx) or width <= 0:
+            return AnnotationClusters(idx, empty, empty, np.empty(0, dtype=np.int64))
+        start, end = to_columns(self._start[idx]), to_columns(self._end[idx])
+        wide = end - start > width
+        narrow = idx[~wide]
+        if not len(narrow):
+            return AnnotationClusters(idx, empty, empty, np.empty(0, dtype=np.int64))
+        cols = np.clip(((start[~wide] - lo) / width).astype(np.int64), 0, n_columns - 1)
+        # narrow is sorted by start: each column is one run of equal values
+        first = np.flatnonzero(np.r_[True, cols[1:] != cols[:-1]])
+        counts = np.diff(np.r_[first, len(narrow)])
+        alone = counts == 1
+        singles = np.sort(np.concatenate([idx[wide], narrow[first[alone]]]))
+        merged = first[~alone]
+        ends = np.maximum.reduceat(self._end[narrow], first)[~alone] if len(merged) else empty
+        return AnnotationClusters(singles, self._start[narrow[merged]], ends, counts[~alone])
+
+    # ------------------------------------------------------------------
+    # Sérialisation
+    # ------------------------------------------------------------------
+    def to_dict(self, store=None) -> dict:
+        """Compact arrays (sidecar files when *store* is given) and string tables."""
+        self._flush()
+        arrays = {"start": self._start, "end": self._end, "kind": self._kind, "label": self._label}
+        if store is None:
+            encoded = {key: arr.tolist() for key, arr in arrays.items()}
+        else:
+            encoded = {key: store.array_to_json(arr) for key, arr in arrays.items()}
+        return {"kinds": list(self.kinds), "labels": list(self.labels), **encoded}
+
+    @classmethod
+    def from_dict(cls, data: dict, store=None) -> "AnnotationStore":
+        annotations = cls()
+        if not data:
+            return annotations
+
+        def load(key, dtype):
+            value = data.get(key, [])
+            if store is not None:
+                value = store.json_to_array(value)
+            return np.array(value, dtype=dtype)
+
+        annotations.kinds = list(data.get("kinds", []))
+        annotations.labels = list(data.get("labels", [""]))
+        annotations._kind_codes = {k: i for i, k in enumerate(annotations.kinds)}
+        annotations._label_codes = {l: i for i, l in enumerate(annotations.labels)}
+        start, end = load("start", np.float64), load("end", np.float64)
+        kind, label = load("kind", KIND_DTYPE), load("label", LABEL_DTYPE)
+        order = np.argsort(start, kind="stable")  # saved sorted; cheap to check
+        annotations._set_arrays(start[order], end[order], kind[order], label[order])
+        return annotations
@@ -14,6 +14,7 @@ def launch_app():
 
     # Coordination de l'application
     app_coordinator = ApplicationCoordinator(window)
+    window.app = app_coordinator
 
     # Connecte la zone centrale de tracé
     window.center_area_widget = app_coordinator.center_area
@@ -0,0 +1,145 @@
+# core/bit_curves.py
+
+"""Derivation of bit curves (single bits or bit groups) from a parent curve."""
+
+import weakref
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from core.models import CurveData
+from core.curve_stats import get_curve_stats
+from core.shared_arrays import array_ref, attach, chunk_bounds, default_chunks, run_chunked, share, shared_empty
+
+BIT_CHUNK_SIZE = 1_000_000
+# From this size, curves are split into bits by worker processes
+PARALLEL_MIN_POINTS = 4_000_000
+
+
+def _integer_chunk(values: np.ndarray):
+    """``(ints, nan_mask)`` of one chunk of *values*, NaN read as 0."""
+    raw = np.asarray(values, dtype=np.float64)
+    mask = np.isnan(raw)
+    return np.nan_to_num(raw, nan=0).astype(np.int64), mask
+
+
+def bit_values(values: np.ndarray, bit_indices: Sequence[int], chunk_size: int = BIT_CHUNK_SIZE) -> np.ndarray:
+    """Integer value formed by *bit_indices* of *values* (LSB first), as float.
+
+    NaN samples stay NaN. The parent is read chunk by chunk so that only one
+    chunk of integer temporaries exists at a time.
+    """
+    out = np.empty(len(values), dtype=np.float64)
+    for start in range(0, len(values), chunk_size):
+        ints, mask = _integer_chunk(values[start : start + chunk_size])
+        group = np.zeros(ints.size, dtype=np.int64)
+        for pos, idx in enumerate(bit_indices):
+            group |= ((ints >> idx) & 1) << pos
+        chunk = group.astype(np.float64)
+        chunk[mask] = np.nan
+        out[start : start + chunk.size] = chunk
+    return out
+
+
+def _bit_planes_chunk(src_ref, out_ref, start: int, stop: int, chunk_size: int = BIT_CHUNK_SIZE):
+    """Worker process: bits of ``src[start:stop]`` written in place into *out*.
+
+    Each block is converted to integers once, then every plane is a shift of
+    the same integers.
+    """
+    src = attach(src_ref)
+    out = attach(out_ref, writable=True)
+    for a in range(start, stop, chunk_size):
+        b = min(a + chunk_size, stop)
+        ints, mask = _integer_chunk(src[a:b])
+        for i in range(out.shape[0]):
+            plane = out[i, a:b]
+            np.bitwise_and(ints >> i, 1, out=plane, casting="unsafe")
+            plane[mask] = np.nan
+def bit_planes(curves: Sequence[CurveData], bit_counts: Sequence[int], executor=None,
+               progress=None, is_cancelled=None) -> Optional[List[np.ndarray]]:
+    """One shared ``(bit_count, n)`` array per curve, computed across processes.
+
+    Only Y is copied into a shared file, and the curves themselves are left
+    untouched (this runs in jobs). The chunks of every curve are queued
+    together, so that several curves keep all the cores busy. Returns None
+    when cancelled.
+    """
+    total = sum(len(c.y) for c in curves) or 1
+    parts = default_chunks(executor)
+    tasks, planes, sources = [], [], []
+    for curve, count in zip(curves, bit_counts):
+        src, src_ref = share(curve.y)
+        sources.append(src)  # a copy's file lives as long as the array mapping it
+        out = shared_empty((count, len(curve.y)))
+        n_parts = max(1, round(parts * len(curve.y) / total))
+        tasks += [(_bit_planes_chunk, src_ref, array_ref(out), a, b) for a, b in chunk_bounds(len(curve.y), n_parts)]
+        planes.append(out)
+    if not run_chunked(tasks, executor, progress, is_cancelled):
+        return None
+    return planes
+
+
+def check_bit_source(curve: CurveData) -> int:
+    """Ensure *curve* can be split into bits and return its largest value.
+
+    Raises ``ValueError`` for non-integer or negative data. Relies on the
+    cached statistics, so repeated checks do not rescan the data.
+    """
+    stats = get_curve_stats(curve)
+    if not stats.is_integer:
+        raise ValueError("Les données ne sont pas entières")
+    if stats.y_min is not None and stats.y_min < 0:
+        raise ValueError("Les valeurs négatives ne sont pas prises en charge")
+    return int(stats.y_max) if stats.y_max is not None else 0
+
+
+def make_bit_curve(
+    parent: CurveData, name: str, bit_indices: List[int], single: bool = False, values=None
+) -> CurveData:
+    """Build the curve made of *bit_indices* of *parent*.
+
+    With *single*, the curve is a one-bit lane (``bit_index`` set); otherwise
+    a grouped curve (``bit_indices`` set). The X axis is shared with *parent*.
+    *values* are the bit values when already computed (background job).
+    """
+    curve = CurveData(
+        name=name,
+        x=parent.x,
+        y=bit_values(parent.y, bit_indices) if values is None else values,
+        color=parent.color,
+        width=parent.width,
+        style=parent.style,
+        parent_curve=parent.name,
+    )
+    if single:
+        curve.bit_index = bit_indices[0]
+    else:
+        curve.bit_indices = list(bit_indices)
+    _record_bit_source(curve, parent)
+    return curve
+
+
+def rebind_bit_curve(curve: CurveData, parent: CurveData):
+    """Make *curve* derive its data lazily from *parent* (e.g. after loading)."""
+    bits = curve.derived_bits
+    curve.x = parent.x
+    curve.defer_data(lambda: bit_values(parent.y, bits))
+    _record_bit_source(curve, parent)
+
+
+def _record_bit_source(curve: CurveData, parent: CurveData):
+    curve.bit_source = (weakref.ref(parent.y), parent.data_version)
+
+
+def bit_source_matches(curve: CurveData, parent: CurveData) -> bool:
+    """True while *parent* still holds the data *curve*'s bits were taken from.
+
+    False once the parent's Y was replaced or modified, or when *parent* is
+    another curve that took the parent's name: the bits can then no longer
+    be rebuilt from it.
+    """
+    if curve.bit_source is None:
+        return False
+    y_ref, version = curve.bit_source
+    return y_ref() is parent.y and parent.data_version == version
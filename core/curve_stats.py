@@ -0,0 +1,104 @@
+# core/curve_stats.py
+
+from dataclasses import dataclass, asdict, field
+from typing import Dict, Optional
+
+import numpy as np
+
+from core.models import DataType
+
+STATS_CHUNK_SIZE = 1_000_000
+
+# Largest value representable by each integer storage type
+DTYPE_LIMITS = {
+    DataType.UINT8: 0xFF,
+    DataType.UINT16: 0xFFFF,
+    DataType.UINT32: 0xFFFFFFFF,
+}
+
+
+@dataclass
+class CurveStats:
+    """Summary of a curve's data computed in one chunked pass."""
+
+    length: int = 0
+    y_min: Optional[float] = None  # finite values only
+    y_max: Optional[float] = None
+    nan_count: int = 0
+    is_integer: bool = True  # every non-NaN value is (close to) an integer
+    x_monotonic: bool = True  # x is non-decreasing and contains no NaN
+    # Values that cannot be stored in each DataType (non finite, non integer,
+    # negative or too large), keyed by ``DataType.value``
+    invalid_counts: Dict[str, int] = field(default_factory=dict)
+
+    def invalid_count(self, dtype: DataType) -> int:
+        if dtype == DataType.FLOAT64:
+            return 0
+        return self.invalid_counts.get(DataType(dtype).value, 0)
+
+    def suggested_dtype(self) -> DataType:
+        """Smallest integer type holding every value, else FLOAT64."""
+        for dtype in DTYPE_LIMITS:
+            if self.invalid_count(dtype) == 0:
+                return dtype
+        return DataType.FLOAT64
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Optional["CurveStats"]:
+        """Rebuild saved statistics, or ``None`` if some fields are missing."""
+        if any(k not in data for k in cls.__dataclass_fields__):
+            return None
+        return cls(**{k: data[k] for k in cls.__dataclass_fields__})
+
+
+def compute_curve_stats(x: Optional[np.ndarray], y: np.ndarray, chunk_size: int = STATS_CHUNK_SIZE) -> CurveStats:
+    """Scan *x* and *y* once, chunk by chunk, to keep memory bounded.
+
+    *x* may be ``None`` when only the values matter (``x_monotonic`` then
+    stays ``True``).
+    """
+    stats = CurveStats(length=len(y))
+    lo, hi = np.inf, -np.inf
+    prev_x = -np.inf
+    invalid = 0  # non finite, non integer or negative
+    too_large = dict.fromkeys(DTYPE_LIMITS, 0)
+
+    for start in range(0, len(y), chunk_size):
+        stop = start + chunk_size
+        part = np.asarray(y[start:stop], dtype=np.float64)
+        nan = np.isnan(part)
+        finite = np.isfinite(part)
+        integral = np.isclose(part, np.round(part))
+        stats.nan_count += int(nan.sum())
+        if stats.is_integer and not np.all(integral | nan):
+            stats.is_integer = False
+
+        values = part[finite]
+        if values.size:
+            lo = min(lo, float(values.min()))
+            hi = max(hi, float(values.max()))
+
+        storable = part[finite & integral & (part >= 0)]
+        invalid += part.size - storable.size
+        for dtype, limit in DTYPE_LIMITS.items():
+            too_large[dtype] += int(np.count_nonzero(storable > limit))
+
+        if x is not None and stats.x_monotonic:
+            xs = np.asarray(x[start:stop], dtype=np.float64)
+            if xs.size:
+                if not (xs[0] >= prev_x) or not np.all(xs[1:] >= xs[:-1]):
+                    stats.x_monotonic = False
+                prev_x = xs[-1]
+
+    if lo <= hi:
+        stats.y_min, stats.y_max = lo, hi
+    stats.invalid_counts = {dtype.value: invalid + n for dtype, n in too_large.items()}
+    return stats
+
+
+def get_curve_stats(curve) -> CurveStats:
+    """Return the cached statistics of *curve*, computing them if needed."""
+    return curve.cached("stats", lambda c: compute_curve_stats(c.x, c.y))
@@ -1,9 +1,10 @@
 # core/graph_service.py
 
 from core.app_state import AppState
-from core.models import GraphData, CurveData
+from core.models import ADDED, MODIFIED, REMOVED, RENAMED, ChangeEvent, GraphData, CurveData
 from core.utils.naming import get_next_graph_name, get_unique_curve_name
 from core.utils import generate_random_color
+from signal_bus import signal_bus
 from typing import Optional
 import logging
 
@@ -45,6 +46,27 @@ def apply_logic_analyzer_layout(graph: GraphData) -> None:
         offset += 1
 
 
+def compute_bit_values(curve: CurveData, bit_count: int, progress=None, is_cancelled=None) -> list:
+    """One array per bit of *curve*, LSB first (reads no state: job-safe).
+
+    Large curves are split by worker processes into a shared array.
+    """
+    from core.bit_curves import PARALLEL_MIN_POINTS, bit_planes, bit_values
+
+    if len(curve.y) >= PARALLEL_MIN_POINTS:
+        planes = bit_planes([curve], [bit_count], progress=progress, is_cancelled=is_cancelled)
+        return [] if planes is None else list(planes[0])
+
+    values = []
+    for i in range(bit_count):
+        if is_cancelled is not None and is_cancelled():
+            return values
+        values.append(bit_values(curve.y, [i]))
+        if progress is not None:
+            progress((i + 1) / bit_count)
+    return values
+
+
 class GraphService:
     """
     Fournit les opérations métier sur les graphes et courbes,
@@ -54,6 +76,25 @@ class GraphService:
     def __init__(self, state: AppState):
         logger.debug("🧠 [GraphService.__init__] Initialisation du service avec AppState")
         self.state = state
+        # > 0 while several operations are grouped into one change event
+        self._held = 0
+
+    # ----- Événements de changement -----
+    def _notify(self, event: ChangeEvent):
+        if self._held:
+            return
+        logger.debug(f"📣 [GraphService._notify] {event}")
+        signal_bus.model_changed.emit(event)
+
+    def _graph_changed(self, *fields: str, kind: str = MODIFIED):
+        graph = self.state.current_graph
+        if graph is not None:
+            self._notify(ChangeEvent(graph.name, None, frozenset(fields), kind))
+
+    def _curve_changed(self, *fields: str, kind: str = MODIFIED):
+        graph, curve = self.state.current_graph, self.state.current_curve
+        if curve is not None:
+            self._notify(ChangeEvent(graph.name if graph else None, curve.name, frozenset(fields), kind))
 
     def select_graph(self, name: str):
         logger.debug(f"🖱 [GraphService.select_graph] Sélection du graphique : {name}")
@@ -72,6 +113,7 @@ class GraphService:
     def rename_graph(self, old_name: str, new_name: str):
         logger.debug(f"✏️ [GraphService.rename_graph] Renommage du graphique : {old_name} → {new_name}")
         self.state.rename_graph(old_name, new_name)
+        self._notify(ChangeEvent(new_name, fields=frozenset({"name"}), kind=RENAMED))
 
     def rename_curve(self, old_name: str, new_name: str):
         logger.debug(f"✏️ [GraphService.rename_curve] Renommage de courbe : {old_name} → {new_name}")
@@ -88,6 +130,7 @@ class GraphService:
             if curve.name == old_name:
                 logger.debug(f"🔁 [GraphService.rename_curve] Mise à jour du nom dans le modèle")
                 curve.name = new_name
+                self._notify(ChangeEvent(graph.name, new_name, frozenset({"name"}), RENAMED))
                 return
 
         logger.debug(f"❌ [GraphService.rename_curve] Courbe '{old_name}' non trouvée")
@@ -108,6 +151,7 @@ class GraphService:
     
         self.state.graphs[name] = GraphData(name)
         self.state.current_graph = self.state.graphs[name]
+        self._notify(ChangeEvent(name, kind=ADDED))
     
         logger.debug(f"✅ [GraphService.add_graph] Graphique '{name}' ajouté dans AppState.")
         logger.debug(f"🔎 [GraphService.add_graph] État courant après ajout :")
@@ -159,6 +203,7 @@ class GraphService:
         graph.curves.append(curve)
         self.state.current_graph = graph
         self.state.current_curve = curve
+        self._notify(ChangeEvent(graph.name, curve_name, frozenset({"curves"}), ADDED))
     
         logger.debug(f"🔎 [GraphService.add_curve] État après ajout de courbe :")
         logger.debug(f"    - Courbes du graphique '{graph.name}' : {[c.name for c in graph.curves]}")
@@ -167,6 +212,28 @@ class GraphService:
         # Le contrôleur d'interface émettra les signaux nécessaires
 
         return curve_name
+
+    def add_curves(self, graph_name: str, curves: list) -> list[str]:
+        """Add several curves (an import) with a single change event.
+
+        Returns the names given to the curves, as :meth:`add_curve` does.
+        """
+        self._held += 1
+        try:
+            names = [self.add_curve(graph_name, curve) for curve in curves]
+        finally:
+            self._held -= 1
+        if graph_name in self.state.graphs:
+            self._notify(ChangeEvent(graph_name, fields=frozenset({"curves"})))
+        return [name for name in names if name]
+
+    def load_graphs(self, graphs: dict):
+        """Replace every graph (project loading); nothing stays selected."""
+        logger.debug(f"📂 [GraphService.load_graphs] {list(graphs.keys())}")
+        self.state.graphs = graphs
+        self.state.current_graph = None
+        self.state.current_curve = None
+        self._notify(ChangeEvent(None))
             
 
     def remove_graph(self, name: str):
@@ -180,6 +247,7 @@ class GraphService:
             logger.debug("🔄 [GraphService.remove_graph] Réinitialisation de current_graph et current_curve")
             self.state.current_graph = None
             self.state.current_curve = None
+        self._notify(ChangeEvent(name, kind=REMOVED))
             
         # Les signaux d'interface seront émis par le contrôleur
 
@@ -202,6 +270,7 @@ class GraphService:
         graph.curves.remove(curve_to_remove)
         if self.state.current_curve == curve_to_remove:
             self.state.current_curve = None
+        self._notify(ChangeEvent(graph.name, curve_name, frozenset({"curves"}), REMOVED))
     
         logger.debug(f"✅ [GraphService.remove_curve] Courbe '{curve_name}' supprimée.")
 
@@ -213,6 +282,7 @@ class GraphService:
     def import_graph(self, graph_data: GraphData):
         logger.debug(f"📥 [GraphService.import_graph] Import du graphique '{graph_data.name}'")
         self.state.graphs[graph_data.name] = graph_data
+        self._notify(ChangeEvent(graph_data.name, kind=ADDED))
 
     def bring_curve_to_front(self):
         logger.debug(f"🔝 [GraphService.bring_curve_to_front] Remonter la courbe courante en tête")
@@ -224,9 +294,12 @@ class GraphService:
         if curve in graph.curves:
             graph.curves.remove(curve)
             graph.curves.append(curve)
+            self._graph_changed("curves")
             logger.debug(f"✅ [GraphService.bring_curve_to_front] Courbe '{curve.name}' déplacée en tête")
 
-    def create_bit_curves(self, curve_name: str, bit_count: Optional[int] = None) -> list[str]:
+    def create_bit_curves(
+        self, curve_name: str, bit_count: Optional[int] = None, values: Optional[list] = None
+    ) -> list[str]:
         """Generate bit curves from the given curve.
 
         Parameters
@@ -236,49 +309,18 @@ class GraphService:
         bit_count: int | None
             Number of bits to generate. If ``None``, the minimal bit width able
             to represent all values is used.
+        values: list | None
+            Bit arrays already computed (LSB first, see
+            :func:`compute_bit_values`); computed here when omitted.
         Returns
         -------
         list[str]
             Names of the created curves in order from LSB to MSB.
         """
         graph = self.state.current_graph
-        if not graph:
-            raise ValueError("Aucun graphique sélectionné")
-
-        curve = next((c for c in graph.curves if c.name == curve_name), None)
-        if not curve:
-            raise ValueError(f"Courbe '{curve_name}' introuvable")
-
-        import numpy as np
+        curve, bit_count = self.bit_source(curve_name, bit_count)
 
-        values = curve.y
-        mask = np.isnan(values)
-        finite_values = values[~mask]
-
-        if not np.allclose(finite_values, np.round(finite_values)):
-            raise ValueError("Les données ne sont pas entières")
-
-        if finite_values.size:
-            max_val = int(finite_values.max())
-            min_val = int(finite_values.min())
-        else:
-            max_val = 0
-            min_val = 0
-
-        if min_val < 0:
-            raise ValueError("Les valeurs négatives ne sont pas prises en charge")
-
-        values_int = np.nan_to_num(values, nan=0).astype(np.int64)
-        min_bits = max(max_val.bit_length(), 1)
-
-        if bit_count is None:
-            bit_count = min_bits
-        else:
-            if max_val >= 2 ** bit_count:
-                raise ValueError("La plage de valeurs dépasse le nombre de bits spécifié")
-
-        bits = ((values_int[:, None] >> np.arange(bit_count)) & 1).astype(float)
-        bits[mask, :] = np.nan
+        from core.bit_curves import make_bit_curve
 
         from core.utils.naming import get_unique_curve_name
         existing = {c.name for c in graph.curves}
@@ -289,22 +331,37 @@ class GraphService:
             base_name = f"{curve.name}[{i}]"
             name = get_unique_curve_name(base_name, existing)
             existing.add(name)
-            bit_curve = CurveData(
-                name=name,
-                x=curve.x.copy(),
-                y=bits[:, i],
-                color=curve.color,
-                width=curve.width,
-                style=curve.style,
-            )
-            bit_curve.bit_index = i
-            bit_curve.parent_curve = curve.name
+            bit_curve = make_bit_curve(curve, name, [i], single=True, values=values[i] if values else None)
             graph.curves.insert(insert_index, bit_curve)
             insert_index += 1
             created.append(name)
 
+        self._graph_changed("curves")
         return created
 
+    def bit_source(self, curve_name: str, bit_count: Optional[int] = None):
+        """Curve of the current graph to split into bits, and the checked bit count."""
+        graph = self.state.current_graph
+        if not graph:
+            raise ValueError("Aucun graphique sélectionné")
+
+        curve = next((c for c in graph.curves if c.name == curve_name), None)
+        if not curve:
+            raise ValueError(f"Courbe '{curve_name}' introuvable")
+
+        from core.bit_curves import check_bit_source
+
+        max_val = check_bit_source(curve)
+
+        min_bits = max(max_val.bit_length(), 1)
+
+        if bit_count is None:
+            bit_count = min_bits
+        else:
+            if max_val >= 2 ** bit_count:
+                raise ValueError("La plage de valeurs dépasse le nombre de bits spécifié")
+        return curve, bit_count
+
     def create_bit_group_curve(
         self, curve_name: str, bit_indices: list[int], group_name: Optional[str] = None
     ) -> str:
@@ -334,35 +391,9 @@ class GraphService:
         if not curve:
             raise ValueError(f"Courbe '{curve_name}' introuvable")
 
-        import numpy as np
+        from core.bit_curves import check_bit_source, make_bit_curve
 
-        values = curve.y
-        mask = np.isnan(values)
-        finite_values = values[~mask]
-
-        if not np.allclose(finite_values, np.round(finite_values)):
-            raise ValueError("Les données ne sont pas entières")
-
-        if finite_values.size:
-            max_val = int(finite_values.max())
-            min_val = int(finite_values.min())
-        else:
-            max_val = 0
-            min_val = 0
-
-        if min_val < 0:
-            raise ValueError("Les valeurs négatives ne sont pas prises en charge")
-
-        values_int = np.nan_to_num(values, nan=0).astype(np.int64)
-        needed_bits = max(max_val.bit_length(), max(bit_indices) + 1)
-
-        bits = ((values_int[:, None] >> np.arange(needed_bits)) & 1).astype(int)
-
-        group = np.zeros(len(values_int), dtype=float)
-        for pos, idx in enumerate(bit_indices):
-            group += (bits[:, idx] << pos)
-        group = group.astype(float)
-        group[mask] = np.nan
+        check_bit_source(curve)
 
         from core.utils.naming import get_unique_curve_name
         existing = {c.name for c in graph.curves}
@@ -374,16 +405,9 @@ class GraphService:
             base_name = f"{curve.name}[{'-'.join(map(str, bit_indices))}]"
         name = get_unique_curve_name(base_name, existing)
 
-        bit_curve = CurveData(
-            name=name,
-            x=curve.x.copy(),
-            y=group,
-            color=curve.color,
-            width=curve.width,
-            style=curve.style,
-        )
-        bit_curve.parent_curve = curve.name
+        bit_curve = make_bit_curve(curve, name, list(bit_indices))
         graph.curves.insert(insert_index, bit_curve)
+        self._graph_changed("curves")
         return name
 
     # ----- Méthodes métier pour les propriétés du graphique -----
@@ -391,26 +415,56 @@ class GraphService:
         logger.debug(f"📐 [GraphService.set_grid_visible] {visible}")
         if self.state.current_graph:
             self.state.current_graph.grid_visible = visible
+            self._graph_changed("grid_visible")
 
     def set_dark_mode(self, enabled: bool):
         logger.debug(f"🌒 [GraphService.set_dark_mode] {enabled}")
         if self.state.current_graph:
             self.state.current_graph.dark_mode = enabled
+            self._graph_changed("dark_mode")
+
+    def set_batch_curves(self, enabled: bool):
+        logger.debug(f"🧺 [GraphService.set_batch_curves] {enabled}")
+        if self.state.current_graph:
+            self.state.current_graph.batch_curves = enabled
+            self._graph_changed("batch_curves")
+
+    def set_adaptive_rendering(self, enabled: bool):
+        logger.debug(f"🎚 [GraphService.set_adaptive_rendering] {enabled}")
+        if self.state.current_graph:
+            self.state.current_graph.adaptive_rendering = enabled
+            self._graph_changed("adaptive_rendering")
+
+    def set_render_thresholds(self, budget_ms: float, idle_ms: int):
+        logger.debug(f"⏱ [GraphService.set_render_thresholds] budget={budget_ms} ms idle={idle_ms} ms")
+        if self.state.current_graph:
+            self.state.current_graph.render_budget_ms = budget_ms
+            self.state.current_graph.render_idle_ms = idle_ms
+            self._graph_changed("render_budget_ms", "render_idle_ms")
+
+    def set_render_overlay(self, visible: bool):
+        logger.debug(f"🐞 [GraphService.set_render_overlay] {visible}")
+        if self.state.current_graph:
+            self.state.current_graph.render_overlay = visible
+            self._graph_changed("render_overlay")
 
     def set_log_x(self, enabled: bool):
         logger.debug(f"📈 [GraphService.set_log_x] {enabled}")
         if self.state.current_graph:
             self.state.current_graph.log_x = enabled
+            self._graph_changed("log_x")
 
     def set_log_y(self, enabled: bool):
         logger.debug(f"📉 [GraphService.set_log_y] {enabled}")
         if self.state.current_graph:
             self.state.current_graph.log_y = enabled
+            self._graph_changed("log_y")
 
     def set_opacity(self, value: float):
         logger.debug(f"🎨 [GraphService.set_opacity] Opacité = {value}")
         if self.state.current_curve:
             self.state.current_curve.opacity = value
+            self._curve_changed("opacity")
 
     def set_gain(self, value: float):
         logger.debug(f"🔊 [GraphService.set_gain] Gain = {value}")
@@ -419,6 +473,7 @@ class GraphService:
             c.gain = value
             if getattr(c, "gain_mode", "multiplier") == "unit" and value != 0:
                 c.units_per_grid = 1.0 / value
+            self._curve_changed("gain", "units_per_grid")
 
     def set_units_per_grid(self, value: float):
         logger.debug(f"📐 [GraphService.set_units_per_grid] units = {value}")
@@ -427,73 +482,93 @@ class GraphService:
             c.units_per_grid = value
             if value != 0:
                 c.gain = 1.0 / value
+            self._curve_changed("units_per_grid", "gain")
 
     def set_gain_mode(self, mode: str):
         logger.debug(f"🏳️ [GraphService.set_gain_mode] mode = {mode}")
         c = self.state.current_curve
         if c:
             c.gain_mode = mode
+            self._curve_changed("gain_mode")
 
     def set_offset(self, value: float):
         logger.debug(f"📏 [GraphService.set_offset] Offset = {value}")
         if self.state.current_curve:
             self.state.current_curve.offset = value
+            self._curve_changed("offset")
 
     def set_time_offset(self, value: float):
         logger.debug(f"⏱ [GraphService.set_time_offset] Time offset = {value}")
         if self.state.current_curve:
             self.state.current_curve.time_offset = value
+            self._curve_changed("time_offset")
 
     def set_width(self, value: int):
         logger.debug(f"📏 [GraphService.set_width] Width = {value}")
         if self.state.current_curve:
             self.state.current_curve.width = value
+            self._curve_changed("width")
 
     def set_style(self, style: int):
         logger.debug(f"🖌 [GraphService.set_style] Style = {style}")
         if self.state.current_curve:
             self.state.current_curve.style = style
+            self._curve_changed("style")
 
     def set_symbol(self, symbol: str):
         logger.debug(f"🔣 [GraphService.set_symbol] Symbole = {symbol}")
         if self.state.current_curve:
             self.state.current_curve.symbol = symbol
+            self._curve_changed("symbol")
 
     def set_fill(self, fill: bool):
         logger.debug(f"🧱 [GraphService.set_fill] Remplissage = {fill}")
         if self.state.current_curve:
             self.state.current_curve.fill = fill
+            self._curve_changed("fill")
 
     def set_display_mode(self, mode: str):
         logger.debug(f"🖥 [GraphService.set_display_mode] Mode d'affichage = {mode}")
         if self.state.current_curve:
             self.state.current_curve.display_mode = mode
+            self._curve_changed("display_mode")
+
+    def set_bar_aggregate(self, how: str):
+        logger.debug(f"📊 [GraphService.set_bar_aggregate] Agrégation des barres = {how}")
+        if self.state.current_curve:
+            self.state.current_curve.bar_aggregate = how
+            self._curve_changed("bar_aggregate")
 
     def set_label_mode(self, mode: str):
         logger.debug(f"🏷 [GraphService.set_label_mode] Mode d’étiquetage = {mode}")
         if self.state.current_curve:
             self.state.current_curve.label_mode = mode
+            self._curve_changed("label_mode")
 
     def set_zero_indicator(self, mode: str):
         logger.debug(f"🎯 [GraphService.set_zero_indicator] Indicateur zéro = {mode}")
         if self.state.current_curve:
             self.state.current_curve.zero_indicator = mode
+            self._curve_changed("zero_indicator")
 
     def set_color(self, color: str):
         logger.debug(f"🌈 [GraphService.set_color] Couleur = {color}")
         if self.state.current_curve:
             self.state.current_curve.color = color
+            self._curve_changed("color")
 
     def set_show_label(self, visible: bool):
         logger.debug(f"👁 [GraphService.set_show_label] Étiquette visible = {visible}")
         if self.state.current_curve:
             self.state.current_curve.show_label = visible
+            self._curve_changed("show_label")
 
     def set_graph_visible(self, graph_name: str, visible: bool):
         logger.debug(f"👁 [GraphService.set_graph_visible] {graph_name} → {visible}")
         graph = self.state.graphs.get(graph_name)
         if graph:
             graph.visible = visible
+            self._notify(ChangeEvent(graph_name, fields=frozenset({"visible"})))
 
     def set_curve_visible(self, graph_name: str, curve_name: str, visible: bool):
         logger.debug(f"👁 [GraphService.set_curve_visible] {curve_name} in {graph_name} → {visible}")
@@ -503,34 +578,78 @@ class GraphService:
         for curve in graph.curves:
             if curve.name == curve_name:
                 curve.visible = visible
+                self._notify(ChangeEvent(graph_name, curve_name, frozenset({"visible"})))
                 break
 
     # ----- Nouvelles options d'axe -----
 
+    def set_x_link_group(self, group: str):
+        logger.debug(f"🔗 [GraphService.set_x_link_group] groupe = {group!r}")
+        if self.state.current_graph:
+            self.state.current_graph.x_link_group = group.strip()
+            self._graph_changed("x_link_group")
+
+    def set_lane_height(self, height_px: int):
+        logger.debug(f"🎚 [GraphService.set_lane_height] {height_px} px")
+        if self.state.current_graph:
+            self.state.current_graph.lane_height_px = max(4, int(height_px))
+            self._graph_changed("lane_height_px")
+
+    def set_measurement_cursors(self, vertical: bool, horizontal: bool):
+        logger.debug(f"📍 [GraphService.set_measurement_cursors] X={vertical} Y={horizontal}")
+        if self.state.current_graph:
+            self.state.current_graph.cursors_vertical = vertical
+            self.state.current_graph.cursors_horizontal = horizontal
+            self._graph_changed("cursors_vertical", "cursors_horizontal")
+
+    def add_annotations(self, starts, ends=None, kind: str = "event", labels=None):
+        """Add events (no *ends*) or spans of one *kind* to the current graph."""
+        logger.debug(f"🔖 [GraphService.add_annotations] {len(starts)} × {kind}")
+        if self.state.current_graph:
+            self.state.current_graph.annotations.add_many(starts, ends, kind, labels)
+            self._graph_changed("annotations")
+
+    def clear_annotations(self, kind: Optional[str] = None):
+        """Remove the annotations of *kind*, or all of them."""
+        logger.debug(f"🔖 [GraphService.clear_annotations] type={kind}")
+        graph = self.state.current_graph
+        if not graph:
+            return
+        if kind is None:
+            graph.annotations.clear()
+        else:
+            graph.annotations.remove_kind(kind)
+        self._graph_changed("annotations")
+
     def set_x_unit(self, unit: str):
         logger.debug(f"📏 [GraphService.set_x_unit] unité X = {unit}")
         if self.state.current_graph:
             self.state.current_graph.x_unit = unit
+            self._graph_changed("x_unit")
 
     def set_y_unit(self, unit: str):
         logger.debug(f"📏 [GraphService.set_y_unit] unité Y = {unit}")
         if self.state.current_graph:
             self.state.current_graph.y_unit = unit
+            self._graph_changed("y_unit")
 
     def set_x_format(self, fmt: str):
         logger.debug(f"🔢 [GraphService.set_x_format] format X = {fmt}")
         if self.state.current_graph:
             self.state.current_graph.x_format = fmt
+            self._graph_changed("x_format")
 
     def set_y_format(self, fmt: str):
         logger.debug(f"🔢 [GraphService.set_y_format] format Y = {fmt}")
         if self.state.current_graph:
             self.state.current_graph.y_format = fmt
+            self._graph_changed("y_format")
 
     def set_auto_range_x(self, enabled: bool):
         logger.debug(f"📏 [GraphService.set_auto_range_x] {enabled}")
         if self.state.current_graph:
             self.state.current_graph.auto_range_x = enabled
+            self._graph_changed("auto_range_x")
 
     def set_auto_range_y(self, enabled: bool):
         logger.debug(f"📏 [GraphService.set_auto_range_y] {enabled}")
@@ -538,28 +657,33 @@ class GraphService:
             self.state.current_graph.auto_range_y = enabled
             if enabled:
                 self.state.current_graph.fix_y_range = False
+            self._graph_changed("auto_range_y", "fix_y_range")
 
     def set_fix_y_range(self, fix: bool):
         logger.debug(f"📊 [GraphService.set_fix_y_range] {fix}")
         if self.state.current_graph:
             self.state.current_graph.fix_y_range = fix
             self.state.current_graph.auto_range_y = not fix
+            self._graph_changed("fix_y_range", "auto_range_y")
 
     def set_y_limits(self, y_min: float, y_max: float):
         logger.debug(f"📉 [GraphService.set_y_limits] {y_min} → {y_max}")
         if self.state.current_graph:
             self.state.current_graph.y_min = y_min
             self.state.current_graph.y_max = y_max
+            self._graph_changed("y_min", "y_max")
 
     def set_mouse_enabled_x(self, enabled: bool):
         logger.debug(f"🖱️ [GraphService.set_mouse_enabled_x] {enabled}")
         if self.state.current_graph:
             self.state.current_graph.mouse_enabled_x = enabled
+            self._graph_changed("mouse_enabled_x")
 
     def set_mouse_enabled_y(self, enabled: bool):
         logger.debug(f"🖱️ [GraphService.set_mouse_enabled_y] {enabled}")
         if self.state.current_graph:
             self.state.current_graph.mouse_enabled_y = enabled
+            self._graph_changed("mouse_enabled_y")
 
     def set_satellite_content(self, zone: str, content: Optional[str]):
         """Define which widget content should appear in the given satellite zone."""
@@ -573,6 +697,7 @@ class GraphService:
             graph.satellite_content[zone] = content
             if zone in graph.satellite_settings:
                 graph.satellite_settings[zone].visible = bool(content)
+            self._graph_changed("satellite_content", "satellite_settings")
 
     def set_satellite_visible(self, zone: str, visible: bool):
         logger.debug(
@@ -583,6 +708,7 @@ class GraphService:
             return
         if zone in graph.satellite_settings:
             graph.satellite_settings[zone].visible = visible
+            self._graph_changed("satellite_settings")
 
     def set_satellite_color(self, zone: str, color: str):
         logger.debug(
@@ -593,6 +719,7 @@ class GraphService:
             return
         if zone in graph.satellite_settings:
             graph.satellite_settings[zone].color = color
+            self._graph_changed("satellite_settings")
 
     def set_satellite_size(self, zone: str, size: int):
         logger.debug(
@@ -603,6 +730,7 @@ class GraphService:
             return
         if zone in graph.satellite_settings:
             graph.satellite_settings[zone].size = size
+            self._graph_changed("satellite_settings")
 
 
     def add_zone(self, zone: dict):
@@ -612,6 +740,7 @@ class GraphService:
         if not graph:
             return
         graph.zones.append(zone)
+        self._graph_changed("zones")
 
     def update_zone(self, index: int, zone: dict):
         """Update a zone at the given index."""
@@ -621,6 +750,7 @@ class GraphService:
             return
         if 0 <= index < len(graph.zones):
             graph.zones[index] = zone
+            self._graph_changed("zones")
 
     def remove_zone(self, index: int):
         """Remove the zone at the given index."""
@@ -630,6 +760,7 @@ class GraphService:
             return
         if 0 <= index < len(graph.zones):
             graph.zones.pop(index)
+            self._graph_changed("zones")
 
     # ------------------------------------------------------------------
     # Satellite objects management
@@ -642,6 +773,7 @@ class GraphService:
             return
         if zone in graph.satellite_objects:
             graph.satellite_objects[zone].append(obj)
+            self._graph_changed("satellite_objects")
 
     def update_satellite_object(self, zone: str, index: int, obj):
         """Replace an object at *index* in the given zone."""
@@ -653,6 +785,7 @@ class GraphService:
             return
         if zone in graph.satellite_objects and 0 <= index < len(graph.satellite_objects[zone]):
             graph.satellite_objects[zone][index] = obj
+            self._graph_changed("satellite_objects")
 
     def remove_satellite_object(self, zone: str, index: int):
         """Remove object at *index* from the given zone."""
@@ -664,6 +797,7 @@ class GraphService:
             return
         if zone in graph.satellite_objects and 0 <= index < len(graph.satellite_objects[zone]):
             graph.satellite_objects[zone].pop(index)
+            self._graph_changed("satellite_objects")
 
     def move_satellite_object(self, zone: str, index: int, new_index: int):
         """Move object to *new_index* in the list for the zone."""
@@ -679,6 +813,7 @@ class GraphService:
         obj = objs.pop(index)
         new_index = max(0, min(new_index, len(objs)))
         objs.insert(new_index, obj)
+        self._graph_changed("satellite_objects")
 
     def apply_mode(self, graph_name: str, mode: str):
         """Apply a predefined configuration to the given graph."""
@@ -691,3 +826,5 @@ class GraphService:
 
         if mode == "logic_analyzer":
             apply_logic_analyzer_layout(graph)
+        # The layout may touch any property of the graph and of its curves
+        self._notify(ChangeEvent(graph_name))
@@ -0,0 +1,304 @@
+# core/job_service.py
+
+"""Tâches longues exécutées hors du thread graphique.
+
+Une :class:`Job` déclare ses entrées (les seules données que ``run`` lit),
+les sorties que son ``apply`` modifie, sa priorité et son pool (threads ou
+processus). :class:`JobService` garde une file par pool, triée par priorité
+(interactive avant arrière-plan), et ne confie un travail au pool que
+lorsqu'une place s'y libère : une tâche interactive demandée après dix
+tâches de fond passe donc devant elles. Demander deux fois la même tâche
+(même clé) renvoie la même exécution.
+
+L'avancement et la fin remontent au thread graphique par des connexions en
+file d'attente, puis sont réémis sur ``signal_bus``. ``apply(state,
+result)`` écrit le résultat dans l':class:`AppState` sur le thread
+graphique, une fois le calcul terminé ; le résultat d'une tâche annulée est
+ignoré.
+"""
+
+import heapq
+import itertools
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from PyQt5.QtCore import QObject, Qt, pyqtSignal
+
+from core.app_state import AppState
+from signal_bus import signal_bus
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Priorities: lower runs first
+INTERACTIVE = 0
+BACKGROUND = 10
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+THREADS = "threads"
+PROCESSES = "processes"
+
+
+class JobCancelled(Exception):
+    """Raised inside a job once its cancellation was requested."""
+
+
+@dataclass(frozen=True)
+class Job:
+    """Declaration of a long operation.
+
+    ``run(*inputs)`` executes on a pool and must only read *inputs*; with
+    *reports_progress* it also receives ``progress(fraction)`` and
+    ``is_cancelled()`` keyword callbacks, like the CSV exports. Process jobs
+    need picklable ``run``/``inputs`` and cannot report progress.
+    ``apply(state, result)`` runs on the GUI thread; *outputs* names what
+    it changes (``"graphs"``, ``"graph:<nom>"``, ``"file:<chemin>"``...).
+    """
+
+    name: str
+    run: Callable
+    inputs: tuple = ()
+    outputs: Tuple[str, ...] = ()
+    apply: Optional[Callable] = None
+    priority: int = BACKGROUND
+    use_processes: bool = False
+    reports_progress: bool = False
+    key: Optional[Hashable] = None  # deduplication key (default: run + inputs)
+
+    def dedup_key(self) -> Hashable:
+        if self.key is not None:
+            return self.key
+        return (self.run, tuple(_input_key(v) for v in self.inputs), self.outputs)
+
+
+def _input_key(value) -> Hashable:
+    try:
+        hash(value)
+    except TypeError:
+        return ("id", id(value))  # unhashable input (graph, array): same object, same job
+    return value
+
+
+class JobHandle:
+    """State of one submitted job, shared by every request deduplicated into it."""
+
+    def __init__(self, job_id: int, job: Job, key: Hashable):
+        self.id = job_id
+        self.job = job
+        self.key = key
+        self.priority = job.priority
+        self.status = PENDING
+        self.progress = 0.0
+        self.result = None
+        self.error: Optional[str] = None
+        self._cancel = threading.Event()
+        self._callbacks: List[Callable[["JobHandle"], None]] = []
+        self._last_percent = -1
+
+    @property
+    def name(self) -> str:
+        return self.job.name
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (DONE, FAILED, CANCELLED)
+
+    def when_done(self, callback: Callable[["JobHandle"], None]):
+        """Call ``callback(handle)`` on the GUI thread once the job ended."""
+        if self.finished:
+            callback(self)
+        else:
+            self._callbacks.append(callback)
+
+
+class JobService(QObject):
+    """Runs :class:`Job` declarations on thread/process pools by priority."""
+
+    # Emitted from worker threads, delivered on the GUI thread (queued)
+    _progress = pyqtSignal(int, float)
+    _completed = pyqtSignal(int, object, object)  # job id, result, exception
+
+    def __init__(self, state: Optional[AppState] = None, max_threads: Optional[int] = None,
+                 max_processes: Optional[int] = None, parent=None):
+        super().__init__(parent)
+        cpus = os.cpu_count() or 2
+        self.state = state or AppState.get_instance()
+        self.limits = {
+            THREADS: max_threads or max(2, min(4, cpus - 1)),
+            PROCESSES: max_processes or max(1, cpus - 1),
+        }
+        self._executors: Dict[str, object] = {}
+        self._queues: Dict[str, list] = {THREADS: [], PROCESSES: []}
+        self._running: Dict[str, int] = {THREADS: 0, PROCESSES: 0}
+        self._jobs: Dict[int, JobHandle] = {}  # pending and running
+        self._by_key: Dict[Hashable, JobHandle] = {}
+        self._ids = itertools.count(1)
+        self._progress.connect(self._on_progress, Qt.QueuedConnection)
+        self._completed.connect(self._on_completed, Qt.QueuedConnection)
+
+    # ------------------------------------------------------------------
+    # API
+    # ------------------------------------------------------------------
+    def submit(self, job: Job) -> JobHandle:
+        """Queue *job*, or return the run already doing the same work."""
+        key = job.dedup_key()
+        handle = self._by_key.get(key)
+        if handle is not None and not handle.cancelled:
+            logger.debug(f"🔁 [JobService.submit] '{job.name}' déjà demandé (tâche {handle.id})")
+            if handle.status == PENDING and job.priority < handle.priority:
+                handle.priority = job.priority  # now needed interactively
+                heapq.heappush(self._queues[self._pool(handle)], (handle.priority, handle.id, handle))
+                self._dispatch()
+            return handle
+
+        handle = JobHandle(next(self._ids), job, key)
+        self._jobs[handle.id] = handle
+        self._by_key[key] = handle
+        heapq.heappush(self._queues[self._pool(handle)], (handle.priority, handle.id, handle))
+        logger.debug(f"📥 [JobService.submit] Tâche {handle.id} '{job.name}' (priorité {job.priority})")
+        signal_bus.job_queued.emit(handle.id, job.name)
+        self._dispatch()
+        return handle
+
+    def cancel(self, job_id: int):
+        """Cancel a job: dropped if pending, its result ignored if running."""
+        handle = self._jobs.get(job_id)
+        if handle is None:
+            return
+        logger.debug(f"⛔️ [JobService.cancel] Tâche {job_id} '{handle.name}'")
+        handle._cancel.set()
+        if handle.status == PENDING:  # its queue entry is skipped on dispatch
+            self._finish(handle, CANCELLED)
+
+    def cancel_all(self):
+        for job_id in list(self._jobs):
+            self.cancel(job_id)
+
+    def active_jobs(self) -> List[JobHandle]:
+        """Pending and running jobs, in submission order."""
+        return [self._jobs[i] for i in sorted(self._jobs)]
+
+    def shutdown(self):
+        self.cancel_all()
+        for executor in self._executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+        self._executors.clear()
+
+    # ------------------------------------------------------------------
+    # Ordonnancement
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _pool(handle: JobHandle) -> str:
+        return PROCESSES if handle.job.use_processes else THREADS
+
+    def _executor(self, pool: str):
+        executor = self._executors.get(pool)
+        if executor is None:
+            if pool == THREADS:
+                executor = ThreadPoolExecutor(self.limits[THREADS], thread_name_prefix="job")
+            else:
+                # spawn: children must not inherit the parent's Qt state
+                context = multiprocessing.get_context("spawn")
+                executor = ProcessPoolExecutor(self.limits[PROCESSES], mp_context=context)
+            self._executors[pool] = executor
+        return executor
+
+    def _dispatch(self):
+        """Hand the most urgent pending jobs to the pools that have room."""
+        for pool, queue in self._queues.items():
+            while queue and self._running[pool] < self.limits[pool]:
+                priority, _, handle = heapq.heappop(queue)
+                if handle.status != PENDING or priority != handle.priority:
+                    continue  # cancelled, or re-queued with a higher priority
+                handle.status = RUNNING
+                self._running[pool] += 1
+                signal_bus.job_started.emit(handle.id, handle.name)
+                if pool == THREADS:
+                    self._executor(pool).submit(self._run_in_thread, handle)
+                else:
+                    future = self._executor(pool).submit(handle.job.run, *handle.job.inputs)
+                    future.add_done_callback(lambda f, h=handle: self._process_done(h, f))
+
+    def _run_in_thread(self, handle: JobHandle):
+        job = handle.job
+        kwargs = {}
+        if job.reports_progress:
+            kwargs = {"progress": lambda f: self._report(handle, f), "is_cancelled": lambda: handle.cancelled}
+        try:
+            result = job.run(*job.inputs, **kwargs)
+        except Exception as e:
+            if not isinstance(e, JobCancelled):
+                logger.exception(f"❌ [JobService] Échec de la tâche '{job.name}'")
+            self._completed.emit(handle.id, None, e)
+            return
+        self._completed.emit(handle.id, result, None)
+
+    def _report(self, handle: JobHandle, fraction: float):
+        if handle.cancelled:
+            raise JobCancelled()
+        percent = int(fraction * 100)
+        if percent != handle._last_percent:  # at most 101 signals per job
+            handle._last_percent = percent
+            self._progress.emit(handle.id, float(fraction))
+
+    def _process_done(self, handle: JobHandle, future):
+        error = None if future.cancelled() else future.exception()
+        result = None if error is not None or future.cancelled() else future.result()
+        self._completed.emit(handle.id, result, error)
+
+    # ------------------------------------------------------------------
+    # Thread graphique
+    # ------------------------------------------------------------------
+    def _on_progress(self, job_id: int, fraction: float):
+        handle = self._jobs.get(job_id)
+        if handle is not None and not handle.cancelled:
+            handle.progress = fraction
+            signal_bus.job_progress.emit(job_id, fraction)
+
+    def _on_completed(self, job_id: int, result, error):
+        handle = self._jobs.get(job_id)
+        if handle is None:
+            return
+        self._running[self._pool(handle)] -= 1
+        if handle.cancelled or isinstance(error, JobCancelled):
+            self._finish(handle, CANCELLED)
+        elif error is not None:
+            handle.error = str(error)
+            self._finish(handle, FAILED)
+        else:
+            try:
+                if handle.job.apply is not None:
+                    handle.job.apply(self.state, result)
+            except Exception as e:
+                logger.exception(f"❌ [JobService] Application du résultat de '{handle.name}' échouée")
+                handle.error = str(e)
+                self._finish(handle, FAILED)
+            else:
+                handle.result = result
+                handle.progress = 1.0
+                self._finish(handle, DONE)
+        self._dispatch()
+
+    def _finish(self, handle: JobHandle, status: str):
+        handle.status = status
+        self._jobs.pop(handle.id, None)
+        if self._by_key.get(handle.key) is handle:
+            del self._by_key[handle.key]
+        logger.debug(f"✅ [JobService] Tâche {handle.id} '{handle.name}' : {status}")
+        signal_bus.job_finished.emit(handle.id, handle.name, status)
+        callbacks, handle._callbacks = handle._callbacks, []
+        for callback in callbacks:
+            callback(handle)
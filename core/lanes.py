@@ -0,0 +1,53 @@
+# core/lanes.py
+
+"""Disposition des pistes de la vue logique empilée.
+
+Chaque courbe visible occupe une piste d'une unité de hauteur ; la première
+courbe est en haut (piste ``n - 1``), comme dans
+:func:`core.graph_service.apply_logic_analyzer_layout`. Les courbes ne
+sont pas modifiées : la mise à l'échelle de chaque piste est calculée ici
+et appliquée au tracé.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import List, Tuple
+
+from core.curve_stats import get_curve_stats
+
+# Fraction of a lane covered by its signal (the rest separates lanes)
+LANE_FILL = 0.8
+
+
+@dataclass(frozen=True)
+class Lane:
+    index: int  # 0 at the bottom
+    curve: object
+
+    @property
+    def center(self) -> float:
+        return self.index + 0.5
+
+
+def layout_lanes(curves) -> List[Lane]:
+    """One lane per visible curve, indexed from the bottom."""
+    shown = [c for c in curves if c.visible]
+    n = len(shown)
+    return [Lane(n - 1 - i, curve) for i, curve in enumerate(shown)]
+
+
+def lanes_in_window(n_lanes: int, y0: float, y1: float, margin: int = 1) -> range:
+    """Indices of the lanes intersecting ``[y0, y1]``, plus *margin* each side."""
+    first = max(0, math.floor(min(y0, y1)) - margin)
+    last = min(n_lanes, math.ceil(max(y0, y1)) + margin)
+    return range(first, max(first, last))
+
+
+def lane_transform(lane: Lane) -> Tuple[float, float]:
+    """``(scale, offset)`` mapping the curve's raw values into its lane."""
+    stats = get_curve_stats(lane.curve)
+    lo, hi = stats.y_min, stats.y_max
+    if lo is None or hi <= lo:
+        lo, hi = (lo or 0.0) - 0.5, (lo or 0.0) + 0.5  # constant or empty signal
+    scale = LANE_FILL / (hi - lo)
+    return scale, lane.index + (1.0 - LANE_FILL) / 2.0 - lo * scale
@@ -0,0 +1,210 @@
+# core/lod.py
+
+"""Min/max decimation pyramid used to draw large curves at screen resolution.
+
+Level 0 groups ``base`` consecutive samples per bucket; every following level
+groups ``factor`` buckets of the previous one, until the coarsest level holds
+at most ``top_buckets`` buckets. Each bucket keeps the X of its first sample
+and the min/max of its Y values (NaN ignored), which is enough to draw a
+visually exact envelope of the curve at any zoom level.
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from core.curve_stats import get_curve_stats
+
+LOD_MIN_POINTS = 100_000  # below this, curves are drawn from raw data
+LOD_BASE = 256
+LOD_FACTOR = 4
+LOD_TOP_BUCKETS = 2048
+LOD_CHUNK_SIZE = LOD_BASE * 4096
+
+
+@dataclass
+class MinMaxPyramid:
+    length: int
+    bucket_sizes: List[int] = field(default_factory=list)
+    x: List[np.ndarray] = field(default_factory=list)
+    y_min: List[np.ndarray] = field(default_factory=list)
+    y_max: List[np.ndarray] = field(default_factory=list)
+
+    @property
+    def levels(self) -> int:
+        return len(self.bucket_sizes)
+
+    def level_for(self, n_samples: int, max_buckets: int) -> int:
+        """Finest level drawing *n_samples* with at most *max_buckets* buckets."""
+        for level, size in enumerate(self.bucket_sizes):
+            if n_samples / size <= max_buckets:
+                return level
+        return self.levels - 1
+
+    def envelope(self, level: int, b0: int = 0, b1: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Interleaved (min, max) polyline for buckets ``b0:b1`` of *level*."""
+        xs = self.x[level][b0:b1]
+        out_x = np.repeat(xs, 2)
+        out_y = np.empty(out_x.size, dtype=np.float64)
+        out_y[0::2] = self.y_min[level][b0:b1]
+        out_y[1::2] = self.y_max[level][b0:b1]
+        return out_x, out_y
+
+
+def build_pyramid(
+    x: np.ndarray,
+    y: np.ndarray,
+    base: int = LOD_BASE,
+    factor: int = LOD_FACTOR,
+    top_buckets: int = LOD_TOP_BUCKETS,
+    chunk_size: int = LOD_CHUNK_SIZE,
+) -> MinMaxPyramid:
+    """Build the pyramid reading *x*/*y* in chunks (memory-mapped data friendly)."""
+    n = len(y)
+    pyr = MinMaxPyramid(length=n)
+    if n == 0:
+        return pyr
+    chunk_size = max(base, chunk_size - chunk_size % base)
+
+    xs, mins, maxs = [], [], []
+    for start in range(0, n, chunk_size):
+        part = np.asarray(y[start : start + chunk_size], dtype=np.float64)
+        full = part.size - part.size % base
+        if full:
+            blocks = part[:full].reshape(-1, base)
+            mins.append(np.fmin.reduce(blocks, axis=1))
+            maxs.append(np.fmax.reduce(blocks, axis=1))
+        if full < part.size:
+            tail = part[full:]
+            mins.append(np.fmin.reduce(tail, keepdims=True))
+            maxs.append(np.fmax.reduce(tail, keepdims=True))
+        xs.append(np.asarray(x[start : start + chunk_size : base], dtype=np.float64))
+
+    size = base
+    level_x = np.concatenate(xs)
+    level_min = np.concatenate(mins)
+    level_max = np.concatenate(maxs)
+    while True:
+        pyr.bucket_sizes.append(size)
+        pyr.x.append(level_x)
+        pyr.y_min.append(level_min)
+        pyr.y_max.append(level_max)
+        if level_x.size <= top_buckets:
+            break
+        idx = np.arange(0, level_x.size, factor)
+        level_x = level_x[idx]
+        level_min = np.fmin.reduceat(level_min, idx)
+        level_max = np.fmax.reduceat(level_max, idx)
+        size *= factor
+    return pyr
+
+
+def get_lod(curve) -> Optional[MinMaxPyramid]:
+    """Cached pyramid of *curve*, or ``None`` when the curve is small or X unsorted."""
+    if len(curve.y) < LOD_MIN_POINTS or not get_curve_stats(curve).x_monotonic:
+        return None
+    return curve.cached("lod", lambda c: build_pyramid(c.x, c.y))
+
+
+def viewport_arrays(
+    x: np.ndarray, y: np.ndarray, pyr: MinMaxPyramid, x0: float, x1: float, max_points: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Arrays to draw for the visible X window ``[x0, x1]`` (raw data units).
+
+    Inside the window the finest level fitting *max_points* buckets is used
+    (raw samples when few enough); outside, the coarsest level provides
+    context so the drawn data still spans the whole curve (auto-range keeps
+    working) without touching full-resolution samples.
+    """
+    n = pyr.length
+    i0 = max(int(np.searchsorted(x, x0, side="left")) - 1, 0)
+    i1 = min(int(np.searchsorted(x, x1, side="right")) + 1, n)
+    top = pyr.levels - 1
+    top_size = pyr.bucket_sizes[top]
+
+    pieces_x, pieces_y = [], []
+    left = i0 // top_size
+    if left > 0:
+        px, py = pyr.envelope(top, 0, left)
+        pieces_x.append(px)
+        pieces_y.append(py)
+        i0 = left * top_size
+
+    right = -(-i1 // top_size)
+    if i1 > i0:
+        if i1 - i0 <= 2 * max_points:
+            pieces_x.append(np.asarray(x[i0:i1], dtype=np.float64))
+            pieces_y.append(np.asarray(y[i0:i1], dtype=np.float64))
+        else:
+            level = pyr.level_for(i1 - i0, max_points)
+            size = pyr.bucket_sizes[level]
+            b1 = right * (top_size // size)
+            px, py = pyr.envelope(level, i0 // size, b1)
+            pieces_x.append(px)
+            pieces_y.append(py)
+
+    if right < pyr.x[top].size and i1 < n:
+        px, py = pyr.envelope(top, right)
+        pieces_x.append(px)
+        pieces_y.append(py)
+
+    if not pieces_x:
+        return np.empty(0), np.empty(0)
+    return np.concatenate(pieces_x), np.concatenate(pieces_y)
+
+
+def minmax_decimate(x: np.ndarray, y: np.ndarray, n_buckets: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Interleaved min/max of *y* over about *n_buckets* equal buckets.
+
+    For slices too small to justify a pyramid (e.g. the visible part of one
+    of many overlaid curves). Arrays shorter than ``2 * n_buckets`` are
+    returned unchanged.
+    """
+    n = len(y)
+    if n <= 2 * n_buckets or n_buckets < 1:
+        return np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+    size = -(-n // n_buckets)
+    idx = np.arange(0, n, size)
+    y = np.asarray(y, dtype=np.float64)
+    out_x = np.repeat(np.asarray(x, dtype=np.float64)[idx], 2)
+    out_y = np.empty(out_x.size)
+    out_y[0::2] = np.fmin.reduceat(y, idx)
+    out_y[1::2] = np.fmax.reduceat(y, idx)
+    return out_x, out_y
+
+
+def column_minmax(
+    x: np.ndarray, y: np.ndarray, x0: float, x1: float, n_columns: int, log_x: bool = False
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Interleaved min/max of *y* per pixel column of ``[x0, x1]`` (sorted *x*).
+
+    Unlike :func:`minmax_decimate`, buckets are equal in X, not in sample
+    count: at most two points per non-empty column of the output image,
+    whatever the sampling. Samples outside ``[x0, x1]`` are dropped. With
+    *log_x*, columns are equal in ``log10(x)``, as on a log axis.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if n_columns < 1 or not x1 > x0 or len(x) <= 2 * n_columns or (log_x and not x0 > 0):
+        return x, y
+    steps = np.arange(n_columns + 1) / n_columns
+    if log_x:
+        lo, hi = math.log10(x0), math.log10(x1)
+        edges = 10.0 ** (lo + (hi - lo) * steps)
+    else:
+        edges = x0 + (x1 - x0) * steps
+    bounds = np.searchsorted(x, edges, side="left")
+    bounds[-1] = np.searchsorted(x, x1, side="right")
+    starts = np.unique(bounds[:-1][bounds[:-1] < bounds[1:]])  # non-empty columns
+    if not starts.size:
+        return np.empty(0), np.empty(0)
+    stop = bounds[-1]
+    segment = y[starts[0]:stop]
+    idx = starts - starts[0]
+    out_x = np.repeat(x[starts], 2)
+    out_y = np.empty(out_x.size)
+    out_y[0::2] = np.fmin.reduceat(segment, idx)
+    out_y[1::2] = np.fmax.reduceat(segment, idx)
+    return out_x, out_y
@@ -1,10 +1,14 @@
 # models.py
 
+import math
+import threading
 import numpy as np
 from dataclasses import dataclass, field, asdict
-from typing import List, Optional
+from typing import FrozenSet, Iterable, List, Optional
 from enum import Enum
 
+from core.annotations import AnnotationStore
+
 
 class DataType(str, Enum):
     """Supported data storage types for curves."""
@@ -30,6 +34,7 @@ class CurveData:
     symbol: Optional[str] = None  # ex: 'o', 't', 's', 'd'
     fill: bool = False
     display_mode: str = "line"  # 'line', 'scatter', 'bar'
+    bar_aggregate: str = "max"  # réduction des barres regroupées : 'max', 'min', 'mean'
     gain: float = 1.0
     units_per_grid: float = 1.0
     gain_mode: str = "multiplier"  # "multiplier" or "unit"
@@ -42,11 +47,21 @@ class CurveData:
     # source curve name. These fields remain ``None`` for normal curves.
     bit_index: Optional[int] = None
     parent_curve: Optional[str] = None
+    # Bits combined (LSB first) by a grouped bit curve of *parent_curve*.
+    bit_indices: Optional[List[int]] = None
+    # Parent data the bits were taken from, ``(weakref to parent.y,
+    # parent.data_version)``: see :func:`core.bit_curves.bit_source_matches`.
+    bit_source: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    # Incremented each time ``x`` or ``y`` is reassigned. Derived data
+    # (statistics, decimation levels...) is cached against this version.
+    data_version: int = field(default=0, init=False, repr=False, compare=False)
+    _derived_cache: dict = field(default_factory=dict, init=False, repr=False, compare=False)
 
 
     def __post_init__(self):
-        self.x = np.array(self.x, dtype=np.float64)
-        self.y = np.array(self.y)
+        # asarray keeps memory-mapped arrays lazy instead of copying them
+        self.x = np.asarray(self.x, dtype=np.float64)
+        self.y = np.asarray(self.y)
         if self.dtype != DataType.FLOAT64:
             self.y = self.y.astype(self.dtype.value)
         if not self.name:
@@ -64,10 +79,185 @@ class CurveData:
             if self.gain:
                 self.units_per_grid = 1.0 / self.gain
 
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name in ("x", "y"):
+            self.__dict__["data_version"] = self.__dict__.get("data_version", 0) + 1
+
+    def __getattr__(self, name):
+        # Only reached when ``y`` was deferred with :meth:`defer_data`
+        if name == "y" and "_lazy_lock" in self.__dict__:
+            with self.__dict__["_lazy_lock"]:
+                # Re-checked under the lock: another thread may have built it meanwhile
+                if "_lazy_y" in self.__dict__:
+                    self.y = self.__dict__["_lazy_y"]()
+                    del self.__dict__["_lazy_y"]
+            if "y" in self.__dict__:
+                return self.__dict__["y"]
+        raise AttributeError(name)
+
     @property
     def is_bit_curve(self) -> bool:
         return self.bit_index is not None
 
+    @property
+    def derived_bits(self) -> Optional[List[int]]:
+        """Bits of *parent_curve* this curve is computed from, if any."""
+        if self.parent_curve is None:
+            return None
+        if self.bit_index is not None:
+            return [self.bit_index]
+        return self.bit_indices
+
+    @property
+    def is_data_loaded(self) -> bool:
+        return "_lazy_y" not in self.__dict__
+
+    def defer_data(self, factory):
+        """Compute ``y`` with ``factory()`` on first access instead of now.
+
+        The first access may come from any thread; the others wait for it.
+        """
+        self.__dict__.setdefault("_lazy_lock", threading.Lock())
+        self.__dict__.pop("y", None)
+        self.__dict__["_lazy_y"] = factory
+        self.mark_data_changed()
+
+    # ----- Requêtes par abscisse (X brut, sans time_offset) -----
+    @property
+    def is_x_sorted(self) -> bool:
+        """True when X is non-decreasing without NaN (checked once, cached)."""
+        from core.curve_stats import get_curve_stats
+
+        return get_curve_stats(self).x_monotonic
+
+    @property
+    def x_order(self) -> Optional[np.ndarray]:
+        """Permutation sorting X, or ``None`` when X is already sorted."""
+        if self.is_x_sorted:
+            return None
+        return self.cached("x_order", lambda c: np.argsort(c.x, kind="stable"))
+
+    def _sorted_x(self) -> np.ndarray:
+        order = self.x_order
+        if order is None:
+            return self.x
+        return self.cached("x_sorted", lambda c: c.x[order])
+
+    @property
+    def x_step(self) -> Optional[tuple]:
+        """``(x0, dx)`` when X is a uniform time base, else ``None`` (cached)."""
+        return self.cached("x_step", lambda c: _uniform_step(c.x) if c.is_x_sorted else None)
+
+    def index_range(self, x0: float, x1: float) -> tuple:
+        """Positions ``(i0, i1)`` of the samples with ``x0 <= x <= x1``.
+
+        Positions index X in sorted order: use them directly on ``x``/``y``
+        when :attr:`is_x_sorted`, otherwise through ``x_order[i0:i1]``.
+        :meth:`sample_indices` does this mapping.
+        """
+        xs = self._sorted_x()
+        i0 = int(np.searchsorted(xs, x0, side="left"))
+        i1 = int(np.searchsorted(xs, x1, side="right"))
+        return i0, max(i0, i1)
+
+    def sample_indices(self, x0: float, x1: float):
+        """Indices of the samples in ``[x0, x1]``: a slice, or an array if X is unsorted."""
+        i0, i1 = self.index_range(x0, x1)
+        order = self.x_order
+        return slice(i0, i1) if order is None else order[i0:i1]
+
+    def nearest_index(self, x: float) -> Optional[int]:
+        """Index of the sample whose X is closest to *x* (``None`` if empty)."""
+        xs = self._sorted_x()
+        n = int(np.searchsorted(xs, np.nan))  # NaN X sort last
+        if n == 0:
+            return None
+        pos = int(np.searchsorted(xs[:n], x))
+        if pos == n or (pos > 0 and x - xs[pos - 1] <= xs[pos] - x):
+            pos -= 1
+        order = self.x_order
+        return pos if order is None else int(order[pos])
+
+    def value_at(self, x: float, interpolate: bool = True) -> float:
+        """Y at *x* (raw, without gain/offset); NaN outside the X range.
+
+        Linear interpolation between the two neighbouring samples, or the
+        nearest sample when *interpolate* is False.
+        """
+        step = self.x_step
+        if step is not None:
+            return self._uniform_value_at(x, step, interpolate)
+        xs = self._sorted_x()
+        n = int(np.searchsorted(xs, np.nan))
+        if n == 0 or not (xs[0] <= x <= xs[n - 1]):
+            return float("nan")
+        if not interpolate:
+            return float(self.y[self.nearest_index(x)])
+        order = self.x_order
+        pos = int(np.searchsorted(xs[:n], x, side="right"))
+        lo, hi = max(pos - 1, 0), min(pos, n - 1)
+        if order is not None:
+            lo_i, hi_i = int(order[lo]), int(order[hi])
+        else:
+            lo_i, hi_i = lo, hi
+        x_lo, x_hi = xs[lo], xs[hi]
+        y_lo, y_hi = float(self.y[lo_i]), float(self.y[hi_i])
+        if x_hi == x_lo:
+            return y_lo
+        return y_lo + (y_hi - y_lo) * (x - x_lo) / (x_hi - x_lo)
+
+    def _uniform_value_at(self, x: float, step: tuple, interpolate: bool) -> float:
+        # Uniform time base: the position is computed, no search needed
+        x0, dx = step
+        last = len(self.x) - 1
+        pos = (x - x0) / dx
+        tol = 1e-9 * last  # (x - x0) / dx can round just past either end
+        if not (-tol <= pos <= last + tol):
+            return float("nan")
+        pos = min(max(pos, 0.0), float(last))
+        if not interpolate:
+            return float(self.y[math.ceil(pos - 0.5)])  # ties go left, like nearest_index
+        lo = min(int(pos), last)
+        hi = min(lo + 1, last)
+        y_lo = float(self.y[lo])
+        return y_lo + (float(self.y[hi]) - y_lo) * (pos - lo)
+
+    def mark_data_changed(self):
+        """Invalidate derived data after an in-place modification of x or y."""
+        self.__dict__["data_version"] = self.data_version + 1
+
+    def cached(self, key: str, compute):
+        """Return ``compute(self)``, memoised until the data version changes."""
+        entry = self._derived_cache.get(key)
+        if entry is not None and entry[0] == self.data_version:
+            return entry[1]
+        value = compute(self)
+        self._derived_cache[key] = (self.data_version, value)
+        return value
+
+    def seed_cache(self, key: str, value):
+        """Store precomputed derived data (e.g. loaded from a project file)."""
+        self._derived_cache[key] = (self.data_version, value)
+
+
+
+def _uniform_step(x: np.ndarray, chunk_size: int = 1_000_000) -> Optional[tuple]:
+    """``(x[0], dx)`` if every ``x[i]`` is ``x[0] + i * dx`` (to rounding), else ``None``."""
+    n = len(x)
+    if n < 2:
+        return None
+    x0 = float(x[0])
+    dx = (float(x[-1]) - x0) / (n - 1)
+    if not dx > 0:
+        return None
+    tol = 1e-6 * dx
+    for start in range(0, n, chunk_size):
+        part = np.asarray(x[start:start + chunk_size], dtype=np.float64)
+        expected = x0 + dx * np.arange(start, start + len(part), dtype=np.float64)
+        if np.abs(part - expected).max() > tol:
+            return None
+    return x0, dx
 
 
 @dataclass
@@ -83,7 +273,7 @@ class SatelliteZoneSettings:
 class SatelliteObjectData:
     """Description of one object placed inside a satellite zone."""
 
-    obj_type: str = "text"  # "text", "button", "image"
+    obj_type: str = "text"  # "text", "button", "image", "cursors", "overview"
     name: str = ""
     config: dict = field(default_factory=dict)
     x: int = 0
@@ -112,8 +302,23 @@ class GraphData:
     x_format: str = "normal"  # valeurs possibles : "normal", "scientific", "scaled"
     y_format: str = "normal"
     mode: str = "standard"  # mode d'affichage spécifique au graphique
+    # Height of one lane in the "logic_lanes" mode, in pixels
+    lane_height_px: int = 24
     mouse_enabled_x: bool = True
     mouse_enabled_y: bool = True
+    # Graphs sharing a non-empty group name share their X range
+    x_link_group: str = ""
+    # Measurement cursor pairs (vertical: X1/X2, horizontal: Y1/Y2)
+    cursors_vertical: bool = False
+    cursors_horizontal: bool = False
+    # Draw same-style line curves as one combined item (large overlays)
+    batch_curves: bool = False
+    # Adaptive rendering: degrade while moving when a full frame exceeds the
+    # budget, restore after *render_idle_ms* without interaction
+    adaptive_rendering: bool = True
+    render_budget_ms: float = 25.0
+    render_idle_ms: int = 150
+    render_overlay: bool = False
     satellite_zones_visible: dict[str, bool] = field(
         default_factory=lambda: {
             "left": True,
@@ -151,7 +356,17 @@ class GraphData:
     )
 
     zones: List[dict] = field(default_factory=list)
+    # Events and spans keyed by X (search results, decoders, measurements)
+    annotations: AnnotationStore = field(default_factory=AnnotationStore)
 
+    @property
+    def effective_log_x(self) -> bool:
+        """Log X as applied to the plot: the "logic_lanes" mode is always linear."""
+        return self.log_x and self.mode != "logic_lanes"
+
+    @property
+    def effective_log_y(self) -> bool:
+        return self.log_y and self.mode != "logic_lanes"
 
     def add_curve(self, curve: CurveData):
         self.curves.append(curve)
@@ -164,3 +379,32 @@ class GraphData:
 
     def apply_to_view(self, plot_view):
         plot_view.update_graph_properties()
+
+
+# Nature of a ChangeEvent
+ADDED = "added"
+REMOVED = "removed"
+RENAMED = "renamed"
+MODIFIED = "modified"
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """One change of the model, sent on ``signal_bus.model_changed``.
+
+    *curve* is None for a graph-level change. *fields* names the attributes
+    that changed (``"curves"`` for the curve list of a graph); an empty set
+    means anything may have changed. *graph* is None when the whole project
+    was replaced.
+    """
+
+    graph: Optional[str]
+    curve: Optional[str] = None
+    fields: FrozenSet[str] = frozenset()
+    kind: str = MODIFIED
+
+    def touches(self, fields: Iterable[str]) -> bool:
+        """Whether a view showing *fields* has to react to this change."""
+        if self.kind != MODIFIED or not self.fields:
+            return True
+        return not self.fields.isdisjoint(fields)
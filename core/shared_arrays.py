@@ -0,0 +1,158 @@
+# core/shared_arrays.py
+
+"""Tableaux partagés entre processus, par fichiers mappés en mémoire.
+
+Confier les tableaux d'une courbe à un ``ProcessPoolExecutor`` les sérialise
+(pickle) pour chaque tâche : des gigaoctets copiés. Ici, un tableau est
+rangé dans un fichier ``.npy`` de ``/dev/shm`` (mémoire vive ; dossier
+temporaire à défaut) et mappé en mémoire ; les processus ne reçoivent
+qu'une :class:`ArrayRef` (chemin, décalage, forme, type), s'y attachent et
+écrivent leurs résultats en place. Les tableaux déjà mappés — ceux d'un
+projet chargé depuis ``<projet>.data/`` — sont partagés tels quels, sans
+copie.
+
+Un fichier partagé est supprimé dès que le dernier tableau qui le mappe est
+libéré (les mappages existants restent valides après la suppression).
+"""
+
+import atexit
+import mmap
+import os
+import shutil
+import tempfile
+import uuid
+import weakref
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+import multiprocessing
+
+import numpy as np
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Copies into shared files are made by blocks of this many bytes
+COPY_BLOCK_BYTES = 64 * 1024 * 1024
+# Chunks per worker process, to balance uneven chunks
+CHUNKS_PER_WORKER = 4
+
+_directory: Optional[Path] = None
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+@dataclass(frozen=True)
+class ArrayRef:
+    """Picklable address of a file-backed array."""
+
+    path: str
+    offset: int
+    shape: Tuple[int, ...]
+    dtype: str
+
+    @property
+    def nbytes(self) -> int:
+        return int(np.prod(self.shape)) * np.dtype(self.dtype).itemsize
+
+
+def shared_directory() -> Path:
+    """Folder of this process' shared files (RAM-backed when possible)."""
+    global _directory
+    if _directory is None:
+        base = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+        _directory = Path(tempfile.mkdtemp(prefix="courbes-", dir=base))
+        atexit.register(shutil.rmtree, _directory, True)
+    return _directory
+
+
+def shared_empty(shape, dtype=np.float64) -> np.memmap:
+    """New zero-filled shared array; its file goes away with the last reference."""
+    path = shared_directory() / f"{uuid.uuid4().hex}.npy"
+    arr = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=tuple(np.atleast_1d(shape)))
+    weakref.finalize(arr, _remove, str(path))
+    return arr
+
+
+def _remove(path: str):
+    try:
+        os.remove(path)
+    except OSError as e:  # e.g. still mapped on Windows: removed at exit
+        logger.debug(f"⚠️ [shared_arrays] {path} conservé : {e}")
+
+
+def array_ref(arr: np.ndarray) -> Optional[ArrayRef]:
+    """Address of *arr* when it is a contiguous view of a mapped file, else None."""
+    if not isinstance(arr, np.memmap) or getattr(arr, "_mmap", None) is None or not arr.filename:
+        return None
+    if not arr.flags.c_contiguous:
+        return None
+    # The mapping starts at the allocation boundary below the array's offset
+    start = arr.offset - arr.offset % mmap.ALLOCATIONGRANULARITY
+    base = np.frombuffer(arr._mmap, dtype=np.uint8).ctypes.data
+    return ArrayRef(str(arr.filename), start + arr.ctypes.data - base, tuple(arr.shape), arr.dtype.str)
+
+
+def share(arr: np.ndarray) -> Tuple[np.ndarray, ArrayRef]:
+    """*arr* itself if already file-backed, else a shared copy; with its address."""
+    ref = array_ref(arr)
+    if ref is not None:
+        return arr, ref
+    src = np.asarray(arr)
+    out = shared_empty(src.shape, src.dtype)
+    flat_src, flat_out = src.reshape(-1), out.reshape(-1)
+    step = max(1, COPY_BLOCK_BYTES // max(1, src.itemsize))
+    for start in range(0, flat_src.size, step):
+        flat_out[start : start + step] = flat_src[start : start + step]
+    return out, array_ref(out)
+
+
+def attach(ref: ArrayRef, writable: bool = False) -> np.ndarray:
+    """The array at *ref*, mapped in this process (read-only by default)."""
+    return np.memmap(ref.path, dtype=np.dtype(ref.dtype), mode="r+" if writable else "r",
+                     offset=ref.offset, shape=ref.shape)
+
+
+def get_process_executor() -> ProcessPoolExecutor:
+    """Process pool shared by the parallel array operations (one worker per core)."""
+    global _executor
+    if _executor is None:
+        # spawn: workers must not inherit the parent's Qt state
+        context = multiprocessing.get_context("spawn")
+        _executor = ProcessPoolExecutor(max_workers=os.cpu_count() or 1, mp_context=context)
+    return _executor
+
+
+def chunk_bounds(n: int, parts: int) -> List[Tuple[int, int]]:
+    """Split ``range(n)`` into at most *parts* contiguous ``(start, stop)``."""
+    parts = max(1, min(parts, n))
+    edges = np.linspace(0, n, parts + 1).astype(np.int64)
+    return [(int(a), int(b)) for a, b in zip(edges[:-1], edges[1:]) if b > a]
+
+
+def run_chunked(tasks: List[tuple], executor: Optional[ProcessPoolExecutor] = None,
+                progress: Optional[Callable[[float], None]] = None,
+                is_cancelled: Optional[Callable[[], bool]] = None) -> bool:
+    """Run ``fn(*args)`` for each ``(fn, *args)`` of *tasks* across processes.
+
+    Workers get :class:`ArrayRef` arguments and write into shared outputs;
+    nothing is returned. Returns False when cancelled before the end.
+    """
+    executor = executor or get_process_executor()
+    futures = [executor.submit(*task) for task in tasks]
+    try:
+        for done, future in enumerate(as_completed(futures), 1):
+            future.result()
+            if is_cancelled is not None and is_cancelled():
+                return False
+            if progress is not None:
+                progress(done / len(futures))
+    finally:
+        for future in futures:
+            future.cancel()
+    return True
+
+
+def default_chunks(executor: Optional[ProcessPoolExecutor] = None) -> int:
+    workers = getattr(executor or get_process_executor(), "_max_workers", os.cpu_count() or 1)
+    return CHUNKS_PER_WORKER * workers
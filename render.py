@@ -0,0 +1,57 @@
+#render.py
+
+"""Rendu en lot de projets vers PNG/SVG, sans interface graphique.
+
+Exemple : ``python render.py projet1.json projet2.json -o rapports --format png svg --jobs 4``
+"""
+
+import argparse
+import os
+import sys
+
+from logging_config import setup_logging
+
+
+def parse_size(text: str):
+    try:
+        width, height = (int(v) for v in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"taille invalide : {text!r} (attendu LARGEURxHAUTEUR)")
+    if width < 1 or height < 1:
+        raise argparse.ArgumentTypeError(f"taille invalide : {text!r}")
+    return width, height
+
+
+def build_parser() -> argparse.ArgumentParser:
+    from ui.batch_render import DEFAULT_SIZE, FORMATS
+
+    parser = argparse.ArgumentParser(description="Exporte chaque graphe des projets en image.")
+    parser.add_argument("projects", nargs="+", help="fichiers projet (.json)")
+    parser.add_argument("-o", "--output", default=".", help="dossier de sortie")
+    parser.add_argument("--format", nargs="+", choices=FORMATS, default=["png"], dest="formats")
+    parser.add_argument(
+        "--size", type=parse_size, default=DEFAULT_SIZE, help="LARGEURxHAUTEUR en pixels"
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=max(1, (os.cpu_count() or 2) - 1), help="processus de rendu"
+    )
+    return parser
+
+
+def main(argv=None) -> int:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from ui.batch_render import list_tasks, render_tasks
+
+    args = build_parser().parse_args(argv)
+    tasks = list_tasks(args.projects, args.output, args.formats, args.size)
+    results = render_tasks(tasks, args.jobs)
+    failed = [task for task, written in results.items() if written is None]
+    for task in failed:
+        print(f"échec : {task.project} / {task.graph}", file=sys.stderr)
+    print(f"{len(tasks) - len(failed)}/{len(tasks)} graphes exportés dans {args.output}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    setup_logging()
+    sys.exit(main())
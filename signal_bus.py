@@ -7,6 +7,8 @@ class SignalBus(QtCore.QObject):
     curve_list_updated = QtCore.pyqtSignal()
     curve_updated = QtCore.pyqtSignal()
     graph_updated = QtCore.pyqtSignal()
+    # Changement typé du modèle (core.models.ChangeEvent), émis par GraphService
+    model_changed = QtCore.pyqtSignal(object)
 
     # Visible state toggles
     graph_visibility_changed = QtCore.pyqtSignal(str, bool)
@@ -19,4 +21,10 @@ class SignalBus(QtCore.QObject):
     add_graph_requested = pyqtSignal(str)  # "graph"
     add_curve_requested = pyqtSignal(str)  # "NomGraphique"
 
+    # Tâches de fond (core.job_service.JobService)
+    job_queued = pyqtSignal(int, str)  # id, nom
+    job_started = pyqtSignal(int, str)
+    job_progress = pyqtSignal(int, float)  # id, fraction 0..1
+    job_finished = pyqtSignal(int, str, str)  # id, nom, statut
+
 signal_bus = SignalBus()
@@ -0,0 +1,18 @@
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt5 import QtWidgets
+
+
+@pytest.fixture(scope="session", autouse=True)
+def qt_app():
+    """One QApplication for the whole run.
+
+    Tests only hold the application in a local variable: without this, it is
+    destroyed after each test and recreated by the next one, which Qt does
+    not support (random crashes while building widgets).
+    """
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    yield app
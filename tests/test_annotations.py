@@ -0,0 +1,147 @@
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt5 import QtWidgets
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.annotations import AnnotationStore
+from core.models import CurveData, GraphData
+from IO_dossier.project_io import export_project_to_json, import_project_from_json
+
+
+def brute_window(store, x0, x1):
+    return np.flatnonzero((store.start <= x1) & (store.end >= x0))
+
+
+def test_window_queries_match_brute_force_with_overlapping_spans():
+    rng = np.random.default_rng(0)
+    store = AnnotationStore()
+    starts = rng.uniform(0, 1000, 5000)
+    store.add_many(starts, starts + rng.exponential(5, 5000), kind="span")
+    store.add_many(rng.uniform(0, 1000, 5000), kind="event")
+    store.add(-50, 2000, kind="span", label="tout")  # one span covering everything
+    assert len(store) == 10001
+    assert np.all(np.diff(store.start) >= 0)
+    for x0, x1 in [(0, 1000), (500, 500.5), (-10, -5), (999.9, 2000), (300, 200)]:
+        lo, hi = min(x0, x1), max(x0, x1)
+        assert np.array_equal(store.in_window(x0, x1), brute_window(store, lo, hi))
+    assert store.label_of(store.in_window(-10, -5)[0]) == "tout"
+
+    store.remove_kind("event")
+    assert len(store) == 5001 and set(store.kinds) == {"span", "event"}
+    assert all(store.kind_of(i) == "span" for i in range(len(store)))
+
+
+def test_clusters_fit_the_pixel_grid():
+    store = AnnotationStore()
+    store.add_many(np.linspace(0, 100, 100_000), kind="decode")
+    store.add(10, 60, kind="mesure", label="large")
+    shown = store.clustered(0, 100, 500)
+    assert len(shown) <= 500 + 1
+    assert shown.count.sum() + len(shown.singles) == 100_001
+    assert any(store.label_of(i) == "large" for i in shown.singles)  # wide span kept as is
+
+    # Zoomed in below the spacing: every event is drawn individually
+    step = 100 / 99_999
+    shown = store.clustered(50, 50 + 20 * step, 2000)
+    assert not len(shown.count) and len(shown.singles) == 20 + 1
+
+
+def test_clusters_follow_a_log_x_axis():
+    store = AnnotationStore()
+    # Events evenly spaced on a log axis, two pixel columns apart
+    store.add_many(10.0 ** np.linspace(0, 4, 201), kind="decode")
+    shown = store.clustered(1, 10_000, 400, log_x=True)
+    assert not len(shown.count) and len(shown.singles) == 201
+    # Linear columns would pile the first decades into the first column
+    assert len(store.clustered(1, 10_000, 400).count)
+
+    # A span wide in log units is kept, even if narrow in data units
+    store.add(1.0, 2.0, kind="mesure", label="large")
+    shown = store.clustered(1, 10_000, 400, log_x=True)
+    assert any(store.label_of(i) == "large" for i in shown.singles)
+
+
+def test_annotations_round_trip_as_compact_arrays(tmp_path):
+    graph = GraphData(name="G", curves=[CurveData(name="c", x=[0, 1], y=[0, 1])])
+    n = 20_000
+    graph.annotations.add_many(np.arange(n, dtype=float), kind="recherche")
+    graph.annotations.add_many([5.0, 7.0], [6.0, 9.0], kind="trame", labels=["0x55", "0xAA"])
+    path = tmp_path / "projet.json"
+    export_project_to_json({"G": graph}, str(path))
+
+    saved = json.loads(path.read_text())["graphs"][0]["annotations"]
+    assert saved["kinds"] == ["recherche", "trame"]
+    assert saved["labels"] == ["", "0x55", "0xAA"]
+    assert isinstance(saved["start"], dict)  # large arrays go to the sidecar folder
+
+    loaded = import_project_from_json(str(path))["G"].annotations
+    original = graph.annotations
+    assert len(loaded) == n + 2
+    for attr in ("start", "end", "kind_codes"):
+        assert np.array_equal(getattr(loaded, attr), getattr(original, attr))
+    i = loaded.in_window(8.5, 8.5)
+    assert [loaded.label_of(j) for j in i if loaded.kind_of(j) == "trame"] == ["0xAA"]
+
+
+def test_zooming_across_100k_annotations_stays_fast():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    from ui.views import MyPlotView
+
+    graph = GraphData(name="A", curves=[CurveData(name="c", x=[0, 1e6], y=[0, 1])])
+    rng = np.random.default_rng(1)
+    starts = np.sort(rng.uniform(0, 1e6, 100_000))
+    graph.annotations.add_many(starts[::2], kind="événement")
+    graph.annotations.add_many(starts[1::2], starts[1::2] + 3, kind="intervalle")
+    view = MyPlotView(graph)
+    view.plot_widget.resize(800, 400)
+    view.refresh_curves()
+    item = view.annotation_layer.item
+    assert item.scene() is view.plot_widget.scene()
+    assert not view.annotation_layer.update(graph.annotations)  # unchanged: nothing to redo
+
+    vb = view.plot_widget.getViewBox()
+    worst = 0.0
+    for width in (1e6, 1e5, 1e4, 1e3, 100, 10):
+        vb.setXRange(5e5 - width / 2, 5e5 + width / 2, padding=0)
+        t0 = time.perf_counter()
+        view.plot_widget.grab()
+        worst = max(worst, time.perf_counter() - t0)
+        shown = item.visible(item.viewRect())
+        assert len(shown) <= vb.width() + 2
+    assert worst < 0.5
+
+    graph.annotations.clear()
+    assert view.annotation_layer.update(graph.annotations)
+    assert item.scene() is None
+
+
+def test_annotations_follow_a_log_x_axis():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    from ui.views import MyPlotView
+
+    graph = GraphData(name="L", curves=[CurveData(name="c", x=[1, 1e4], y=[1, 2])], log_x=True)
+    graph.annotations.add_many([0.0, 10.0, 100.0, 1000.0], kind="événement")
+    graph.annotations.add_many([2000.0], [5000.0], kind="intervalle")
+    view = MyPlotView(graph)
+    view.plot_widget.resize(800, 400)
+    view.update_graph_properties()
+    view.refresh_curves()
+    item = view.annotation_layer.item
+    assert item._log_x
+
+    # The view rect is in log10 units; the store is queried in data units
+    view.plot_widget.getViewBox().setXRange(0.5, 3.5, padding=0)  # 10**0.5 .. 10**3.5
+    shown = item.visible(item.viewRect())
+    assert sorted(item.store.start[shown.singles]) == [10.0, 100.0, 1000.0, 2000.0]
+    assert np.allclose(item._to_view(item.store.start[shown.singles]), np.log10(item.store.start[shown.singles]))
+    view.plot_widget.grab()  # paints at log10 positions, 0.0 falls off the left
+
+    item.setLogMode(False, False)
+    assert len(item.visible(item.viewRect())) == 0  # 0.5 .. 3.5 in data units: nothing
@@ -0,0 +1,78 @@
+import os
+import sys
+import time
+import numpy as np
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt5 import QtWidgets
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.models import CurveData, GraphData
+from ui.axis_links import LINK_INTERVAL_MS, XLinkManager
+
+
+def wait(app, ms):
+    end = time.time() + ms / 1000.0
+    while time.time() < end:
+        app.processEvents()
+        time.sleep(0.002)
+
+
+def make_views(names, group="A"):
+    from ui.views import MyPlotView
+
+    views = {}
+    for name in names:
+        graph = GraphData(name=name, x_link_group=group,
+                          curves=[CurveData(name="c", x=np.arange(100.0), y=np.arange(100.0))])
+        views[graph.name] = MyPlotView(graph)
+    return views
+
+
+def x_range(view):
+    return view.plot_widget.getViewBox().viewRange()[0]
+
+
+def test_group_follows_throttled_without_full_refresh(monkeypatch):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    views = make_views([f"g{i}" for i in range(10)])
+    views.update(make_views(["loner"], group=""))
+
+    manager = XLinkManager()
+    manager.sync(views)
+    refreshed = []
+    applied = []
+    for view in views.values():
+        monkeypatch.setattr(view, "refresh_curves", lambda v=view: refreshed.append(v))
+    original = XLinkManager._apply
+    monkeypatch.setattr(XLinkManager, "_apply", staticmethod(lambda v, a, b: (applied.append(v), original(v, a, b))))
+
+    source = views["g3"]
+    for end in range(20, 30):  # a burst of range changes within one frame
+        source.plot_widget.getViewBox().setXRange(10, end, padding=0)
+    wait(app, LINK_INTERVAL_MS * 4)
+
+    assert len(applied) == 9  # one propagation for the whole burst
+    for name, view in views.items():
+        if name.startswith("g"):
+            assert np.allclose(x_range(view), (10, 29))
+    assert not np.allclose(x_range(views["loner"]), (10, 29))
+    assert not refreshed
+
+
+def test_log_axis_members_get_converted_range():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    views = make_views(["g0", "g1"])
+    views["g1"].graph_data.log_x = True
+    views["g1"].update_graph_properties()
+    manager = XLinkManager()
+    manager.sync(views)
+
+    views["g0"].plot_widget.getViewBox().setXRange(10, 1000, padding=0)
+    manager.flush()
+    assert np.allclose(x_range(views["g1"]), (1, 3))
+
+    views["g1"].graph_data.x_link_group = ""
+    manager.sync(views)
+    assert manager.group_of(views["g0"]) == "A" and manager.members("A") == [views["g0"]]
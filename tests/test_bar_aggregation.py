@@ -0,0 +1,46 @@
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.models import CurveData
+from ui.bar_aggregation import BAR_FILL, aggregate_bars
+from ui.render_pipeline import Viewport, prepare_curve
+
+
+def test_few_samples_keep_one_bar_each_sized_from_spacing():
+    x = np.array([0.0, 2.0, 4.0, 6.0])
+    bins = aggregate_bars(x, [1, 2, 3, 4], 0, 6, n_bins=100)
+    assert not bins.aggregated
+    assert np.array_equal(bins.x, x)
+    assert bins.width == 2.0 * BAR_FILL
+
+
+def test_bins_reduce_min_max_mean_and_skip_empty_bins():
+    x = np.array([0.0, 0.1, 0.2, 5.0, 5.1, 9.9])
+    y = np.array([1.0, 5.0, np.nan, -2.0, 4.0, 7.0])
+    for how, expected in (("max", [5.0, 4.0, 7.0]), ("min", [1.0, -2.0, 7.0]), ("mean", [3.0, 1.0, 7.0])):
+        bins = aggregate_bars(x, y, 0.0, 10.0, n_bins=4, how=how)
+        assert bins.aggregated
+        assert np.allclose(bins.x, [1.25, 6.25, 8.75])
+        assert np.allclose(bins.height, expected), how
+        assert bins.width == 2.5 * BAR_FILL
+
+
+def test_large_bar_curve_is_rebinned_for_the_viewport():
+    n = 1_000_000
+    curve = CurveData(name="hist", x=np.arange(n) * 0.5, y=np.random.default_rng(0).random(n),
+                      display_mode="bar", gain=2.0)
+    prepare_curve(curve, Viewport(0, n * 0.5, 1000))  # caches spacing and stats
+
+    start = time.perf_counter()
+    full = prepare_curve(curve, Viewport(0, n * 0.5, 1000))
+    assert (time.perf_counter() - start) < 0.1
+    assert len(full.x) <= 1000
+    assert full.y.max() > 1.99  # max of each bin, gain applied
+
+    zoomed = prepare_curve(curve, Viewport(1000.0, 1100.0, 1000))
+    assert len(zoomed.x) == 201
+    assert np.isclose(zoomed.bar_width, 0.5 * BAR_FILL)
@@ -0,0 +1,76 @@
+import os
+import sys
+import numpy as np
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.models import CurveData, GraphData
+from IO_dossier.project_io import export_project_to_json
+import render
+
+
+def make_project(path, n=2_000_000):
+    x = np.arange(n) * 1e-6
+    big = CurveData(name="big", x=x, y=np.sin(x * 300.0) + np.random.rand(n) * 0.1)
+    small = CurveData(name="small", x=np.arange(20.0), y=np.arange(20.0), display_mode="bar")
+    graphs = {
+        "signal 1": GraphData(name="signal 1", curves=[big]),
+        "bars": GraphData(name="bars", curves=[small], zones=[{"type": "vlinear", "bounds": [2, 4]}]),
+    }
+    export_project_to_json(graphs, str(path))
+
+
+def test_cli_renders_every_graph_with_column_decimated_svg(tmp_path):
+    project = tmp_path / "nuit.json"
+    make_project(project)
+    out = tmp_path / "images"
+
+    code = render.main([str(project), "-o", str(out), "--format", "png", "svg",
+                        "--size", "400x300", "--jobs", "1"])
+    assert code == 0
+    names = sorted(os.listdir(out))
+    assert names == ["nuit_bars.png", "nuit_bars.svg", "nuit_signal_1.png", "nuit_signal_1.svg"]
+    # 2 M points, but at most one min/max pair per column of a 400 px image
+    assert os.path.getsize(out / "nuit_signal_1.svg") < 200_000
+
+    from PyQt5 import QtGui
+    assert QtGui.QImage(str(out / "nuit_signal_1.png")).width() == 400
+
+
+def test_parallel_rendering_reports_failures(tmp_path):
+    from ui.batch_render import RenderTask, render_tasks
+
+    project = tmp_path / "p.json"
+    make_project(project, n=1000)
+    tasks = [
+        RenderTask(str(project), "bars", str(tmp_path), ("png",), 200, 100),
+        RenderTask(str(project), "absent", str(tmp_path), ("png",), 200, 100),
+    ]
+    results = render_tasks(tasks, jobs=2)
+    assert results[tasks[0]] == [str(tmp_path / "p_bars.png")]
+    assert results[tasks[1]] is None
+    assert os.path.exists(tmp_path / "p_bars.png")
+
+
+def test_column_decimation_follows_a_log_x_axis():
+    from ui.batch_render import _wait_until_drawn, decimate_to_columns, ensure_application
+    from ui.views import MyPlotView
+
+    app = ensure_application()
+    x = np.logspace(0, 6, 200_000)
+    curve = CurveData(name="c", x=x, y=np.sin(np.log(x) * 40))
+    view = MyPlotView(GraphData(name="log", curves=[curve], log_x=True))
+    view.plot_widget.resize(400, 300)
+    view.update_graph_properties()
+    view.refresh_curves()
+    _wait_until_drawn(app, view)
+    view.reset_zoom()
+    _wait_until_drawn(app, view)
+
+    decimate_to_columns(view, 300)
+    cx, _ = view.curves["c"].getOriginalDataset()
+    assert len(cx) <= 2 * 300
+    # The first decade keeps its sixth of the columns, not a single one
+    assert (cx < 10).sum() >= 2 * 40
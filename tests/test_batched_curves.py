@@ -0,0 +1,120 @@
+import os
+import sys
+import numpy as np
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt5 import QtWidgets
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.models import CurveData, GraphData
+from ui.batched_curves import BatchedCurveItem, group_batches
+from ui.render_pipeline import Viewport, prepare_batch
+
+
+def make_overlay(n_curves, n_points=100, **style):
+    x = np.arange(n_points, dtype=float)
+    return [CurveData(name=f"acq{i}", x=x, y=np.sin(x / 10.0) + i, **style) for i in range(n_curves)]
+
+
+def test_group_batches_by_style():
+    curves = make_overlay(3)
+    curves.append(CurveData(name="red", x=[0, 1], y=[0, 1], color="r"))
+    curves.append(CurveData(name="dots", x=[0, 1], y=[0, 1], symbol="o"))
+    batches, singles = group_batches(curves)
+    assert [[c.name for c in m] for m in batches.values()] == [["acq0", "acq1", "acq2"]]
+    assert [c.name for c in singles] == ["red", "dots"]
+
+
+def test_prepare_batch_breaks_between_curves_and_at_nan():
+    curves = make_overlay(3, n_points=10)
+    curves[1].y = np.where(np.arange(10) == 4, np.nan, curves[1].y)
+    prepared = prepare_batch(curves, Viewport(0, 9, 500))
+
+    assert list(prepared.offsets) == [0, 10, 20, 30]
+    assert not prepared.connect[9] and not prepared.connect[19]
+    assert not prepared.connect[13] and not prepared.connect[14]
+    assert prepared.connect[:9].all()
+    assert prepared.bounds[:3] == (0.0, 9.0, 0.0) and prepared.bounds[3] > 2.7
+
+
+def test_prepare_batch_decimates_each_member_to_viewport():
+    curves = make_overlay(4, n_points=50_000)
+    prepared = prepare_batch(curves, Viewport(10_000, 20_000, 400))
+    assert len(prepared.x) < 4 * 2_000
+    assert prepared.x[0] >= 9_000 and prepared.x[prepared.offsets[1] - 1] <= 21_000
+
+
+def test_member_visibility():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    curves = make_overlay(3, n_points=10)
+    prepared = prepare_batch(curves, None)
+    item = BatchedCurveItem("b", prepared.names)
+    item.setData(prepared.x, prepared.y, prepared.connect, prepared.offsets, prepared.bounds)
+
+    full = item.boundingRect().height()
+    item.set_member_visible("acq2", False)
+    assert not item.is_member_visible("acq2")
+    assert item.boundingRect().height() < full
+
+
+def test_view_draws_overlay_with_constant_item_count():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    from ui.views import MyPlotView
+
+    graph = GraphData(name="g", curves=make_overlay(200), batch_curves=True)
+    view = MyPlotView(graph)
+    view.refresh_curves()
+
+    items = [i for i in view.plot_widget.getPlotItem().items if isinstance(i, BatchedCurveItem)]
+    assert len(items) == 1
+    assert len(view.curves) == 200
+    assert set(view.curves.values()) == {items[0]}
+
+
+def test_batches_follow_log_axes():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    from ui.views import MyPlotView
+
+    x = np.array([1.0, 2.0, 3.0])
+    curves = [CurveData(name=f"acq{i}", x=x, y=x * (i + 1)) for i in range(2)]
+    graph = GraphData(name="g", curves=curves, batch_curves=True, log_x=True, log_y=True)
+    view = MyPlotView(graph)
+    view.update_graph_properties()
+    view.refresh_curves()
+
+    item = view.curves["acq0"]
+    assert isinstance(item, BatchedCurveItem)
+    bx, by = item.member_data("acq1")
+    assert np.allclose(bx, np.log10(x)) and np.allclose(by, np.log10(2 * x))
+    # Same place as a separate PlotDataItem, auto-range included
+    assert np.allclose(item.dataBounds(0), (0.0, np.log10(3)))
+    assert np.allclose(item.dataBounds(1), (0.0, np.log10(6)))
+
+    # Non-positive samples are left out of the path
+    prepared = prepare_batch([CurveData(name="z", x=np.array([0.0, 1.0, 10.0]), y=np.ones(3))],
+                             Viewport(1, 10, 100, log_x=True))
+    assert not prepared.connect[0] and prepared.connect[1]
+    assert prepared.bounds[:2] == (0.0, 1.0)
+
+
+def test_hiding_a_batched_curve_keeps_the_batch():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    from ui.views import MyPlotView
+
+    graph = GraphData(name="g", curves=make_overlay(3, n_points=10), batch_curves=True)
+    view = MyPlotView(graph)
+    view.refresh_curves()
+    item = view.curves["acq2"]
+    full = item.boundingRect().height()
+
+    graph.curves[2].visible = False
+    view.update_curve("acq2", {"visible"})
+    assert view.curves["acq2"] is item  # not rebuilt
+    assert not item.is_member_visible("acq2")
+    assert item.boundingRect().height() < full
+
+    graph.curves[2].visible = True
+    view.update_curve("acq2", {"visible"})
+    assert item.is_member_visible("acq2")
+    assert item.boundingRect().height() == full
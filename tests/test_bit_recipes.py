@@ -0,0 +1,109 @@
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.models import CurveData, GraphData
+from core.bit_curves import bit_values, make_bit_curve
+from IO_dossier.project_io import export_project_to_json, import_project_from_json, snapshot_project
+from IO_dossier.serializers import graph_to_dict
+
+
+def make_graph():
+    graph = GraphData(name="bus")
+    parent = CurveData(name="data", x=np.arange(6.0), y=[0, 1, 2, 3, np.nan, 5])
+    graph.add_curve(parent)
+    for i in range(3):
+        lane = make_bit_curve(parent, f"data[{i}]", [i], single=True)
+        lane.color = "#123456"
+        lane.offset = 2.0 * i
+        graph.add_curve(lane)
+    graph.add_curve(make_bit_curve(parent, "grp", [2, 0]))
+    return graph
+
+
+def test_bit_values_chunked_matches_group():
+    values = np.array([0, 1, 2, 3, 4, 5, np.nan])
+    out = bit_values(values, [2, 0], chunk_size=3)
+    assert np.array_equal(out[:-1], [0, 2, 0, 2, 1, 3])
+    assert np.isnan(out[-1])
+
+
+def test_bit_curves_saved_as_recipes(tmp_path):
+    path = tmp_path / "bus.json"
+    export_project_to_json({"bus": make_graph()}, str(path))
+
+    saved = json.loads(path.read_text())["graphs"][0]["curves"]
+    assert "y" in saved[0]
+    assert [c["recipe"] for c in saved[1:]] == [
+        {"parent": "data", "bit_index": 0},
+        {"parent": "data", "bit_index": 1},
+        {"parent": "data", "bit_index": 2},
+        {"parent": "data", "bit_indices": [2, 0]},
+    ]
+    assert all("x" not in c and "y" not in c for c in saved[1:])
+
+
+def saved_curves(graph, path):
+    export_project_to_json({"bus": graph}, str(path))
+    return json.loads(path.read_text())["graphs"][0]["curves"]
+
+
+def test_bit_curves_outliving_their_parent_data_keep_their_arrays(tmp_path):
+    graph = make_graph()
+    assert all("recipe" in c for c in graph_to_dict(snapshot_project({"bus": graph})["bus"])["curves"][1:])
+
+    # The parent's data changes (e.g. new data type): the bits no longer derive from it
+    parent = graph.curves[0]
+    parent.y = parent.y * 4
+    saved = saved_curves(graph, tmp_path / "bus.json")
+    assert all("recipe" not in c and "y" in c for c in saved)
+    loaded = import_project_from_json(str(tmp_path / "bus.json"))["bus"]
+    assert np.array_equal(loaded.curves[2].y[:4], [0, 0, 1, 1])
+    assert np.array_equal(loaded.curves[4].y[:4], [0, 2, 0, 2])
+
+    # Another curve takes the parent's name
+    graph = make_graph()
+    graph.curves[0] = CurveData(name="data", x=np.arange(6.0), y=np.zeros(6))
+    saved = saved_curves(graph, tmp_path / "renamed.json")
+    assert all("recipe" not in c for c in saved)
+    assert saved_curves(make_graph(), tmp_path / "intact.json")[1]["recipe"] == {"parent": "data", "bit_index": 0}
+
+
+def test_recipes_rebuilt_lazily(tmp_path):
+    path = tmp_path / "bus.json"
+    export_project_to_json({"bus": make_graph()}, str(path))
+
+    graph = import_project_from_json(str(path))["bus"]
+    lane1 = graph.curves[2]
+    assert lane1.parent_curve == "data" and lane1.bit_index == 1
+    assert lane1.offset == 2.0 and lane1.color == "#123456"
+    assert not lane1.is_data_loaded
+
+    assert np.array_equal(lane1.y[:4], [0, 0, 1, 1])
+    assert np.isnan(lane1.y[4])
+    assert lane1.is_data_loaded
+    assert lane1.x is graph.curves[0].x
+    assert np.array_equal(graph.curves[4].y[:4], [0, 2, 0, 2])
+
+
+def test_lazy_data_is_built_once_across_threads():
+    curve = CurveData(name="lane", x=np.arange(4.0), y=np.zeros(4))
+    calls = []
+
+    def build():
+        calls.append(1)
+        time.sleep(0.05)  # let the other readers arrive meanwhile
+        return np.arange(4.0)
+
+    curve.defer_data(build)
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(lambda _: curve.y, range(8)))
+
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results) and curve.is_data_loaded
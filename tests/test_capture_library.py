@@ -0,0 +1,124 @@
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.models import CurveData
+from IO_dossier.capture_library import CaptureLibrary, guess_channel
+
+
+def make_library(tmp_path):
+    src = tmp_path / "scope.bin"
+    src.write_bytes(b"raw")
+    x = np.linspace(0, 1e-3, 1001)
+    curves = [
+        CurveData(name="Channel 1", x=x, y=np.sin(x * 1e4)),
+        CurveData(name="Channel 2", x=x, y=np.linspace(0, 5, 1001)),
+    ]
+    lib = CaptureLibrary(tmp_path / "lib")
+    lib.index_file(str(src), "rohde_schwarz_bin", curves)
+    lib.cache_arrays(str(src), curves)  # the background job of an import
+    return lib
+
+
+def test_guess_channel():
+    assert guess_channel("Channel 2") == "CH2"
+    assert guess_channel("ch03") == "CH3"
+    assert guess_channel("temperature") is None
+
+
+def test_index_and_search(tmp_path):
+    lib = make_library(tmp_path)
+
+    records = lib.search(channel="CH2", max_above=3.3)
+    assert [r.name for r in records] == ["Channel 2"]
+    rec = records[0]
+    assert rec.instrument == "Rohde & Schwarz"
+    assert rec.length == 1001
+    assert rec.sample_rate == pytest.approx(1e6, rel=1e-6)
+    assert rec.y_max == 5.0
+
+    assert lib.search(channel="CH1", max_above=3.3) == []
+    assert len(lib.search(since=time.time() - 3600)) == 2
+    assert len(lib.search(name="Chan*")) == 2
+
+
+def test_reindex_replaces_rows_and_shares_x_cache(tmp_path):
+    lib = make_library(tmp_path)
+    records = lib.search()
+    assert records[0].x_cache == records[1].x_cache
+
+    src = str(tmp_path / "scope.bin")
+    cache_files = set(os.listdir(lib.cache_dir))
+    assert len(cache_files) == 3  # one shared X, two Y
+    curves = [CurveData(name="Channel 1", x=[0, 1], y=[0, 1])]
+    lib.index_file(src, "rohde_schwarz_bin", curves)
+    lib.cache_arrays(src, curves)
+    assert [r.name for r in lib.search()] == ["Channel 1"]
+    # The arrays of the replaced rows are pruned
+    remaining = set(os.listdir(lib.cache_dir))
+    assert len(remaining) == 2 and not remaining & cache_files
+
+
+def test_indexing_copies_no_array_until_the_cache_job(tmp_path):
+    src = tmp_path / "scope.bin"
+    src.write_bytes(b"raw")
+    curves = [CurveData(name="CH1", x=np.arange(10.0), y=np.arange(10.0))]
+    lib = CaptureLibrary(tmp_path / "lib")
+    lib.index_file(str(src), "keysight_bin", curves)
+    assert os.listdir(lib.cache_dir) == []
+    assert lib.search() == []  # not reloadable yet
+
+    (lib.cache_dir / "orphan.npy").write_bytes(b"")
+    assert lib.cache_arrays(str(src), curves) == 1
+    assert [r.name for r in lib.search()] == ["CH1"]
+    assert "orphan.npy" not in os.listdir(lib.cache_dir)
+    lib.close()
+
+
+def test_load_curve_from_cache(tmp_path):
+    lib = make_library(tmp_path)
+    rec = lib.search(channel="CH2")[0]
+
+    curve = lib.load_curve(rec)
+
+    assert curve.name == "Channel 2"
+    assert np.allclose(curve.y, np.linspace(0, 5, 1001))
+
+
+def test_index_from_a_job_thread(tmp_path):
+    lib = make_library(tmp_path)  # opened on this thread, as by the GUI
+    src = tmp_path / "other.bin"
+    src.write_bytes(b"raw")
+    curve = CurveData(name="CH3", x=np.arange(10.0), y=np.arange(10.0))
+    with ThreadPoolExecutor(1) as pool:
+        pool.submit(lib.index_file, str(src), "keysight_bin", [curve]).result()
+        pool.submit(lib.cache_arrays, str(src), [curve]).result()
+        # and a library first opened by a job is usable from here
+        other = pool.submit(CaptureLibrary, tmp_path / "lib").result()
+    assert [r.name for r in lib.search(channel="CH3")] == ["CH3"]
+    assert "Keysight" in other.instruments()
+    other.close()
+    lib.close()
+
+
+def test_library_singleton_is_opened_once_across_threads(tmp_path, monkeypatch):
+    import IO_dossier.capture_library as capture_library
+
+    opened = []
+
+    def slow_library():
+        opened.append(1)
+        time.sleep(0.05)  # the other threads ask meanwhile
+        return CaptureLibrary(tmp_path / "lib")
+
+    monkeypatch.setattr(capture_library, "_library", None)
+    monkeypatch.setattr(capture_library, "CaptureLibrary", slow_library)
+    with ThreadPoolExecutor(4) as pool:
+        libraries = list(pool.map(lambda _: capture_library.get_capture_library(), range(4)))
+    assert len(opened) == 1 and all(lib is libraries[0] for lib in libraries)
+    libraries[0].close()
@@ -0,0 +1,64 @@
+import os
+import sys
+import numpy as np
+from types import SimpleNamespace
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt5 import QtWidgets
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.models import CurveData, GraphData
+from ui.CentralPlotArea import CentralPlotArea
+
+
+def settle(app):
+    for _ in range(5):
+        app.processEvents()
+
+
+def test_area_reports_only_on_screen_widgets():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    area = CentralPlotArea()
+    area.resize(400, 300)
+    events = []
+    area.widget_visibility_changed.connect(lambda w, v: events.append((w.objectName(), v)))
+    for i in range(30):
+        box = QtWidgets.QGroupBox(f"g{i}")
+        box.setObjectName(f"g{i}")
+        box.setFixedHeight(200)
+        area.add_plot_widget(box)
+    area.show()
+    settle(app)
+
+    visible = {w.objectName() for w in area.visible_widgets()}
+    assert visible and "g0" in visible and "g29" not in visible
+    assert len(visible) <= 3
+
+    events.clear()
+    area.verticalScrollBar().setValue(area.verticalScrollBar().maximum())
+    settle(app)
+    assert ("g29", True) in events and ("g0", False) in events
+    area.close()
+
+
+def test_coordinator_renders_views_only_when_visible():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    from ui.graph_ui_coordinator import GraphUICoordinator
+
+    graphs = {
+        f"g{i}": GraphData(name=f"g{i}", curves=[CurveData(name="c", x=np.arange(10.0), y=np.arange(10.0))])
+        for i in range(3)
+    }
+    area = CentralPlotArea()
+    coordinator = GraphUICoordinator(SimpleNamespace(graphs=graphs), {}, area)
+    coordinator.refresh_plot()
+    views = coordinator.views
+    assert all(v.suspended and not v.curves for v in views.values())
+
+    area.widget_visibility_changed.emit(views["g1"].container, True)
+    assert not views["g1"].suspended and "c" in views["g1"].curves
+
+    area.widget_visibility_changed.emit(views["g1"].container, False)
+    assert views["g1"].suspended and not views["g1"].curves
+    assert views["g1"]._snapshot is not None
@@ -0,0 +1,82 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt5 import QtWidgets
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.app_state import AppState
+import core.graph_service as graph_service
+from core.graph_service import GraphService
+from core.models import ADDED, MODIFIED, RENAMED, ChangeEvent, CurveData
+import ui.GraphCurvePanel as graph_curve_panel
+from signal_bus import SignalBus
+
+
+@pytest.fixture
+def setup(monkeypatch):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    bus = SignalBus()  # fresh bus: the global one may not outlive earlier tests' app
+    monkeypatch.setattr(graph_service, "signal_bus", bus)
+    monkeypatch.setattr(graph_curve_panel, "signal_bus", bus)
+    AppState._instance = None
+    state = AppState.get_instance()
+    events = []
+    bus.model_changed.connect(events.append)
+    return app, GraphService(state), state, events
+
+
+def make_curves(count):
+    return [CurveData(name=f"c{i}", x=np.arange(3.0), y=np.arange(3.0)) for i in range(count)]
+
+
+def test_setters_describe_what_changed(setup):
+    _, service, state, events = setup
+    service.add_graph("G")
+    names = service.add_curves("G", make_curves(3))
+    assert names == ["c0", "c1", "c2"]
+    assert events == [ChangeEvent("G", kind=ADDED), ChangeEvent("G", fields=frozenset({"curves"}))]
+
+    events.clear()
+    service.set_width(4)
+    service.set_gain(2.0)
+    service.set_dark_mode(True)
+    service.rename_curve("c2", "bus")
+    assert events == [
+        ChangeEvent("G", "c2", frozenset({"width"})),
+        ChangeEvent("G", "c2", frozenset({"gain", "units_per_grid"})),
+        ChangeEvent("G", None, frozenset({"dark_mode"})),
+        ChangeEvent("G", "bus", frozenset({"name"}), RENAMED),
+    ]
+    assert not events[0].touches({"name", "visible"})
+    assert events[3].touches({"width"}) and ChangeEvent("G").touches({"width"})
+
+
+def test_width_change_does_not_rebuild_the_curve_tree(setup):
+    _, service, state, events = setup
+    panel = graph_curve_panel.GraphCurvePanel()
+    rebuilds = []
+    panel.refresh_tree = lambda *args: rebuilds.append(args)
+
+    service.add_graph("G")
+    service.add_curves("G", make_curves(2000))
+    assert len(rebuilds) == 2  # one per change, not one per curve
+    graph_curve_panel.GraphCurvePanel.refresh_tree(panel)
+
+    service.set_width(5)
+    service.set_color("#ff0000")
+    assert len(rebuilds) == 2
+
+    # Visibility is updated on the existing item
+    service.set_curve_visible("G", "c7", False)
+    assert len(rebuilds) == 2
+    item = panel._find_item("G", "c7")
+    assert item is not None and item.data(graph_curve_panel.Qt.UserRole + 1) is False
+
+    service.bring_curve_to_front()
+    assert len(rebuilds) == 3
+    assert events[-1].kind == MODIFIED and events[-1].fields == {"curves"}
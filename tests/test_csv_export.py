@@ -0,0 +1,116 @@
+import os
+import sys
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.models import CurveData, GraphData
+from IO_dossier.csv_export import export_graph_to_csv, export_project_to_csv
+
+
+def read_rows(path):
+    with open(path, encoding="utf-8") as f:
+        return [line.rstrip("\n").split(";") for line in f]
+
+
+def test_shared_axis_single_x_column(tmp_path):
+    x = np.arange(5, dtype=float)
+    graph = GraphData(name="g")
+    graph.add_curve(CurveData(name="a", x=x, y=x * 2, gain=0.5, offset=1.0))
+    graph.add_curve(CurveData(name="b", x=x.copy(), y=x + 0.5))
+    path = tmp_path / "g.csv"
+
+    reported = []
+    assert export_graph_to_csv(graph, str(path), chunk_size=2, progress=reported.append)
+
+    rows = read_rows(path)
+    assert rows[0] == ["x", "a", "b"]
+    assert len(rows) == 6
+    assert rows[1] == ["0,0", "1,0", "0,5"]
+    assert rows[5] == ["4,0", "5,0", "4,5"]
+    assert reported[-1] == 1.0
+
+
+def test_merged_axes_leave_gaps(tmp_path):
+    graph = GraphData(name="g")
+    graph.add_curve(CurveData(name="a", x=[0, 2, 4], y=[1, 2, 3]))
+    graph.add_curve(CurveData(name="b", x=[0, 1, 2], y=[7, 8, 9], time_offset=1.0))
+    path = tmp_path / "g.csv"
+
+    export_graph_to_csv(graph, str(path), sep=",", decimal=".", chunk_size=2)
+
+    with open(path, encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    assert lines == [
+        "x,a,b",
+        "0.0,1.0,",
+        "1.0,,7.0",
+        "2.0,2.0,8.0",
+        "3.0,,9.0",
+        "4.0,3.0,",
+    ]
+
+
+def test_merged_axes_keep_repeated_x_values(tmp_path):
+    graph = GraphData(name="g")
+    graph.add_curve(CurveData(name="a", x=[0, 1, 1, 2], y=[10, 11, 12, 13]))
+    graph.add_curve(CurveData(name="b", x=[1, 1, 1, 3], y=[20, 21, 22, 23]))
+    path = tmp_path / "g.csv"
+
+    export_graph_to_csv(graph, str(path), sep=",", decimal=".", chunk_size=3)
+
+    with open(path, encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    assert lines == [
+        "x,a,b",
+        "0.0,10.0,",
+        "1.0,11.0,20.0",
+        "1.0,12.0,21.0",
+        "1.0,,22.0",
+        "2.0,13.0,",
+        "3.0,,23.0",
+    ]
+
+
+def test_bit_curves_derived_from_parent(tmp_path):
+    graph = GraphData(name="g")
+    parent = CurveData(name="p", x=[0, 1, 2, 3], y=[0, 1, 2, float("nan")])
+    bit1 = CurveData(name="p[1]", x=[0, 1, 2, 3], y=[0, 0, 0, 0])
+    bit1.bit_index = 1
+    bit1.parent_curve = "p"
+    graph.add_curve(parent)
+    graph.add_curve(bit1)
+    path = tmp_path / "g.csv"
+
+    export_graph_to_csv(graph, str(path))
+
+    rows = read_rows(path)
+    assert [r[2] for r in rows[1:]] == ["0,0", "0,0", "1,0", ""]
+
+
+def test_project_headers_prefixed(tmp_path):
+    g1 = GraphData(name="g1")
+    g1.add_curve(CurveData(name="c", x=[0, 1], y=[1, 2]))
+    g2 = GraphData(name="g2")
+    g2.add_curve(CurveData(name="c", x=[0, 1], y=[3, 4]))
+    path = tmp_path / "p.csv"
+
+    export_project_to_csv({"g1": g1, "g2": g2}, str(path))
+
+    assert read_rows(path)[0] == ["x", "g1 - c", "g2 - c"]
+
+
+def test_cancel_stops_export(tmp_path):
+    graph = GraphData(name="g")
+    graph.add_curve(CurveData(name="a", x=np.arange(10), y=np.arange(10)))
+
+    target = tmp_path / "g.csv"
+    target.write_text("previous export")
+    done = export_graph_to_csv(
+        graph, str(target), chunk_size=2, is_cancelled=lambda: True
+    )
+
+    assert done is False
+    # No truncated file: the previous export is untouched, nothing left behind
+    assert target.read_text() == "previous export"
+    assert os.listdir(tmp_path) == ["g.csv"]
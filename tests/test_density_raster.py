@@ -0,0 +1,68 @@
+import os
+import sys
+import numpy as np
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt5 import QtWidgets
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.models import CurveData, GraphData
+from ui.density_raster import DENSITY_MAX_SYMBOLS, DensityImageItem, density_counts
+from ui.render_pipeline import Viewport, prepare_curve
+
+
+def make_cloud(n=1_000_000, seed=0):
+    rng = np.random.default_rng(seed)
+    x = rng.normal(size=n)
+    return CurveData(name="cloud", x=x, y=2.0 * x + rng.normal(size=n), display_mode="scatter")
+
+
+def test_density_counts_match_histogram2d():
+    rng = np.random.default_rng(1)
+    x, y = rng.random(10_000), rng.random(10_000)
+    x[0] = np.nan
+    counts = density_counts(x, y, (0.0, 0.0, 1.0, 1.0), (40, 30))
+    expected, _, _ = np.histogram2d(x[1:], y[1:], bins=(40, 30), range=((0, 1), (0, 1)))
+    assert counts.shape == (40, 30)
+    assert np.array_equal(counts, expected)
+
+
+def test_dense_scatter_is_rasterised_at_screen_resolution():
+    curve = make_cloud()
+    prepared = prepare_curve(curve, Viewport(-4, 4, 800, -10, 10, 600))
+    assert prepared.density is not None
+    assert prepared.density.counts.shape == (800, 600)
+    assert prepared.density.n_points > 0.99 * len(curve.x)
+    assert len(prepared.x) == 0
+
+
+def test_zoomed_scatter_falls_back_to_symbols():
+    curve = make_cloud()
+    prepared = prepare_curve(curve, Viewport(0.0, 0.01, 800, -10, 10, 600))
+    assert prepared.density is None
+    assert 0 < len(prepared.x) <= DENSITY_MAX_SYMBOLS
+    assert prepared.x.min() >= 0.0 and prepared.x.max() <= 0.01
+
+
+def test_density_item_reports_full_extent_for_auto_range():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    curve = make_cloud(300_000)
+    prepared = prepare_curve(curve, Viewport(-1, 1, 200, -1, 1, 100))
+    item = DensityImageItem("b")
+    item.set_extent((-5.0, 5.0, -20.0, 20.0))
+    item.set_raster(prepared.density)
+    rect = item.mapRectToParent(item.boundingRect())
+    assert rect.left() == -1 and rect.right() == 1
+    x0, x1 = item.dataBounds(0)
+    assert np.isclose(x0, (-5.0 + 1) * 200 / 2) and np.isclose(x1, (5.0 + 1) * 200 / 2)
+
+
+def test_view_uses_density_item_for_huge_scatter():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    from ui.views import MyPlotView
+
+    view = MyPlotView(GraphData(name="g", curves=[make_cloud(300_000)]))
+    view.refresh_curves()
+    assert "cloud" in view._density
+    assert view.pipeline.is_pending("cloud")
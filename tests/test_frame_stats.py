@@ -0,0 +1,64 @@
+import os
+import sys
+import time
+import numpy as np
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt5 import QtWidgets
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.models import CurveData, GraphData
+from ui.frame_stats import FrameStats
+
+
+def wait_for(app, predicate, timeout=5.0):
+    end = time.time() + timeout
+    while time.time() < end and not predicate():
+        app.processEvents()
+        time.sleep(0.005)
+    return predicate()
+
+
+def test_percentile_and_refresh_rate():
+    stats = FrameStats()
+    for ms in range(1, 101):
+        stats.paint(float(ms))
+    assert stats.last_paint_ms == 100.0
+    assert 94.0 <= stats.p95_paint_ms <= 96.0
+    for t in (0.0, 0.5, 1.2, 1.4):
+        stats.refreshed(now=t)
+    assert stats.refreshes_last_second(now=1.45) == 3
+    stats.curve_drawn("a", 4000, 1_000_000, 2)
+    stats.curve_drawn("b", 10, 10)
+    assert stats.lod_summary() == "niveau 2"
+    assert "4 010 tracés / 1 000 010 stockés" in "\n".join(stats.lines())
+
+
+def test_hud_measures_only_while_visible():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    from ui.views import MyPlotView
+
+    n = 2_000_000
+    big = CurveData(name="big", x=np.arange(float(n)), y=np.random.rand(n))
+    small = CurveData(name="small", x=np.arange(50.0), y=np.arange(50.0))
+    view = MyPlotView(GraphData(name="g", curves=[big, small], auto_range_x=False))
+    view.plot_widget.setXRange(0, n, padding=0)
+    view.refresh_curves()
+    job = lambda: None
+    assert view.stats is None and view._timed(job) is job
+
+    view.set_hud_visible(True)
+    stats = view.stats
+    assert wait_for(app, lambda: "big" in stats.drawn)
+    assert stats.stored == {"big": n, "small": 50}
+    assert stats.drawn["small"] == 50 and stats.drawn["big"] < n
+    assert stats.lod_levels["big"] is not None
+    assert stats.prep_ms > 0 and stats.refreshes_last_second() >= 1
+    view._update_hud()
+    assert "Points" in view._hud.text()
+
+    view.set_hud_visible(False)
+    assert view.stats is None and not view._hud.isVisible()
+    view.plot_widget.frame_painted.emit(3.0)
+    assert not stats.paint_ms
@@ -23,6 +23,7 @@ def make_signal_bus():
         curve_list_updated=DummySignal(),
         curve_updated=DummySignal(),
         graph_updated=DummySignal(),
+        model_changed=DummySignal(),
         graph_visibility_changed=DummySignal(),
         curve_visibility_changed=DummySignal(),
     )
@@ -38,6 +39,8 @@ class DummyCoordinator:
         self.plot_calls += 1
     def refresh_curve_ui(self):
         self.curve_calls += 1
+    def refresh_curve(self, graph_name, curve_name, fields):
+        self.plot_calls += 1
     def reset_zoom(self):
         pass
     def reset_zoom_x(self):
@@ -67,6 +70,9 @@ def controller(monkeypatch):
 
     import controllers as ctrl
     importlib.reload(ctrl)
+    # GraphService emits its change events on the bus it was imported with
+    import core.graph_service as gs
+    monkeypatch.setattr(gs, "signal_bus", bus_module.signal_bus)
 
     AppState._instance = None
     state = AppState.get_instance()
@@ -4,7 +4,7 @@ import pytest
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from core import GraphData, SatelliteObjectData
+from core import CurveData, GraphData, SatelliteObjectData
 
 
 def test_satellite_dicts_are_instance_specific():
@@ -22,3 +22,47 @@ def test_satellite_objects_are_instance_specific():
     g2 = GraphData("g2")
     g1.satellite_objects["left"].append(SatelliteObjectData(name="obj"))
     assert g2.satellite_objects["left"] == []
+
+
+def test_curve_range_queries_sorted_and_unsorted():
+    import numpy as np
+
+    sorted_curve = CurveData(name="s", x=[0, 1, 2, 3, 4], y=[0, 10, 20, 30, 40])
+    assert sorted_curve.is_x_sorted
+    assert sorted_curve.index_range(1, 3) == (1, 4)
+    assert sorted_curve.sample_indices(1.5, 10) == slice(2, 5)
+    assert sorted_curve.value_at(2.5) == 25
+    assert sorted_curve.value_at(2.4, interpolate=False) == 20
+    assert np.isnan(sorted_curve.value_at(5))
+    assert sorted_curve.nearest_index(3.6) == 4
+
+    shuffled = CurveData(name="u", x=[3, 0, 4, 1, 2], y=[30, 0, 40, 10, 20])
+    assert not shuffled.is_x_sorted
+    idx = shuffled.sample_indices(1, 3)
+    assert sorted(shuffled.y[idx].tolist()) == [10, 20, 30]
+    assert shuffled.value_at(0.5) == 5
+    assert shuffled.nearest_index(3.9) == 2
+
+    shuffled.x = np.array([0.0, 1, 2, 3, 4])
+    assert shuffled.is_x_sorted
+
+
+def test_uniform_time_base_is_detected_and_read_directly():
+    import numpy as np
+
+    uniform = CurveData(name="t", x=np.arange(1000) * 0.1 + 5.0, y=np.arange(1000.0))
+    x0, dx = uniform.x_step
+    assert x0 == 5.0 and np.isclose(dx, 0.1)
+    assert np.isclose(uniform.value_at(5.25), 2.5)
+    assert uniform.value_at(5.25, interpolate=False) == 2
+    assert np.isnan(uniform.value_at(4.9))
+    # The last sample is inside the curve even when (x - x0) / dx rounds past it
+    assert uniform.value_at(uniform.x[-1]) == 999.0
+    assert uniform.value_at(uniform.x[-1], interpolate=False) == 999.0
+    fine = CurveData(name="f", x=np.arange(1000) * 1e-3 + 5.0, y=np.arange(1000.0))
+    assert fine.x_step is not None
+    assert np.allclose([fine.value_at(xi) for xi in fine.x], fine.y)
+
+    jittered = CurveData(name="j", x=[0.0, 1.0, 2.5, 3.0], y=[0, 10, 25, 30])
+    assert jittered.x_step is None
+    assert jittered.value_at(2.0) == 20
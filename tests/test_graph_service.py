@@ -27,6 +27,7 @@ def service(monkeypatch):
         curve_list_updated=DummySignal(),
         curve_updated=DummySignal(),
         graph_updated=DummySignal(),
+        model_changed=DummySignal(),
     )
     monkeypatch.setitem(sys.modules, "signal_bus", bus_module)
 
@@ -0,0 +1,73 @@
+import os
+import sys
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.models import CurveData
+import ui.hit_testing as hit_testing
+from ui.hit_testing import MAX_HIT_SAMPLES, CurveBoundsIndex, ViewTransform, hit_test
+
+
+def test_hit_in_pixels_with_tiny_units():
+    # nanosecond X, millivolt Y: a data-unit threshold would select anything
+    x = np.arange(0, 100) * 1e-9
+    low = CurveData(name="low", x=x, y=np.full(100, 0.001))
+    high = CurveData(name="high", x=x, y=np.full(100, 0.003))
+    index = CurveBoundsIndex([low, high])
+    t = ViewTransform(pixel_width=1e-10, pixel_height=1e-4)
+
+    assert hit_test(index, 50.5e-9, 0.0012, t) == "low"
+    assert hit_test(index, 50.5e-9, 0.0029, t) == "high"
+    assert hit_test(index, 50.5e-9, 0.002, t) is None
+
+
+def test_hit_on_segment_between_samples_with_offsets():
+    curve = CurveData(name="ramp", x=[0, 10], y=[0, 10], gain=2.0, offset=1.0, time_offset=5.0)
+    index = CurveBoundsIndex([curve])
+    t = ViewTransform(pixel_width=0.1, pixel_height=0.1)
+    # displayed segment goes from (5, 1) to (15, 21)
+    assert hit_test(index, 10.0, 11.0, t) == "ramp"
+    assert hit_test(index, 10.0, 14.0, t) is None
+
+
+def test_hit_large_curve_reads_a_bounded_envelope(monkeypatch):
+    n = 2_000_000
+    x = np.arange(n, dtype=np.float64)
+    curve = CurveData(name="big", x=x, y=np.sin(x / 5000.0))
+    index = CurveBoundsIndex([curve])
+    # whole curve in 1000 px: the click window covers ~12000 samples
+    t = ViewTransform(pixel_width=n / 1000, pixel_height=2.0 / 500)
+    read = []
+    window_samples = hit_testing._window_samples
+
+    def counting(c, x0, x1):
+        xs, ys = window_samples(c, x0, x1)
+        read.append((c.index_range(x0, x1), len(xs)))
+        return xs, ys
+
+    monkeypatch.setattr(hit_testing, "_window_samples", counting)
+    assert hit_test(index, 1.0e6, np.sin(200.0), t) == "big"
+
+    # The min/max pyramid stands in for the raw samples of the window
+    [((i0, i1), examined)] = read
+    assert i1 - i0 > MAX_HIT_SAMPLES
+    assert examined <= 2 * MAX_HIT_SAMPLES and examined < i1 - i0
+
+
+def test_unsorted_line_uses_the_drawn_segments():
+    # A square drawn as an XY loop: X is not sorted
+    square = CurveData(name="loop", x=[0, 10, 10, 0, 0], y=[0, 0, 10, 10, 0])
+    assert square.x_order is not None
+    index = CurveBoundsIndex([square])
+    t = ViewTransform(pixel_width=0.1, pixel_height=0.1)
+
+    # On the bottom and top edges: both ends of the segment lie outside the click window
+    assert hit_test(index, 5.0, 0.2, t) == "loop"
+    assert hit_test(index, 5.0, 9.8, t) == "loop"
+
+    # Drawn: (0, 0) -> (2, 0) -> (1, 10) -> (3, 10); sorted by X it would be (0, 0) -> (1, 10) -> ...
+    zigzag = CurveData(name="zig", x=[0, 2, 1, 3], y=[0, 0, 10, 10])
+    index = CurveBoundsIndex([zigzag])
+    assert hit_test(index, 0.5, 5.0, t) is None  # on a segment that is never drawn
+    assert hit_test(index, 1.5, 5.0, t) == "zig"  # on the drawn (2, 0) -> (1, 10)
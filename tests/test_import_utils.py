@@ -96,3 +96,23 @@ def test_suggest_dtype_integer_range():
     assert suggest_dtype(arr) == DataType.UINT32
     arr = [-1, 0]
     assert suggest_dtype(arr) == DataType.FLOAT64
+
+
+def test_stats_invalid_counts_match_masks():
+    from core.curve_stats import compute_curve_stats
+
+    y = np.array([0, 1.5, -2, np.nan, np.inf, 300, 70000, 5e9, 7])
+    stats = compute_curve_stats(None, y, chunk_size=4)
+    assert stats.invalid_count(DataType.FLOAT64) == 0
+    assert stats.invalid_count(DataType.UINT8) == 7
+    assert stats.invalid_count(DataType.UINT16) == 6
+    assert stats.invalid_count(DataType.UINT32) == 5
+    assert stats.nan_count == 1 and not stats.is_integer
+
+
+def test_imported_curves_have_cached_stats(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("x,a\n0,1\n1,300\n")
+    curve = import_curves_from_csv(str(path))[0]
+    assert curve.dtype == DataType.UINT16
+    assert "stats" in curve._derived_cache
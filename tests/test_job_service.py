@@ -0,0 +1,149 @@
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt5 import QtWidgets
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.app_state import AppState
+from core.graph_service import GraphService, compute_bit_values
+import core.graph_service as graph_service
+import core.job_service as job_service
+from core.job_service import BACKGROUND, CANCELLED, DONE, FAILED, INTERACTIVE, Job, JobService
+from core.models import CurveData
+from signal_bus import SignalBus
+
+
+def wait_until(app, condition, timeout=10.0):
+    end = time.time() + timeout
+    while not condition() and time.time() < end:
+        app.processEvents()
+        time.sleep(0.001)
+    app.processEvents()
+    return condition()
+
+
+@pytest.fixture
+def make_service(monkeypatch):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    bus = SignalBus()  # fresh bus: the global one may not outlive earlier tests' app
+    monkeypatch.setattr(job_service, "signal_bus", bus)
+    monkeypatch.setattr(graph_service, "signal_bus", bus)
+
+    def make(**kwargs):
+        AppState._instance = None
+        return app, JobService(AppState.get_instance(), **kwargs)
+
+    make.bus = bus
+    return make
+
+
+def test_interactive_jobs_run_before_queued_background_jobs(make_service):
+    app, jobs = make_service(max_threads=1)
+    release = threading.Event()
+    order = []
+
+    def step(name, wait=False):
+        if wait:
+            release.wait(5)
+        order.append(name)
+        return name
+
+    first = jobs.submit(Job("bloquante", step, ("bloquante", True), priority=BACKGROUND))
+    background = [jobs.submit(Job(f"fond {i}", step, (f"fond {i}",))) for i in range(3)]
+    urgent = jobs.submit(Job("interactive", step, ("interactive",), priority=INTERACTIVE))
+    assert [h.status for h in jobs.active_jobs()][:1] == ["running"]
+    release.set()
+    assert wait_until(app, lambda: not jobs.active_jobs())
+    assert order == ["bloquante", "interactive", "fond 0", "fond 1", "fond 2"]
+    assert all(h.status == DONE for h in [first, urgent, *background])
+    assert urgent.result == "interactive"
+
+
+def test_same_job_twice_shares_one_run_and_applies_once(make_service):
+    app, jobs = make_service()
+    runs, applied = [], []
+    release = threading.Event()
+
+    def work(x):
+        runs.append(x)
+        release.wait(5)
+        return x * 2
+
+    job = Job("double", work, (21,), outputs=("test",), apply=lambda state, r: applied.append(r))
+    a = jobs.submit(job)
+    b = jobs.submit(Job("double", work, (21,), outputs=("test",), priority=INTERACTIVE))
+    assert a is b
+    release.set()
+    assert wait_until(app, lambda: a.finished)
+    assert runs == [21] and applied == [42]
+    # Once finished, the same request runs again
+    assert jobs.submit(job) is not a
+
+
+def test_progress_and_cancellation_go_through_the_signal_bus(make_service):
+    app, jobs = make_service()
+    progress, finished, applied = [], [], []
+    make_service.bus.job_progress.connect(lambda i, f: progress.append((i, f)))
+    make_service.bus.job_finished.connect(lambda i, name, status: finished.append((i, status)))
+
+    def endless(progress, is_cancelled):
+        step = 0
+        while True:  # only stops through the cancellation
+            step += 1
+            progress(min(step / 1000, 0.99))
+            time.sleep(0.001)
+
+    handle = jobs.submit(Job("sans fin", endless, reports_progress=True, apply=lambda s, r: applied.append(r)))
+    assert wait_until(app, lambda: handle.progress > 0.02)
+    assert progress and all(i == handle.id for i, _ in progress)
+    jobs.cancel(handle.id)
+    assert wait_until(app, lambda: handle.finished)
+    assert handle.status == CANCELLED and not applied
+    assert (handle.id, CANCELLED) in finished
+
+    pending = jobs.submit(Job("jamais lancée", time.sleep, (0,)))
+    jobs.limits["threads"] = 0  # nothing else starts: cancel while pending
+    later = jobs.submit(Job("en attente", time.sleep, (0.01,)))
+    jobs.cancel(later.id)
+    assert later.status == CANCELLED
+    assert wait_until(app, lambda: pending.finished)
+
+
+def test_failures_and_process_jobs(make_service):
+    app, jobs = make_service(max_processes=1)
+
+    def broken():
+        raise RuntimeError("fichier illisible")
+
+    failed = jobs.submit(Job("cassée", broken))
+    remote = jobs.submit(Job("processus", pow, (2, 10), use_processes=True))
+    assert wait_until(app, lambda: failed.finished and remote.finished, timeout=60)
+    assert failed.status == FAILED and "illisible" in failed.error
+    assert remote.status == DONE and remote.result == 1024
+    jobs.shutdown()
+
+
+def test_bit_curves_computed_by_a_job_match_the_direct_path(make_service):
+    app, jobs = make_service()
+    state = jobs.state
+    service = GraphService(state)
+    service.add_graph("G")
+    service.add_curve("G", CurveData(name="bus", x=np.arange(1000.0), y=np.arange(1000) % 16))
+    _, n_bits = service.bit_source("bus")
+
+    handle = jobs.submit(Job(
+        "bits", compute_bit_values, (state.current_graph.curves[0], n_bits), reports_progress=True,
+        apply=lambda st, values: service.create_bit_curves("bus", n_bits, values),
+    ))
+    assert wait_until(app, lambda: handle.finished)
+    assert handle.status == DONE
+    curves = state.current_graph.curves
+    assert [c.name for c in curves] == ["bus", "bus[0]", "bus[1]", "bus[2]", "bus[3]"]
+    assert np.array_equal(curves[4].y, (np.arange(1000) >> 3) & 1)
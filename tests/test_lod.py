@@ -0,0 +1,118 @@
+import os
+import sys
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.models import CurveData, GraphData
+from core.curve_stats import compute_curve_stats, get_curve_stats
+from core.lod import build_pyramid, get_lod, viewport_arrays
+from IO_dossier.project_io import export_project_to_json, import_project_from_json
+
+
+def make_curve(n=300_000):
+    x = np.arange(n, dtype=np.float64) * 1e-6
+    y = np.sin(np.arange(n) / 1000.0)
+    y[12345] = 7.0
+    y[200_000] = np.nan
+    return CurveData(name="big", x=x, y=y)
+
+
+def test_stats_single_pass_matches_numpy():
+    curve = make_curve()
+    stats = compute_curve_stats(curve.x, curve.y, chunk_size=65_536)
+    assert stats.length == len(curve.y)
+    assert stats.nan_count == 1
+    assert stats.y_max == 7.0
+    assert stats.y_min == np.nanmin(curve.y)
+    assert stats.x_monotonic and not stats.is_integer
+    assert not compute_curve_stats(curve.x[::-1], curve.y).x_monotonic
+
+
+def test_stats_cache_invalidated_by_new_data():
+    curve = CurveData(name="c", x=np.arange(1000.0), y=np.linspace(0, 1, 1000))
+    assert get_curve_stats(curve).length == 1000
+    curve.y = np.zeros(10)
+    curve.x = np.arange(10.0)
+    assert get_curve_stats(curve).length == 10
+    assert get_curve_stats(curve).is_integer
+
+
+def test_pyramid_levels_keep_extremes():
+    curve = make_curve()
+    pyr = build_pyramid(curve.x, curve.y, chunk_size=70_000)
+    assert pyr.x[-1].size <= 2048
+    for level in range(pyr.levels):
+        assert np.nanmax(pyr.y_max[level]) == 7.0
+        assert np.nanmin(pyr.y_min[level]) == np.nanmin(curve.y)
+
+
+def test_viewport_full_and_zoomed():
+    curve = make_curve()
+    pyr = get_lod(curve)
+    assert pyr is not None
+
+    x, y = viewport_arrays(curve.x, curve.y, pyr, curve.x[0], curve.x[-1], 1000)
+    assert len(x) <= 4 * 1000
+    assert x[0] == curve.x[0] and x[-1] >= curve.x[-1] - 1e-3
+    assert np.nanmax(y) == 7.0
+
+    # Zoomed: raw samples inside the window, coarse context around it
+    x, y = viewport_arrays(curve.x, curve.y, pyr, 0.1, 0.1005, 1000)
+    assert np.all(np.diff(x) >= 0)
+    inside = (x >= 0.1) & (x <= 0.1005)
+    assert np.count_nonzero(inside) in (500, 501)
+    assert x[0] == 0.0 and x[-1] > 0.29
+
+
+def test_project_stores_arrays_and_lod(tmp_path):
+    graph = GraphData(name="g")
+    graph.add_curve(make_curve())
+    graph.add_curve(CurveData(name="small", x=[0, 1, 2], y=[3, 4, 5]))
+    path = tmp_path / "project.json"
+
+    export_project_to_json({"g": graph}, str(path))
+    data_dir = tmp_path / "project.data"
+    assert len(list(data_dir.glob("*.npy"))) == 2
+    assert len(list(data_dir.glob("lod-*.npz"))) == 1
+
+    loaded = import_project_from_json(str(path))["g"]
+    big, small = loaded.curves
+    assert isinstance(big.y.base, np.memmap)
+    assert "lod" in big._derived_cache and "stats" in big._derived_cache
+    assert get_curve_stats(big).y_max == 7.0
+    assert np.array_equal(small.y, [3, 4, 5])
+
+    # Saving again with modified data drops the stale sidecar files
+    big.y = np.asarray(big.y) * 2
+    export_project_to_json({"g": loaded}, str(path))
+    assert len(list(data_dir.glob("*.npy"))) == 2
+    assert len(list(data_dir.glob("lod-*.npz"))) == 1
+
+
+def test_column_minmax_keeps_two_points_per_pixel_column():
+    from core.lod import column_minmax
+
+    x = np.concatenate([np.linspace(0, 1, 500_000), np.linspace(1.5, 10, 10)])
+    y = np.sin(x * 50)
+    y[250_000] = 9.0
+    cx, cy = column_minmax(x, y, 0.0, 10.0, 100)
+    assert len(cx) <= 2 * 100 and cy.max() == 9.0
+    assert np.all(np.diff(cx) >= 0)
+    # Dense [0, 1] spans 11 columns (x = 1 opens the 11th), sparse ones 1 each
+    assert len(cx) == 2 * (11 + 10)
+
+
+def test_column_minmax_follows_a_log_x_axis():
+    from core.lod import column_minmax
+
+    x = np.logspace(0, 6, 1_000_000)  # six decades
+    y = np.sin(np.log(x) * 40)
+    cx, cy = column_minmax(x, y, 1.0, 1e6, 600, log_x=True)
+    # Every decade gets its share of the 600 columns
+    for decade in range(6):
+        in_decade = (cx >= 10.0 ** decade) & (cx < 10.0 ** (decade + 1))
+        assert 2 * 95 <= in_decade.sum() <= 2 * 105
+    # Equal columns in linear X leave the five lower decades about 60 columns
+    lx, _ = column_minmax(x, y, 1.0, 1e6, 600)
+    assert (lx < 1e5).sum() <= 2 * 60
@@ -0,0 +1,114 @@
+import os
+import sys
+import numpy as np
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt5 import QtWidgets
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.lanes import LANE_FILL, lane_transform, lanes_in_window, layout_lanes
+from core.models import CurveData, GraphData
+
+
+def bits(n_lanes, n=1000):
+    x = np.arange(float(n))
+    return [CurveData(name=f"bit{i}", x=x, y=(np.arange(n) >> (i % 8)) & 1) for i in range(n_lanes)]
+
+
+def test_layout_window_and_transform():
+    curves = bits(5)
+    curves[1].visible = False
+    lanes = layout_lanes(curves)
+    assert [(l.index, l.curve.name) for l in lanes] == [(3, "bit0"), (2, "bit2"), (1, "bit3"), (0, "bit4")]
+    assert list(lanes_in_window(512, 100.2, 116.7)) == list(range(99, 118))
+    assert list(lanes_in_window(10, -3, 2.5, margin=0)) == [0, 1, 2]
+
+    scale, offset = lane_transform(lanes[0])
+    lo, hi = 0 * scale + offset, 1 * scale + offset
+    assert np.isclose(hi - lo, LANE_FILL) and 3 < lo < hi < 4
+
+
+def test_scrolling_512_lanes_builds_only_entering_lanes():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    from ui.views import MyPlotView
+
+    graph = GraphData(name="logic", curves=bits(512), mode="logic_lanes", lane_height_px=20)
+    view = MyPlotView(graph)
+    view.plot_widget.resize(600, 400)
+    view.refresh()
+    lanes = view.lanes
+    vb = view.plot_widget.getViewBox()
+    span = lanes.span()
+    y0, y1 = vb.viewRange()[1]
+    assert np.isclose(y1, 512) and np.isclose(y1 - y0, span)
+    items = set(map(id, lanes.lane_items().values()))
+    assert len(items) <= span + 3 and lanes.lane_items().keys() >= {511, 500}
+
+    built = lanes.built
+    d = (y0 % 1.0) / 2  # a pixel-level scroll staying within the same lanes
+    vb.setYRange(y0 - d, y1 - d, padding=0)
+    assert lanes.built == built
+
+    steps = np.arange(511.0, span, -1.0)
+    for top in steps:  # scroll to the bottom lane by lane
+        vb.setYRange(top - span, top, padding=0)
+        assert len(lanes.lane_items()) <= span + 3
+    # Items are recycled: the pool only grows to the largest window
+    created = set(map(id, lanes.lane_items().values())) | set(map(id, lanes._pool))
+    assert created >= items and len(created) <= span + 3
+    assert 0 in lanes.lane_items() and 511 not in lanes.lane_items()
+    # About one lane enters per step, whatever the lane count
+    assert lanes.built - built <= len(steps) + 2
+
+    graph.mode = "standard"
+    view.refresh()
+    assert not lanes.active and len(view.curves) == 512
+
+
+def test_lanes_ignore_the_graph_log_axes():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    from ui.views import MyPlotView
+
+    graph = GraphData(name="logic", curves=bits(4), mode="logic_lanes", log_x=True, log_y=True)
+    assert not graph.effective_log_x and not graph.effective_log_y
+    view = MyPlotView(graph)
+    view.plot_widget.resize(600, 400)
+    view.refresh()
+
+    # The plot stays linear: windows and cursor readouts too
+    view.plot_widget.getViewBox().setXRange(100, 200, padding=0)
+    assert np.allclose(view._visible_x_range(), (100, 200))
+    viewport = view._viewport()
+    assert not viewport.log_x and not viewport.log_y
+    assert not view.cursors.log_x and not view.cursors.log_y
+
+    graph.mode = "standard"
+    assert graph.effective_log_x and graph.effective_log_y
+
+
+def test_clicking_a_lane_selects_its_curve(monkeypatch):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    from types import SimpleNamespace
+    from PyQt5.QtCore import QPointF
+    import ui.views as views
+    from signal_bus import SignalBus
+
+    bus = SignalBus()
+    monkeypatch.setattr(views, "signal_bus", bus)
+    selected = []
+    bus.curve_selected.connect(lambda graph, curve: selected.append((graph, curve)))
+
+    graph = GraphData(name="logic", curves=bits(4), mode="logic_lanes", lane_height_px=20)
+    view = views.MyPlotView(graph)
+    view.plot_widget.resize(600, 400)
+    view.refresh()
+    assert not view.curves
+    vb = view.plot_widget.getViewBox()
+
+    def click(x, y):
+        view._on_mouse_click(SimpleNamespace(scenePos=lambda: vb.mapViewToScene(QPointF(x, y))))
+
+    click(500.0, 3.5)  # top lane: first curve
+    click(500.0, 0.2)  # bottom lane: last curve
+    assert selected == [("logic", "bit0"), ("logic", "bit3")]
@@ -0,0 +1,64 @@
+import os
+import sys
+import time
+import numpy as np
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt5 import QtWidgets
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.models import CurveData, GraphData, SatelliteObjectData
+from ui.measurement_cursors import CursorReadoutTable, read_cursors
+
+
+def make_curves(n=64, size=100_000):
+    x = np.arange(size) * 1e-3
+    return [
+        CurveData(name=f"c{i}", x=x, y=np.sin(x + i), gain=2.0, offset=float(i))
+        for i in range(n)
+    ]
+
+
+def test_readout_values_deltas_and_cost_per_curve():
+    curves = make_curves()
+    curves[1].visible = False
+    readout = read_cursors(curves, 10.0, 10.5, -1.0, 3.0)
+    assert readout.dx == 0.5 and readout.inv_dx == 2.0 and readout.dy == 4.0
+    assert "c1" not in readout.values
+    v1, v2 = readout.values["c3"]
+    assert np.isclose(v1, 2.0 * np.sin(13.0) + 3.0)
+    assert np.isclose(v2, 2.0 * np.sin(13.5) + 3.0)
+
+    shifted = CurveData(name="s", x=[0.0, 1.0, 3.0], y=[0.0, 10.0, 30.0], time_offset=1.0)
+    assert read_cursors([shifted], 2.0, 5.0).values["s"][0] == 10.0
+    assert np.isnan(read_cursors([shifted], 2.0, 5.0).values["s"][1])
+
+    start = time.perf_counter()
+    for i in range(100):
+        read_cursors(curves, 10.0 + i * 1e-3, 20.0)
+    per_curve_us = (time.perf_counter() - start) / (100 * 63 * 2) * 1e6
+    assert per_curve_us < 100
+
+
+def test_dragging_updates_numbers_without_refresh(monkeypatch):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    from ui.views import MyPlotView
+
+    graph = GraphData(name="g", curves=make_curves(4, 1000), cursors_vertical=True)
+    graph.satellite_settings["right"].visible = True
+    graph.satellite_objects["right"] = [SatelliteObjectData(obj_type="cursors")]
+    view = MyPlotView(graph)
+    view.refresh()
+    table = view.container.advanced_container.right_box.findChild(CursorReadoutTable)
+    assert table is not None and table.rowCount() == 2 + 4
+
+    refreshed = []
+    monkeypatch.setattr(view, "refresh_curves", lambda: refreshed.append(1))
+    first_item = table.item(2, 1)
+    view.cursors.vertical[0].setValue(0.25)
+    assert table.item(2, 1) is first_item  # same items, new text
+    assert np.isclose(float(first_item.text()), 2.0 * np.sin(0.25))
+    assert table.item(0, 1).text() == "0.25"
+    assert not refreshed
+    assert view.cursors.horizontal[0].scene() is None
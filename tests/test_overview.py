@@ -0,0 +1,56 @@
+import os
+import sys
+import numpy as np
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt5 import QtWidgets
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.lod import LOD_MIN_POINTS
+from core.models import CurveData, GraphData, SatelliteObjectData
+import ui.overview as overview_module
+from ui.overview import OVERVIEW_BUCKETS, OverviewWidget, overview_envelope
+
+
+def test_envelope_is_coarse_and_built_once(monkeypatch):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    big = CurveData(name="big", x=np.arange(LOD_MIN_POINTS * 4.0), y=np.random.rand(LOD_MIN_POINTS * 4))
+    big.y[12345] = 7.0
+    x, y = overview_envelope(big)
+    assert len(x) <= 2 * 2048 and y.max() == 7.0
+
+    small = CurveData(name="small", x=np.arange(10_000.0)[::-1], y=np.arange(10_000.0))
+    sx, sy = overview_envelope(small)
+    assert len(sx) <= 2 * OVERVIEW_BUCKETS + 2 and np.all(np.diff(sx) >= 0)
+
+    def fail(*args):
+        raise AssertionError("full-resolution data read again")
+
+    monkeypatch.setattr(overview_module, "get_lod", fail)
+    monkeypatch.setattr(overview_module, "minmax_decimate", fail)
+    widget = OverviewWidget()
+    widget.set_curves([big, small])
+    big.gain = 2.0  # restyled from the cached envelope
+    widget.set_curves([big, small])
+    assert np.isclose(widget._items["big"].yData.max(), 14.0)
+
+
+def test_dragging_the_window_moves_the_main_view():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    from ui.views import MyPlotView
+
+    curve = CurveData(name="c", x=np.arange(1000.0), y=np.sin(np.arange(1000.0)))
+    graph = GraphData(name="g", curves=[curve])
+    graph.satellite_settings["bottom"].visible = True
+    graph.satellite_objects["bottom"] = [SatelliteObjectData(obj_type="overview")]
+    view = MyPlotView(graph)
+    view.refresh()
+    overview = view.container.advanced_container.bottom_box.findChild(OverviewWidget)
+    assert overview is not None and "c" in overview._items
+
+    overview.region.setRegion((100.0, 300.0))
+    assert np.allclose(view.plot_widget.getViewBox().viewRange()[0], (100.0, 300.0))
+
+    view.plot_widget.getViewBox().setXRange(400.0, 500.0, padding=0)
+    assert np.allclose(overview.region.getRegion(), (400.0, 500.0))
@@ -0,0 +1,63 @@
+import os
+import sys
+import threading
+import time
+import numpy as np
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt5 import QtWidgets
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.models import CurveData
+from ui.render_pipeline import RenderPipeline, Viewport, prepare_curve
+
+
+def wait_for(pipeline, app, timeout=5.0):
+    end = time.time() + timeout
+    while pipeline.is_pending() and time.time() < end:
+        app.processEvents()
+        time.sleep(0.001)
+
+
+def test_prepare_small_curve_applies_transforms():
+    curve = CurveData(name="c", x=[0, 1, 2], y=[1, np.nan, 3], gain=2.0, offset=1.0, time_offset=10.0)
+    prepared = prepare_curve(curve, Viewport(0, 20, 500))
+    assert np.array_equal(prepared.x, [10, 11, 12])
+    assert prepared.y[0] == 3 and prepared.y[2] == 7
+    assert prepared.connect == "finite"
+    assert not prepared.decimated
+
+
+def test_prepare_large_curve_is_decimated_to_viewport():
+    n = 500_000
+    y = np.sin(np.arange(n) / 100.0)
+    y[1000] = np.nan
+    curve = CurveData(name="big", x=np.arange(n, dtype=float), y=y)
+    prepared = prepare_curve(curve, Viewport(0, n, 800))
+    assert prepared.decimated
+    assert len(prepared.x) < 10_000
+    assert isinstance(prepared.connect, np.ndarray) or prepared.connect == "all"
+
+
+def test_pipeline_drops_superseded_results():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    pipeline = RenderPipeline()
+    started = threading.Event()
+    release = threading.Event()
+    received = []
+
+    def slow():
+        started.set()
+        release.wait(5)
+        return "old"
+
+    pipeline.submit("curve", slow, received.append)
+    started.wait(5)
+    pipeline.submit("curve", lambda: "new", received.append)
+    wait_for(pipeline, app)
+    release.set()
+    time.sleep(0.05)
+    app.processEvents()
+
+    assert received == ["new"]
@@ -0,0 +1,86 @@
+import os
+import sys
+import time
+import numpy as np
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt5 import QtWidgets
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.models import CurveData, GraphData
+from ui.render_policy import FULL, INTERACTIVE, INTERACTIVE_LOD_SCALE, RenderPolicy
+
+
+def wait(app, ms):
+    end = time.time() + ms / 1000.0
+    while time.time() < end:
+        app.processEvents()
+        time.sleep(0.005)
+
+
+def test_slow_graph_degrades_while_moving_and_recovers_when_idle():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    policy = RenderPolicy()
+    policy.configure(True, budget_ms=20.0, idle_ms=50)
+    modes = []
+    policy.quality_changed.connect(modes.append)
+
+    policy.frame_painted(5.0)
+    policy.interaction()
+    assert policy.mode == FULL  # fast enough: nothing to drop
+
+    policy.frame_painted(80.0)
+    policy.interaction()
+    assert policy.mode == INTERACTIVE
+    policy.frame_painted(4.0)  # cheap interactive frames do not hide the cost
+    assert policy.full_frame_ms > 20.0
+
+    wait(app, 120)
+    assert policy.mode == FULL
+    assert modes == [INTERACTIVE, FULL]
+
+    policy.configure(False, 20.0, 50)
+    policy.interaction()
+    assert policy.mode == FULL
+
+
+def test_view_drops_symbols_labels_and_resolution_in_interactive_mode():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    from ui.views import MyPlotView
+
+    curve = CurveData(name="c", x=np.arange(10.0), y=np.arange(10.0), symbol="o", label_mode="inline")
+    view = MyPlotView(GraphData(name="g", curves=[curve]))
+    view.refresh_curves()
+    item = view.curves["c"]
+
+    view._apply_quality(INTERACTIVE)
+    assert item.opts["symbol"] is None
+    assert not view.labels["c"].isVisible()
+    assert view._lod_scale == INTERACTIVE_LOD_SCALE
+
+    view._apply_quality(FULL)
+    assert item.opts["symbol"] == "o"
+    assert view._lod_scale == 1.0
+
+
+def test_interactive_mode_turns_antialiasing_off_and_restores_it():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    from PyQt5.QtGui import QPainter
+    from ui.views import MyPlotView
+
+    curve = CurveData(name="c", x=np.arange(10.0), y=np.arange(10.0))
+    view = MyPlotView(GraphData(name="g", curves=[curve]))
+    view.refresh_curves()
+    item = view.curves["c"]
+    item.opts["antialias"] = item.curve.opts["antialias"] = True  # e.g. global option on
+    view_hint = bool(view.plot_widget.renderHints() & QPainter.Antialiasing)
+
+    view._apply_quality(INTERACTIVE)
+    assert not item.curve.opts["antialias"]
+    assert not view.plot_widget.renderHints() & QPainter.Antialiasing
+
+    view._apply_quality(FULL)
+    assert item.curve.opts["antialias"] and item.opts["antialias"]
+    # The view hint goes back to what it was, not to "on"
+    assert bool(view.plot_widget.renderHints() & QPainter.Antialiasing) == view_hint
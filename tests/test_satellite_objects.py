@@ -47,3 +47,36 @@ def test_satellite_widget_uses_param():
     tmp.close()
     os.unlink(tmp.name)
 
+
+
+def test_satellite_widgets_are_reused_and_images_cached(tmp_path):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    path = str(tmp_path / "logo.png")
+    pix = QtGui.QPixmap(16, 16)
+    pix.fill(QtGui.QColor("blue"))
+    pix.save(path)
+
+    graph = GraphData(name="g")
+    graph.satellite_settings["left"].visible = True
+    text = SatelliteObjectData(obj_type="text", name="t", config={"value": "a"})
+    image = SatelliteObjectData(obj_type="image", name="i", config={"value": path, "width": 8, "height": 8})
+    graph.satellite_objects["left"] += [text, image]
+    view = MyPlotView(graph)
+    view.refresh_satellites()
+    widgets = dict(view._satellite_widgets)
+    assert len(widgets) == 2
+
+    os.unlink(path)  # a refresh must not read the image again
+    view.refresh_satellites()
+    assert view._satellite_widgets == widgets
+
+    text.config["value"] = "b"
+    view.refresh_satellites()
+    assert len(view._satellite_widgets) == 2
+    reused = set(view._satellite_widgets.values()) & set(widgets.values())
+    assert [w for w in reused if w.pixmap() is not None and w.pixmap().width() == 8]
+    assert any(w.text() == "b" for w in view._satellite_widgets.values())
+
+    # Another view of the same image is served from the pixmap cache
+    other = view._create_satellite_widget(image)
+    assert other.pixmap().width() == 8
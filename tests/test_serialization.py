@@ -5,7 +5,7 @@ from core.models import CurveData, GraphData
 
 from IO_dossier.curve_io import export_curve_to_json, import_curve_from_json
 from IO_dossier.graph_io import export_graph_to_json, import_graph_from_json
-from IO_dossier.project_io import export_project_to_json, import_project_from_json
+from IO_dossier.project_io import export_project_to_json, import_project_from_json, snapshot_project
 from IO_dossier import serializers
 
 
@@ -91,3 +91,25 @@ def test_project_serialization(tmp_path):
     assert loaded["g1"].curves[0].name == "c1"
     assert loaded["g1"].curves[0].time_offset == g1.curves[0].time_offset
     assert loaded["g1"].mode == "logic_analyzer"
+
+
+def test_project_snapshot_is_independent_but_shares_arrays(tmp_path):
+    g = GraphData(name="g")
+    g.add_curve(create_sample_curve("c1"))
+    g.annotations.add_many([1.0, 2.0])
+    snapshot = snapshot_project({"g": g})
+
+    curve, copied = g.curves[0], snapshot["g"].curves[0]
+    assert copied is not curve and copied.y is curve.y
+    assert copied.data_version == curve.data_version
+
+    # Later GUI edits do not reach the snapshot being saved
+    curve.width = 7
+    g.add_curve(create_sample_curve("c2"))
+    g.annotations.add(3.0)
+    assert copied.width != 7 and len(snapshot["g"].curves) == 1
+    assert len(snapshot["g"].annotations) == 2
+
+    path = tmp_path / "project.json"
+    export_project_to_json(snapshot, str(path))
+    assert [c.name for c in import_project_from_json(str(path))["g"].curves] == ["c1"]
@@ -0,0 +1,84 @@
+import gc
+import multiprocessing
+import os
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.bit_curves import _bit_planes_chunk, bit_planes, bit_values
+from core.models import CurveData
+from core.shared_arrays import array_ref, attach, chunk_bounds, share, shared_empty
+
+
+@pytest.fixture(scope="module")
+def executor():
+    pool = ProcessPoolExecutor(2, mp_context=multiprocessing.get_context("spawn"))
+    yield pool
+    pool.shutdown()
+
+
+def test_shared_arrays_are_addressed_not_copied(tmp_path):
+    data = np.arange(1000, dtype=np.float64)
+    shared, ref = share(data)
+    assert np.array_equal(shared, data) and ref.nbytes == data.nbytes
+    assert len(pickle.dumps(ref)) < 500  # what a worker receives
+    assert np.array_equal(attach(ref), data)
+
+    # Already file-backed (project sidecar): shared as is, rows included
+    path = tmp_path / "a.npy"
+    np.save(path, np.arange(60, dtype=np.int32).reshape(3, 20))
+    mapped = np.load(path, mmap_mode="r")
+    row, row_ref = share(mapped[1])
+    assert row is mapped[1] or np.shares_memory(row, mapped)
+    assert row_ref.path == str(path)
+    assert np.array_equal(attach(row_ref), np.arange(20, 40))
+
+    # The file goes away with the last array mapping it
+    shared_path = ref.path
+    del shared, data
+    gc.collect()
+    assert not os.path.exists(shared_path)
+
+
+def test_workers_write_bit_planes_in_place(executor):
+    rng = np.random.default_rng(0)
+    curves = [
+        CurveData(name=f"bus{i}", x=np.arange(n, dtype=float), y=rng.integers(0, 2**bits, n).astype(float))
+        for i, (n, bits) in enumerate([(100_001, 8), (30_000, 4)])
+    ]
+    curves[0].y[5] = np.nan
+    buffers = [(c.x, c.y) for c in curves]
+    seen = []
+    planes = bit_planes(curves, [8, 4], executor=executor, progress=seen.append)
+    assert seen[-1] == 1.0
+    # The curves are only read: their buffers stay in place
+    assert all(c.x is x and c.y is y for c, (x, y) in zip(curves, buffers))
+    for curve, plane in zip(curves, planes):
+        assert array_ref(plane) is not None
+        for i in range(plane.shape[0]):
+            assert np.array_equal(plane[i], bit_values(curve.y, [i]), equal_nan=True)
+
+    assert bit_planes(curves, [8, 4], executor=executor, is_cancelled=lambda: True) is None
+
+
+def test_bit_planes_chunk_spans_several_blocks():
+    values = np.arange(50, dtype=float) % 13
+    values[[0, 21]] = np.nan
+    src, src_ref = share(values)
+    out = shared_empty((4, 50))
+    out[:] = -1
+    _bit_planes_chunk(src_ref, array_ref(out), 3, 47, chunk_size=10)
+    for i in range(4):
+        assert np.array_equal(out[i, 3:47], bit_values(values[3:47], [i]), equal_nan=True)
+    assert (out[:, :3] == -1).all() and (out[:, 47:] == -1).all()
+
+
+def test_chunk_bounds_cover_the_range():
+    assert chunk_bounds(10, 3) == [(0, 3), (3, 6), (6, 10)]
+    assert chunk_bounds(2, 8) == [(0, 1), (1, 2)]
+    assert chunk_bounds(0, 4) == []
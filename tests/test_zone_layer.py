@@ -0,0 +1,70 @@
+import os
+import sys
+import numpy as np
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+import pyqtgraph as pg
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.graph_service import apply_logic_analyzer_layout
+from core.models import CurveData, GraphData
+from ui.zone_layer import ZoneBatchItem, ZoneLayer
+
+
+def logic_graph(n_lanes=256):
+    curves = [CurveData(name=f"bit{i}", x=[0, 1, 2], y=[0, 1, 0]) for i in range(n_lanes)]
+    graph = GraphData(name="logic", curves=curves)
+    apply_logic_analyzer_layout(graph)
+    return graph
+
+
+def test_lanes_are_drawn_by_a_few_items_and_not_rebuilt():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    from ui.views import MyPlotView
+
+    graph = logic_graph()
+    view = MyPlotView(graph)
+    view.refresh_curves()
+    items = list(view.zone_layer.items)
+    assert len(graph.zones) == 256
+    assert len(items) == 2  # alternating lane colours
+    assert sum(len(i) for i in items) == 256
+
+    view.refresh_curves()
+    assert view.zone_layer.items == items
+    assert all(i.scene() is view.plot_widget.scene() for i in items)
+
+    graph.zones[0]["fill_color"] = "#ff0000"
+    view.refresh_curves()
+    assert len(view.zone_layer.items) == 3
+
+
+def test_only_visible_zones_are_painted():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    zones = [{"type": "hlinear", "bounds": [i, i + 1]} for i in range(256)]
+    item = ZoneBatchItem("hlinear", zones, QtGui.QPen(), QtGui.QBrush())
+    visible = item.visible_indices(QtCore.QRectF(-10, 10.5, 20, 3))
+    assert list(visible) == [10, 11, 12, 13]
+    assert item.dataBounds(0) is None
+    assert item.dataBounds(1) == (0, 256)
+
+
+def test_rect_and_path_zones_paint():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    layer = ZoneLayer(pg.PlotWidget())
+    assert layer.update([
+        {"type": "rect", "rect": [0, 0, 2, -1]},
+        {"type": "path", "points": [[0, 0], [1, 1], [2, 0]]},
+    ])
+    assert not layer.update([dict(z) for z in layer._zones])
+
+    image = QtGui.QImage(64, 64, QtGui.QImage.Format_ARGB32)
+    painter = QtGui.QPainter(image)
+    for item in layer.items:
+        assert not item.boundingRect().isNull()
+        item.paint(painter, None)
+    painter.end()
+    rect_item = next(i for i in layer.items if i.ztype == "rect")
+    assert np.array_equal(rect_item._boxes[0], [0, -1, 2, 0])
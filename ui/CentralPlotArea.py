@@ -1,14 +1,32 @@
-
 # CentralPlotArea.py
 
-from PyQt5 import QtWidgets
+from PyQt5 import QtCore, QtWidgets
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Widgets within this fraction of the viewport height beyond its edges
+# count as visible, so that they are ready just before being scrolled in
+VISIBILITY_MARGIN = 0.5
+
+
 class CentralPlotArea(QtWidgets.QScrollArea):
+    """Scrollable column of graphs that reports which ones are on screen.
+
+    ``widget_visibility_changed(widget, visible)`` is emitted when a graph
+    enters or leaves the viewport (plus a margin), so that off-screen views
+    can be suspended and refreshed only when scrolled back into view.
+    """
+
+    widget_visibility_changed = QtCore.pyqtSignal(object, bool)
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._visible = {}  # widget -> last reported visibility
+        self._visibility_timer = QtCore.QTimer(self)
+        self._visibility_timer.setSingleShot(True)
+        self._visibility_timer.setInterval(0)
+        self._visibility_timer.timeout.connect(self.update_visibility)
         self.setup_ui()
 
     def setup_ui(self):
@@ -16,12 +34,58 @@ class CentralPlotArea(QtWidgets.QScrollArea):
         self.widget = QtWidgets.QWidget()
         self.layout = QtWidgets.QVBoxLayout(self.widget)
         self.setWidget(self.widget)
+        # Graphs added, removed or resized move the others
+        self.widget.installEventFilter(self)
+        self.verticalScrollBar().valueChanged.connect(self._schedule_visibility_update)
+        self.horizontalScrollBar().valueChanged.connect(self._schedule_visibility_update)
 
     def add_plot_widget(self, widget):
         logger.debug(f"[CentralPlotArea] ➕ Ajout du widget : {widget}")
         self.layout.addWidget(widget)
-    
+        self._visible[widget] = False  # views start suspended until laid out
+        self._schedule_visibility_update()
+
     def remove_plot_widget(self, widget):
         logger.debug(f"[CentralPlotArea] ➖ Retrait du widget : {widget}")
         self.layout.removeWidget(widget)
+        self._visible.pop(widget, None)
         widget.deleteLater()
+        self._schedule_visibility_update()
+
+    def is_widget_visible(self, widget) -> bool:
+        """Whether *widget* intersects the viewport (with the margin)."""
+        if widget.isHidden():
+            return False
+        viewport = self.viewport().rect()
+        margin = int(viewport.height() * VISIBILITY_MARGIN)
+        area = viewport.adjusted(0, -margin, 0, margin)
+        top_left = widget.mapTo(self.viewport(), QtCore.QPoint(0, 0))
+        return area.intersects(QtCore.QRect(top_left, widget.size()))
+
+    def visible_widgets(self):
+        return [w for w, visible in self._visible.items() if visible]
+
+    def update_visibility(self):
+        """Emit visibility changes of the graphs since the last update."""
+        for widget, was_visible in list(self._visible.items()):
+            visible = self.is_widget_visible(widget)
+            if visible != was_visible:
+                self._visible[widget] = visible
+                logger.debug(f"[CentralPlotArea] 👁 {widget.objectName()} visible={visible}")
+                self.widget_visibility_changed.emit(widget, visible)
+
+    def _schedule_visibility_update(self, *args):
+        self._visibility_timer.start()
+
+    def eventFilter(self, obj, event):
+        if obj is self.widget and event.type() == QtCore.QEvent.Resize:
+            self._schedule_visibility_update()
+        return super().eventFilter(obj, event)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._schedule_visibility_update()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._schedule_visibility_update()
@@ -5,11 +5,15 @@ from PyQt5.QtWidgets import QTreeView, QStyledItemDelegate, QMessageBox
 from PyQt5.QtGui import QStandardItemModel, QStandardItem, QPainter, QFont
 from PyQt5.QtCore import Qt, QRect, QSize
 from core.app_state import AppState
+from core.models import MODIFIED
 from signal_bus import signal_bus
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Champs affichés par l'arbre : les autres changements ne le reconstruisent pas
+TREE_FIELDS = frozenset({"name", "visible", "curves", "parent_curve"})
+
 class CombinedDelegate(QStyledItemDelegate):
     def paint(self, painter, option, index):
         painter.save()
@@ -114,8 +118,7 @@ class GraphCurvePanel(QtWidgets.QWidget):
         logger.debug("🔧 [GraphCurvePanel.__init__] Initialisation du panneau graphique")
         self.controller = None
         self.setup_ui()
-        signal_bus.graph_updated.connect(self.refresh_tree)
-        signal_bus.curve_updated.connect(self.refresh_tree)
+        signal_bus.model_changed.connect(self.on_model_changed)
 
     def set_controller(self, controller):
         """Expose le contrôleur pour déclencher des actions directement."""
@@ -201,6 +204,49 @@ class GraphCurvePanel(QtWidgets.QWidget):
         logger.debug("🔁 [refresh_tree] Rafraîchissement demandé depuis signal_bus")
         self.populate_from_state()
 
+    def on_model_changed(self, event):
+        """Rebuild the tree only for changes of what it shows (names, visibility, lists)."""
+        if not event.touches(TREE_FIELDS):
+            return
+        if event.kind == MODIFIED and event.fields == {"visible"}:
+            item = self._find_item(event.graph, event.curve)
+            if item is not None:
+                logger.debug(f"👁 [on_model_changed] {event.graph} > {event.curve} mis à jour sur place")
+                item.setData(self._visible_in_state(event.graph, event.curve), Qt.UserRole + 1)
+                return
+        self.refresh_tree()
+
+    @staticmethod
+    def _visible_in_state(graph_name, curve_name):
+        graph = AppState.get_instance().graphs.get(graph_name)
+        if graph is None:
+            return False
+        if curve_name is None:
+            return graph.visible
+        return next((c.visible for c in graph.curves if c.name == curve_name), False)
+
+    def _find_item(self, graph_name, curve_name=None):
+        """Item of a graph, or of one of its curves (bit curves included)."""
+        graph_item = next(
+            (self.model.item(row) for row in range(self.model.rowCount())
+             if self.model.item(row).data(Qt.UserRole + 3) == "graph"
+             and self.model.item(row).data(Qt.UserRole + 4) == graph_name),
+            None,
+        )
+        if graph_item is None or curve_name is None:
+            return graph_item
+        pending = [graph_item]
+        while pending:
+            parent = pending.pop()
+            for row in range(parent.rowCount()):
+                child = parent.child(row)
+                if child.data(Qt.UserRole + 3) != "curve":
+                    continue
+                if child.data(Qt.UserRole + 4) == curve_name:
+                    return child
+                pending.append(child)
+        return None
+
     def on_item_renamed(self, item):
         logger.debug("✏️ [on_item_renamed] Item modifié")
         kind = item.data(Qt.UserRole + 3)
@@ -6,6 +6,7 @@ from ui.widgets import BitGroupWidget
 from signal_bus import signal_bus
 from core.utils import generate_random_color
 from core import SatelliteObjectData
+from core.models import MODIFIED
 import logging
 
 logger = logging.getLogger(__name__)
@@ -18,6 +19,9 @@ ZONE_TYPES = {
     "path": "x1, y1, x2, y2, ...",
 }
 
+# Champs de l'onglet Mode (liste des graphiques et leur mode)
+MODE_TAB_FIELDS = frozenset({"name", "mode"})
+
 
 class ZoneParamsWidget(QtWidgets.QWidget):
     """Widget to edit parameters of a custom zone."""
@@ -204,6 +208,11 @@ class PropertiesPanel(QtWidgets.QTabWidget):
                 self.controller.set_display_mode, self.display_mode_combo.itemData(i)
             )
         )
+        self.bar_aggregate_combo.currentIndexChanged.connect(
+            lambda i: self._call_controller(
+                self.controller.set_bar_aggregate, self.bar_aggregate_combo.itemData(i)
+            )
+        )
         self.label_mode_combo.currentIndexChanged.connect(
             lambda i: self._call_controller(
                 self.controller.set_label_mode, self.label_mode_combo.itemData(i)
@@ -259,8 +268,18 @@ class PropertiesPanel(QtWidgets.QTabWidget):
                 self.controller.set_mouse_enabled_y, val
             )
         )
+        self.batch_checkbox.toggled.connect(
+            lambda val: self._call_graph_controller(
+                self.controller.set_batch_curves, val
+            )
+        )
 
         # Nouvelles connexions pour les options d'axe
+        self.x_link_input.editingFinished.connect(
+            lambda: self._call_graph_controller(
+                self.controller.set_x_link_group, self.x_link_input.text()
+            )
+        )
         self.x_unit_input.editingFinished.connect(
             lambda: self._call_graph_controller(
                 self.controller.set_x_unit, self.x_unit_input.text()
@@ -296,6 +315,39 @@ class PropertiesPanel(QtWidgets.QTabWidget):
                 self.controller.set_y_limits, self.ymin_input.value(), float(v)
             )
         )
+        self.adaptive_checkbox.toggled.connect(
+            lambda val: self._call_graph_controller(
+                self.controller.set_adaptive_rendering, val
+            )
+        )
+        self.render_budget_input.valueChanged.connect(
+            lambda v: self._call_graph_controller(
+                self.controller.set_render_thresholds, float(v), self.render_idle_input.value()
+            )
+        )
+        self.render_idle_input.valueChanged.connect(
+            lambda v: self._call_graph_controller(
+                self.controller.set_render_thresholds, self.render_budget_input.value(), int(v)
+            )
+        )
+        self.render_overlay_checkbox.toggled.connect(
+            lambda val: self._call_graph_controller(
+                self.controller.set_render_overlay, val
+            )
+        )
+        self.lane_height_input.valueChanged.connect(
+            lambda v: self._call_graph_controller(self.controller.set_lane_height, int(v))
+        )
+        self.cursor_x_checkbox.toggled.connect(
+            lambda val: self._call_graph_controller(
+                self.controller.set_measurement_cursors, val, self.cursor_y_checkbox.isChecked()
+            )
+        )
+        self.cursor_y_checkbox.toggled.connect(
+            lambda val: self._call_graph_controller(
+                self.controller.set_measurement_cursors, self.cursor_x_checkbox.isChecked(), val
+            )
+        )
 
         # Satellite zones
         self.satellite_left_checkbox.toggled.connect(
@@ -351,7 +403,7 @@ class PropertiesPanel(QtWidgets.QTabWidget):
         }.items():
             btn.clicked.connect(lambda _, z=zone: self._add_satellite_object(z))
 
-        signal_bus.graph_updated.connect(self.update_mode_tab)
+        signal_bus.model_changed.connect(self.on_model_changed)
         self.update_mode_tab()
 
     def setup_ui(self):
@@ -382,10 +434,20 @@ class PropertiesPanel(QtWidgets.QTabWidget):
         self.auto_y_checkbox = QtWidgets.QCheckBox("Auto-échelle Y")
         self.mouse_x_checkbox = QtWidgets.QCheckBox("Souris activée X")
         self.mouse_y_checkbox = QtWidgets.QCheckBox("Souris activée Y")
+        self.batch_checkbox = QtWidgets.QCheckBox("Regrouper les courbes de même style")
+        self.batch_checkbox.setToolTip(
+            "Trace les courbes en ligne de même apparence en un seul élément "
+            "(superpositions de nombreuses acquisitions)"
+        )
         self.button_reset_zoom = QtWidgets.QPushButton("🔍 Réinitialiser le zoom")
         self.button_reset_zoom_x = QtWidgets.QPushButton("🔍 Zoom X")
         self.button_reset_zoom_y = QtWidgets.QPushButton("🔍 Zoom Y")
         self.fix_y_checkbox = QtWidgets.QCheckBox("Fixer l'échelle Y")
+        self.x_link_input = QtWidgets.QLineEdit()
+        self.x_link_input.setPlaceholderText("aucun")
+        self.x_link_input.setToolTip(
+            "Les graphes portant le même nom de groupe partagent leur axe X"
+        )
         self.ymin_input = QtWidgets.QDoubleSpinBox()
         self.ymax_input = QtWidgets.QDoubleSpinBox()
         self.ymin_input.setRange(-1000, 1000)
@@ -394,6 +456,27 @@ class PropertiesPanel(QtWidgets.QTabWidget):
         self.ymax_input.setValue(5.0)
         self.font_combo = QtWidgets.QFontComboBox()
 
+        # Adaptive rendering
+        self.adaptive_checkbox = QtWidgets.QCheckBox("Simplifier le tracé pendant les déplacements")
+        self.render_budget_input = QtWidgets.QDoubleSpinBox()
+        self.render_budget_input.setRange(1.0, 1000.0)
+        self.render_budget_input.setDecimals(1)
+        self.render_budget_input.setValue(25.0)
+        self.render_idle_input = QtWidgets.QSpinBox()
+        self.render_idle_input.setRange(10, 5000)
+        self.render_idle_input.setSingleStep(10)
+        self.render_idle_input.setValue(150)
+        self.render_overlay_checkbox = QtWidgets.QCheckBox("Afficher le mode de rendu (débogage)")
+
+        self.lane_height_input = QtWidgets.QSpinBox()
+        self.lane_height_input.setRange(4, 200)
+        self.lane_height_input.setSuffix(" px")
+        self.lane_height_input.setValue(24)
+
+        # Measurement cursors
+        self.cursor_x_checkbox = QtWidgets.QCheckBox("Curseurs verticaux (X1, X2)")
+        self.cursor_y_checkbox = QtWidgets.QCheckBox("Curseurs horizontaux (Y1, Y2)")
+
         # Axis units and formats
         self.x_unit_input = QtWidgets.QLineEdit()
         self.y_unit_input = QtWidgets.QLineEdit()
@@ -414,6 +497,11 @@ class PropertiesPanel(QtWidgets.QTabWidget):
         gen_layout.addWidget(self.darkmode_checkbox)
         gen_layout.addWidget(self.logx_checkbox)
         gen_layout.addWidget(self.logy_checkbox)
+        gen_layout.addWidget(self.batch_checkbox)
+        lane_layout = QtWidgets.QHBoxLayout()
+        lane_layout.addWidget(QtWidgets.QLabel("Hauteur des pistes logiques :"))
+        lane_layout.addWidget(self.lane_height_input)
+        gen_layout.addLayout(lane_layout)
         layout.addWidget(general_group)
 
         axes_group = QtWidgets.QGroupBox("Axes")
@@ -437,6 +525,10 @@ class PropertiesPanel(QtWidgets.QTabWidget):
         nav_layout.addWidget(self.button_reset_zoom)
         nav_layout.addWidget(self.button_reset_zoom_x)
         nav_layout.addWidget(self.button_reset_zoom_y)
+        link_layout = QtWidgets.QHBoxLayout()
+        link_layout.addWidget(QtWidgets.QLabel("Groupe d'axe X lié :"))
+        link_layout.addWidget(self.x_link_input)
+        nav_layout.addLayout(link_layout)
         nav_layout.addWidget(self.fix_y_checkbox)
         ylayout = QtWidgets.QHBoxLayout()
         ylayout.addWidget(QtWidgets.QLabel("Y min :"))
@@ -446,6 +538,20 @@ class PropertiesPanel(QtWidgets.QTabWidget):
         nav_layout.addLayout(ylayout)
         layout.addWidget(navigation_group)
 
+        render_group = QtWidgets.QGroupBox("Rendu adaptatif")
+        render_layout = QtWidgets.QFormLayout(render_group)
+        render_layout.addRow(self.adaptive_checkbox)
+        render_layout.addRow("Budget par image (ms) :", self.render_budget_input)
+        render_layout.addRow("Retour pleine qualité (ms) :", self.render_idle_input)
+        render_layout.addRow(self.render_overlay_checkbox)
+        layout.addWidget(render_group)
+
+        cursor_group = QtWidgets.QGroupBox("Curseurs de mesure")
+        cursor_layout = QtWidgets.QVBoxLayout(cursor_group)
+        cursor_layout.addWidget(self.cursor_x_checkbox)
+        cursor_layout.addWidget(self.cursor_y_checkbox)
+        layout.addWidget(cursor_group)
+
         # Satellite zones
         def create_satellite_group(title, zone):
             group = QtWidgets.QGroupBox(title)
@@ -622,6 +728,14 @@ class PropertiesPanel(QtWidgets.QTabWidget):
         self.display_mode_combo.addItem("Points (scatter)", "scatter")
         self.display_mode_combo.addItem("Histogramme (barres)", "bar")
 
+        self.bar_aggregate_combo = QtWidgets.QComboBox()
+        self.bar_aggregate_combo.addItem("Maximum", "max")
+        self.bar_aggregate_combo.addItem("Minimum", "min")
+        self.bar_aggregate_combo.addItem("Moyenne", "mean")
+        self.bar_aggregate_combo.setToolTip(
+            "Valeur affichée quand plusieurs échantillons tombent dans une même barre"
+        )
+
         self.gain_mode_combo = QtWidgets.QComboBox()
         self.gain_mode_combo.addItem("Multiplicateur", "multiplier")
         self.gain_mode_combo.addItem("Unité par carreau", "unit")
@@ -689,6 +803,8 @@ class PropertiesPanel(QtWidgets.QTabWidget):
         app_layout.addWidget(self.fill_checkbox)
         app_layout.addWidget(QtWidgets.QLabel("Type d'affichage :"))
         app_layout.addWidget(self.display_mode_combo)
+        app_layout.addWidget(QtWidgets.QLabel("Agrégation des barres :"))
+        app_layout.addWidget(self.bar_aggregate_combo)
         app_layout.addWidget(QtWidgets.QLabel("Indicateur de zéro :"))
         app_layout.addWidget(self.zero_indicator_combo)
         layout.addWidget(appearance_group)
@@ -916,7 +1032,7 @@ class PropertiesPanel(QtWidgets.QTabWidget):
         table.insertRow(row)
 
         type_combo = QtWidgets.QComboBox()
-        for t in ["text", "button", "image"]:
+        for t in ["text", "button", "image", "cursors", "overview"]:
             type_combo.addItem(t.capitalize(), t)
         idx = type_combo.findData(obj.obj_type)
         if idx != -1:
@@ -1245,23 +1361,12 @@ class PropertiesPanel(QtWidgets.QTabWidget):
         if not curve:
             return
 
-        import numpy as np
-
-        values = curve.y
-        mask = np.isnan(values)
-        finite_values = values[~mask]
+        from core.bit_curves import check_bit_source
 
-        if not np.allclose(finite_values, np.round(finite_values)):
-            QtWidgets.QMessageBox.warning(
-                self, "Erreur", "Les données ne sont pas entières"
-            )
-            self.bits_checkbox.setChecked(False)
-            return
-
-        if finite_values.size and int(finite_values.min()) < 0:
-            QtWidgets.QMessageBox.warning(
-                self, "Erreur", "Les valeurs négatives ne sont pas prises en charge"
-            )
+        try:
+            check_bit_source(curve)
+        except ValueError as e:
+            QtWidgets.QMessageBox.warning(self, "Erreur", str(e))
             self.bits_checkbox.setChecked(False)
             return
 
@@ -1273,6 +1378,23 @@ class PropertiesPanel(QtWidgets.QTabWidget):
         logger.debug("[PropertiesPanel] 🔁 Rafraîchissement de l’onglet graphique")
         self.update_graph_ui()
 
+    def on_model_changed(self, event):
+        """Refresh only the tabs showing what *event* changed."""
+        state = AppState.get_instance()
+        if event.curve is None and event.touches(MODE_TAB_FIELDS):
+            self.update_mode_tab()
+
+        graph = state.current_graph
+        if event.graph is not None and graph is not None and event.graph != graph.name:
+            return  # another graph: nothing shown here
+        if event.curve is None:
+            if event.kind != MODIFIED or event.fields != {"curves"}:
+                self.refresh_graph_tab()
+            if event.touches({"curves"}):
+                self.refresh_curve_tab()  # selection or bit curves may have changed
+        elif state.current_curve is None or state.current_curve.name == event.curve:
+            self.refresh_curve_tab()
+
     def update_graph_ui(self):
         """Met à jour les champs de l'onglet graphique en fonction du graphique sélectionné."""
         state = AppState.get_instance()
@@ -1297,6 +1419,26 @@ class PropertiesPanel(QtWidgets.QTabWidget):
         self.auto_y_checkbox.setChecked(graph.auto_range_y)
         self.mouse_x_checkbox.setChecked(graph.mouse_enabled_x)
         self.mouse_y_checkbox.setChecked(graph.mouse_enabled_y)
+        self.batch_checkbox.setChecked(graph.batch_curves)
+        self.adaptive_checkbox.setChecked(graph.adaptive_rendering)
+        # Both spin boxes feed one setter: fill them without emitting
+        for spin, value in (
+            (self.render_budget_input, graph.render_budget_ms),
+            (self.render_idle_input, graph.render_idle_ms),
+        ):
+            spin.blockSignals(True)
+            spin.setValue(value)
+            spin.blockSignals(False)
+        self.render_overlay_checkbox.setChecked(graph.render_overlay)
+        self.lane_height_input.setValue(graph.lane_height_px)
+        # Same for the cursor pair checkboxes
+        for box, value in (
+            (self.cursor_x_checkbox, graph.cursors_vertical),
+            (self.cursor_y_checkbox, graph.cursors_horizontal),
+        ):
+            box.blockSignals(True)
+            box.setChecked(value)
+            box.blockSignals(False)
         self.auto_y_checkbox.setEnabled(not graph.fix_y_range)
 
         # Police
@@ -1304,6 +1446,7 @@ class PropertiesPanel(QtWidgets.QTabWidget):
 
         # Unités et formats
         self.x_unit_input.setText(graph.x_unit or "")
+        self.x_link_input.setText(graph.x_link_group)
         self.y_unit_input.setText(graph.y_unit or "")
 
         index_x_format = self.x_format_combo.findData(graph.x_format)
@@ -1406,6 +1549,8 @@ class PropertiesPanel(QtWidgets.QTabWidget):
             self.width_spin.setValue(1)
             self.symbol_combo.setCurrentIndex(0)
             self.display_mode_combo.setCurrentIndex(0)
+            self.bar_aggregate_combo.setCurrentIndex(0)
+            self.bar_aggregate_combo.setEnabled(False)
             self.label_mode_combo.setCurrentIndex(0)
             self.opacity_slider.setValue(100)
             self.fill_checkbox.setChecked(False)
@@ -1445,6 +1590,9 @@ class PropertiesPanel(QtWidgets.QTabWidget):
         self.display_mode_combo.setCurrentIndex(
             index_display if index_display != -1 else 0
         )
+        index_bar = self.bar_aggregate_combo.findData(curve.bar_aggregate)
+        self.bar_aggregate_combo.setCurrentIndex(index_bar if index_bar != -1 else 0)
+        self.bar_aggregate_combo.setEnabled(curve.display_mode == "bar")
 
         index_label = self.label_mode_combo.findData(curve.label_mode)
         self.label_mode_combo.setCurrentIndex(index_label if index_label != -1 else 0)
@@ -1503,6 +1651,7 @@ class PropertiesPanel(QtWidgets.QTabWidget):
         for graph in state.graphs.values():
             combo = QtWidgets.QComboBox()
             combo.addItem("Analyseur logique", "logic_analyzer")
+            combo.addItem("Pistes logiques (défilement)", "logic_lanes")
             combo.addItem("Standard", "standard")
             combo.addItem("Analyse", "analysis")
             combo.addItem("Sombre", "dark")
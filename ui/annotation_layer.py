@@ -0,0 +1,184 @@
+# ui/annotation_layer.py
+
+"""Tracé des annotations d'un graphe (événements, intervalles, regroupements).
+
+Un seul item dessine toutes les annotations : à chaque image, il demande au
+:class:`core.annotations.AnnotationStore` celles de la fenêtre X visible,
+réduites à la grille des pixels. Un événement est une ligne verticale, un
+intervalle une bande ; plusieurs annotations tombant dans la même colonne
+de pixels deviennent un repère de regroupement portant leur nombre. Le coût
+d'une image dépend donc de la largeur de la vue, pas du nombre
+d'annotations.
+
+Les annotations sont stockées en unités de données : sous un axe X
+logarithmique, la fenêtre est convertie (``10**``) pour interroger le
+store et les positions le sont (``log10``) pour le tracé.
+"""
+
+from typing import Optional
+
+import numpy as np
+import pyqtgraph as pg
+from PyQt5 import QtCore, QtGui
+from PyQt5.QtGui import QColor
+
+from core.annotations import AnnotationClusters, AnnotationStore
+from ui.zone_layer import ZONE_Z_VALUE
+
+ANNOTATION_COLORS = ("#e6194b", "#3cb44b", "#4363d8", "#f58231", "#911eb4", "#42d4f4")
+CLUSTER_COLOR = "#ffb000"
+# Above this many markers in view, texts are not drawn
+MAX_TEXT_LABELS = 64
+
+
+def kind_color(code: int) -> QColor:
+    return QColor(ANNOTATION_COLORS[int(code) % len(ANNOTATION_COLORS)])
+
+
+def _log_positions(values: np.ndarray) -> np.ndarray:
+    """``log10`` of X positions; non-positive ones go to ``-inf`` (left of any view)."""
+    values = np.asarray(values, dtype=np.float64)
+    with np.errstate(divide="ignore"):
+        return np.log10(np.where(values > 0, values, 0.0))
+
+
+class AnnotationItem(pg.GraphicsObject):
+    """All the annotations of a store, painted for the visible X window."""
+
+    def __init__(self, store: Optional[AnnotationStore] = None):
+        super().__init__()
+        self.store = store or AnnotationStore()
+        self._cache_key = None
+        self._cache: Optional[AnnotationClusters] = None
+        self._log_x = False
+        self.setZValue(ZONE_Z_VALUE + 1)
+        self.setAcceptedMouseButtons(QtCore.Qt.NoButton)
+
+    def set_store(self, store: AnnotationStore):
+        self.store = store
+        self._cache_key = None
+        self.update()
+
+    def setLogMode(self, x: bool, y: bool):
+        """Called by the plot when its axes switch between linear and log."""
+        if bool(x) != self._log_x:
+            self._log_x = bool(x)
+            self._cache_key = None
+            self.update()
+
+    def _to_view(self, values) -> np.ndarray:
+        """X positions in view coordinates (``log10`` under a log X axis)."""
+        return _log_positions(values) if self._log_x else np.asarray(values, dtype=np.float64)
+
+    def data_window(self, view: QtCore.QRectF) -> tuple:
+        """X window of *view* in data units (undoing the log scale if any)."""
+        x0, x1 = view.left(), view.right()
+        if self._log_x:
+            x0, x1 = 10.0 ** x0, 10.0 ** x1
+        return x0, x1
+
+    def viewRangeChanged(self):
+        self.prepareGeometryChange()
+        self.update()
+
+    def dataBounds(self, ax, frac=1.0, orthoRange=None):
+        return None  # annotations never drive the auto-range
+
+    def boundingRect(self):
+        view = self.viewRect()
+        if view is None or not len(self.store):
+            return QtCore.QRectF()
+        return QtCore.QRectF(view)
+
+    def visible(self, view: QtCore.QRectF) -> AnnotationClusters:
+        """Annotations of *view* at the current pixel size (cached per frame)."""
+        vb = self.getViewBox()
+        n_columns = max(1, int(vb.width())) if vb is not None else 1000
+        x0, x1 = self.data_window(view)
+        key = (self.store.version, x0, x1, n_columns, self._log_x)
+        if key != self._cache_key:
+            # Columns follow the screen pixels, log-spaced under a log X axis
+            self._cache = self.store.clustered(x0, x1, n_columns, log_x=self._log_x)
+            self._cache_key = key
+        return self._cache
+
+    def paint(self, painter, option, widget=None):
+        view = self.viewRect()
+        if view is None or not len(self.store):
+            return
+        shown = self.visible(view)
+        store = self.store
+        top, bottom = view.top(), view.bottom()
+        px = view.width() / self._cache_key[3]  # view width of one pixel column
+
+        singles = shown.singles
+        starts, ends = self._to_view(store.start[singles]), self._to_view(store.end[singles])
+        kinds = store.kind_codes[singles]
+        spans = ends > starts
+        for code in np.unique(kinds):
+            color = kind_color(code)
+            of_kind = kinds == code
+            band = of_kind & spans
+            if band.any():
+                fill = QColor(color)
+                fill.setAlphaF(0.25)
+                painter.setPen(QtCore.Qt.NoPen)
+                painter.setBrush(QtGui.QBrush(fill))
+                x0 = np.maximum(starts[band], view.left())
+                x1 = np.minimum(ends[band], view.right())
+                painter.drawRects([QtCore.QRectF(a, top, b - a, bottom - top) for a, b in zip(x0, x1)])
+            point = of_kind & ~spans
+            if point.any():
+                painter.setPen(pg.mkPen(color, width=1))
+                painter.drawLines([QtCore.QLineF(x, top, x, bottom) for x in starts[point]])
+
+        if len(shown.count):
+            fill = QColor(CLUSTER_COLOR)
+            fill.setAlphaF(0.6)
+            painter.setPen(pg.mkPen(CLUSTER_COLOR, width=1))
+            painter.setBrush(QtGui.QBrush(fill))
+            x0 = self._to_view(shown.x0)
+            x1 = np.maximum(self._to_view(shown.x1), x0 + 2 * px)  # at least two pixels wide
+            painter.drawRects([QtCore.QRectF(a, top, b - a, bottom - top) for a, b in zip(x0, x1)])
+
+        if len(shown) <= MAX_TEXT_LABELS:
+            self._paint_texts(painter, shown, view)
+
+    def _paint_texts(self, painter, shown: AnnotationClusters, view: QtCore.QRectF):
+        """Cluster counts and labels, drawn in device pixels at the top of the view."""
+        texts = [(x, str(n)) for x, n in zip(self._to_view(shown.x0), shown.count)]
+        starts = self._to_view(self.store.start[shown.singles])
+        texts += [(x, self.store.label_of(i)) for x, i in zip(starts, shown.singles)]
+        texts = [(max(x, view.left()), text) for x, text in texts if text]
+        if not texts:
+            return
+        transform = painter.transform()
+        painter.save()
+        painter.resetTransform()
+        painter.setPen(pg.mkPen("#202020"))
+        for x, text in texts:
+            pos = transform.map(QtCore.QPointF(x, view.bottom()))
+            painter.drawText(pos + QtCore.QPointF(3, 12), text)
+        painter.restore()
+
+
+class AnnotationLayer:
+    """Annotation item of one plot, following the graph's store."""
+
+    def __init__(self, plot_widget):
+        self.plot_widget = plot_widget
+        self.item = AnnotationItem()
+        self._version = None
+
+    def update(self, store: AnnotationStore) -> bool:
+        """Show *store*; returns True when the item had to be repainted."""
+        changed = store is not self.item.store or store.version != self._version
+        if changed:
+            self.item.set_store(store)
+            self._version = store.version
+        # PlotWidget.clear() detaches the item: put it back as it is
+        if len(store) and self.item.scene() is None:
+            self.plot_widget.addItem(self.item)
+        elif not len(store) and self.item.scene() is not None:
+            self.plot_widget.removeItem(self.item)
+        return changed
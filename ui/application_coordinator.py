@@ -5,9 +5,9 @@ from ui.CentralPlotArea import CentralPlotArea
 from ui.PropertiesPanel import PropertiesPanel
 from signal_bus import signal_bus
 from core.app_state import AppState
+from core.models import MODIFIED
 from ui.graph_ui_coordinator import GraphUICoordinator
 from ui.dialogs.import_curve_dialog import ImportCurveDialog
-from IO_dossier.curve_loader_factory import load_curve_by_format
 import logging
 
 logger = logging.getLogger(__name__)
@@ -54,14 +54,12 @@ class ApplicationCoordinator:
         signal_bus.graph_selected.connect(self.controller.select_graph)
         signal_bus.curve_selected.connect(self._handle_curve_selected)
 
-        # 🔄 Mise à jour des panneaux de propriétés
-        signal_bus.graph_updated.connect(self.properties_panel.refresh_graph_tab)
-        signal_bus.curve_updated.connect(self.properties_panel.refresh_curve_tab)
-        signal_bus.curve_list_updated.connect(self.properties_panel.refresh_curve_tab)
+        # 🔄 Les panneaux réagissent eux-mêmes à signal_bus.model_changed,
+        # selon les champs qu'ils affichent
 
         # 🧠 Mise à jour de l’état interne
         signal_bus.graph_selected.connect(self.on_graph_selected)
-        signal_bus.graph_updated.connect(self.on_graph_updated)
+        signal_bus.model_changed.connect(self.on_model_changed)
 
         # ✅ ➕ Connexions vers l'UI passive (nouvelle logique)
         signal_bus.graph_updated.connect(self._on_graph_updated)
@@ -112,14 +110,15 @@ class ApplicationCoordinator:
                         index += 1
                     curves = [generate_random_curve(index)]
                 else:
-                    curves = load_curve_by_format(path, fmt, sep=sep, mode=mode)
+                    # Parsed by a job; the curves are added when it is done
+                    handle = self.controller.import_curves_in_background(kind_or_graphname, path, fmt, sep, mode)
+                    handle.when_done(self._report_import_failure)
+                    return
 
-                last_name = None
-                for curve in curves:
-                    last_name = self.controller.service.add_curve(kind_or_graphname, curve)
+                names = self.controller.service.add_curves(kind_or_graphname, curves)
 
-                if last_name:
-                    signal_bus.curve_selected.emit(kind_or_graphname, last_name)
+                if names:
+                    signal_bus.curve_selected.emit(kind_or_graphname, names[-1])
                 signal_bus.curve_list_updated.emit()
                 signal_bus.curve_updated.emit()
                 self.controller.ui.refresh_plot()
@@ -128,6 +127,12 @@ class ApplicationCoordinator:
                 from PyQt5.QtWidgets import QMessageBox
                 QMessageBox.critical(None, "Erreur", f"Échec de l'importation : {str(e)}")
 
+    @staticmethod
+    def _report_import_failure(handle):
+        if handle.error:
+            from PyQt5.QtWidgets import QMessageBox
+            QMessageBox.critical(None, "Erreur", f"Échec de l'importation : {handle.error}")
+
     def on_graph_selected(self, name):
         logger.debug(f"📥 [ApplicationCoordinator] Signal graph_selected reçu pour : {name}")
         graph = self.state.graphs.get(name)
@@ -138,9 +143,13 @@ class ApplicationCoordinator:
                 self.properties_panel.update_graph_ui()
         self.graph_ui_coordinator.refresh_plot()
 
-    def on_graph_updated(self):
-        logger.debug("📥 [ApplicationCoordinator] Signal graph_updated reçu")
-        self.graph_ui_coordinator.refresh_plot()
+    def on_model_changed(self, event):
+        # Graph-level changes are redrawn by the controller; a curve property
+        # only touches the view of its graph (visibility: see set_curve_visible)
+        if event.curve is None or event.kind != MODIFIED or not event.fields or "visible" in event.fields:
+            return
+        logger.debug(f"📥 [ApplicationCoordinator] {event.graph} > {event.curve} : {sorted(event.fields)}")
+        self.graph_ui_coordinator.refresh_curve(event.graph, event.curve, event.fields)
 
     # 🆕 Méthodes pour pilotage de l’UI
     def _on_graph_updated(self):
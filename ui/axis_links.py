@@ -0,0 +1,98 @@
+# ui/axis_links.py
+
+"""Axes X liés entre graphes.
+
+Les graphes d'un même groupe de liaison (``GraphData.x_link_group``)
+partagent leur fenêtre X. Un changement de plage n'est pas propagé à chaque
+signal mais au plus une fois par image : la dernière plage de chaque groupe
+est appliquée aux autres vues, dont ``setXRange`` déclenche seulement leur
+re-découpage par niveaux de détail, jamais un ``refresh_curves`` complet.
+"""
+
+import math
+from typing import Dict, Optional, Tuple
+
+from PyQt5 import QtCore
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Propagation period (about one frame at 60 Hz)
+LINK_INTERVAL_MS = 16
+
+
+class XLinkManager(QtCore.QObject):
+    """Propagates X range changes within link groups, throttled."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._groups: Dict[str, list] = {}
+        self._slots = {}  # view -> (viewbox, connected slot)
+        self._pending: Dict[str, Tuple[object, Tuple[float, float]]] = {}
+        self._applying = False
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(LINK_INTERVAL_MS)
+        self._timer.timeout.connect(self.flush)
+
+    def sync(self, views: dict):
+        """(Re)build the groups from the views' ``graph_data.x_link_group``."""
+        for view in list(self._slots):
+            if view not in views.values() or not view.graph_data.x_link_group:
+                self._disconnect(view)
+        self._groups = {}
+        for view in views.values():
+            group = view.graph_data.x_link_group
+            if not group:
+                continue
+            self._groups.setdefault(group, []).append(view)
+            if view not in self._slots:
+                vb = view.plot_widget.getViewBox()
+                slot = lambda _vb, _range, v=view: self._on_range_changed(v)
+                vb.sigXRangeChanged.connect(slot)
+                self._slots[view] = (vb, slot)
+        self._pending = {g: p for g, p in self._pending.items() if g in self._groups}
+
+    def group_of(self, view) -> Optional[str]:
+        group = view.graph_data.x_link_group
+        return group if group in self._groups else None
+
+    def members(self, group: str) -> list:
+        return list(self._groups.get(group, []))
+
+    def _disconnect(self, view):
+        vb, slot = self._slots.pop(view)
+        try:
+            vb.sigXRangeChanged.disconnect(slot)
+        except (TypeError, RuntimeError):
+            pass  # viewbox already deleted
+
+    def _on_range_changed(self, view):
+        if self._applying:
+            return  # echo of a range we are propagating
+        group = self.group_of(view)
+        if group is None or len(self._groups[group]) < 2:
+            return
+        self._pending[group] = (view, view._visible_x_range())
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self):
+        """Apply the latest range of each group to its other members."""
+        pending, self._pending = self._pending, {}
+        self._applying = True
+        try:
+            for group, (source, (x0, x1)) in pending.items():
+                for view in self._groups.get(group, []):
+                    if view is not source:
+                        self._apply(view, x0, x1)
+        finally:
+            self._applying = False
+
+    @staticmethod
+    def _apply(view, x0: float, x1: float):
+        if view.graph_data.effective_log_x:
+            if x0 <= 0 or x1 <= 0:
+                return  # not representable on a log axis
+            x0, x1 = math.log10(x0), math.log10(x1)
+        view.plot_widget.getViewBox().setXRange(x0, x1, padding=0)
@@ -0,0 +1,107 @@
+# ui/bar_aggregation.py
+
+"""Barres agrégées pour les grandes courbes en mode histogramme.
+
+Un rectangle par échantillon devient inutilisable au-delà de quelques
+milliers de points. Les échantillons de la fenêtre visible sont regroupés en
+au plus une barre par colonne de pixels (minimum, maximum ou moyenne, au
+choix par courbe), et la largeur des barres suit l'espacement réel des
+échantillons ou des groupes. Le regroupement est refait à chaque zoom.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+import pyqtgraph as pg
+
+BAR_AGGREGATES = ("max", "min", "mean")
+# Fraction of the sample (or bin) spacing covered by a bar
+BAR_FILL = 0.8
+
+
+@dataclass
+class BarBins:
+    """Bars to draw: centers, heights (raw units) and a common width."""
+
+    x: np.ndarray
+    height: np.ndarray
+    width: float
+    aggregated: bool  # several samples per bar
+
+
+def sample_spacing(x: np.ndarray) -> float:
+    """Typical distance between consecutive sorted X values (median)."""
+    if len(x) < 2:
+        return 1.0
+    steps = np.diff(x)
+    steps = steps[np.isfinite(steps) & (steps > 0)]
+    return float(np.median(steps)) if len(steps) else 1.0
+
+
+def aggregate_bars(
+    x: np.ndarray,
+    y: np.ndarray,
+    x0: float,
+    x1: float,
+    n_bins: int,
+    how: str = "max",
+    spacing: Optional[float] = None,
+) -> BarBins:
+    """Bars for the sorted samples (x, y) visible in ``[x0, x1]``.
+
+    Up to *n_bins* samples are returned as they are; beyond, samples are
+    grouped into *n_bins* equal X bins reduced with *how* (``"min"``,
+    ``"max"`` or ``"mean"``, NaN ignored). Empty bins are dropped.
+    """
+    if spacing is None:
+        spacing = sample_spacing(x)
+    n_bins = max(int(n_bins), 1)
+    if len(x) <= n_bins or not x1 > x0:
+        return BarBins(np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64),
+                       spacing * BAR_FILL, False)
+
+    edges = np.linspace(x0, x1, n_bins + 1)
+    starts = np.searchsorted(x, edges[:-1], side="left")
+    stops = np.append(starts[1:], np.searchsorted(x, x1, side="right"))
+    filled = stops > starts
+    starts, stops = starts[filled], stops[filled]
+    centers = 0.5 * (edges[:-1] + edges[1:])[filled]
+    bin_width = (x1 - x0) / n_bins
+    if not len(starts):
+        return BarBins(centers, np.empty(0), bin_width * BAR_FILL, True)
+
+    # Non-empty bins are contiguous: reduceat over the covered span is exact
+    y = np.asarray(y[starts[0]:stops[-1]], dtype=np.float64)
+    starts = starts - starts[0]
+    if how == "min":
+        height = np.fmin.reduceat(y, starts)
+    elif how == "mean":
+        finite = np.isfinite(y)
+        sums = np.add.reduceat(np.where(finite, y, 0.0), starts)
+        counts = np.add.reduceat(finite.astype(np.int64), starts)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            height = sums / counts
+    else:
+        height = np.fmax.reduceat(y, starts)
+    return BarBins(centers, height, max(bin_width, spacing) * BAR_FILL, True)
+
+
+class AggregatedBarItem(pg.BarGraphItem):
+    """Bar item holding only the visible bars, auto-ranged on the whole curve."""
+
+    def __init__(self, **opts):
+        super().__init__(x=[], height=[], width=1.0, **opts)
+        self._extent: Optional[Tuple[float, float, float, float]] = None
+
+    def set_extent(self, extent: Optional[Tuple[float, float, float, float]]):
+        """Displayed ``(x0, x1, y0, y1)`` of the full curve."""
+        self._extent = extent
+
+    def dataBounds(self, ax, frac=1.0, orthoRange=None):
+        if self._extent is None:
+            return super().dataBounds(ax, frac, orthoRange)
+        if ax == 0:
+            return self._extent[0], self._extent[1]
+        # Bars are drawn from zero
+        return min(self._extent[2], 0.0), max(self._extent[3], 0.0)
@@ -0,0 +1,183 @@
+# ui/batch_render.py
+
+"""Rendu sans fenêtre de projets vers des images PNG/SVG.
+
+Chaque graphe est tracé par une :class:`MyPlotView` hors écran (plateforme
+Qt ``offscreen``, sans OpenGL) à la taille de l'image, puis exporté avec
+l'``ImageExporter`` ou le ``SVGExporter`` de pyqtgraph. Avant l'export,
+chaque courbe en ligne est réduite à un couple min/max par colonne de
+pixels de l'image : un SVG de 10 M points ne contient ainsi que quelques
+milliers de segments. Les graphes sont répartis sur plusieurs processus,
+chacun chargeant une fois les projets qu'il traite.
+"""
+
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+import multiprocessing
+from typing import Dict, List, Optional, Sequence
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ("png", "svg")
+DEFAULT_SIZE = (1600, 900)
+# Longest wait for the asynchronous preparation of one graph
+PREPARE_TIMEOUT_S = 120.0
+
+_projects: Dict[str, dict] = {}  # per-process cache of loaded projects
+
+
+@dataclass(frozen=True)
+class RenderTask:
+    """One graph of one project to render in the given formats."""
+
+    project: str
+    graph: str
+    out_dir: str
+    formats: tuple = ("png",)
+    width: int = DEFAULT_SIZE[0]
+    height: int = DEFAULT_SIZE[1]
+
+
+def output_path(task: RenderTask, fmt: str) -> str:
+    stem = os.path.splitext(os.path.basename(task.project))[0]
+    name = re.sub(r"[^\w.-]+", "_", task.graph).strip("_") or "graphe"
+    return os.path.join(task.out_dir, f"{stem}_{name}.{fmt}")
+
+
+def ensure_application():
+    """Offscreen QApplication for this process (created once)."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5 import QtWidgets
+
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def load_project(path: str) -> dict:
+    from IO_dossier.project_io import import_project_from_json
+
+    graphs = _projects.get(path)
+    if graphs is None:
+        graphs = _projects[path] = import_project_from_json(path)
+    return graphs
+
+
+def list_tasks(projects: Sequence[str], out_dir: str, formats=("png",), size=DEFAULT_SIZE) -> List[RenderTask]:
+    """One task per visible graph of each project."""
+    tasks = []
+    for project in projects:
+        for name, graph in load_project(project).items():
+            if graph.visible:
+                tasks.append(RenderTask(project, name, out_dir, tuple(formats), *size))
+    return tasks
+
+
+def _wait_until_drawn(app, view):
+    """Let the pool deliver every prepared buffer and the LOD re-slicing run."""
+    deadline = time.monotonic() + PREPARE_TIMEOUT_S
+    while view.pipeline.is_pending() or view._lod_timer.isActive():
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"préparation trop longue pour {view.graph_data.name}")
+        app.processEvents()
+        time.sleep(0.002)
+    app.processEvents()
+
+
+def decimate_to_columns(view, width: int):
+    """Reduce every line item to one min/max pair per output pixel column.
+
+    Columns follow the X axis of the image: equal in ``log10(x)`` under log X.
+    """
+    import pyqtgraph as pg
+    from core.lod import column_minmax
+
+    x0, x1 = view._visible_x_range()
+    for curve in view.graph_data.curves:
+        item = view.curves.get(curve.name)
+        if not isinstance(item, pg.PlotDataItem) or not curve.is_x_sorted:
+            continue
+        x, y = item.getOriginalDataset()
+        if x is None or len(x) <= 2 * width:
+            continue
+        cx, cy = column_minmax(x, y, x0, x1, width, log_x=view.graph_data.effective_log_x)
+        item.setDownsampling(auto=False)
+        item.setData(cx, cy, connect="finite")
+
+
+def render_graph(graph, task: RenderTask) -> List[str]:
+    """Draw *graph* offscreen and export it in each format of *task*."""
+    app = ensure_application()
+    import pyqtgraph.exporters
+    from PyQt5 import QtCore
+    from ui.views import MyPlotView
+
+    view = MyPlotView(graph)
+    widget = view.plot_widget
+    widget.useOpenGL(False)
+    widget.setParent(None)  # satellite zones are not part of the image
+    widget.setTitle(graph.name)
+    widget.resize(task.width, task.height)
+    widget.setAttribute(QtCore.Qt.WA_DontShowOnScreen)
+    widget.show()  # laid out at the image size, never composed on a screen
+    app.processEvents()
+
+    view.update_graph_properties()
+    view.refresh_curves()
+    _wait_until_drawn(app, view)
+    view.reset_zoom()
+    _wait_until_drawn(app, view)  # re-sliced for the final range
+    decimate_to_columns(view, task.width)
+
+    os.makedirs(task.out_dir, exist_ok=True)
+    written = []
+    for fmt in task.formats:
+        path = output_path(task, fmt)
+        if fmt == "svg":
+            exporter = pyqtgraph.exporters.SVGExporter(widget.plotItem)
+        else:
+            exporter = pyqtgraph.exporters.ImageExporter(widget.plotItem)
+            exporter.parameters()["width"] = task.width
+        exporter.export(path)
+        written.append(path)
+    widget.close()
+    widget.deleteLater()
+    view.container.deleteLater()
+    return written
+
+
+def run_task(task: RenderTask) -> List[str]:
+    """Render one task in the current process (worker entry point)."""
+    graph = load_project(task.project)[task.graph]
+    written = render_graph(graph, task)
+    logger.info(f"🖼 [batch_render] {task.project} / {task.graph} → {', '.join(written)}")
+    return written
+
+
+def render_tasks(tasks: Sequence[RenderTask], jobs: int = 1) -> Dict[RenderTask, Optional[List[str]]]:
+    """Render *tasks*, in *jobs* processes; failed tasks map to ``None``."""
+    results: Dict[RenderTask, Optional[List[str]]] = {}
+    if jobs <= 1:
+        for task in tasks:
+            try:
+                results[task] = run_task(task)
+            except Exception:
+                logger.exception(f"❌ [batch_render] Échec du rendu de {task.graph}")
+                results[task] = None
+        return results
+
+    # spawn: workers must not inherit a half-initialised Qt from the parent
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context, initializer=ensure_application) as pool:
+        futures = {pool.submit(run_task, task): task for task in tasks}
+        for future in as_completed(futures):
+            task = futures[future]
+            try:
+                results[task] = future.result()
+            except Exception:
+                logger.exception(f"❌ [batch_render] Échec du rendu de {task.graph}")
+                results[task] = None
+    return results
@@ -0,0 +1,141 @@
+# ui/batched_curves.py
+
+"""Tracé groupé des courbes superposées de même style.
+
+Quand un graphe superpose des centaines d'acquisitions, un ``PlotDataItem``
+par courbe fait dominer le coût de la scène Qt (un stylo, un rectangle
+englobant et un appel ``paint`` chacun). Les courbes en ligne simple de même
+apparence sont donc regroupées dans un :class:`BatchedCurveItem` : un seul
+``QPainterPath`` construit par ``arrayToQPath`` avec un masque ``connect``
+coupé entre deux courbes. Un index (nom → tranche) conserve l'accès par
+courbe pour la visibilité ; la sélection au clic passe par les données
+(:mod:`ui.hit_testing`) et n'a pas besoin d'item dédié.
+"""
+
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+import pyqtgraph as pg
+from PyQt5 import QtCore, QtGui
+
+# Below this many curves of one style, separate items are cheaper to manage
+BATCH_MIN_CURVES = 2
+
+
+def can_batch(curve) -> bool:
+    """Whether *curve* is drawn as a plain line that can share a path."""
+    return (
+        curve.visible
+        and curve.display_mode == "line"
+        and not curve.symbol
+        and not curve.fill
+        and curve.label_mode != "legend"
+    )
+
+
+def batch_key(curve) -> Hashable:
+    """Appearance shared by every curve of one batch."""
+    return (str(curve.color), curve.width, curve.style, float(curve.opacity))
+
+
+def group_batches(curves) -> Tuple[Dict[Hashable, List], List]:
+    """Split *curves* into batches by style and the curves drawn on their own."""
+    groups: Dict[Hashable, List] = {}
+    for curve in curves:
+        if can_batch(curve):
+            groups.setdefault(batch_key(curve), []).append(curve)
+    batches = {k: v for k, v in groups.items() if len(v) >= BATCH_MIN_CURVES}
+    batched = {id(c) for members in batches.values() for c in members}
+    return batches, [c for c in curves if id(c) not in batched]
+
+
+class BatchedCurveItem(pg.GraphicsObject):
+    """Several curves with one pen, painted as a single path."""
+
+    def __init__(self, pen, names: List[str]):
+        super().__init__()
+        self._pen = pg.mkPen(pen)
+        self.names = list(names)
+        self._hidden = set()
+        self._x = np.empty(0)
+        self._y = np.empty(0)
+        self._connect = np.empty(0, dtype=bool)
+        self._offsets = np.zeros(len(self.names) + 1, dtype=np.int64)
+        self._bounds: Optional[Tuple[float, float, float, float]] = None
+        self._path = QtGui.QPainterPath()
+        self._rect = QtCore.QRectF()
+
+    def setData(self, x, y, connect, offsets, bounds=None):
+        """Replace the buffers (*offsets*: start of each member, plus the end)."""
+        self._x = np.asarray(x, dtype=np.float64)
+        self._y = np.asarray(y, dtype=np.float64)
+        self._connect = np.asarray(connect, dtype=bool)
+        self._offsets = np.asarray(offsets, dtype=np.int64)
+        self._bounds = bounds
+        self._rebuild()
+
+    def member_slice(self, name: str) -> slice:
+        i = self.names.index(name)
+        return slice(int(self._offsets[i]), int(self._offsets[i + 1]))
+
+    def member_data(self, name: str) -> Tuple[np.ndarray, np.ndarray]:
+        s = self.member_slice(name)
+        return self._x[s], self._y[s]
+
+    def set_member_visible(self, name: str, visible: bool):
+        if visible == (name not in self._hidden):
+            return
+        if visible:
+            self._hidden.discard(name)
+        else:
+            self._hidden.add(name)
+        self._rebuild()
+
+    def is_member_visible(self, name: str) -> bool:
+        return name in self.names and name not in self._hidden
+
+    def _rebuild(self):
+        x, y, connect = self._x, self._y, self._connect
+        if self._hidden:
+            keep = np.ones(len(x), dtype=bool)
+            for name in self._hidden:
+                keep[self.member_slice(name)] = False
+            x, y, connect = x[keep], y[keep], connect[keep]
+        self.prepareGeometryChange()
+        if len(x):
+            # arrayToQPath wants finite coordinates: broken points are zeroed,
+            # the connect mask already skips them
+            finite = np.isfinite(x) & np.isfinite(y)
+            if not finite.all():
+                x, y = np.where(finite, x, 0.0), np.where(finite, y, 0.0)
+            self._path = pg.arrayToQPath(x, y, connect=connect)
+        else:
+            self._path = QtGui.QPainterPath()
+        self._rect = self._path.boundingRect()
+        self.update()
+
+    def dataBounds(self, ax, frac=1.0, orthoRange=None):
+        # Auto-range uses the full curves, not just the decimated window
+        if self._bounds is None:
+            return None, None
+        return (self._bounds[0], self._bounds[1]) if ax == 0 else (self._bounds[2], self._bounds[3])
+
+    def pixelPadding(self):
+        return self._pen.widthF() / 2.0
+
+    def boundingRect(self):
+        if self._rect.isNull():
+            return QtCore.QRectF()
+        # Pen width is in pixels: pad by its size in item coordinates
+        px, py = self.pixelVectors()
+        pad_x = pad_y = 0.0
+        if px is not None:
+            pad = self.pixelPadding()
+            pad_x, pad_y = abs(px.x()) * pad, abs(py.y()) * pad
+        return self._rect.adjusted(-pad_x, -pad_y, pad_x, pad_y)
+
+    def paint(self, painter, option, widget=None):
+        if self._path.isEmpty():
+            return
+        painter.setPen(self._pen)
+        painter.drawPath(self._path)
@@ -0,0 +1,161 @@
+# ui/density_raster.py
+
+"""Nuage de points en raster de densité.
+
+Au-delà de quelques centaines de milliers de points, un symbole par
+échantillon rend ``ScatterPlotItem`` lent et gourmand en mémoire. Les points
+de la fenêtre visible sont alors comptés dans un histogramme 2D à la
+résolution de l'écran (``np.bincount``) et affichés par un
+:class:`DensityImageItem` teinté de la couleur de la courbe. Quand peu de
+points restent visibles, la vue repasse automatiquement aux vrais symboles.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+import pyqtgraph as pg
+from PyQt5 import QtCore
+from PyQt5.QtGui import QColor
+
+# Scatter curves with at least this many samples may be drawn as a raster
+DENSITY_MIN_POINTS = 200_000
+# Up to this many visible points are still drawn as real symbols
+DENSITY_MAX_SYMBOLS = 50_000
+# Points binned per pass (keeps temporaries in cache)
+DENSITY_CHUNK = 1 << 18
+
+
+@dataclass
+class DensityRaster:
+    """Per-pixel point counts over a rectangle in view coordinates."""
+
+    counts: np.ndarray  # shape (width_px, height_px), indexed [x, y]
+    rect: Tuple[float, float, float, float]  # x, y, width, height
+    n_points: int
+
+
+def _to_view(values: np.ndarray, log: bool) -> np.ndarray:
+    if not log:
+        return values
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.log10(values)
+
+
+def density_counts(
+    x: np.ndarray,
+    y: np.ndarray,
+    rect: Tuple[float, float, float, float],
+    shape: Tuple[int, int],
+) -> np.ndarray:
+    """2D histogram of (x, y) over *rect*, one bin per pixel.
+
+    ``bincount`` on flattened bin indices, by chunks that stay in cache:
+    much faster than ``np.histogram2d`` for tens of millions of points.
+    Points outside the rectangle or non-finite are ignored.
+    """
+    x0, y0, w, h = rect
+    nx, ny = shape
+    sx, sy = nx / w, ny / h
+    counts = np.zeros(nx * ny, dtype=np.int64)
+    for start in range(0, len(x), DENSITY_CHUNK):
+        fx = np.subtract(x[start:start + DENSITY_CHUNK], x0, dtype=np.float64)
+        fx *= sx
+        fy = np.subtract(y[start:start + DENSITY_CHUNK], y0, dtype=np.float64)
+        fy *= sy
+        with np.errstate(invalid="ignore"):
+            inside = (fx >= 0) & (fx < nx) & (fy >= 0) & (fy < ny)
+        index = fx[inside].astype(np.int64)
+        index *= ny
+        index += fy[inside].astype(np.int64)
+        counts += np.bincount(index, minlength=nx * ny)
+    return counts.reshape(nx, ny)
+
+
+def density_raster(
+    x: np.ndarray,
+    y: np.ndarray,
+    x_range: Tuple[float, float],
+    y_range: Optional[Tuple[float, float]],
+    shape: Tuple[int, int],
+    log_x: bool = False,
+    log_y: bool = False,
+) -> Optional[DensityRaster]:
+    """Rasterise displayed points over the visible window (ranges in data units).
+
+    Returns ``None`` when at most :data:`DENSITY_MAX_SYMBOLS` points fall in
+    the window, i.e. when symbols are cheap enough to draw.
+    """
+    vx, vy = _to_view(x, log_x), _to_view(y, log_y)
+    vx0, vx1 = _to_view(np.asarray(x_range, dtype=np.float64), log_x)
+    if y_range is None:
+        finite = vy[np.isfinite(vy)]
+        if not len(finite):
+            return None
+        vy0, vy1 = finite.min(), finite.max()
+    else:
+        vy0, vy1 = _to_view(np.asarray(y_range, dtype=np.float64), log_y)
+    if not all(np.isfinite((vx0, vx1, vy0, vy1))):
+        return None
+    if vx1 <= vx0:
+        vx1 = vx0 + 1.0
+    if vy1 <= vy0:
+        vy1 = vy0 + 1.0
+    rect = (vx0, vy0, vx1 - vx0, vy1 - vy0)
+    counts = density_counts(vx, vy, rect, shape)
+    n_points = int(counts.sum())
+    if n_points <= DENSITY_MAX_SYMBOLS:
+        return None
+    return DensityRaster(counts, rect, n_points)
+
+
+class DensityImageItem(pg.ImageItem):
+    """Point-density image shaded from transparent to the curve colour."""
+
+    def __init__(self, color):
+        super().__init__(axisOrder="col-major")
+        qcolor = QColor(color)
+        r, g, b = qcolor.red(), qcolor.green(), qcolor.blue()
+        alpha = int(255 * qcolor.alphaF())
+        cmap = pg.ColorMap([0.0, 0.15, 1.0], [(r, g, b, 0), (r, g, b, alpha // 3), (r, g, b, alpha)])
+        self.setLookupTable(cmap.getLookupTable(nPts=256, alpha=True))
+        self._extent: Optional[Tuple[float, float, float, float]] = None
+        self._rect: Optional[Tuple[float, float, float, float]] = None
+
+    def set_extent(self, extent: Optional[Tuple[float, float, float, float]], log_x=False, log_y=False):
+        """Full data extent ``(x0, x1, y0, y1)`` (data units), used for auto-range."""
+        if extent is None:
+            self._extent = None
+            return
+        x0, x1 = _to_view(np.asarray(extent[:2], dtype=np.float64), log_x)
+        y0, y1 = _to_view(np.asarray(extent[2:], dtype=np.float64), log_y)
+        self._extent = (x0, x1, y0, y1)
+
+    def set_raster(self, raster: DensityRaster):
+        # Log scale of the counts keeps sparse areas visible next to dense ones
+        image = np.log1p(raster.counts.astype(np.float32))
+        top = float(image.max()) or 1.0
+        self.setImage(image, levels=(0.0, top), autoLevels=False)
+        self._rect = raster.rect
+        self.setRect(QtCore.QRectF(*raster.rect))
+
+    def clear_raster(self):
+        """Show nothing (symbols drawn instead) but keep auto-range bounds."""
+        if self._rect is None:
+            if self._extent is None:
+                return
+            x0, x1, y0, y1 = self._extent
+            self._rect = (x0, y0, (x1 - x0) or 1.0, (y1 - y0) or 1.0)
+        self.setImage(np.zeros((1, 1), dtype=np.float32), levels=(0.0, 1.0), autoLevels=False)
+        self.setRect(QtCore.QRectF(*self._rect))
+
+    def dataBounds(self, ax, frac=1.0, orthoRange=None):
+        # Auto-range must see the whole curve, not only the binned window.
+        # Bounds are expected in item (pixel) coordinates.
+        if self._extent is None or self._rect is None or self.image is None:
+            return None
+        x0, y0, w, h = self._rect
+        nx, ny = self.image.shape[:2]
+        if ax == 0:
+            return ((self._extent[0] - x0) * nx / w, (self._extent[1] - x0) * nx / w)
+        return ((self._extent[2] - y0) * ny / h, (self._extent[3] - y0) * ny / h)
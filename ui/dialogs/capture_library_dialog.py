@@ -0,0 +1,145 @@
+from PyQt5.QtWidgets import (
+    QDialog,
+    QVBoxLayout,
+    QHBoxLayout,
+    QFormLayout,
+    QLabel,
+    QLineEdit,
+    QComboBox,
+    QCheckBox,
+    QDoubleSpinBox,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QAbstractItemView,
+    QDialogButtonBox,
+)
+from PyQt5.QtCore import Qt
+from datetime import datetime
+import time
+
+from typing import List
+from IO_dossier.capture_library import CaptureLibrary, CaptureRecord
+
+PERIODS = [
+    ("Toutes", None),
+    ("Dernières 24 h", 24 * 3600),
+    ("7 derniers jours", 7 * 24 * 3600),
+    ("30 derniers jours", 30 * 24 * 3600),
+]
+
+
+class CaptureLibraryDialog(QDialog):
+    """
+    Recherche dans la bibliothèque de captures et sélection des courbes
+    à ajouter au graphique courant.
+    """
+
+    COLUMNS = ["Nom", "Voie", "Instrument", "Fe (Hz)", "Points", "Min", "Max", "Date", "Fichier"]
+
+    def __init__(self, library: CaptureLibrary, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Bibliothèque de captures")
+        self.resize(900, 450)
+        self.library = library
+        self._records: List[CaptureRecord] = []
+
+        layout = QVBoxLayout(self)
+        form = QFormLayout()
+
+        self.name_edit = QLineEdit()
+        self.name_edit.setPlaceholderText("ex : *temp*")
+        form.addRow("Nom :", self.name_edit)
+
+        self.channel_edit = QLineEdit()
+        self.channel_edit.setPlaceholderText("ex : CH2")
+        form.addRow("Voie :", self.channel_edit)
+
+        self.instrument_combo = QComboBox()
+        self.instrument_combo.addItem("Tous", None)
+        for name in library.instruments():
+            self.instrument_combo.addItem(name, name)
+        form.addRow("Instrument :", self.instrument_combo)
+
+        self.period_combo = QComboBox()
+        for label, seconds in PERIODS:
+            self.period_combo.addItem(label, seconds)
+        form.addRow("Période :", self.period_combo)
+
+        self.max_check, self.max_spin = self._threshold_row(form, "Max >")
+        self.min_check, self.min_spin = self._threshold_row(form, "Min <")
+        layout.addLayout(form)
+
+        search_btn = QPushButton("🔍 Rechercher")
+        search_btn.clicked.connect(self.search)
+        layout.addWidget(search_btn)
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        layout.addWidget(self.table)
+
+        self.status_label = QLabel("")
+        layout.addWidget(self.status_label)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Cancel)
+        add_btn = buttons.addButton("Ajouter au graphique", QDialogButtonBox.AcceptRole)
+        add_btn.clicked.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+        self.search()
+
+    def _threshold_row(self, form: QFormLayout, label: str):
+        row = QHBoxLayout()
+        check = QCheckBox()
+        spin = QDoubleSpinBox()
+        spin.setRange(-1e12, 1e12)
+        spin.setDecimals(6)
+        spin.setEnabled(False)
+        check.toggled.connect(spin.setEnabled)
+        row.addWidget(check)
+        row.addWidget(spin)
+        form.addRow(label, row)
+        return check, spin
+
+    def search(self):
+        period = self.period_combo.currentData()
+        start = time.perf_counter()
+        self._records = self.library.search(
+            name=self.name_edit.text().strip() or None,
+            channel=self.channel_edit.text().strip() or None,
+            instrument=self.instrument_combo.currentData(),
+            since=time.time() - period if period else None,
+            max_above=self.max_spin.value() if self.max_check.isChecked() else None,
+            min_below=self.min_spin.value() if self.min_check.isChecked() else None,
+        )
+        elapsed = (time.perf_counter() - start) * 1000
+        self._fill_table()
+        self.status_label.setText(f"{len(self._records)} capture(s) trouvée(s) en {elapsed:.1f} ms")
+
+    def _fill_table(self):
+        self.table.setRowCount(len(self._records))
+        for row, rec in enumerate(self._records):
+            date = datetime.fromtimestamp(rec.acquired_at).strftime("%d/%m/%Y %H:%M") if rec.acquired_at else ""
+            values = [
+                rec.name,
+                rec.channel or "",
+                rec.instrument or "",
+                f"{rec.sample_rate:.6g}" if rec.sample_rate else "",
+                str(rec.length),
+                f"{rec.y_min:.6g}" if rec.y_min is not None else "",
+                f"{rec.y_max:.6g}" if rec.y_max is not None else "",
+                date,
+                rec.path,
+            ]
+            for col, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                item.setData(Qt.UserRole, row)
+                self.table.setItem(row, col, item)
+
+    def get_selected_records(self) -> List[CaptureRecord]:
+        rows = sorted({index.row() for index in self.table.selectionModel().selectedRows()})
+        return [self._records[r] for r in rows]
@@ -0,0 +1,53 @@
+from PyQt5 import QtWidgets
+from PyQt5.QtWidgets import (
+    QDialog,
+    QFormLayout,
+    QVBoxLayout,
+    QComboBox,
+    QDialogButtonBox,
+)
+
+
+class CsvExportDialog(QDialog):
+    """Choix du séparateur de colonnes et du symbole décimal pour l'export CSV."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Export CSV")
+        self.setMinimumWidth(300)
+
+        layout = QVBoxLayout(self)
+        form = QFormLayout()
+
+        self.sep_combo = QComboBox()
+        self.sep_combo.addItem("Point-virgule ( ; )", ";")
+        self.sep_combo.addItem("Virgule ( , )", ",")
+        self.sep_combo.addItem("Tabulation", "\t")
+        form.addRow("Séparateur :", self.sep_combo)
+
+        self.decimal_combo = QComboBox()
+        self.decimal_combo.addItem("Virgule ( , )", ",")
+        self.decimal_combo.addItem("Point ( . )", ".")
+        form.addRow("Symbole décimal :", self.decimal_combo)
+        layout.addLayout(form)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self._on_accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+    def _on_accept(self):
+        if self.get_separator() == self.get_decimal():
+            QtWidgets.QMessageBox.warning(
+                self,
+                "Erreur",
+                "Le séparateur et le symbole décimal doivent être différents.",
+            )
+            return
+        self.accept()
+
+    def get_separator(self) -> str:
+        return self.sep_combo.currentData()
+
+    def get_decimal(self) -> str:
+        return self.decimal_combo.currentData()
@@ -18,6 +18,7 @@ import fnmatch
 
 from typing import List
 from core.models import CurveData, DataType
+from core.curve_stats import get_curve_stats
 
 class CurveSelectionDialog(QDialog):
     """
@@ -91,8 +92,9 @@ class CurveSelectionDialog(QDialog):
             dtype = combo.currentData()
             curve.dtype = dtype
             import numpy as np
+            invalid = get_curve_stats(curve).invalid_count(dtype)
             data = np.asarray(curve.y, dtype=float)
-            if dtype != DataType.FLOAT64:
+            if invalid:
                 mask = self._get_invalid_mask(data, dtype)
                 data[mask] = np.nan
             curve.y = data
@@ -141,13 +143,10 @@ class CurveSelectionDialog(QDialog):
         return mask
 
     def _update_warning(self, curve: CurveData, combo: QComboBox, label: QLabel):
-        import numpy as np
-
-        dtype = combo.currentData()
-        data = np.asarray(curve.y, dtype=float)
-        count = int(self._get_invalid_mask(data, dtype).sum()) if dtype != DataType.FLOAT64 else 0
+        stats = get_curve_stats(curve)
+        count = stats.invalid_count(combo.currentData())
         if count:
-            label.setText(f"{count}/{len(data)}")
+            label.setText(f"{count}/{stats.length}")
         else:
             label.setText("")
     def _move_to_selected(self, items):
@@ -4,6 +4,7 @@ from PyQt5.QtWidgets import (
 )
 from typing import List
 from core.models import CurveData, DataType
+from core.curve_stats import get_curve_stats
 
 
 class DataTypeDialog(QDialog):
@@ -61,16 +62,14 @@ class DataTypeDialog(QDialog):
         return mask
 
     def _update_warning(self, curve: CurveData):
-        import numpy as np
-
         key = id(curve)
         combo = self._combos[key]
         dtype: DataType = combo.currentData()
-        data = np.asarray(curve.y, dtype=float)
-        count = int(self._get_invalid_mask(data, dtype).sum()) if dtype != DataType.FLOAT64 else 0
+        stats = get_curve_stats(curve)
+        count = stats.invalid_count(dtype)
         lbl = self._warn_labels[key]
         if count:
-            lbl.setText(f"{count}/{len(data)} invalid")
+            lbl.setText(f"{count}/{stats.length} invalid")
         else:
             lbl.setText("")
 
@@ -79,19 +78,14 @@ class DataTypeDialog(QDialog):
             QMessageBox.information(self, "OK", "Conversion possible")
 
     def _validate(self) -> bool:
-        import numpy as np
-
         warnings = []
         for curve in self.curves:
             combo = self._combos[id(curve)]
             dtype: DataType = combo.currentData()
-            if dtype == DataType.FLOAT64:
-                continue
-            data = np.asarray(curve.y, dtype=float)
-            mask = self._get_invalid_mask(data, dtype)
-            count = int(mask.sum())
+            stats = get_curve_stats(curve)
+            count = stats.invalid_count(dtype)
             if count:
-                warnings.append(f"{curve.name}: {count}/{len(data)}")
+                warnings.append(f"{curve.name}: {count}/{stats.length}")
         if warnings:
             msg = "\n".join(warnings) + "\nLes valeurs incompatibles seront remplac\xc3\xa9es par NaN. Continuer ?"
             resp = QMessageBox.question(self, "Conversion", msg, QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
@@ -107,8 +101,9 @@ class DataTypeDialog(QDialog):
             combo = self._combos[id(curve)]
             dtype: DataType = combo.currentData()
             curve.dtype = dtype
+            invalid = get_curve_stats(curve).invalid_count(dtype)
             data = np.asarray(curve.y, dtype=float)
-            if dtype != DataType.FLOAT64:
+            if invalid:
                 mask = self._get_invalid_mask(data, dtype)
                 data[mask] = np.nan
             curve.y = data
@@ -0,0 +1,105 @@
+# ui/frame_stats.py
+
+"""Statistiques de rendu d'une vue et leur affichage tête haute (HUD).
+
+:class:`FrameStats` n'existe que lorsque le HUD est affiché : la vue ne
+mesure rien (ni chronométrage des préparations, ni comptage des points)
+tant qu'il est masqué. Le texte est rafraîchi sur minuterie, pas à chaque
+image, pour ne pas provoquer de repeint supplémentaire.
+"""
+
+import time
+from collections import deque
+from typing import Dict, Optional
+
+import numpy as np
+from PyQt5 import QtCore, QtWidgets
+
+# Paint times kept for the percentile
+PAINT_HISTORY = 120
+HUD_INTERVAL_MS = 250
+
+
+class FrameStats:
+    """Timings and point counts of one view, fed by the view itself."""
+
+    def __init__(self):
+        self.paint_ms = deque(maxlen=PAINT_HISTORY)
+        self.prep_ms = 0.0  # last data preparation (worker thread)
+        self.rebuild_ms = 0.0  # last item rebuild or buffer swap (GUI thread)
+        self.drawn: Dict[str, int] = {}  # points handed to each item
+        self.stored: Dict[str, int] = {}
+        self.lod_levels: Dict[str, Optional[int]] = {}
+        self._refreshes = deque()
+
+    def paint(self, ms: float):
+        self.paint_ms.append(ms)
+
+    def prepared(self, ms: float):
+        self.prep_ms = ms
+
+    def rebuilt(self, ms: float):
+        self.rebuild_ms = ms
+
+    def refreshed(self, now: Optional[float] = None):
+        self._refreshes.append(time.monotonic() if now is None else now)
+
+    def curve_drawn(self, name: str, drawn: int, stored: int, lod_level: Optional[int] = None):
+        self.drawn[name] = drawn
+        self.stored[name] = stored
+        self.lod_levels[name] = lod_level
+
+    def reset_curves(self):
+        self.drawn.clear()
+        self.stored.clear()
+        self.lod_levels.clear()
+
+    @property
+    def last_paint_ms(self) -> float:
+        return self.paint_ms[-1] if self.paint_ms else 0.0
+
+    @property
+    def p95_paint_ms(self) -> float:
+        return float(np.percentile(self.paint_ms, 95)) if self.paint_ms else 0.0
+
+    def refreshes_last_second(self, now: Optional[float] = None) -> int:
+        now = time.monotonic() if now is None else now
+        while self._refreshes and self._refreshes[0] < now - 1.0:
+            self._refreshes.popleft()
+        return len(self._refreshes)
+
+    def lod_summary(self) -> str:
+        levels = [lvl for lvl in self.lod_levels.values() if lvl is not None]
+        if not levels:
+            return "brut"
+        return f"niveaux {min(levels)}–{max(levels)}" if min(levels) != max(levels) else f"niveau {levels[0]}"
+
+    def lines(self):
+        drawn = sum(self.drawn.values())
+        stored = sum(self.stored.values())
+        return [
+            f"Image : {self.last_paint_ms:.1f} ms (p95 {self.p95_paint_ms:.1f} ms)",
+            f"Points : {drawn:,} tracés / {stored:,} stockés".replace(",", " "),
+            f"LOD : {self.lod_summary()}",
+            f"Préparation : {self.prep_ms:.1f} ms — Items : {self.rebuild_ms:.1f} ms",
+            f"Rafraîchissements : {self.refreshes_last_second()} /s",
+        ]
+
+
+class StatsHud(QtWidgets.QLabel):
+    """Top-right label showing a view's :class:`FrameStats`."""
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents)
+        self.setStyleSheet(
+            "background-color: rgba(0, 0, 0, 170); color: #9f9; padding: 3px;"
+            " font-family: monospace; font-size: 8pt;"
+        )
+
+    def show_stats(self, stats: FrameStats):
+        self.setText("\n".join(stats.lines()))
+        self.adjustSize()
+        parent = self.parentWidget()
+        if parent is not None:
+            self.move(max(0, parent.width() - self.width() - 4), 4)
@@ -3,6 +3,7 @@
 from core.app_state import AppState
 from ui.views import MyPlotView
 from ui.PropertiesPanel import PropertiesPanel
+from ui.axis_links import XLinkManager
 import logging
 
 logger = logging.getLogger(__name__)
@@ -16,6 +17,24 @@ class GraphUICoordinator:
         self.central_area = central_area  # 🆕 pour gérer dynamiquement les widgets
         self.properties_panel = properties_panel
         logger.debug(f"[GraphUICoordinator.__init__] Vues disponibles : {list(self.views.keys())}")
+        # Groupes d'axes X liés, propagation limitée à une fois par image
+        self.x_links = XLinkManager()
+        # HUD des statistiques de rendu (menu Affichage), commun à toutes les vues
+        self.render_hud = False
+        # Zone centrale virtualisée : seules les vues à l'écran sont tracées
+        self._virtualised = hasattr(central_area, "widget_visibility_changed")
+        if self._virtualised:
+            central_area.widget_visibility_changed.connect(self._on_widget_visibility_changed)
+
+    def _on_widget_visibility_changed(self, widget, visible: bool):
+        for name, view in self.views.items():
+            if view.container is widget:
+                logger.debug(f"👁 [GraphUICoordinator] {name} visible={visible}")
+                if visible:
+                    view.resume()
+                else:
+                    view.suspend()
+                return
         
     def refresh_curve_ui(self):
         logger.debug("[graph_ui_coordinator > refresh_curve_ui()] ▶️ Rafraîchissement des propriétés de courbe")
@@ -27,6 +46,14 @@ class GraphUICoordinator:
         if self.properties_panel:
             self.properties_panel.update_curve_ui()
 
+    def refresh_curve(self, graph_name: str, curve_name: str, fields):
+        """Redraw one curve after a change of *fields*, leaving the other views alone."""
+        view = self.views.get(graph_name)
+        if view is None or view.suspended:
+            return  # refreshed when scrolled back into view
+        logger.debug(f"🎨 [GraphUICoordinator.refresh_curve] {graph_name} > {curve_name} : {sorted(fields)}")
+        view.update_curve(curve_name, fields)
+
     def refresh_plot(self):
         logger.debug("\n[GraphUICoordinator.refresh_plot] ▶️ Début du rafraîchissement des graphes")
         logger.debug(f"[refresh_plot] Graphiques connus dans l'état : {list(self.state.graphs.keys())}")
@@ -39,9 +66,12 @@ class GraphUICoordinator:
                 logger.debug(f"🆕 [refresh_plot] Création de la vue pour le graphique : {name}")
                 view = MyPlotView(graph)
                 self.views[name] = view
+                view.set_hud_visible(self.render_hud)
                 if self.central_area:
                     logger.debug(f"📤 [refresh_plot] Tentative d’ajout du widget à la zone centrale")
                     self.central_area.add_plot_widget(view.container)
+                    if self._virtualised:
+                        view.suspend()  # rendered once scrolled into view
                     logger.debug(f"✅ Widget ajouté à la zone centrale pour : {name}")
             else:
                 logger.debug(f"♻️ [refresh_plot] Mise à jour de la vue existante : {name}")
@@ -66,13 +96,24 @@ class GraphUICoordinator:
                 continue
             view.graph_data = graph
             view.container.set_graph_name(graph.name)
+            if view.suspended:
+                logger.debug(f"💤 [refresh_plot] Vue hors écran, rafraîchie à son affichage : {name}")
+                continue
             logger.debug(f"🔧 [refresh_plot] Appel de update_graph_properties() pour : {name}")
             view.update_graph_properties()
             logger.debug(f"🔄 [refresh_plot] Appel de refresh_curves() pour : {name}")
             view.refresh_curves()
             view.refresh_satellites()
             logger.debug(f"✅ [refresh_plot] Vue mise à jour : {name}")
+
+        self.x_links.sync(self.views)
             
+    def set_render_hud(self, visible: bool):
+        logger.debug(f"📊 [GraphUICoordinator.set_render_hud] {visible}")
+        self.render_hud = visible
+        for view in self.views.values():
+            view.set_hud_visible(visible)
+
     def reset_zoom(self):
         logger.debug("[graph_ui_coordinator > reset_zoom()] ▶️ Réinitialisation du zoom sur toutes les vues")
         for name, view in self.views.items():
@@ -0,0 +1,197 @@
+# ui/hit_testing.py
+
+"""Sélection de courbe au clic, en pixels.
+
+Le clic est converti en une petite fenêtre X (tolérance en pixels) ; pour
+chaque courbe candidate — pré-filtrée par son rectangle englobant — seuls les
+échantillons de cette fenêtre sont lus par recherche binaire, ou les seaux
+min/max de la pyramide de décimation quand la fenêtre en contient trop. La
+distance est mesurée en pixels, au segment le plus proche pour les courbes en
+ligne, indépendamment des unités des axes. Pour un X non trié (tracé XY), les
+segments sont ceux du tracé, entre échantillons consécutifs dans l'ordre
+d'origine.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from core.curve_stats import get_curve_stats
+from core.lod import get_lod
+
+HIT_TOLERANCE_PX = 6.0
+# Above this many samples in the click window, the min/max pyramid is used
+MAX_HIT_SAMPLES = 4096
+
+
+@dataclass
+class ViewTransform:
+    """Mapping between data and view coordinates at click time."""
+
+    pixel_width: float  # view units per pixel along X
+    pixel_height: float
+    log_x: bool = False
+    log_y: bool = False
+
+    def to_view_x(self, x):
+        if self.log_x:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return np.log10(x)
+        return x
+
+    def to_view_y(self, y):
+        if self.log_y:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return np.log10(y)
+        return y
+
+    def to_data_x(self, vx: float) -> float:
+        return 10.0 ** vx if self.log_x else vx
+
+
+def _x_bounds(curve):
+    if curve.is_x_sorted:
+        return float(curve.x[0]), float(curve.x[-1])
+    return curve.cached("x_bounds", lambda c: (float(np.nanmin(c.x)), float(np.nanmax(c.x))))
+
+
+class CurveBoundsIndex:
+    """Displayed bounding boxes of a set of curves, for fast pre-filtering."""
+
+    def __init__(self, curves: Sequence):
+        self.curves = [c for c in curves if len(c.x)]
+        boxes = np.full((len(self.curves), 4), np.nan)
+        for i, curve in enumerate(self.curves):
+            stats = get_curve_stats(curve)
+            x0, x1 = _x_bounds(curve)
+            ys = [curve.gain * v + curve.offset for v in (stats.y_min, stats.y_max) if v is not None]
+            if ys and curve.display_mode == "bar":
+                ys.append(0.0)  # bars are drawn from zero
+            if ys:
+                boxes[i] = (x0 + curve.time_offset, x1 + curve.time_offset, min(ys), max(ys))
+        self.boxes = boxes
+
+    def candidates(self, x0: float, x1: float, y0: float, y1: float) -> List:
+        b = self.boxes
+        with np.errstate(invalid="ignore"):
+            hit = (b[:, 0] <= x1) & (b[:, 1] >= x0) & (b[:, 2] <= y1) & (b[:, 3] >= y0)
+        return [self.curves[i] for i in np.flatnonzero(hit)]
+
+
+def _window_samples(curve, x0: float, x1: float):
+    """Raw (x, y) samples around ``[x0, x1]``, or a min/max envelope if too many.
+
+    For a sorted X only; see :func:`_unsorted_window_samples`.
+    """
+    i0, i1 = curve.index_range(x0, x1)
+    # One neighbour on each side so that segments crossing the window count
+    i0, i1 = max(i0 - 1, 0), min(i1 + 1, len(curve.x))
+    if i1 - i0 > MAX_HIT_SAMPLES:
+        pyr = get_lod(curve)
+        if pyr is not None:
+            level = pyr.level_for(i1 - i0, MAX_HIT_SAMPLES)
+            size = pyr.bucket_sizes[level]
+            return pyr.envelope(level, i0 // size, -(-i1 // size))
+        idx = slice(i0, i1, -(-(i1 - i0) // MAX_HIT_SAMPLES))
+    else:
+        idx = slice(i0, i1)
+    return np.asarray(curve.x[idx], dtype=np.float64), np.asarray(curve.y[idx], dtype=np.float64)
+
+
+def _segment_extents(curve):
+    """X extent ``(lo, hi)`` of each drawn segment ``k -> k + 1`` (cached)."""
+
+    def compute(c):
+        x = np.asarray(c.x, dtype=np.float64)
+        return np.minimum(x[:-1], x[1:]), np.maximum(x[:-1], x[1:])
+
+    return curve.cached("segment_extents", compute)
+
+
+def _unsorted_window_samples(curve, x0: float, x1: float):
+    """Samples of ``[x0, x1]`` for an unsorted X, in their original order.
+
+    For a line, the ends of every drawn segment crossing the window are
+    added. Returns ``(x, y, connect)`` where ``connect[k]`` tells whether
+    samples ``k`` and ``k + 1`` are consecutive, i.e. joined by a segment.
+    """
+    i0, i1 = curve.index_range(x0, x1)
+    idx = curve.x_order[i0:i1]
+    if curve.display_mode == "line" and len(curve.x) > 1:
+        lo, hi = _segment_extents(curve)
+        with np.errstate(invalid="ignore"):
+            seg = np.flatnonzero((lo <= x1) & (hi >= x0))
+        idx = np.concatenate([idx, seg, seg + 1])
+    idx = np.unique(idx)
+    if len(idx) > MAX_HIT_SAMPLES:
+        # Too many to measure segments: a spread of points instead
+        idx = idx[:: -(-len(idx) // MAX_HIT_SAMPLES)]
+        connect = np.zeros(max(len(idx) - 1, 0), dtype=bool)
+    else:
+        connect = np.diff(idx) == 1
+    x = np.asarray(curve.x[idx], dtype=np.float64)
+    return x, np.asarray(curve.y[idx], dtype=np.float64), connect
+
+
+def _segment_distance(px: np.ndarray, py: np.ndarray, connect: Optional[np.ndarray] = None) -> float:
+    """Distance from the origin to the polyline (px, py), in pixels.
+
+    With *connect*, only the pairs it marks are segments; the other samples
+    count as points.
+    """
+    ax, ay, bx, by = px[:-1], py[:-1], px[1:], py[1:]
+    dx, dy = bx - ax, by - ay
+    length2 = dx * dx + dy * dy
+    with np.errstate(invalid="ignore", divide="ignore"):
+        t = np.clip(-(ax * dx + ay * dy) / length2, 0.0, 1.0)
+    t = np.where(length2 > 0, t, 0.0)
+    if connect is not None:
+        t = np.where(connect, t, 0.0)
+        ax, ay, dx, dy = np.r_[ax, px[-1:]], np.r_[ay, py[-1:]], np.r_[dx, 0.0], np.r_[dy, 0.0]
+        t = np.r_[t, 0.0]
+    d = np.hypot(ax + t * dx, ay + t * dy)
+    return float(np.nanmin(d)) if np.any(~np.isnan(d)) else np.inf
+
+
+def curve_distance_px(curve, vx: float, vy: float, transform: ViewTransform, tolerance_px: float) -> float:
+    """Pixel distance between the click (view coords) and *curve*."""
+    half = tolerance_px * transform.pixel_width
+    x0 = transform.to_data_x(vx - half) - curve.time_offset
+    x1 = transform.to_data_x(vx + half) - curve.time_offset
+    connect = None
+    if curve.x_order is None:
+        x, y = _window_samples(curve, x0, x1)
+    else:
+        x, y, connect = _unsorted_window_samples(curve, x0, x1)
+    if not len(x):
+        return np.inf
+    px = (transform.to_view_x(x + curve.time_offset) - vx) / transform.pixel_width
+    py = (transform.to_view_y(curve.gain * y + curve.offset) - vy) / transform.pixel_height
+    if curve.display_mode == "line" and len(px) > 1:
+        return _segment_distance(px, py, connect)
+    d = np.hypot(px, py)
+    return float(np.nanmin(d)) if np.any(~np.isnan(d)) else np.inf
+
+
+def hit_test(
+    index: CurveBoundsIndex,
+    vx: float,
+    vy: float,
+    transform: ViewTransform,
+    tolerance_px: float = HIT_TOLERANCE_PX,
+) -> Optional[str]:
+    """Name of the curve closest to the click at view coords (vx, vy), if any."""
+    half_x = tolerance_px * transform.pixel_width
+    half_y = tolerance_px * transform.pixel_height
+    x0, x1 = transform.to_data_x(vx - half_x), transform.to_data_x(vx + half_x)
+    y0, y1 = vy - half_y, vy + half_y
+    if transform.log_y:
+        y0, y1 = 10.0 ** y0, 10.0 ** y1
+
+    best, best_distance = None, tolerance_px
+    for curve in index.candidates(x0, x1, y0, y1):
+        distance = curve_distance_px(curve, vx, vy, transform, tolerance_px)
+        if distance <= best_distance:
+            best, best_distance = curve.name, distance
+    return best
@@ -0,0 +1,214 @@
+# ui/logic_lanes.py
+
+"""Vue logique empilée : pistes de hauteur fixe, virtualisées verticalement.
+
+En mode ``logic_lanes``, la hauteur d'une piste est fixée en pixels
+(``GraphData.lane_height_px``) : la plage Y visible est verrouillée à
+``hauteur de la vue / hauteur de piste`` pistes et seul le défilement
+vertical est possible. Seules les pistes de la fenêtre Y (plus une de
+marge) ont un item ; les items des pistes qui sortent sont recyclés pour
+celles qui entrent. Un défilement ne prépare que les pistes nouvellement
+visibles : parcourir 512 pistes coûte autant qu'en afficher 16.
+"""
+
+import math
+from typing import Dict, List, Optional
+
+import numpy as np
+import pyqtgraph as pg
+from PyQt5 import QtCore, QtGui
+
+from core.lanes import Lane, lane_transform, lanes_in_window, layout_lanes
+from core.lod import get_lod, viewport_arrays
+
+LANE_COLORS = ("#eeeeee", "#dddddd")
+DEFAULT_LANE_HEIGHT_PX = 24
+
+
+def lane_arrays(lane: Lane, x0: float, x1: float, width_px: int):
+    """Arrays drawing *lane*'s curve in its lane for the X window ``[x0, x1]``."""
+    curve = lane.curve
+    t = curve.time_offset
+    pyr = get_lod(curve)
+    if pyr is not None:
+        x, y = viewport_arrays(curve.x, curve.y, pyr, x0 - t, x1 - t, max(width_px, 256))
+    else:
+        x, y = curve.x, np.asarray(curve.y, dtype=np.float64)
+    scale, offset = lane_transform(lane)
+    return x + t, y * scale + offset
+
+
+class LaneBackgroundItem(pg.GraphicsObject):
+    """Alternating lane bands, painted for the visible lanes only."""
+
+    def __init__(self):
+        super().__init__()
+        self.n_lanes = 0
+        self._brushes = [QtGui.QBrush(QtGui.QColor(c)) for c in LANE_COLORS]
+        self._pen = pg.mkPen("#999999", width=1)
+        self.setZValue(-100)
+        self.setAcceptedMouseButtons(QtCore.Qt.NoButton)
+
+    def set_lane_count(self, n: int):
+        self.prepareGeometryChange()
+        self.n_lanes = n
+        self.update()
+
+    def viewRangeChanged(self):
+        self.prepareGeometryChange()
+        self.update()
+
+    def dataBounds(self, ax, frac=1.0, orthoRange=None):
+        return (0, self.n_lanes) if ax == 1 and self.n_lanes else None
+
+    def boundingRect(self):
+        view = self.viewRect()
+        if view is None or not self.n_lanes:
+            return QtCore.QRectF()
+        return QtCore.QRectF(view.left(), 0, view.width(), self.n_lanes)
+
+    def paint(self, painter, option, widget=None):
+        view = self.viewRect()
+        if view is None:
+            return
+        lanes = lanes_in_window(self.n_lanes, view.top(), view.bottom(), margin=0)
+        painter.setPen(QtCore.Qt.NoPen)
+        for i in lanes:
+            painter.setBrush(self._brushes[i % 2])
+            painter.drawRect(QtCore.QRectF(view.left(), i, view.width(), 1))
+        painter.setPen(self._pen)
+        painter.drawLines([QtCore.QLineF(view.left(), i, view.right(), i) for i in lanes])
+
+
+class LogicLanes:
+    """Lane items of one plot, built only for the lanes in the Y window."""
+
+    def __init__(self, plot_widget):
+        self.plot_widget = plot_widget
+        self.background = LaneBackgroundItem()
+        self.lanes: List[Lane] = []  # sorted by index, 0 at the bottom
+        self.lane_height_px = DEFAULT_LANE_HEIGHT_PX
+        self.active = False
+        self._items: Dict[int, pg.PlotDataItem] = {}  # lane index -> item
+        self._pool: List[pg.PlotDataItem] = []
+        self._window = range(0)
+        self.built = 0  # lanes prepared since attach (entering the window)
+
+    def attach(self, curves, lane_height_px: int):
+        """Lay the curves out as lanes (after the plot items were cleared)."""
+        keep_top = self.active and len(layout_lanes(curves)) == len(self.lanes)
+        self.active = True
+        self.lanes = sorted(layout_lanes(curves), key=lambda lane: lane.index)
+        self.lane_height_px = max(4, int(lane_height_px))
+        for item in list(self._items.values()) + self._pool:
+            if item.scene() is not None:
+                self.plot_widget.removeItem(item)
+        self._pool.extend(self._items.values())
+        self._items = {}
+        self._window = range(0)
+        self.built = 0
+        self.background.set_lane_count(len(self.lanes))
+        if self.background.scene() is None:
+            self.plot_widget.addItem(self.background)
+        vb = self.plot_widget.getViewBox()
+        vb.enableAutoRange(y=False)
+        self.fix_span(keep_top)  # same lanes: stay where the user scrolled
+
+    def detach(self):
+        """Leave lane mode: free the Y axis again."""
+        if not self.active:
+            return
+        self.active = False
+        vb = self.plot_widget.getViewBox()
+        vb.setLimits(yMin=None, yMax=None, minYRange=None, maxYRange=None)
+        self.plot_widget.getAxis("left").setTicks(None)
+        if self.background.scene() is not None:
+            self.plot_widget.removeItem(self.background)
+        for item in self._items.values():
+            if item.scene() is not None:
+                self.plot_widget.removeItem(item)
+        self._pool.extend(self._items.values())
+        self._items = {}
+        self._window = range(0)
+
+    def span(self) -> float:
+        """Number of lanes fitting the view height at the fixed lane height."""
+        height = self.plot_widget.getViewBox().height()
+        return max(1.0, height / self.lane_height_px) if height > 0 else 16.0
+
+    def fix_span(self, keep_top: bool = True):
+        """Lock the visible Y span to the lane height (after a resize)."""
+        if not self.active:
+            return
+        vb = self.plot_widget.getViewBox()
+        n = len(self.lanes)
+        span = self.span()
+        y_min = min(0.0, n - span)  # few lanes: they stay at the top
+        top = vb.viewRange()[1][1] if keep_top else n
+        top = min(max(top, y_min + span), n)
+        vb.setLimits(yMin=y_min, yMax=n, minYRange=span, maxYRange=span)
+        vb.setYRange(top - span, top, padding=0)
+        self.update()
+
+    def update(self, *args):
+        """Give items to lanes entering the Y window, recycle the others."""
+        if not self.active:
+            return
+        vb = self.plot_widget.getViewBox()
+        y0, y1 = vb.viewRange()[1]
+        window = lanes_in_window(len(self.lanes), y0, y1)
+        if window == self._window:
+            return  # scrolled within the same lanes: the view moves, not the items
+        for index in [i for i in self._items if i not in window]:
+            item = self._items.pop(index)
+            item.hide()
+            self._pool.append(item)
+        x0, x1 = vb.viewRange()[0]
+        width = int(vb.width())
+        for index in window:
+            if index not in self._items:
+                self._items[index] = self._build(self.lanes[index], x0, x1, width)
+        self._window = window
+        self.plot_widget.getAxis("left").setTicks(
+            [[(i + 0.5, self.lanes[i].curve.name) for i in window]]
+        )
+
+    def reslice(self, x0: float, x1: float, width_px: int):
+        """Re-slice the lanes in view for a new X window (LOD path)."""
+        for index, item in self._items.items():
+            lane = self.lanes[index]
+            x, y = lane_arrays(lane, x0, x1, width_px)
+            item.setData(x, y, connect="finite")
+
+    def _build(self, lane: Lane, x0: float, x1: float, width_px: int) -> pg.PlotDataItem:
+        item = self._pool.pop() if self._pool else None
+        if item is None:
+            item = pg.PlotDataItem()
+            item.setClipToView(True)
+        if item.scene() is None:
+            self.plot_widget.addItem(item)
+        curve = lane.curve
+        color = QtGui.QColor(curve.color)
+        color.setAlphaF(curve.opacity / 100.0)
+        item.setPen(pg.mkPen(color, width=curve.width))
+        x, y = lane_arrays(lane, x0, x1, width_px)
+        item.setData(x, y, connect="finite")
+        item.show()
+        self.built += 1
+        return item
+
+    def lane_items(self) -> Dict[int, pg.PlotDataItem]:
+        return dict(self._items)
+
+    def lane_at(self, y: float) -> Optional[Lane]:
+        """Lane under the view Y coordinate *y* (one unit per lane), if any."""
+        index = math.floor(y)
+        if not self.active or not 0 <= index < len(self.lanes):
+            return None
+        return self.lanes[index]
+
+    def item_for(self, name: str) -> Optional[pg.PlotDataItem]:
+        for index, item in self._items.items():
+            if self.lanes[index].curve.name == name:
+                return item
+        return None
@@ -0,0 +1,191 @@
+# ui/measurement_cursors.py
+
+"""Curseurs de mesure verticaux (X1/X2) et horizontaux (Y1/Y2).
+
+La lecture donne, pour chaque courbe visible, sa valeur interpolée aux
+curseurs X (``CurveData.value_at`` : recherche dichotomique, ou calcul
+direct sur une base de temps uniforme) ainsi que ΔX, 1/ΔX et ΔY. Pendant
+un déplacement seuls les textes existants sont mis à jour : aucun
+``refresh_curves``, aucun item recréé.
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import pyqtgraph as pg
+from PyQt5 import QtCore, QtWidgets
+
+CURSOR_COLOR = "#ff8c00"
+EMPTY = "—"
+
+
+def _fmt(value: Optional[float]) -> str:
+    if value is None or not math.isfinite(value):
+        return EMPTY
+    return f"{value:.6g}"
+
+
+@dataclass
+class CursorReadout:
+    """Cursor positions and curve values, in displayed (data) units."""
+
+    x1: Optional[float] = None
+    x2: Optional[float] = None
+    y1: Optional[float] = None
+    y2: Optional[float] = None
+    values: Dict[str, Tuple[float, float]] = field(default_factory=dict)
+
+    @property
+    def dx(self) -> Optional[float]:
+        if self.x1 is None or self.x2 is None:
+            return None
+        return self.x2 - self.x1
+
+    @property
+    def inv_dx(self) -> Optional[float]:
+        dx = self.dx
+        return 1.0 / dx if dx else None
+
+    @property
+    def dy(self) -> Optional[float]:
+        if self.y1 is None or self.y2 is None:
+            return None
+        return self.y2 - self.y1
+
+    def rows(self) -> List[Tuple[str, str, str, str]]:
+        """Table rows ``(label, at 1, at 2, delta)`` as text."""
+        rows = []
+        if self.x1 is not None:
+            rows.append(("X", _fmt(self.x1), _fmt(self.x2), _fmt(self.dx)))
+            rows.append(("1/ΔX", "", "", _fmt(self.inv_dx)))
+        if self.y1 is not None:
+            rows.append(("Y", _fmt(self.y1), _fmt(self.y2), _fmt(self.dy)))
+        for name, (v1, v2) in self.values.items():
+            rows.append((name, _fmt(v1), _fmt(v2), _fmt(v2 - v1)))
+        return rows
+
+
+def displayed_value(curve, x: float) -> float:
+    """Value of *curve* as drawn (gain, offset, time offset) at abscissa *x*."""
+    return curve.gain * curve.value_at(x - curve.time_offset) + curve.offset
+
+
+def read_cursors(curves, x1=None, x2=None, y1=None, y2=None) -> CursorReadout:
+    """Readout of the visible *curves* for the given cursor positions."""
+    readout = CursorReadout(x1, x2, y1, y2)
+    if x1 is not None:
+        for curve in curves:
+            if curve.visible:
+                readout.values[curve.name] = (
+                    displayed_value(curve, x1),
+                    displayed_value(curve, x2),
+                )
+    return readout
+
+
+class MeasurementCursors(QtCore.QObject):
+    """Two pairs of draggable cursors on a plot and their live readout."""
+
+    readout_changed = QtCore.pyqtSignal(object)  # CursorReadout
+
+    def __init__(self, plot_widget, parent=None):
+        super().__init__(parent)
+        self.plot_widget = plot_widget
+        self.curves = []
+        self.log_x = False
+        self.log_y = False
+        self.readout = CursorReadout()
+        pen = pg.mkPen(CURSOR_COLOR, width=1, style=QtCore.Qt.DashLine)
+        self.vertical = [pg.InfiniteLine(angle=90, movable=True, pen=pen) for _ in range(2)]
+        self.horizontal = [pg.InfiniteLine(angle=0, movable=True, pen=pen) for _ in range(2)]
+        for i, line in enumerate(self.vertical + self.horizontal):
+            line.setZValue(1000)
+            line.placed = False  # positioned the first time it is shown
+            pg.InfLineLabel(line, text=("X", "Y")[i // 2] + str(i % 2 + 1), position=0.95)
+            line.sigPositionChanged.connect(self.update_readout)
+        self.text = pg.TextItem(color=CURSOR_COLOR, anchor=(0, 0), fill=pg.mkBrush(0, 0, 0, 120))
+        self.text.setZValue(1000)
+        self.show_vertical = False
+        self.show_horizontal = False
+
+    def configure(self, vertical: bool, horizontal: bool, log_x: bool, log_y: bool):
+        self.show_vertical = vertical
+        self.show_horizontal = horizontal
+        self.log_x = log_x
+        self.log_y = log_y
+
+    def attach(self, curves):
+        """(Re)add the enabled cursors after the plot items were cleared."""
+        self.curves = curves
+        vb = self.plot_widget.getViewBox()
+        for lines, shown, axis in (
+            (self.vertical, self.show_vertical, 0),
+            (self.horizontal, self.show_horizontal, 1),
+        ):
+            for i, line in enumerate(lines):
+                if not shown:
+                    if line.scene() is not None:
+                        self.plot_widget.removeItem(line)
+                    continue
+                if not line.placed:
+                    lo, hi = vb.viewRange()[axis]
+                    line.setValue(lo + (hi - lo) * (i + 1) / 3.0)
+                    line.placed = True
+                if line.scene() is None:
+                    self.plot_widget.addItem(line, ignoreBounds=True)
+        if self.show_vertical or self.show_horizontal:
+            if self.text.parentItem() is None:
+                self.text.setParentItem(vb)  # fixed in the corner, in pixels
+                self.text.setPos(4, 4)
+            self.text.show()
+        else:
+            self.text.hide()
+        self.update_readout()
+
+    def _positions(self, lines, log: bool):
+        values = [line.value() for line in lines]
+        if log:
+            values = [10.0 ** v for v in values]
+        return values
+
+    def update_readout(self, *args):
+        """Recompute the values and update the existing texts only."""
+        x1 = x2 = y1 = y2 = None
+        if self.show_vertical:
+            x1, x2 = self._positions(self.vertical, self.log_x)
+        if self.show_horizontal:
+            y1, y2 = self._positions(self.horizontal, self.log_y)
+        self.readout = read_cursors(self.curves, x1, x2, y1, y2)
+        if self.text.isVisible():
+            self.text.setText("\n".join(
+                f"{label}: {a} | {b} | Δ {d}" if a or b else f"{label}: {d}"
+                for label, a, b, d in self.readout.rows()
+            ))
+        self.readout_changed.emit(self.readout)
+
+
+class CursorReadoutTable(QtWidgets.QTableWidget):
+    """Satellite zone table mirroring a :class:`CursorReadout`."""
+
+    def __init__(self, parent=None):
+        super().__init__(0, 4, parent)
+        self.setHorizontalHeaderLabels(["", "1", "2", "Δ"])
+        self.verticalHeader().hide()
+        self.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self._labels: List[str] = []
+
+    def show_readout(self, readout: CursorReadout):
+        rows = readout.rows()
+        labels = [row[0] for row in rows]
+        if labels != self._labels:  # new row set: rebuild the items once
+            self._labels = labels
+            self.setRowCount(len(rows))
+            for r in range(len(rows)):
+                for c in range(4):
+                    self.setItem(r, c, QtWidgets.QTableWidgetItem())
+        for r, row in enumerate(rows):
+            for c, text in enumerate(row):
+                item = self.item(r, c)
+                if item.text() != text:
+                    item.setText(text)
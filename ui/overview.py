@@ -0,0 +1,116 @@
+# ui/overview.py
+
+"""Bandeau de vue d'ensemble (navigateur) d'un graphe.
+
+Le bandeau montre tout l'enregistrement à partir d'une enveloppe min/max
+grossière, calculée une seule fois par version des données : le niveau le
+plus grossier de la pyramide LOD pour les grandes courbes, une décimation
+directe pour les petites. Le rectangle déplaçable suit la plage X de la vue
+principale ; le déplacer change cette plage, ce qui passe par le chemin LOD
+habituel de la vue. Une fois l'enveloppe construite, le bandeau ne relit
+jamais les données pleine résolution.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+import pyqtgraph as pg
+from PyQt5 import QtCore, QtGui
+
+from core.lod import get_lod, minmax_decimate
+
+OVERVIEW_BUCKETS = 1024
+
+
+def overview_envelope(curve) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """Coarse (x, y) min/max envelope of the whole *curve*, raw units (cached)."""
+    if not len(curve.x):
+        return None
+
+    def build(c):
+        pyr = get_lod(c)
+        if pyr is not None:
+            return pyr.envelope(pyr.levels - 1)
+        order = c.x_order  # envelope along X even for unsorted data
+        x = c.x if order is None else c.x[order]
+        y = c.y if order is None else c.y[order]
+        return minmax_decimate(x, y, OVERVIEW_BUCKETS)
+
+    return curve.cached("overview", build)
+
+
+def _style_key(curve) -> tuple:
+    return (curve.name, curve.data_version, curve.visible, curve.color,
+            curve.gain, curve.offset, curve.time_offset)
+
+
+class OverviewWidget(pg.PlotWidget):
+    """Thin plot of the whole record with a draggable X window."""
+
+    range_requested = QtCore.pyqtSignal(float, float)  # data units
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMinimumHeight(30)
+        self.setBackground(None)
+        self.hideAxis("left")
+        self.hideAxis("bottom")
+        self.setMenuEnabled(False)
+        self.setMouseEnabled(x=False, y=False)
+        self.hideButtons()
+        self.log_x = False
+        self._items = {}
+        self._keys = None
+        self._syncing = False
+        self.region = pg.LinearRegionItem(
+            brush=pg.mkBrush(0, 120, 215, 50), pen=pg.mkPen("#0078d7", width=1)
+        )
+        self.region.setZValue(10)
+        self.addItem(self.region, ignoreBounds=True)
+        self.region.sigRegionChanged.connect(self._on_region_changed)
+
+    def set_curves(self, curves, log_x: bool = False):
+        """Draw the envelopes; rebuilt only when data or style changed."""
+        keys = [_style_key(c) for c in curves] + [log_x]
+        if keys == self._keys:
+            return
+        self._keys = keys
+        self.log_x = log_x
+        self.setLogMode(log_x, False)
+        for item in self._items.values():
+            self.removeItem(item)
+        self._items = {}
+        for curve in curves:
+            envelope = overview_envelope(curve) if curve.visible else None
+            if envelope is None:
+                continue
+            x, y = envelope
+            item = pg.PlotDataItem(
+                x + curve.time_offset,
+                curve.gain * y + curve.offset,
+                pen=pg.mkPen(QtGui.QColor(curve.color), width=1),
+                connect="finite",
+            )
+            self.addItem(item)
+            self._items[curve.name] = item
+        self.enableAutoRange()
+
+    def show_range(self, x0: float, x1: float):
+        """Move the window to the main view's X range (data units)."""
+        if self.log_x:
+            if x0 <= 0 or x1 <= 0:
+                return
+            x0, x1 = np.log10(x0), np.log10(x1)
+        self._syncing = True
+        try:
+            self.region.setRegion((x0, x1))
+        finally:
+            self._syncing = False
+
+    def _on_region_changed(self):
+        if self._syncing:
+            return
+        x0, x1 = self.region.getRegion()
+        if self.log_x:
+            x0, x1 = 10.0 ** x0, 10.0 ** x1
+        self.range_requested.emit(float(x0), float(x1))
@@ -0,0 +1,331 @@
+# ui/render_pipeline.py
+
+"""Préparation des données de tracé hors du thread graphique.
+
+Tout le travail sur les tableaux (découpage de la fenêtre visible,
+décimation, gain/offset/décalage temporel, masque ``connect`` des NaN) est
+fait par :func:`prepare_curve`, exécutable sur un pool de threads (NumPy
+relâche le GIL). :class:`RenderPipeline` numérote chaque demande par clé
+(courbe) : une demande dépassée est abandonnée avant calcul si possible, et
+son résultat est ignoré s'il arrive après une demande plus récente. Les
+tampons prêts sont remis au thread graphique par un signal en file d'attente,
+où seul ``setData`` sur l'item reste à faire.
+"""
+
+import itertools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from core.curve_stats import get_curve_stats
+from core.lod import get_lod, minmax_decimate, viewport_arrays
+from ui.bar_aggregation import aggregate_bars, sample_spacing
+from ui.density_raster import DENSITY_MAX_SYMBOLS, DENSITY_MIN_POINTS, DensityRaster, density_raster
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Curves with at least this many samples are prepared on the thread pool
+ASYNC_MIN_POINTS = 200_000
+
+
+@dataclass(frozen=True)
+class Viewport:
+    """Visible window (data units) and its size in pixels."""
+
+    x0: float
+    x1: float
+    width_px: int
+    # Vertical window, only needed by density rasters (None: data extent)
+    y0: Optional[float] = None
+    y1: Optional[float] = None
+    height_px: int = 0
+    log_x: bool = False
+    log_y: bool = False
+
+
+@dataclass
+class PreparedCurve:
+    """Ready-to-draw buffers of one curve."""
+
+    x: np.ndarray
+    y: np.ndarray
+    connect: Union[str, np.ndarray] = "all"
+    decimated: bool = False  # already reduced to screen resolution
+    data_version: int = 0
+    density: Optional[DensityRaster] = None  # scatter drawn as a raster instead
+    bar_width: float = 0.0
+    lod_level: Optional[int] = None  # pyramid level drawn, None for raw samples
+
+
+def prepare_curve(curve, viewport: Optional[Viewport]) -> PreparedCurve:
+    """Compute the arrays to draw for *curve* (thread-safe, no Qt calls)."""
+    version = curve.data_version
+    if curve.display_mode == "scatter" and len(curve.y) >= DENSITY_MIN_POINTS and viewport:
+        return _prepare_density(curve, viewport)
+    if curve.display_mode == "bar":
+        return _prepare_bars(curve, viewport)
+    pyr = None
+    if curve.display_mode == "line" and curve.downsampling_mode == "auto" and viewport:
+        pyr = get_lod(curve)
+
+    if pyr is not None:
+        # Only the decimated window is transformed, never the full arrays
+        x0, x1 = viewport.x0 - curve.time_offset, viewport.x1 - curve.time_offset
+        max_points = max(viewport.width_px, 256)
+        x, y = viewport_arrays(curve.x, curve.y, pyr, x0, x1, max_points)
+        i0, i1 = curve.index_range(x0, x1)
+        level = pyr.level_for(i1 - i0, max_points) if i1 - i0 > 2 * max_points else None
+        x = x + curve.time_offset
+        y = curve.gain * y + curve.offset
+        finite = np.isfinite(y)
+        connect = "all" if finite.all() else finite
+        return PreparedCurve(x, y, connect, decimated=True, data_version=version, lod_level=level)
+
+    if curve.downsampling_mode == "manual":
+        step = curve.downsampling_ratio
+        x = curve.x[::step] + curve.time_offset
+        y = curve.gain * curve.y[::step] + curve.offset
+    else:
+        x = curve.x + curve.time_offset
+        y = curve.gain * curve.y + curve.offset
+    # pyqtgraph may downsample these arrays itself: let it derive the NaN mask
+    connect = "finite" if get_curve_stats(curve).nan_count else "all"
+    return PreparedCurve(x, y, connect, data_version=version)
+
+
+def _prepare_density(curve, viewport: Viewport) -> PreparedCurve:
+    """Visible points of a huge scatter curve, binned per pixel when dense."""
+    t = curve.time_offset
+    if curve.is_x_sorted:
+        idx = curve.sample_indices(viewport.x0 - t, viewport.x1 - t)
+    else:
+        # Binning ignores off-window points anyway: no gather of a sort order
+        idx = slice(None)
+    x, y = curve.x[idx], curve.y[idx]
+    # Skip full-size temporaries for the common identity transform
+    if t:
+        x = x + t
+    if curve.gain != 1.0 or curve.offset:
+        y = curve.gain * np.asarray(y, dtype=np.float64) + curve.offset
+    y_range = None if viewport.y0 is None else (viewport.y0, viewport.y1)
+    shape = (max(viewport.width_px, 1), max(viewport.height_px, 1))
+    raster = density_raster(
+        x, y, (viewport.x0, viewport.x1), y_range, shape, viewport.log_x, viewport.log_y
+    )
+    if raster is not None:
+        empty = np.empty(0)
+        return PreparedCurve(empty, empty, decimated=True, data_version=curve.data_version, density=raster)
+
+    # Few points visible: real symbols again
+    keep = (x >= viewport.x0) & (x <= viewport.x1)
+    if y_range is not None:
+        keep &= (y >= y_range[0]) & (y <= y_range[1])
+    x, y = x[keep], y[keep]
+    if len(x) > DENSITY_MAX_SYMBOLS:  # raster impossible (e.g. log of negatives)
+        step = -(-len(x) // DENSITY_MAX_SYMBOLS)
+        x, y = x[::step], y[::step]
+    return PreparedCurve(x, y, decimated=True, data_version=curve.data_version)
+
+
+def _prepare_bars(curve, viewport: Optional[Viewport]) -> PreparedCurve:
+    """Visible bars, grouped to at most one per pixel column in auto mode."""
+    t = curve.time_offset
+    spacing = curve.cached(
+        "x_spacing", lambda c: sample_spacing(c.x[c.sample_indices(-np.inf, np.inf)])
+    )
+    x0, x1 = (viewport.x0, viewport.x1) if viewport else (-np.inf, np.inf)
+    idx = curve.sample_indices(x0 - t, x1 - t)
+    x, y = curve.x[idx], curve.y[idx]
+    if curve.downsampling_mode == "manual":
+        step = curve.downsampling_ratio
+        x, y, spacing = x[::step], y[::step], spacing * step
+    aggregate = viewport is not None and curve.downsampling_mode == "auto"
+    n_bins = viewport.width_px if aggregate else len(x)
+    bins = aggregate_bars(x, y, x0 - t, x1 - t, n_bins, curve.bar_aggregate, spacing)
+    return PreparedCurve(
+        bins.x + t,
+        curve.gain * bins.height + curve.offset,
+        decimated=viewport is not None,
+        data_version=curve.data_version,
+        bar_width=bins.width,
+    )
+
+
+@dataclass
+class PreparedBatch:
+    """Concatenated buffers of curves drawn as a single path."""
+
+    names: List[str]
+    x: np.ndarray
+    y: np.ndarray
+    connect: np.ndarray  # connect[i]: draw a segment from point i to i + 1
+    offsets: np.ndarray  # start of each curve in x/y, plus the total length
+    bounds: Optional[Tuple[float, float, float, float]]  # full data extent
+    data_versions: List[int]
+
+
+def _batch_member(curve, viewport: Optional[Viewport]) -> Tuple[np.ndarray, np.ndarray]:
+    """Visible, screen-resolution (x, y) of one overlaid curve."""
+    if viewport is None or curve.downsampling_mode == "manual" or not curve.is_x_sorted:
+        prepared = prepare_curve(curve, viewport)
+        return prepared.x, prepared.y
+    if get_lod(curve) is not None:
+        prepared = prepare_curve(curve, viewport)
+        return prepared.x, prepared.y
+    i0, i1 = curve.index_range(viewport.x0 - curve.time_offset, viewport.x1 - curve.time_offset)
+    i0, i1 = max(i0 - 1, 0), min(i1 + 1, len(curve.x))
+    x, y = curve.x[i0:i1], curve.y[i0:i1]
+    if curve.downsampling_mode == "auto":
+        x, y = minmax_decimate(x, y, max(viewport.width_px, 256))
+    return x + curve.time_offset, curve.gain * np.asarray(y, dtype=np.float64) + curve.offset
+
+
+def curve_extent(curve) -> Optional[Tuple[float, float, float, float]]:
+    """Displayed data extent ``(x0, x1, y0, y1)`` of the whole curve."""
+    stats = get_curve_stats(curve)
+    if stats.y_min is None or not len(curve.x):
+        return None
+    if curve.is_x_sorted:
+        x0, x1 = float(curve.x[0]), float(curve.x[-1])
+    else:
+        # Same cache entry as the click hit-testing bounds
+        x0, x1 = curve.cached("x_bounds", lambda c: (float(np.nanmin(c.x)), float(np.nanmax(c.x))))
+    y0, y1 = sorted((curve.gain * stats.y_min + curve.offset, curve.gain * stats.y_max + curve.offset))
+    return x0 + curve.time_offset, x1 + curve.time_offset, y0, y1
+
+
+def _log_batch(x, y, bounds, log_x: bool, log_y: bool):
+    """Batch buffers and extent in log10 view units, as pyqtgraph's log mode draws.
+
+    Non-positive samples become non-finite and break the line; a
+    non-positive extent bound falls back to the smallest drawable sample.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if log_x:
+            x = np.log10(x)
+        if log_y:
+            y = np.log10(y)
+        if bounds is None:
+            return x, y, None
+        b = list(bounds)
+        for axis, (log, values) in enumerate(((log_x, x), (log_y, y))):
+            if not log:
+                continue
+            lo, hi = np.log10(b[2 * axis : 2 * axis + 2])
+            if not np.isfinite(hi):
+                return x, y, None
+            if not np.isfinite(lo):
+                finite = values[np.isfinite(values)]
+                lo = float(finite.min()) if finite.size else hi
+            b[2 * axis : 2 * axis + 2] = float(lo), float(hi)
+    return x, y, tuple(b)
+
+
+def prepare_batch(curves: Sequence, viewport: Optional[Viewport]) -> PreparedBatch:
+    """Prepare several same-style curves as one polyline broken between curves.
+
+    The item has no log mode of its own: with a log axis in *viewport*, the
+    buffers and the extent are returned in log10 units.
+    """
+    xs, ys, extents = [], [], []
+    for curve in curves:
+        x, y = _batch_member(curve, viewport)
+        xs.append(np.asarray(x, dtype=np.float64))
+        ys.append(np.asarray(y, dtype=np.float64))
+        extent = curve_extent(curve)
+        if extent is not None:
+            extents.append(extent)
+
+    offsets = np.zeros(len(xs) + 1, dtype=np.int64)
+    np.cumsum([len(x) for x in xs], out=offsets[1:])
+    x = np.concatenate(xs) if xs else np.empty(0)
+    y = np.concatenate(ys) if ys else np.empty(0)
+
+    bounds = None
+    if extents:
+        e = np.asarray(extents)
+        bounds = (e[:, 0].min(), e[:, 1].max(), e[:, 2].min(), e[:, 3].max())
+    if viewport is not None and (viewport.log_x or viewport.log_y):
+        x, y, bounds = _log_batch(x, y, bounds, viewport.log_x, viewport.log_y)
+
+    finite = np.isfinite(x) & np.isfinite(y)
+    connect = np.zeros(len(x), dtype=bool)
+    connect[:-1] = finite[:-1] & finite[1:]
+    connect[offsets[1:] - 1] = False  # never join the end of a curve to the next one
+    return PreparedBatch(
+        names=[c.name for c in curves],
+        x=x,
+        y=y,
+        connect=connect,
+        offsets=offsets,
+        bounds=bounds,
+        data_versions=[c.data_version for c in curves],
+    )
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_render_executor() -> ThreadPoolExecutor:
+    """Thread pool shared by every plot view."""
+    global _executor
+    if _executor is None:
+        workers = max(2, min(8, (os.cpu_count() or 2) - 1))
+        _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="render")
+    return _executor
+
+
+class RenderPipeline(QObject):
+    """Runs preparation jobs on the pool and hands results to the GUI thread."""
+
+    # (key, generation, result), emitted from worker threads (queued delivery)
+    _prepared = pyqtSignal(object, int, object)
+
+    def __init__(self, executor: Optional[ThreadPoolExecutor] = None, parent=None):
+        super().__init__(parent)
+        self._executor = executor or get_render_executor()
+        self._counter = itertools.count(1)
+        self._latest: Dict[Hashable, int] = {}
+        self._handlers: Dict[Hashable, Callable] = {}
+        self._prepared.connect(self._deliver)
+
+    def submit(self, key: Hashable, job: Callable[[], object], on_ready: Callable[[object], None]):
+        """Run ``job()`` on the pool; ``on_ready(result)`` unless superseded."""
+        generation = next(self._counter)
+        self._latest[key] = generation
+        self._handlers[key] = on_ready
+        self._executor.submit(self._run, key, generation, job)
+
+    def cancel(self, key: Optional[Hashable] = None):
+        """Forget pending requests (all of them when *key* is None)."""
+        if key is None:
+            self._latest.clear()
+            self._handlers.clear()
+        else:
+            self._latest.pop(key, None)
+            self._handlers.pop(key, None)
+
+    def is_pending(self, key: Optional[Hashable] = None) -> bool:
+        return bool(self._latest) if key is None else key in self._latest
+
+    def _run(self, key, generation: int, job):
+        if self._latest.get(key) != generation:
+            return  # superseded before it started
+        try:
+            result = job()
+        except Exception:
+            logger.exception(f"❌ [RenderPipeline._run] Préparation échouée pour {key!r}")
+            return
+        self._prepared.emit(key, generation, result)
+
+    def _deliver(self, key, generation: int, result):
+        if self._latest.get(key) != generation:
+            return  # a newer request exists: drop this stale buffer
+        del self._latest[key]
+        handler = self._handlers.pop(key)
+        handler(result)
@@ -0,0 +1,105 @@
+# ui/render_policy.py
+
+"""Qualité de rendu adaptative selon le temps d'affichage mesuré.
+
+Chaque vue mesure la durée de ses ``paintEvent``. Quand l'utilisateur
+déplace ou zoome un graphe dont une image en pleine qualité dépasse le
+budget du graphe, :class:`RenderPolicy` passe en mode interactif (sans
+anticrénelage, décimation plus grossière, sans symboles, remplissages ni
+étiquettes) ; la pleine qualité revient après une courte inactivité.
+"""
+
+import time
+
+import pyqtgraph as pg
+from PyQt5 import QtCore, QtWidgets
+
+FULL = "full"
+INTERACTIVE = "interactive"
+
+DEFAULT_BUDGET_MS = 25.0
+DEFAULT_IDLE_MS = 150
+# Fraction of the pixel width used for decimation while interacting
+INTERACTIVE_LOD_SCALE = 0.25
+# Weight of the newest paint time in the moving average
+_SMOOTHING = 0.3
+
+
+class TimedPlotWidget(pg.PlotWidget):
+    """PlotWidget reporting how long each frame took to paint."""
+
+    frame_painted = QtCore.pyqtSignal(float)  # milliseconds
+
+    def paintEvent(self, event):
+        start = time.perf_counter()
+        super().paintEvent(event)
+        self.frame_painted.emit((time.perf_counter() - start) * 1000.0)
+
+
+class RenderPolicy(QtCore.QObject):
+    """Chooses the render quality of one view from its measured paint time."""
+
+    quality_changed = QtCore.pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.enabled = True
+        self.budget_ms = DEFAULT_BUDGET_MS
+        self.mode = FULL
+        self.full_frame_ms = 0.0  # smoothed paint time at full quality
+        self.last_frame_ms = 0.0
+        self._idle = QtCore.QTimer(self)
+        self._idle.setSingleShot(True)
+        self._idle.setInterval(DEFAULT_IDLE_MS)
+        self._idle.timeout.connect(self._on_idle)
+
+    def configure(self, enabled: bool, budget_ms: float, idle_ms: int):
+        self.enabled = enabled
+        self.budget_ms = float(budget_ms)
+        self._idle.setInterval(int(idle_ms))
+        if not enabled:
+            self._set_mode(FULL)
+
+    def frame_painted(self, ms: float):
+        self.last_frame_ms = ms
+        if self.mode == FULL:
+            if self.full_frame_ms:
+                self.full_frame_ms += _SMOOTHING * (ms - self.full_frame_ms)
+            else:
+                self.full_frame_ms = ms
+
+    def interaction(self, *args):
+        """Pan, zoom or drag in progress: degrade if full frames are too slow."""
+        if not self.enabled:
+            return
+        self._idle.start()
+        if self.mode == FULL and self.full_frame_ms > self.budget_ms:
+            self._set_mode(INTERACTIVE)
+
+    def _on_idle(self):
+        self._set_mode(FULL)
+
+    def _set_mode(self, mode: str):
+        if mode != self.mode:
+            self.mode = mode
+            self.quality_changed.emit(mode)
+
+
+class RenderOverlay(QtWidgets.QLabel):
+    """Small debug label showing the render mode and the last paint time."""
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents)
+        self.setStyleSheet(
+            "background-color: rgba(0, 0, 0, 150); color: white; padding: 2px; font-size: 9pt;"
+        )
+        self.move(4, 4)
+
+    def show_state(self, policy: RenderPolicy):
+        label = "interactif" if policy.mode == INTERACTIVE else "pleine qualité"
+        self.setText(
+            f"Rendu : {label} — {policy.last_frame_ms:.1f} ms "
+            f"(pleine : {policy.full_frame_ms:.1f} / budget {policy.budget_ms:.0f} ms)"
+        )
+        self.adjustSize()
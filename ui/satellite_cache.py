@@ -0,0 +1,68 @@
+# ui/satellite_cache.py
+
+"""Réutilisation des widgets et images des zones satellites.
+
+Les widgets satellites sont identifiés par (zone, identité de l'objet,
+contenu) : tant que cette clé ne change pas, le widget existant est
+conservé d'un rafraîchissement à l'autre. Les images décodées, et leurs
+versions redimensionnées, passent par le cache LRU global ``QPixmapCache``
+afin de ne pas relire le disque à chaque modification de courbe.
+"""
+
+import json
+from typing import Hashable, Optional
+
+from PyQt5 import QtCore, QtGui
+
+# Minimum size of the global pixmap cache, in KiB
+SATELLITE_PIXMAP_CACHE_KB = 32 * 1024
+
+_cache_sized = False
+
+
+def content_key(obj) -> Hashable:
+    """What a satellite widget shows: a change means a new widget."""
+    config = json.dumps(obj.config, sort_keys=True, default=str)
+    return (obj.obj_type, obj.name, config)
+
+
+def satellite_key(zone: str, obj) -> Hashable:
+    return (zone, id(obj), content_key(obj))
+
+
+def _find(key: str) -> Optional[QtGui.QPixmap]:
+    pix = QtGui.QPixmapCache.find(key)
+    return pix if pix is not None and not pix.isNull() else None
+
+
+def cached_pixmap(path: str, width: Optional[int] = None, height: Optional[int] = None) -> QtGui.QPixmap:
+    """Pixmap of the image at *path*, scaled to ``width`` x ``height`` if given.
+
+    Both the decoded image and each scaled size are kept in ``QPixmapCache``
+    (least recently used entries are evicted first). A null pixmap is
+    returned when the file cannot be read.
+    """
+    global _cache_sized
+    if not _cache_sized:
+        limit = max(QtGui.QPixmapCache.cacheLimit(), SATELLITE_PIXMAP_CACHE_KB)
+        QtGui.QPixmapCache.setCacheLimit(limit)
+        _cache_sized = True
+
+    source_key = f"satellite:{path}"
+    pix = _find(source_key)
+    if pix is None:
+        pix = QtGui.QPixmap(path)
+        if pix.isNull():
+            return pix
+        QtGui.QPixmapCache.insert(source_key, pix)
+
+    w = int(width) if width is not None else pix.width()
+    h = int(height) if height is not None else pix.height()
+    if (w, h) == (pix.width(), pix.height()):
+        return pix
+    scaled_key = f"{source_key}@{w}x{h}"
+    scaled = _find(scaled_key)
+    if scaled is None:
+        scaled = pix.scaled(w, h, QtCore.Qt.IgnoreAspectRatio, QtCore.Qt.SmoothTransformation)
+        QtGui.QPixmapCache.insert(scaled_key, scaled)
+    return scaled
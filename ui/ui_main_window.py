@@ -10,11 +10,17 @@ from ui.PropertiesPanel import PropertiesPanel
 import logging
 
 logger = logging.getLogger(__name__)
-from IO_dossier.project_io import export_project_to_json, import_project_from_json
+from IO_dossier.project_io import export_project_to_json, import_project_from_json, snapshot_project
 from IO_dossier.graph_io import export_graph_to_json, import_graph_from_json
 from IO_dossier.curve_io import export_curve_to_json, import_curve_from_json
+from IO_dossier.csv_export import export_graph_to_csv, export_project_to_csv
+from ui.dialogs.csv_export_dialog import CsvExportDialog
+from ui.workers import CsvExportThread
+from ui.dialogs.capture_library_dialog import CaptureLibraryDialog
+from IO_dossier.capture_library import get_capture_library
 from ui.dialogs.import_curve_dialog import ImportCurveDialog
-from IO_dossier.curve_loader_factory import load_curve_by_format
+from core.job_service import FAILED, INTERACTIVE, Job
+from ui.widgets.job_status import JobStatusWidget
 from curve_generators import generate_random_curve
 from core.app_state import AppState
 from signal_bus import signal_bus
@@ -31,10 +37,13 @@ class MainWindow(QtWidgets.QMainWindow):
         self.setWindowTitle("Gestionnaire de courbes. Version alpha. Clément SAMPERE. Publication restreinte soumise à autorisation")
         self.setGeometry(100, 100, 1200, 700)
         self._current_project_path = None
+        self._saves = {}  # path -> handle of its last save job
+        self._resave = set()
     
         self._setup_menu()
         self._setup_ui()         # Crée tous les panneaux (left, right, etc.)
         self._setup_toolbar()
+        self._setup_status_bar()
     
         #logger.debug("\n🏗️ [MainWindow] Instanciation du ApplicationCoordinator")
         #self.app = ApplicationCoordinator(self)  # 👈 Seulement après que right_panel existe
@@ -81,6 +90,10 @@ class MainWindow(QtWidgets.QMainWindow):
     def _setup_menu(self):
         menu_bar = self.menuBar()
         self.view_menu = menu_bar.addMenu("Affichage")
+        self.render_hud_action = self.view_menu.addAction("📊 Statistiques de rendu")
+        self.render_hud_action.setCheckable(True)
+        self.render_hud_action.toggled.connect(self._toggle_render_hud)
+        self.view_menu.addSeparator()
 
         file_menu = menu_bar.addMenu("Fichier")
         self.save_action = file_menu.addAction("Sauvegarder")
@@ -92,10 +105,14 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self.recent_menu = file_menu.addMenu("Charger récent")
         self._populate_recent_projects()
+        self.capture_library_action = file_menu.addAction("📚 Bibliothèque de captures...")
+        self.capture_library_action.triggered.connect(self.open_capture_library)
 
         file_menu.addSeparator()
         self.export_graph_csv_action = file_menu.addAction("Exporter graphique en CSV")
+        self.export_graph_csv_action.triggered.connect(self.export_graph_csv)
         self.export_project_csv_action = file_menu.addAction("Exporter projet en CSV")
+        self.export_project_csv_action.triggered.connect(self.export_project_csv)
         file_menu.addSeparator()
         quit_action = file_menu.addAction("Quitter")
         quit_action.triggered.connect(self.close)
@@ -148,6 +165,27 @@ class MainWindow(QtWidgets.QMainWindow):
         layout_btn.triggered.connect(self.open_layout_dialog)
         self.toolbar.addAction(layout_btn)
 
+    def _setup_status_bar(self):
+        # Tâches de fond en cours (imports, sauvegardes, calculs)
+        self.job_status = JobStatusWidget(self)
+        self.job_status.cancel_requested.connect(self._cancel_job)
+        self.statusBar().addPermanentWidget(self.job_status)
+
+    def _cancel_job(self, job_id: int):
+        if hasattr(self, "app"):
+            self.app.controller.jobs.cancel(job_id)
+
+    def _submit_job(self, job: Job, error_title: str):
+        """Run *job* in the background; a failure is reported in a dialog."""
+        handle = self.app.controller.jobs.submit(job)
+
+        def report(h):
+            if h.status == FAILED:
+                QtWidgets.QMessageBox.warning(self, error_title, h.error or "Erreur inconnue")
+
+        handle.when_done(report)
+        return handle
+
     def open_layout_dialog(self):
         dlg = LayoutManagerDialog(self)
         dlg.exec_()
@@ -156,23 +194,65 @@ class MainWindow(QtWidgets.QMainWindow):
         if not self._current_project_path:
             self.save_project_as()
             return
-        export_project_to_json(AppState.get_instance().graphs, self._current_project_path)
+        self._save_to(self._current_project_path)
 
     def save_project_as(self):
         path, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Sauvegarder le projet", "", "Fichiers JSON (*.json)")
         if path:
             self._current_project_path = path
-            export_project_to_json(AppState.get_instance().graphs, path)
+            self._save_to(path)
             self._add_to_recent(path)
 
+    def _save_to(self, path: str):
+        """Write the project in a job; one write at a time per file."""
+        running = self._saves.get(path)
+        if running is not None and not running.finished:
+            if path not in self._resave:  # save again, with the latest state, once it ends
+                self._resave.add(path)
+
+                def resave(_handle):
+                    self._resave.discard(path)
+                    self._save_to(path)
+
+                running.when_done(resave)
+            return
+        graphs = snapshot_project(AppState.get_instance().graphs)  # taken here, on the GUI thread
+        self._saves[path] = self._submit_job(
+            Job(
+                name=f"Sauvegarde de {os.path.basename(path)}",
+                run=export_project_to_json,
+                inputs=(graphs, path),
+                outputs=(f"file:{path}",),
+                priority=INTERACTIVE,
+            ),
+            "Échec de la sauvegarde",
+        )
+
     def load_project(self):
         path, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Charger un projet", "", "Fichiers JSON (*.json)")
         if path:
-            graphs = import_project_from_json(path)
+            self._open_project(path)
+
+    def _open_project(self, path: str):
+        """Read the project in a job, then replace the open one."""
+
+        def apply(state, graphs):
             self.app.controller.load_project(graphs)
             self._current_project_path = path
             self._add_to_recent(path)
 
+        self._submit_job(
+            Job(
+                name=f"Ouverture de {os.path.basename(path)}",
+                run=import_project_from_json,
+                inputs=(path,),
+                outputs=("graphs",),
+                apply=apply,
+                priority=INTERACTIVE,
+            ),
+            "Échec du chargement",
+        )
+
     def import_graph(self):
         path, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Importer graphique", "", "Fichiers JSON (*.json)")
         if path:
@@ -199,16 +279,42 @@ class MainWindow(QtWidgets.QMainWindow):
                     curve = generate_random_curve(index)
                     curves = [curve]
                 else:
-                    curves = load_curve_by_format(path, fmt, sep=sep, mode=mode)
+                    # Parsed by a job; the curves are added when it is done
+                    handle = self.app.controller.import_curves_in_background(graph.name, path, fmt, sep, mode)
+                    handle.when_done(self._report_curve_import)
+                    return
 
-                for curve in curves:
-                    self.app.controller.service.add_curve(graph.name, curve)
+                self.app.controller.service.add_curves(graph.name, curves)
                 signal_bus.curve_list_updated.emit()
                 signal_bus.curve_updated.emit()
                 QtWidgets.QMessageBox.information(self, "Import réussi", f"{len(curves)} courbe(s) importée(s) dans '{graph.name}'.")
             except Exception as e:
                 QtWidgets.QMessageBox.warning(self, "Erreur", str(e))
 
+    def _report_curve_import(self, handle):
+        if handle.error:
+            QtWidgets.QMessageBox.warning(self, "Erreur", handle.error)
+
+    def open_capture_library(self):
+        state = AppState.get_instance()
+        graph = state.current_graph
+        if not graph:
+            QtWidgets.QMessageBox.warning(self, "Aucun graphique sélectionné", "Veuillez sélectionner un graphique pour y ajouter les captures.")
+            return
+        library = get_capture_library()
+        dlg = CaptureLibraryDialog(library, self)
+        if dlg.exec_() != QtWidgets.QDialog.Accepted:
+            return
+        try:
+            curves = [library.load_curve(rec) for rec in dlg.get_selected_records()]
+        except OSError as e:
+            QtWidgets.QMessageBox.warning(self, "Erreur", f"Cache de capture illisible : {e}")
+            return
+        self.app.controller.service.add_curves(graph.name, curves)
+        signal_bus.curve_list_updated.emit()
+        signal_bus.curve_updated.emit()
+        self.app.controller.ui.refresh_plot()
+
     def _populate_recent_projects(self):
         self.recent_menu.clear()
         if not os.path.exists(RECENT_FILE):
@@ -240,9 +346,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _load_recent_project(self, path):
         if os.path.exists(path):
-            graphs = import_project_from_json(path)
-            self.app.controller.load_project(graphs)
-            self._current_project_path = path
+            self._open_project(path)
         else:
             QtWidgets.QMessageBox.warning(self, "Fichier introuvable", f"Le fichier '{path}' n'existe plus.")
             self._populate_recent_projects()
@@ -267,6 +371,51 @@ class MainWindow(QtWidgets.QMainWindow):
         if path:
             export_curve_to_json(curve, path)
 
+    def export_graph_csv(self):
+        graph = AppState.get_instance().current_graph
+        if not graph:
+            QtWidgets.QMessageBox.warning(self, "Aucun graphique", "Veuillez sélectionner un graphique.")
+            return
+        self._run_csv_export(export_graph_to_csv, graph, f"{graph.name}.csv")
+
+    def export_project_csv(self):
+        graphs = AppState.get_instance().graphs
+        if not graphs:
+            QtWidgets.QMessageBox.warning(self, "Projet vide", "Aucun graphique à exporter.")
+            return
+        self._run_csv_export(export_project_to_csv, graphs, "projet.csv")
+
+    def _run_csv_export(self, export_func, source, default_name):
+        dlg = CsvExportDialog(self)
+        if dlg.exec_() != QtWidgets.QDialog.Accepted:
+            return
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Exporter en CSV", default_name, "Fichiers CSV (*.csv)")
+        if not path:
+            return
+
+        progress = QtWidgets.QProgressDialog("Export CSV en cours...", "Annuler", 0, 100, self)
+        progress.setWindowTitle("Export CSV")
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(0)
+
+        thread = CsvExportThread(
+            export_func, source, path, sep=dlg.get_separator(), decimal=dlg.get_decimal(), parent=self
+        )
+        thread.progress_changed.connect(progress.setValue)
+        progress.canceled.connect(thread.cancel)
+
+        def on_finished(done, error):
+            progress.reset()
+            thread.deleteLater()
+            if error:
+                QtWidgets.QMessageBox.warning(self, "Erreur", error)
+            elif done:
+                QtWidgets.QMessageBox.information(self, "Export réussi", f"Fichier écrit : {path}")
+
+        thread.export_finished.connect(on_finished)
+        self._csv_export_thread = thread
+        thread.start()
+
     def show_graph_tab(self):
         logger.debug("[MainWindow] Activation de l'onglet Graphique")
         self.right_panel.setTabEnabled(0, True)
@@ -291,6 +440,10 @@ class MainWindow(QtWidgets.QMainWindow):
             "Application de gestion de courbes conçue avec PyQt5 et pyqtgraph"
         )
 
+    def _toggle_render_hud(self, checked: bool):
+        if hasattr(self, "app"):
+            self.app.controller.ui.set_render_hud(checked)
+
     def add_graph_to_view_menu(self, name, dock):
         action = self.view_menu.addAction(name)
         action.setCheckable(True)
@@ -1,23 +1,62 @@
 from core.app_state import AppState
 from PyQt5 import QtWidgets, QtCore, QtGui
 from PyQt5.QtCore import QTimer
+import math
 import time
 import pyqtgraph as pg
 from signal_bus import signal_bus
-from PyQt5.QtGui import QColor, QPainterPath
-from ui.custom_regions import LinearRegion, HLinearRegion
+from PyQt5.QtGui import QColor
+from ui.zone_layer import ZoneLayer
+from ui.annotation_layer import AnnotationLayer
+from ui.satellite_cache import cached_pixmap, satellite_key
 from ui.widgets.plot_container import PlotContainerWidget
+from ui.render_pipeline import (
+    ASYNC_MIN_POINTS,
+    PreparedBatch,
+    PreparedCurve,
+    RenderPipeline,
+    Viewport,
+    curve_extent,
+    prepare_batch,
+    prepare_curve,
+)
+from ui.density_raster import DENSITY_MIN_POINTS, DensityImageItem
+from ui.bar_aggregation import AggregatedBarItem
+from ui.batched_curves import BatchedCurveItem, group_batches
+from ui.measurement_cursors import CursorReadoutTable, MeasurementCursors
+from ui.overview import OverviewWidget
+from ui.logic_lanes import LogicLanes
+from ui.frame_stats import HUD_INTERVAL_MS, FrameStats, StatsHud
+from ui.hit_testing import CurveBoundsIndex, ViewTransform, hit_test
+from ui.render_policy import (
+    INTERACTIVE,
+    INTERACTIVE_LOD_SCALE,
+    RenderOverlay,
+    RenderPolicy,
+    TimedPlotWidget,
+)
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Curve properties held by the pen alone: changed in place, without a rebuild
+PEN_ONLY_FIELDS = frozenset({"width", "style"})
+
+
+def _set_antialias(item, enabled: bool):
+    """Antialiasing option of a curve/scatter item and of its drawn children."""
+    for part in (item, getattr(item, "curve", None), getattr(item, "scatter", None)):
+        if part is not None and "antialias" in part.opts:
+            part.opts["antialias"] = enabled
+            part.update()
+
 
 class MyPlotView:
     def __init__(self, graph_data):
         logger.debug("[views.py > __init__()] ▶️ Entrée dans __init__()")
 
         self.graph_data = graph_data
-        self.plot_widget = pg.PlotWidget()
+        self.plot_widget = TimedPlotWidget()
         self.plot_widget.setBackground("w")
         self.plot_widget.useOpenGL(True)
         # Container widget that will host the plot and the satellite zones
@@ -29,27 +68,138 @@ class MyPlotView:
 
         self.left_indicator_plot = None  # ← AJOUT ICI ✅
 
+        # Data preparation runs on a thread pool; results come back here
+        self.pipeline = RenderPipeline()
+        # Curves drawn from their min/max pyramid, re-sliced on range changes
+        self._decimated = {}
+        # Same-style curves sharing one item: batch key -> (item, curves)
+        self._batches = {}
+        # Huge scatter curves: name -> density image shown instead of symbols
+        self._density = {}
+        self._hit_index = None  # bounding boxes for click selection, built lazily
+        self.zone_layer = ZoneLayer(self.plot_widget)
+        self.annotation_layer = AnnotationLayer(self.plot_widget)
+        # Satellite widgets kept across refreshes, keyed by satellite_key()
+        self._satellite_widgets = {}
+        self._satellite_placement = {}  # zone -> placement of its last layout
+        self._lod_timer = QTimer()
+        self._lod_timer.setSingleShot(True)
+        self._lod_timer.setInterval(30)
+        self._lod_timer.timeout.connect(self._update_lod_items)
+        vb = self.plot_widget.getViewBox()
+        vb.sigXRangeChanged.connect(self._schedule_lod_update)
+        vb.sigYRangeChanged.connect(self._schedule_density_update)
+        vb.sigResized.connect(self._schedule_lod_update)
+        vb.sigXRangeChanged.connect(self._sync_overviews)
+
+        # "logic_lanes" mode: fixed-height lanes, only those in view are built
+        self.lanes = LogicLanes(self.plot_widget)
+        vb.sigYRangeChanged.connect(self.lanes.update)
+        vb.sigResized.connect(lambda *_: self.lanes.fix_span())
+
         self.plot_widget.scene().sigMouseClicked.connect(self._on_mouse_click)
 
+        # Quality drops while moving a slow graph, restored when idle
+        self.render_policy = RenderPolicy()
+        self._lod_scale = 1.0
+        # Antialiasing to restore after interaction: view hint, then per item
+        self._view_antialias = bool(self.plot_widget.renderHints() & QtGui.QPainter.Antialiasing)
+        self._item_antialias = {}
+        self.plot_widget.frame_painted.connect(self.render_policy.frame_painted)
+        vb.sigRangeChangedManually.connect(self.render_policy.interaction)
+        self.render_policy.quality_changed.connect(self._apply_quality)
+        self._overlay = None
+        self._overlay_timer = QTimer()
+        self._overlay_timer.setInterval(250)
+        self._overlay_timer.timeout.connect(self._update_overlay)
+
+        # Frame statistics HUD: nothing is measured while it is hidden
+        self.stats = None
+        self._hud = None
+        self._hud_timer = QTimer()
+        self._hud_timer.setInterval(HUD_INTERVAL_MS)
+        self._hud_timer.timeout.connect(self._update_hud)
+
+        # Measurement cursors, re-attached after each refresh_curves
+        self.cursors = MeasurementCursors(self.plot_widget)
+
+        # Off-screen views are suspended: no items, no GL context, a snapshot
+        self.suspended = False
+        self._snapshot = None  # QLabel showing the last frame while suspended
+
+    def suspend(self):
+        """Release the plot items and GL viewport of an off-screen view.
+
+        The last frame is kept as a pixmap, shown again while the view is
+        being rebuilt by :meth:`resume`.
+        """
+        if self.suspended:
+            return
+        logger.debug(f"💤 [MyPlotView.suspend] {self.graph_data.name}")
+        self.suspended = True
+        if self.curves or self.zone_layer.items or len(self.graph_data.annotations):
+            pixmap = self.plot_widget.grab()
+            if self._snapshot is None:
+                self._snapshot = QtWidgets.QLabel(self.plot_widget)
+                self._snapshot.setScaledContents(True)
+            self._snapshot.setPixmap(pixmap)
+            self._snapshot.setGeometry(self.plot_widget.rect())
+            self._snapshot.show()
+        self._lod_timer.stop()
+        self.pipeline.cancel()
+        self.plot_widget.clear()
+        self.curves.clear()
+        self.labels.clear()
+        self._decimated.clear()
+        self._batches.clear()
+        self._density.clear()
+        self._hit_index = None
+        self.plot_widget.useOpenGL(False)
+
+    def resume(self):
+        """Rebuild a suspended view that is scrolled back into view."""
+        if not self.suspended:
+            return
+        logger.debug(f"👁 [MyPlotView.resume] {self.graph_data.name}")
+        self.suspended = False
+        self.plot_widget.useOpenGL(True)
+        self.refresh()
+        if self._snapshot is not None:
+            self._snapshot.hide()
+            self._snapshot.clear()  # keep no pixmap once live again
+
+    def refresh(self):
+        """Full update: properties, curves and satellites (skipped if suspended)."""
+        if self.suspended:
+            return
+        self.update_graph_properties()
+        self.refresh_curves()
+        self.refresh_satellites()
+
     def update_graph_properties(self):
         logger.debug(
             "[views.py > update_graph_properties()] ▶️ Entrée dans update_graph_properties()"
         )
 
         g = self.graph_data
+        lanes = g.mode == "logic_lanes"
         self.plot_widget.showGrid(g.grid_visible, g.grid_visible)
-        self.plot_widget.setLogMode(g.log_x, g.log_y)
+        self.plot_widget.setLogMode(g.effective_log_x, g.effective_log_y)
         self.plot_widget.setBackground("k" if g.dark_mode else "w")
 
         x_auto = g.auto_range_x
-        y_auto = g.auto_range_y and not g.fix_y_range
+        y_auto = g.auto_range_y and not g.fix_y_range and not lanes
         self.plot_widget.enableAutoRange(x=x_auto, y=y_auto)
-        if g.fix_y_range:
+        if g.fix_y_range and not lanes:
             self.plot_widget.setYRange(g.y_min, g.y_max)
 
         vb = self.plot_widget.getViewBox()
         vb.setMouseEnabled(x=g.mouse_enabled_x, y=g.mouse_enabled_y)
 
+        self.render_policy.configure(g.adaptive_rendering, g.render_budget_ms, g.render_idle_ms)
+        self.cursors.configure(g.cursors_vertical, g.cursors_horizontal, g.effective_log_x, g.effective_log_y)
+        self._show_overlay(g.render_overlay)
+
         self._format_axis(self.plot_widget.getAxis("bottom"), g.x_unit, g.x_format)
         self._format_axis(self.plot_widget.getAxis("left"), g.y_unit, g.y_format)
 
@@ -62,6 +212,14 @@ class MyPlotView:
         self.curves.clear()
         self.labels.clear()
         self.satellites.clear()
+        if self.stats is not None:
+            self.stats.reset_curves()
+            self.stats.refreshed()
+        self._decimated.clear()
+        self._batches.clear()
+        self._density.clear()
+        self._item_antialias.clear()
+        self._hit_index = None
 
         # Supprimer les anciens éléments personnalisés (TextItem, ArrowItem, etc.)
         for item in self.plot_widget.items():
@@ -84,6 +242,27 @@ class MyPlotView:
 
         legend_items_added = set()
         self.zero_arrows = []
+        self.pipeline.cancel()
+        viewport = self._viewport()
+
+        if self.graph_data.mode == "logic_lanes":
+            self.lanes.attach(self.graph_data.curves, self.graph_data.lane_height_px)
+            self.zone_layer.update(getattr(self.graph_data, "zones", []))
+            self.annotation_layer.update(self.graph_data.annotations)
+            self.cursors.attach(self.graph_data.curves)
+            logger.debug(f"[PROFILER] refresh_curves (pistes) took {time.perf_counter() - start:.4f} seconds")
+            return
+        self.lanes.detach()
+
+        # Mode groupé : un seul item par style pour les courbes en ligne simple
+        if self.graph_data.batch_curves:
+            batches, _ = group_batches(self.graph_data.curves)
+            for key, members in batches.items():
+                item = BatchedCurveItem(self._curve_pen(members[0]), [c.name for c in members])
+                self.plot_widget.addItem(item)
+                self._batches[key] = (item, members)
+                for member in members:
+                    self.curves[member.name] = item
 
         for curve in self.graph_data.curves:
             logger.debug(
@@ -93,47 +272,45 @@ class MyPlotView:
             if not curve.visible:
                 continue
 
-            base_x = (
-                curve.x[:: curve.downsampling_ratio]
-                if curve.downsampling_mode == "manual"
-                else curve.x
-            )
-            x = base_x + curve.time_offset
-            y = curve.gain * curve.y + curve.offset
-
             qcolor = QColor(curve.color)
             qcolor.setAlphaF(curve.opacity / 100.0)
-            pen = pg.mkPen(color=qcolor, width=curve.width, style=curve.style)
+            pen = self._curve_pen(curve)
+            batch_item = self.curves.get(curve.name)
 
-            if curve.display_mode == "line":
-                item = pg.PlotDataItem(x, y, pen=pen, symbol=curve.symbol)
+            if batch_item is not None:
+                item = batch_item  # drawn by its batch, data prepared below
+            elif curve.display_mode == "line":
+                item = pg.PlotDataItem(pen=pen, symbol=curve.symbol)
                 if curve.fill:
                     item.setFillLevel(0)
                     item.setBrush(pg.mkBrush(qcolor))
             elif curve.display_mode == "scatter":
                 item = pg.ScatterPlotItem(
-                    x=x,
-                    y=y,
                     pen=pen,
                     brush=pg.mkBrush(qcolor),
                     symbol=curve.symbol or "o",
                     size=curve.width * 2,
                 )
+                if len(curve.y) >= DENSITY_MIN_POINTS:
+                    image = DensityImageItem(qcolor)
+                    g = self.graph_data
+                    image.set_extent(curve_extent(curve), g.effective_log_x, g.effective_log_y)
+                    self.plot_widget.addItem(image)
+                    self._density[curve.name] = image
             elif curve.display_mode == "bar":
-                item = pg.BarGraphItem(
-                    x=x, height=y, width=0.1, brush=pg.mkBrush(qcolor)
-                )
+                item = AggregatedBarItem(brush=pg.mkBrush(qcolor))
+                item.set_extent(curve_extent(curve))
             else:
                 continue
 
-            item.curve_name = curve.name
-            self.plot_widget.addItem(item)
-            self.curves[curve.name] = item
+            if batch_item is None:
+                item.curve_name = curve.name
+                self.plot_widget.addItem(item)
+                self.curves[curve.name] = item
 
-            # Étiquette inline
-            if curve.label_mode == "inline" and len(x) and len(y):
+            # Étiquette inline (positionnée quand les données sont prêtes)
+            if curve.label_mode == "inline" and len(curve.x):
                 text = pg.TextItem(text=curve.name, anchor=(1, 0), color=qcolor)
-                text.setPos(x[-1], y[-1])
                 self.plot_widget.addItem(text)
                 self.labels[curve.name] = text
 
@@ -151,95 +328,311 @@ class MyPlotView:
                 zero_line.setPos(curve.offset)
                 self.plot_widget.addItem(zero_line)
 
-            # Optimisation
-            if hasattr(item, "setClipToView"):
-                item.setClipToView(True)
-            if hasattr(item, "setDownsampling"):
-                if curve.downsampling_mode == "off":
-                    item.setDownsampling(auto=False)
-                elif curve.downsampling_mode == "auto":
-                    item.setDownsampling(auto=True)
+            # Données : préparées ici pour les petites courbes, sur le pool sinon
+            if batch_item is not None:
+                continue
+            if len(curve.y) >= ASYNC_MIN_POINTS:
+                self._submit_prepare(curve)
+            else:
+                self._apply_prepared(curve, prepare_curve(curve, viewport))
 
-        # Add custom zones
-        for zone in getattr(self.graph_data, "zones", []):
-            ztype = zone.get("type")
-            line_color = zone.get("line_color", "#FF0000")
-            line_alpha = float(zone.get("line_alpha", 100)) / 100.0
-            line_width = int(zone.get("line_width", 1))
-            fill_color = zone.get("fill_color", line_color)
-            fill_alpha = float(zone.get("fill_alpha", 40)) / 100.0
-            line_qcolor = QColor(line_color)
-            line_qcolor.setAlphaF(line_alpha)
-            pen = pg.mkPen(line_qcolor, width=line_width)
-
-            fill_qcolor = QColor(fill_color)
-            fill_qcolor.setAlphaF(fill_alpha)
-
-            if ztype in {"hlinear", "vlinear"}:
-                bounds = zone.get("bounds", [0, 1])
-                region_cls = HLinearRegion if ztype == "hlinear" else LinearRegion
-                item = region_cls(
-                    values=bounds,
-                    brush=QtGui.QBrush(fill_qcolor),
-                    pen=pen,
-                )
-                item.setMovable(False)
-                item.setHoverBrush(item.brush)
-                item.setAcceptedMouseButtons(QtCore.Qt.NoButton)
-                item.setZValue(100)
-            elif ztype == "rect":
-                x, y, w, h = zone.get("rect", [0, 0, 1, 1])
-                item = QtWidgets.QGraphicsRectItem(x, y, w, h)
-                # mkBrush may return tuples on some platforms if given an
-                # unrecognized color specification. Construct the QBrush
-                # explicitly to avoid "unexpected type 'tuple'" errors on
-                # setBrush().
-                brush = QtGui.QBrush(fill_qcolor)
-                item.setPen(pen)
-                item.setBrush(brush)
-            elif ztype == "path":
-                pts = zone.get("points", [])
-                path = QPainterPath()
-                if pts:
-                    path.moveTo(*pts[0])
-                    for pt in pts[1:]:
-                        path.lineTo(*pt)
-                item = QtWidgets.QGraphicsPathItem(path)
-                item.setPen(pen)
+        for key, (item, members) in self._batches.items():
+            if sum(len(c.x) for c in members) >= ASYNC_MIN_POINTS:
+                self._submit_batch(key, viewport)
             else:
-                continue
-            item.setAcceptedMouseButtons(QtCore.Qt.NoButton)
-            item.setZValue(100)
-            self.plot_widget.addItem(item)
+                self._apply_batch(key, prepare_batch(members, viewport))
+
+        # Zones : items groupés, reconstruits seulement si graph.zones change
+        self.zone_layer.update(getattr(self.graph_data, "zones", []))
+        # Annotations : un seul item, limité à la fenêtre visible
+        self.annotation_layer.update(self.graph_data.annotations)
+
+        self.cursors.attach(self.graph_data.curves)
+        for overview in self._overviews():
+            overview.set_curves(self.graph_data.curves, self.graph_data.effective_log_x)
+
+        if self.render_policy.mode == INTERACTIVE:
+            self._apply_quality(INTERACTIVE)
 
         end = time.perf_counter()
         logger.debug(f"[PROFILER] refresh_curves took {end - start:.4f} seconds")
+        if self.stats is not None:
+            self.stats.rebuilt((end - start) * 1000.0)
+
+    def update_curve(self, name: str, fields):
+        """Apply a property change of curve *name*.
+
+        Width and dash style only change the pen of a plain line item, which
+        is updated in place; showing or hiding a member of a batch only drops
+        its slice from the shared path. Anything else rebuilds the curves of
+        the view.
+        """
+        curve = next((c for c in self.graph_data.curves if c.name == name), None)
+        item = self.curves.get(name)
+        if curve is not None and set(fields) <= PEN_ONLY_FIELDS and type(item) is pg.PlotDataItem:
+            item.setPen(self._curve_pen(curve))
+            return
+        if curve is not None and set(fields) == {"visible"} and isinstance(item, BatchedCurveItem):
+            item.set_member_visible(name, curve.visible)
+            self._hit_index = None
+            label = self.labels.get(name)
+            if label is not None:
+                label.setVisible(curve.visible)
+            for overview in self._overviews():
+                overview.set_curves(self.graph_data.curves, self.graph_data.effective_log_x)
+            return
+        self.refresh_curves()
+
+    def _curve_pen(self, curve):
+        qcolor = QColor(curve.color)
+        qcolor.setAlphaF(curve.opacity / 100.0)
+        return pg.mkPen(color=qcolor, width=curve.width, style=curve.style)
+
+    def _visible_x_range(self):
+        """Visible X range in data units (undoing the log scale if any)."""
+        x0, x1 = self.plot_widget.getViewBox().viewRange()[0]
+        if self.graph_data.effective_log_x:
+            x0, x1 = 10.0 ** x0, 10.0 ** x1
+        return x0, x1
+
+    def _set_visible_x_range(self, x0: float, x1: float):
+        """Show ``[x0, x1]`` (data units); decimated items follow via the LOD timer."""
+        if self.graph_data.effective_log_x:
+            if x0 <= 0 or x1 <= 0:
+                return
+            x0, x1 = math.log10(x0), math.log10(x1)
+        self.plot_widget.getViewBox().setXRange(x0, x1, padding=0)
+
+    def _overviews(self):
+        return [w for w in self._satellite_widgets.values() if isinstance(w, OverviewWidget)]
+
+    def _sync_overviews(self, *args):
+        for overview in self._overviews():
+            overview.show_range(*self._visible_x_range())
+
+    def _viewport(self) -> Viewport:
+        g = self.graph_data
+        vb = self.plot_widget.getViewBox()
+        x0, x1 = self._visible_x_range()
+        y0, y1 = vb.viewRange()[1]
+        if g.effective_log_y:
+            y0, y1 = 10.0 ** y0, 10.0 ** y1
+        scale = self._lod_scale  # coarser decimation while interacting
+        return Viewport(
+            x0, x1, int(vb.width() * scale), y0, y1, int(vb.height() * scale), g.effective_log_x, g.effective_log_y
+        )
 
-    def _on_mouse_click(self, event):
-        logger.debug("[views.py > _on_mouse_click()] ▶️ Entrée dans _on_mouse_click()")
-
-        scene_pos = event.scenePos()
-        view_pos = self.plot_widget.plotItem.vb.mapSceneToView(scene_pos)
-        x_click, y_click = view_pos.x(), view_pos.y()
+    def _timed(self, job):
+        """Wrap a pool job so that its duration reaches the HUD statistics."""
+        stats = self.stats
+        if stats is None:
+            return job
+
+        def run():
+            start = time.perf_counter()
+            result = job()
+            stats.prepared((time.perf_counter() - start) * 1000.0)
+            return result
+
+        return run
+
+    def _submit_prepare(self, curve, viewport: Viewport = None):
+        viewport = viewport or self._viewport()
+        self.pipeline.submit(
+            curve.name,
+            self._timed(lambda: prepare_curve(curve, viewport)),
+            lambda prepared, c=curve: self._apply_prepared(c, prepared),
+        )
 
-        min_distance = float("inf")
-        selected_curve = None
+    def _apply_prepared(self, curve, prepared: PreparedCurve):
+        """Swap freshly prepared buffers into the curve's item (GUI thread)."""
+        if self.stats is None:
+            self._swap_prepared(curve, prepared)
+            return
+        start = time.perf_counter()
+        if self._swap_prepared(curve, prepared):
+            self.stats.rebuilt((time.perf_counter() - start) * 1000.0)
+            self.stats.curve_drawn(curve.name, len(prepared.x), len(curve.x), prepared.lod_level)
+
+    def _swap_prepared(self, curve, prepared: PreparedCurve) -> bool:
+        item = self.curves.get(curve.name)
+        if item is None or prepared.data_version != curve.data_version:
+            return False
+        x, y = prepared.x, prepared.y
+        if isinstance(item, pg.PlotDataItem):
+            item.setData(x, y, connect=prepared.connect)
+            if prepared.decimated:
+                self._decimated[curve.name] = curve
+            else:
+                item.setClipToView(True)
+                if curve.downsampling_mode == "off":
+                    item.setDownsampling(auto=False)
+                elif curve.downsampling_mode == "auto":
+                    item.setDownsampling(auto=True)
+        elif isinstance(item, pg.ScatterPlotItem):
+            item.setData(x=x, y=y)
+            image = self._density.get(curve.name)
+            if image is not None:
+                self._decimated[curve.name] = curve
+                if prepared.density is not None:
+                    image.set_raster(prepared.density)
+                else:
+                    image.clear_raster()
+        elif isinstance(item, pg.BarGraphItem):
+            item.setOpts(x=x, height=y, width=prepared.bar_width)
+            if prepared.decimated:
+                self._decimated[curve.name] = curve  # rebinned on zoom
+
+        label = self.labels.get(curve.name)
+        if label is not None and len(x):
+            label.setPos(x[-1], y[-1])
+        return True
+
+    def _submit_batch(self, key, viewport: Viewport = None):
+        viewport = viewport or self._viewport()
+        members = self._batches[key][1]
+        self.pipeline.submit(
+            ("batch", key),
+            self._timed(lambda: prepare_batch(members, viewport)),
+            lambda prepared, k=key: self._apply_batch(k, prepared),
+        )
 
-        for curve_name, item in self.curves.items():
-            x_data, y_data = item.getData()
-            if x_data is None or y_data is None:
+    def _apply_batch(self, key, prepared: PreparedBatch):
+        """Swap a batch's combined buffers into its item (GUI thread)."""
+        if key not in self._batches:
+            return
+        item, members = self._batches[key]
+        if prepared.data_versions != [c.data_version for c in members]:
+            return
+        start = time.perf_counter()
+        item.setData(prepared.x, prepared.y, prepared.connect, prepared.offsets, prepared.bounds)
+        for curve in members:
+            label = self.labels.get(curve.name)
+            x, y = item.member_data(curve.name)
+            if label is not None and len(x):
+                label.setPos(x[-1], y[-1])
+            if self.stats is not None:
+                self.stats.curve_drawn(curve.name, len(x), len(curve.x))
+        if self.stats is not None:
+            self.stats.rebuilt((time.perf_counter() - start) * 1000.0)
+
+    def _apply_quality(self, mode: str):
+        """Drop or restore the costly parts of the drawing (GUI thread)."""
+        interactive = mode == INTERACTIVE
+        logger.debug(f"🎚 [MyPlotView._apply_quality] {self.graph_data.name} → {mode}")
+        self.plot_widget.setAntialiasing(self._view_antialias and not interactive)
+        # Curve and scatter items set the painter hint from their own option
+        for item in set(self.curves.values()):
+            if isinstance(item, (pg.PlotDataItem, pg.ScatterPlotItem)):
+                if interactive:
+                    self._item_antialias.setdefault(item, item.opts.get("antialias", False))
+                    _set_antialias(item, False)
+                elif item in self._item_antialias:
+                    _set_antialias(item, self._item_antialias.pop(item))
+        lod_scale = INTERACTIVE_LOD_SCALE if interactive else 1.0
+        for curve in self.graph_data.curves:
+            item = self.curves.get(curve.name)
+            if not isinstance(item, pg.PlotDataItem):
                 continue
+            if curve.symbol:
+                item.setSymbol(None if interactive else curve.symbol)
+            if curve.fill:
+                item.setFillLevel(None if interactive else 0)
+        for label in self.labels.values():
+            label.setVisible(not interactive)
+        if lod_scale != self._lod_scale:
+            self._lod_scale = lod_scale
+            self._update_lod_items()
+        self._update_overlay()
+
+    def _show_overlay(self, visible: bool):
+        if visible and self._overlay is None:
+            self._overlay = RenderOverlay(self.plot_widget)
+        if self._overlay is not None:
+            self._overlay.setVisible(visible)
+        if visible:
+            self._update_overlay()
+            self._overlay_timer.start()
+        else:
+            self._overlay_timer.stop()
+
+    def _update_overlay(self):
+        # Refreshed on a timer, not per frame: the label would repaint the view
+        if self._overlay is not None and self._overlay.isVisible():
+            self._overlay.show_state(self.render_policy)
+
+    def set_hud_visible(self, visible: bool):
+        """Show the frame statistics HUD; hiding it stops every measurement."""
+        if visible == (self.stats is not None):
+            return
+        if visible:
+            self.stats = FrameStats()
+            if self._hud is None:
+                self._hud = StatsHud(self.plot_widget)
+            self.plot_widget.frame_painted.connect(self.stats.paint)
+            self._hud.show()
+            self._hud_timer.start()
+            self.refresh()  # fill the point counts
+        else:
+            self.plot_widget.frame_painted.disconnect(self.stats.paint)
+            self.stats = None
+            self._hud.hide()
+            self._hud_timer.stop()
+
+    def _update_hud(self):
+        if self.stats is not None and self._hud is not None:
+            self._hud.show_stats(self.stats)
+
+    def _schedule_lod_update(self, *args):
+        if self._decimated or self._batches or self.lanes.active:
+            self._lod_timer.start()
+
+    def _schedule_density_update(self, *args):
+        # Only density rasters depend on the vertical range
+        if self._density:
+            self._lod_timer.start()
+
+    def _update_lod_items(self):
+        """Re-slice decimated curves for the new visible range (throttled).
+
+        Preparation happens on the pool; a request still running when the
+        view moves again is superseded and its result dropped.
+        """
+        viewport = self._viewport()
+        if self.lanes.active:
+            self.lanes.reslice(viewport.x0, viewport.x1, viewport.width_px)
+        for curve in list(self._decimated.values()):
+            self._submit_prepare(curve, viewport)
+        for key in list(self._batches):
+            self._submit_batch(key, viewport)
 
-            distances = (x_data - x_click) ** 2 + (y_data - y_click) ** 2
-            idx_min = distances.argmin()
-            distance = distances[idx_min] ** 0.5
+    def _on_mouse_click(self, event):
+        logger.debug("[views.py > _on_mouse_click()] ▶️ Entrée dans _on_mouse_click()")
 
-            if distance < 10 and distance < min_distance:
-                min_distance = distance
-                selected_curve = curve_name
+        vb = self.plot_widget.plotItem.vb
+        view_pos = vb.mapSceneToView(event.scenePos())
+        pixel_width, pixel_height = vb.viewPixelSize()
+        if not pixel_width or not pixel_height:
+            return
+
+        if self.lanes.active:
+            # Curves are drawn in the lanes, not as plot items: pick the lane's curve
+            lane = self.lanes.lane_at(view_pos.y())
+            if lane is not None:
+                logger.debug(f"[CLICK] Piste cliquée : {lane.curve.name}")
+                signal_bus.curve_selected.emit(self.graph_data.name, lane.curve.name)
+            return
+
+        if self._hit_index is None:
+            drawn = [c for c in self.graph_data.curves if c.visible and c.name in self.curves]
+            self._hit_index = CurveBoundsIndex(drawn)
+        transform = ViewTransform(
+            pixel_width, pixel_height, self.graph_data.effective_log_x, self.graph_data.effective_log_y
+        )
+        selected_curve = hit_test(self._hit_index, view_pos.x(), view_pos.y(), transform)
 
         if selected_curve:
-            logger.debug(f"[CLICK] Courbe cliquée (par distance) : {selected_curve}")
+            logger.debug(f"[CLICK] Courbe cliquée (en pixels) : {selected_curve}")
             signal_bus.curve_selected.emit(self.graph_data.name, selected_curve)
 
     def _format_axis(self, axis, unit: str, fmt: str):
@@ -323,48 +716,68 @@ class MyPlotView:
             else:
                 box.setFixedHeight(size)
 
-            box.setStyleSheet(f"background-color: {color};")
+            style = f"background-color: {color};"
+            if box.styleSheet() != style:
+                box.setStyleSheet(style)
 
-            layout = box.layout()
-            if layout is not None:
-                while layout.count():
-                    item = layout.takeAt(0)
-                    if item and item.widget():
-                        item.widget().deleteLater()
-            for child in box.findChildren(QtWidgets.QWidget):
-                if layout is None or layout.indexOf(child) == -1:
-                    child.deleteLater()
-
-            for obj in self.graph_data.satellite_objects.get(zone, []):
+            objects = self.graph_data.satellite_objects.get(zone, [])
+            placement = [
+                (satellite_key(zone, obj), getattr(obj, "anchor", "grid"), obj.x, obj.y, box.size())
+                for obj in objects
+            ]
+            if self._satellite_placement.get(zone) == placement:
+                continue  # same widgets at the same places: nothing to do
+            self._place_satellites(zone, box, objects)
+            self._satellite_placement[zone] = placement
+
+    def _place_satellites(self, zone, box, objects):
+        """(Re)place the zone's widgets, reusing those whose key is unchanged."""
+        layout = box.layout()
+        if layout is not None:
+            while layout.count():
+                layout.takeAt(0)  # widgets stay alive in the pool
+
+        keys = [satellite_key(zone, obj) for obj in objects]
+        for key in [k for k in self._satellite_widgets if k[0] == zone and k not in keys]:
+            self._satellite_widgets.pop(key).deleteLater()
+        pooled = set(self._satellite_widgets.values())
+        for child in box.findChildren(QtWidgets.QWidget, options=QtCore.Qt.FindDirectChildrenOnly):
+            if child not in pooled:
+                child.deleteLater()
+
+        for obj, key in zip(objects, keys):
+            widget = self._satellite_widgets.get(key)
+            if widget is None:
                 widget = self._create_satellite_widget(obj)
-                anchor = getattr(obj, "anchor", "grid")
-                if anchor == "grid" and layout is not None:
-                    if isinstance(layout, QtWidgets.QGridLayout):
-                        row = max(0, obj.y)
-                        col = max(0, obj.x)
-                        layout.addWidget(widget, row, col)
-                    else:
-                        layout.addWidget(widget)
+                self._satellite_widgets[key] = widget
+            anchor = getattr(obj, "anchor", "grid")
+            if anchor == "grid" and layout is not None:
+                if isinstance(layout, QtWidgets.QGridLayout):
+                    row = max(0, obj.y)
+                    col = max(0, obj.x)
+                    layout.addWidget(widget, row, col)
                 else:
-                    widget.setParent(box)
-                    zone_w = box.width()
-                    zone_h = box.height()
-                    anchor_map = {
-                        "top-left": (0, 0),
-                        "top": (0.5, 0),
-                        "top-right": (1, 0),
-                        "left": (0, 0.5),
-                        "center": (0.5, 0.5),
-                        "right": (1, 0.5),
-                        "bottom-left": (0, 1),
-                        "bottom": (0.5, 1),
-                        "bottom-right": (1, 1),
-                    }
-                    ax, ay = anchor_map.get(anchor, (0, 0))
-                    x = int(ax * zone_w) + obj.x
-                    y = int(ay * zone_h) + obj.y
-                    widget.move(x, y)
-                    widget.show()
+                    layout.addWidget(widget)
+            else:
+                widget.setParent(box)
+                zone_w = box.width()
+                zone_h = box.height()
+                anchor_map = {
+                    "top-left": (0, 0),
+                    "top": (0.5, 0),
+                    "top-right": (1, 0),
+                    "left": (0, 0.5),
+                    "center": (0.5, 0.5),
+                    "right": (1, 0.5),
+                    "bottom-left": (0, 1),
+                    "bottom": (0.5, 1),
+                    "bottom-right": (1, 1),
+                }
+                ax, ay = anchor_map.get(anchor, (0, 0))
+                x = int(ax * zone_w) + obj.x
+                y = int(ay * zone_h) + obj.y
+                widget.move(x, y)
+                widget.show()
 
     def _create_satellite_widget(self, obj):
         if obj.obj_type == "text":
@@ -381,10 +794,19 @@ class MyPlotView:
             label = QtWidgets.QLabel()
             path = obj.config.get("value")
             if path:
-                pix = QtGui.QPixmap(path)
+                pix = cached_pixmap(path, obj.config.get("width"), obj.config.get("height"))
                 if not pix.isNull():
-                    w = int(obj.config.get("width", pix.width()))
-                    h = int(obj.config.get("height", pix.height()))
-                    label.setPixmap(pix.scaled(w, h))
+                    label.setPixmap(pix)
             return label
+        if obj.obj_type == "overview":
+            overview = OverviewWidget()
+            overview.set_curves(self.graph_data.curves, self.graph_data.effective_log_x)
+            overview.show_range(*self._visible_x_range())
+            overview.range_requested.connect(self._set_visible_x_range)
+            return overview
+        if obj.obj_type == "cursors":
+            table = CursorReadoutTable()
+            table.show_readout(self.cursors.readout)
+            self.cursors.readout_changed.connect(table.show_readout)
+            return table
         return QtWidgets.QLabel(obj.name)
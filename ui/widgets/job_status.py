@@ -0,0 +1,77 @@
+"""Status-bar list of the background jobs."""
+
+from typing import Dict, List
+
+from PyQt5 import QtCore, QtWidgets
+
+from signal_bus import signal_bus
+
+
+class JobStatusWidget(QtWidgets.QWidget):
+    """Shows the running jobs; their menu entries request a cancellation."""
+
+    cancel_requested = QtCore.pyqtSignal(int)  # job id
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._jobs: Dict[int, List] = {}  # id -> [name, fraction, running]
+        layout = QtWidgets.QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.button = QtWidgets.QToolButton()
+        self.button.setPopupMode(QtWidgets.QToolButton.InstantPopup)
+        self.button.setAutoRaise(True)
+        self.menu = QtWidgets.QMenu(self.button)
+        self.button.setMenu(self.menu)
+        self.progress = QtWidgets.QProgressBar()
+        self.progress.setRange(0, 100)
+        self.progress.setMaximumWidth(120)
+        self.progress.setMaximumHeight(14)
+        self.progress.setTextVisible(False)
+        layout.addWidget(self.button)
+        layout.addWidget(self.progress)
+
+        signal_bus.job_queued.connect(self.on_job_queued)
+        signal_bus.job_started.connect(self.on_job_started)
+        signal_bus.job_progress.connect(self.on_job_progress)
+        signal_bus.job_finished.connect(self.on_job_finished)
+        self._refresh()
+
+    def on_job_queued(self, job_id: int, name: str):
+        self._jobs[job_id] = [name, 0.0, False]
+        self._refresh()
+
+    def on_job_started(self, job_id: int, name: str):
+        self._jobs.setdefault(job_id, [name, 0.0, False])[2] = True
+        self._refresh()
+
+    def on_job_progress(self, job_id: int, fraction: float):
+        if job_id in self._jobs:
+            self._jobs[job_id][1] = fraction
+            self._refresh()
+
+    def on_job_finished(self, job_id: int, name: str, status: str):
+        self._jobs.pop(job_id, None)
+        self._refresh()
+
+    def job_lines(self) -> List[str]:
+        lines = []
+        for name, fraction, running in self._jobs.values():
+            state = f"{int(fraction * 100)} %" if running else "en attente"
+            lines.append(f"{name} — {state}")
+        return lines
+
+    def _refresh(self):
+        running = [job for job in self._jobs.values() if job[2]]
+        self.setVisible(bool(self._jobs))
+        if not self._jobs:
+            return
+        first = running[0][0] if running else next(iter(self._jobs.values()))[0]
+        more = f" (+{len(self._jobs) - 1})" if len(self._jobs) > 1 else ""
+        self.button.setText(f"⏳ {first}{more}")
+        self.button.setToolTip("\n".join(self.job_lines()))
+        self.progress.setValue(int(100 * running[0][1]) if running else 0)
+
+        self.menu.clear()
+        for job_id, line in zip(list(self._jobs), self.job_lines()):
+            action = self.menu.addAction(f"⛔️ Annuler : {line}")
+            action.triggered.connect(lambda checked=False, i=job_id: self.cancel_requested.emit(i))
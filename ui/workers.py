@@ -0,0 +1,50 @@
+# workers.py
+
+from PyQt5 import QtCore
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class CsvExportThread(QtCore.QThread):
+    """Run a streaming CSV export off the GUI thread.
+
+    *export_func* is one of the ``IO_dossier.csv_export`` functions; it is
+    called with ``progress`` and ``is_cancelled`` callbacks wired to this
+    thread. Progress is reported in percent through :attr:`progress_changed`.
+    """
+
+    progress_changed = QtCore.pyqtSignal(int)
+    export_finished = QtCore.pyqtSignal(bool, str)  # completed, error message
+
+    def __init__(self, export_func, *args, parent=None, **kwargs):
+        super().__init__(parent)
+        self._export_func = export_func
+        self._args = args
+        self._kwargs = kwargs
+        self._cancelled = False
+        self._last_percent = -1
+
+    def cancel(self):
+        logger.debug("⛔️ [CsvExportThread.cancel] Annulation demandée")
+        self._cancelled = True
+
+    def _report(self, fraction: float):
+        percent = int(fraction * 100)
+        if percent != self._last_percent:
+            self._last_percent = percent
+            self.progress_changed.emit(percent)
+
+    def run(self):
+        try:
+            done = self._export_func(
+                *self._args,
+                progress=self._report,
+                is_cancelled=lambda: self._cancelled,
+                **self._kwargs,
+            )
+        except Exception as e:
+            logger.debug(f"❌ [CsvExportThread.run] {e}")
+            self.export_finished.emit(False, str(e))
+            return
+        self.export_finished.emit(bool(done), "")
@@ -0,0 +1,216 @@
+# ui/zone_layer.py
+
+"""Zones graphiques fixes d'un graphe, tracées par lots.
+
+La vue analyseur logique ajoute une zone ``hlinear`` par voie : avec 256
+voies, un ``LinearRegionItem`` interactif par zone (et ses lignes de
+bornes) alourdit inutilement la scène. Les zones, toutes immobiles, sont
+regroupées par type et par apparence dans quelques :class:`ZoneBatchItem`
+qui ne dessinent que les zones visibles. :class:`ZoneLayer` ne reconstruit
+ces items que lorsque ``graph.zones`` change réellement.
+"""
+
+import copy
+from typing import Dict, Hashable, List, Optional
+
+import numpy as np
+import pyqtgraph as pg
+from PyQt5 import QtCore, QtGui
+from PyQt5.QtGui import QColor, QPainterPath
+
+ZONE_Z_VALUE = 100
+
+
+def _zone_colors(zone: dict):
+    line_color = zone.get("line_color", "#FF0000")
+    line = QColor(line_color)
+    line.setAlphaF(float(zone.get("line_alpha", 100)) / 100.0)
+    fill = QColor(zone.get("fill_color", line_color))
+    fill.setAlphaF(float(zone.get("fill_alpha", 40)) / 100.0)
+    return line, fill
+
+
+def zone_style_key(zone: dict) -> Hashable:
+    """Zones sharing this key are drawn by the same item."""
+    line, fill = _zone_colors(zone)
+    return (zone.get("type"), line.rgba(), int(zone.get("line_width", 1)), fill.rgba())
+
+
+class ZoneBatchItem(pg.GraphicsObject):
+    """Static zones of one type and style, painted in a single pass.
+
+    ``hlinear``/``vlinear`` zones are bands spanning the whole view across
+    their axis; ``rect`` zones are rectangles; ``path`` zones are polylines.
+    Only zones intersecting the visible area are drawn.
+    """
+
+    def __init__(self, ztype: str, zones: List[dict], pen, brush):
+        super().__init__()
+        self.ztype = ztype
+        self._pen = pen
+        self._brush = brush
+        self._paths: List[QPainterPath] = []
+        self._boxes = np.zeros((0, 4))  # x0, y0, x1, y1 of each zone
+        if ztype in ("hlinear", "vlinear"):
+            spans = np.sort(np.array([z.get("bounds", [0, 1]) for z in zones], dtype=float), axis=1)
+            if ztype == "hlinear":
+                self._boxes = np.column_stack(
+                    [np.full(len(spans), -np.inf), spans[:, 0], np.full(len(spans), np.inf), spans[:, 1]]
+                )
+            else:
+                self._boxes = np.column_stack(
+                    [spans[:, 0], np.full(len(spans), -np.inf), spans[:, 1], np.full(len(spans), np.inf)]
+                )
+        elif ztype == "rect":
+            r = np.array([z.get("rect", [0, 0, 1, 1]) for z in zones], dtype=float).reshape(-1, 4)
+            self._boxes = np.column_stack(
+                [np.minimum(r[:, 0], r[:, 0] + r[:, 2]), np.minimum(r[:, 1], r[:, 1] + r[:, 3]),
+                 np.maximum(r[:, 0], r[:, 0] + r[:, 2]), np.maximum(r[:, 1], r[:, 1] + r[:, 3])]
+            )
+        elif ztype == "path":
+            boxes = []
+            for zone in zones:
+                pts = zone.get("points", [])
+                path = QPainterPath()
+                if pts:
+                    path.moveTo(*pts[0])
+                    for pt in pts[1:]:
+                        path.lineTo(*pt)
+                self._paths.append(path)
+                b = path.boundingRect()
+                boxes.append((b.left(), b.top(), b.right(), b.bottom()))
+            self._boxes = np.array(boxes, dtype=float).reshape(-1, 4)
+        self.setZValue(ZONE_Z_VALUE)
+        self.setAcceptedMouseButtons(QtCore.Qt.NoButton)
+
+    def __len__(self):
+        return len(self._boxes)
+
+    def _finite_extent(self) -> QtCore.QRectF:
+        b = self._boxes
+        if not len(b):
+            return QtCore.QRectF()
+        with np.errstate(invalid="ignore"):
+            x0, y0 = np.nanmin(b[:, 0]), np.nanmin(b[:, 1])
+            x1, y1 = np.nanmax(b[:, 2]), np.nanmax(b[:, 3])
+        vr = self.viewRect()
+        if vr is not None:
+            # Bands extend over the visible area along their free axis
+            if not np.isfinite(x0) or not np.isfinite(x1):
+                x0, x1 = vr.left(), vr.right()
+            if not np.isfinite(y0) or not np.isfinite(y1):
+                y0, y1 = vr.top(), vr.bottom()
+        if not all(np.isfinite((x0, y0, x1, y1))):
+            return QtCore.QRectF()
+        return QtCore.QRectF(x0, y0, x1 - x0, y1 - y0)
+
+    def visible_indices(self, rect: Optional[QtCore.QRectF] = None) -> np.ndarray:
+        """Zones intersecting *rect* (the visible area by default)."""
+        rect = rect if rect is not None else self.viewRect()
+        if rect is None:
+            return np.arange(len(self._boxes))
+        b = self._boxes
+        rect = rect.normalized()
+        hit = (b[:, 2] >= rect.left()) & (b[:, 0] <= rect.right())
+        hit &= (b[:, 3] >= rect.top()) & (b[:, 1] <= rect.bottom())
+        return np.flatnonzero(hit)
+
+    def viewRangeChanged(self):
+        # Bands follow the view: their bounding rect depends on it
+        self.prepareGeometryChange()
+        self.update()
+
+    def dataBounds(self, ax, frac=1.0, orthoRange=None):
+        b = self._boxes
+        if not len(b):
+            return None
+        lo, hi = np.nanmin(b[:, ax]), np.nanmax(b[:, ax + 2])
+        if not (np.isfinite(lo) and np.isfinite(hi)):
+            return None  # bands never auto-scale their free axis
+        return lo, hi
+
+    def boundingRect(self):
+        rect = self._finite_extent()
+        if rect.isNull():
+            return rect
+        px, py = self.pixelVectors()
+        if px is None:
+            return rect
+        pad = self._pen.widthF() or 1.0
+        pad_x, pad_y = abs(px.x()) * pad, abs(py.y()) * pad
+        return rect.adjusted(-pad_x, -pad_y, pad_x, pad_y)
+
+    def paint(self, painter, option, widget=None):
+        view = self.viewRect()
+        if view is None:
+            view = self._finite_extent()
+        idx = self.visible_indices(view)
+        if not len(idx):
+            return
+        if self.ztype == "path":
+            painter.setPen(self._pen)
+            painter.setBrush(QtCore.Qt.NoBrush)
+            for i in idx:
+                painter.drawPath(self._paths[i])
+            return
+
+        b = self._boxes[idx]
+        x0 = np.maximum(b[:, 0], view.left())
+        x1 = np.minimum(b[:, 2], view.right())
+        y0 = np.maximum(b[:, 1], view.top())
+        y1 = np.minimum(b[:, 3], view.bottom())
+        rects = [QtCore.QRectF(a, c, w, h) for a, c, w, h in zip(x0, y0, x1 - x0, y1 - y0)]
+        if self.ztype == "rect":
+            painter.setPen(self._pen)
+            painter.setBrush(self._brush)
+            painter.drawRects(rects)
+            return
+
+        # Bands: fill without outline, then their two boundary lines
+        painter.setPen(QtCore.Qt.NoPen)
+        painter.setBrush(self._brush)
+        painter.drawRects(rects)
+        lines = []
+        if self.ztype == "hlinear":
+            for y in np.concatenate([b[:, 1], b[:, 3]]):
+                lines.append(QtCore.QLineF(view.left(), y, view.right(), y))
+        else:
+            for x in np.concatenate([b[:, 0], b[:, 2]]):
+                lines.append(QtCore.QLineF(x, view.top(), x, view.bottom()))
+        painter.setPen(self._pen)
+        painter.drawLines(lines)
+
+
+class ZoneLayer:
+    """Batched zone items of one plot, rebuilt only when the zones change."""
+
+    def __init__(self, plot_widget):
+        self.plot_widget = plot_widget
+        self.items: List[ZoneBatchItem] = []
+        self._zones: Optional[List[dict]] = None
+
+    def update(self, zones: List[dict]) -> bool:
+        """Show *zones*; returns True when the items had to be rebuilt."""
+        rebuilt = zones != self._zones
+        if rebuilt:
+            self._rebuild(zones)
+        # PlotWidget.clear() detaches the items: put them back as they are
+        for item in self.items:
+            if item.scene() is None:
+                self.plot_widget.addItem(item)
+        return rebuilt
+
+    def _rebuild(self, zones: List[dict]):
+        for item in self.items:
+            if item.scene() is not None:
+                self.plot_widget.removeItem(item)
+        groups: Dict[Hashable, List[dict]] = {}
+        for zone in zones:
+            if zone.get("type") in {"hlinear", "vlinear", "rect", "path"}:
+                groups.setdefault(zone_style_key(zone), []).append(zone)
+        self.items = []
+        for members in groups.values():
+            line, fill = _zone_colors(members[0])
+            pen = pg.mkPen(line, width=int(members[0].get("line_width", 1)))
+            self.items.append(ZoneBatchItem(members[0]["type"], members, pen, QtGui.QBrush(fill)))
+        self._zones = copy.deepcopy(zones)